@@ -20,6 +20,9 @@ ASGI config for hyperion project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Set the SELENE_ASYNC_VIEW environment variable to 1 to serve the GraphQL API
+via the asyncio based Selene view when running with an ASGI server.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 """
@@ -31,3 +34,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hyperion.settings')
 
 application = get_asgi_application()  # pylint: disable=invalid-name
+
+# build the schema before the first request. When running gunicorn the
+# arbiter is warmed up via selene.warmup.when_ready instead.
+if int(os.environ.get('SELENE_WARMUP', 0)):
+    from selene.warmup import warmup  # pylint: disable=wrong-import-position
+
+    warmup(docs=True)
@@ -79,17 +79,92 @@ STATIC_ROOT = BASE_DIR / 'static'
 SELENE = {
     'GMP_SOCKET_PATH': os.environ.get(
         "GMP_SOCKET_PATH", '/var/run/gvmd.sock'  # add your gvmd.sock path here
-    )
+    ),
+    # number of authenticated gvmd connections kept open per worker process.
+    # 0 disables the connection pool.
+    'GMP_POOL_SIZE': int(os.environ.get("GMP_POOL_SIZE", 0)),
+    # close pooled connections not used for this number of seconds
+    'GMP_POOL_IDLE_TIMEOUT': int(os.environ.get("GMP_POOL_IDLE_TIMEOUT", 60)),
+    # use the asyncio based view. Should only be enabled when running hyperion
+    # with an ASGI server (see hyperion/asgi.py). The view doesn't use the
+    # connection pool and doesn't batch lookups of single entities.
+    'ASYNC_VIEW': bool(int(os.environ.get("SELENE_ASYNC_VIEW", 0))),
+    # number of SecInfo responses (CVEs, NVTs, ...) cached per worker process.
+    # 0 disables the cache.
+    'SECINFO_CACHE_SIZE': int(os.environ.get("SECINFO_CACHE_SIZE", 0)),
+    # directory for sharing the cached SecInfo responses between workers
+    'SECINFO_CACHE_DIR': os.environ.get("SECINFO_CACHE_DIR"),
+    # JSON file mapping SHA-256 hashes to persisted GraphQL queries
+    'PERSISTED_QUERIES_FILE': os.environ.get("PERSISTED_QUERIES_FILE"),
+    # number of gvmd connections used per request for resolving the root
+    # fields of a query in parallel. 0 or 1 disables the parallel resolution.
+    'GMP_PARALLELISM': int(os.environ.get("GMP_PARALLELISM", 0)),
+    # measure the duration of GMP commands, resolvers and serialization.
+    # Clients sending the X-Selene-Debug header get the timings of their
+    # request in the extensions of the response.
+    'INSTRUMENTATION': bool(int(os.environ.get("SELENE_INSTRUMENTATION", 0))),
+    # export metrics at /selene/metrics
+    'METRICS': bool(int(os.environ.get("SELENE_METRICS", 0))),
+    # space separated client addresses allowed to request the metrics. Behind
+    # nginx the address is the one of nginx.
+    'METRICS_ALLOWED_ADDRESSES': os.environ.get(
+        "SELENE_METRICS_ALLOWED_ADDRESSES", ""
+    ).split(),
+    # token the clients requesting the metrics have to send as
+    # "Authorization: Bearer <token>" header
+    'METRICS_TOKEN': os.environ.get("SELENE_METRICS_TOKEN"),
+    # existing directory for sharing the metrics between worker processes,
+    # e.g. when running uWSGI. Should be emptied on startup.
+    'METRICS_DIR': os.environ.get("SELENE_METRICS_DIR"),
+    # log requests taking longer than this number of seconds via the
+    # selene.slow_queries logger
+    'SLOW_QUERY_THRESHOLD': (
+        float(os.environ["SELENE_SLOW_QUERY_THRESHOLD"])
+        if os.environ.get("SELENE_SLOW_QUERY_THRESHOLD")
+        else None
+    ),
+    # redirect to the schema documentation below STATIC_URL after it has
+    # been written to STATIC_ROOT via python manage.py graphqldocs
+    'GRAPHQL_DOCS_STATIC': bool(
+        int(os.environ.get("SELENE_GRAPHQL_DOCS_STATIC", 0))
+    ),
+    # fetch the following page of results and NVTs in the background while a
+    # user is paging through them
+    'CONNECTION_PREFETCH': bool(
+        int(os.environ.get("SELENE_CONNECTION_PREFETCH", 0))
+    ),
+    # send responses containing a list with at least this number of items,
+    # e.g. a page of 10000 results, while they are encoded
+    'STREAMING_RESPONSE_MIN_ITEMS': (
+        int(os.environ["SELENE_STREAMING_RESPONSE_MIN_ITEMS"])
+        if os.environ.get("SELENE_STREAMING_RESPONSE_MIN_ITEMS")
+        else None
+    ),
 }
 
-SESSION_ENGINE = 'django.contrib.sessions.backends.file'
+# sessions are stored in memory shared between the workers and serialized
+# as compact JSON (see selene/sessions.py)
+SESSION_ENGINE = 'selene.sessions'
+
+# memory mapped file shared by all workers for storing the sessions. It must
+# only be accessible by the user running hyperion. Defaults to
+# /dev/shm/selene-<uid>/sessions.
+SESSION_TABLE_PATH = os.environ.get("SELENE_SESSION_TABLE_PATH")
+
+# maximum number of concurrent sessions
+SESSION_TABLE_SLOT_COUNT = int(
+    os.environ.get("SELENE_SESSION_TABLE_SLOT_COUNT", 4096)
+)
+
+# size of a session in the table in bytes. Larger sessions, e.g. of users with
+# very long passwords, are stored in files next to the table.
+SESSION_TABLE_SLOT_SIZE = int(
+    os.environ.get("SELENE_SESSION_TABLE_SLOT_SIZE", 512)
+)
 
 # session timeout in seconds (15 min)
 SESSION_COOKIE_AGE = 900
 
-# use pickle as serializer to allow seralizing of datetime for session expiry
-SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
-
 # always try to use secret key from the environment
 SECRET_KEY = os.environ.get("SECRET_KEY")
 
@@ -31,3 +31,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hyperion.settings')
 
 application = get_wsgi_application()  # pylint: disable=invalid-name
+
+# build the schema before a server forks its workers from this process, so
+# they share it instead of each building it on its first request. The garbage
+# collector is only frozen if this process forks the workers afterwards.
+if int(os.environ.get('SELENE_WARMUP', 0)):
+    # pylint: disable=wrong-import-position
+    from selene.warmup import forks_workers, warmup
+
+    warmup(docs=True, freeze=forks_workers())
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of the filter string handling
+
+Compares the tokenizing FilterString with the previous implementation, which
+only removed the rows and first terms via regular expressions and appended
+new terms to the string. Each operation is run on a set of typical filter
+strings of GSA, including quoted terms.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+from typing import Callable, Dict, List
+
+DEFAULT_NUMBER = 20000
+
+FILTER_STRINGS = [
+    'rows=10 first=1 sort=name',
+    'apply_overrides=0 min_qod=70 rows=100 first=1 sort-reverse=severity',
+    'name~"web server" severity>5.0 and host=192.168.0.1 rows=50 first=51',
+    'task_id=5ad9ebf1-4f8c-4ef6-8e08-4b1a9d6a6bd8 levels=hml rows=-1 '
+    'sort=created',
+    '"rows=5 first=1" tag="foo=bar" sort=modified rows=25',
+]
+
+ROWS_RE = re.compile(r'(^|\s+)rows=\S+\s*')
+FIRST_RE = re.compile(r'(^|\s+)first=\S+\s*')
+
+
+def regex_paginate(filter_string: str) -> str:
+    filter_string = ROWS_RE.sub(' ', filter_string).strip()
+    filter_string = filter_string + ' rows=10'
+    filter_string = FIRST_RE.sub(' ', filter_string).strip()
+    return filter_string + ' first=11'
+
+
+def regex_normalize(filter_string: str) -> str:
+    return ' '.join(filter_string.split())
+
+
+def tokenizer_paginate(filter_string: str) -> str:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.parser import FilterString
+
+    return str(
+        FilterString(filter_string)
+        .remove_rows()
+        .add_rows(10)
+        .remove_first()
+        .add_first(11)
+    )
+
+
+def tokenizer_canonical(filter_string: str) -> str:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.parser import FilterString
+
+    return FilterString(filter_string).canonical()
+
+
+def tokenizer_get_sort(filter_string: str):
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.parser import FilterString
+
+    return FilterString(filter_string).get_sort()
+
+
+def measure(func: Callable[[str], object], number: int) -> float:
+    """Return the mean duration of a call in microseconds"""
+
+    def run():
+        for filter_string in FILTER_STRINGS:
+            func(filter_string)
+
+    duration = min(timeit.repeat(run, number=number, repeat=3))
+    return duration / number / len(FILTER_STRINGS) * 1e6
+
+
+def run_benchmark(number: int) -> Dict[str, Dict[str, float]]:
+    return {
+        'paginate': {
+            'regex': measure(regex_paginate, number),
+            'tokenizer': measure(tokenizer_paginate, number),
+        },
+        'normalize': {
+            'whitespace': measure(regex_normalize, number),
+            'canonical': measure(tokenizer_canonical, number),
+        },
+        'get sort': {
+            'tokenizer': measure(tokenizer_get_sort, number),
+        },
+    }
+
+
+def compare_results() -> List[Dict[str, str]]:
+    """Return the filter strings for which both implementations differ"""
+    return [
+        {
+            'filter': filter_string,
+            'regex': regex_paginate(filter_string),
+            'tokenizer': tokenizer_paginate(filter_string),
+        }
+        for filter_string in FILTER_STRINGS
+        if regex_paginate(filter_string) != tokenizer_paginate(filter_string)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=DEFAULT_NUMBER,
+        help='Number of runs over all filter strings (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    import django
+
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'selene.benchmarks.settings'
+    )
+    django.setup()
+
+    report = {
+        'durations': run_benchmark(args.number),
+        'differences': compare_results(),
+    }
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print('Mean duration per filter string (microseconds)')
+    for operation, durations in report['durations'].items():
+        values = ' '.join(
+            f'{name} {duration:.2f}' for name, duration in durations.items()
+        )
+        print(f'  {operation:<10} {values}')
+
+    print('Different results of the regex implementation')
+    for difference in report['differences']:
+        print(f'  {difference["filter"]}')
+        print(f'    regex     {difference["regex"]}')
+        print(f'    tokenizer {difference["tokenizer"]}')
+
+
+if __name__ == '__main__':
+    main()
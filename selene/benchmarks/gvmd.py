@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A fake gvmd speaking GMP over a unix socket
+
+The responses are generated from the example XML files of the tests
+(`selene/tests/*/example-*.xml`). The entities of a fixture are used as
+templates and are replicated to `size` entities with distinct ids. List
+commands return the page requested via the `first` and `rows` keywords of
+the filter together with matching counts.
+
+Commands which are not known are answered with an error response like gvmd
+does. Commands creating, modifying or deleting resources always succeed.
+
+Run the server standalone with
+
+    python -m selene.benchmarks.gvmd --socket /tmp/fake-gvmd.sock
+"""
+
+import argparse
+import copy
+import re
+import socketserver
+import threading
+import uuid
+
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+FIXTURES_DIRECTORY = Path(__file__).absolute().parent.parent / 'tests'
+FIXTURES_PATTERN = '*/example-*.xml'
+
+DEFAULT_SIZE = 100
+DEFAULT_ROWS = 10
+DEFAULT_GMP_VERSION = '21.4'
+
+# child elements of info elements containing the type specific data
+INFO_TYPES = ('cert_bund_adv', 'cpe', 'cve', 'dfn_cert_adv', 'nvt', 'ovaldef')
+
+ID_NAMESPACE = uuid.UUID('0a5e5d6c-3a1b-4f5e-9a55-8a1e7a3b1c00')
+
+UUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I
+)
+TRAILING_NUMBER_PATTERN = re.compile(r'(\d+)$')
+ID_NUMBER_STEP = 1000000
+FILTER_KEYWORD_PATTERN = re.compile(r'(?:^|\s)(first|rows)=(-?\d+)')
+
+BUFFER_SIZE = 64 * 1024
+
+
+def _get_kind(entity: etree.Element) -> Optional[str]:
+    """Return the sub type of an entity, e.g. the info type or asset type"""
+    if entity.tag == 'info':
+        for child in entity:
+            if child.tag in INFO_TYPES:
+                return child.tag
+        return None
+
+    if entity.tag == 'asset':
+        kind = entity.findtext('type')
+    else:
+        kind = entity.findtext('usage_type')
+
+    return kind.lower() if kind else None
+
+
+def _get_entity_tag(root: etree.Element) -> Optional[str]:
+    tags = Counter(
+        child.tag
+        for child in root
+        if child.get('id') is not None and child.tag != 'filters'
+    )
+    if not tags:
+        return None
+    return tags.most_common(1)[0][0]
+
+
+def _create_id(
+    template_id: str, entity_tag: str, index: int, repetition: int
+) -> str:
+    """Create the id of the index-th entity of a type
+
+    The first repetition of a template keeps the id of the template.
+    """
+    if repetition == 0:
+        return template_id
+
+    if UUID_PATTERN.match(template_id):
+        return str(uuid.uuid5(ID_NAMESPACE, f'{entity_tag}-{index}'))
+
+    # e.g. CVE-2020-1234 or the OID of a NVT
+    match = TRAILING_NUMBER_PATTERN.search(template_id)
+    if match is None:
+        return f'{template_id}-{repetition}'
+
+    number = int(match.group(1)) + repetition * ID_NUMBER_STEP
+    return template_id[: match.start()] + str(number)
+
+
+def _parse_filter(filter_string: Optional[str]) -> Dict[str, int]:
+    if not filter_string:
+        return {}
+    return {
+        keyword: int(value)
+        for keyword, value in FILTER_KEYWORD_PATTERN.findall(filter_string)
+    }
+
+
+class Fixture:
+    """The example response of a get command"""
+
+    def __init__(self, root: etree.Element):
+        self.root = root
+        self.entity_tag = _get_entity_tag(root)
+        self.templates: List[etree.Element] = (
+            [child for child in root if child.tag == self.entity_tag]
+            if self.entity_tag
+            else []
+        )
+
+    @property
+    def kinds(self) -> set:
+        return {_get_kind(template) for template in self.templates}
+
+    @property
+    def requested_tag(self) -> str:
+        return 'info' if self.entity_tag == 'info' else f'{self.entity_tag}s'
+
+    @property
+    def counts_tag(self) -> str:
+        return f'{self.entity_tag}_count'
+
+
+class FixtureStore:
+    """The fixtures by the name of the get command"""
+
+    def __init__(self, directory: Path = FIXTURES_DIRECTORY):
+        self._fixtures: Dict[str, List[Fixture]] = defaultdict(list)
+
+        for path in sorted(directory.glob(FIXTURES_PATTERN)):
+            try:
+                root = etree.parse(str(path)).getroot()
+            except etree.XMLSyntaxError:
+                continue
+
+            if not root.tag.endswith('_response'):
+                continue
+
+            command = root.tag[: -len('_response')]
+            self._fixtures[command].append(Fixture(root))
+
+    def __contains__(self, command: str) -> bool:
+        return self.get(command) is not None
+
+    @property
+    def commands(self) -> List[str]:
+        return sorted(self._fixtures)
+
+    def get(
+        self, command: str, kind: Optional[str] = None
+    ) -> Optional[Fixture]:
+        # the fixtures of single entities are named like get_config_response
+        # while the command is get_configs
+        fixtures = (
+            self._fixtures.get(command)
+            or self._fixtures.get(command.rstrip('s'))
+            or self._fixtures.get(f'{command}s')
+        )
+        if not fixtures:
+            return None
+
+        # prefer the fixture with the most entities
+        fixtures = sorted(
+            fixtures, key=lambda f: len(f.templates), reverse=True
+        )
+
+        if kind:
+            for fixture in fixtures:
+                if kind in fixture.kinds:
+                    return fixture
+
+        return fixtures[0]
+
+
+class ResponseGenerator:
+    """Create GMP responses from the fixtures
+
+    Arguments:
+        fixtures: Store of the example responses
+        size: Number of entities of each type
+        default_rows: Number of entities returned if the filter of a command
+            doesn't contain a rows keyword
+        version: GMP version returned by get_version
+    """
+
+    def __init__(
+        self,
+        fixtures: FixtureStore,
+        *,
+        size: int = DEFAULT_SIZE,
+        default_rows: int = DEFAULT_ROWS,
+        version: str = DEFAULT_GMP_VERSION,
+    ):
+        self.fixtures = fixtures
+        self.size = size
+        self.default_rows = default_rows
+        self.version = version
+
+        self._cache: Dict[Tuple, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _get_templates(
+        self, fixture: Fixture, kind: Optional[str]
+    ) -> List[etree.Element]:
+        templates = [t for t in fixture.templates if _get_kind(t) == kind]
+        return templates or fixture.templates
+
+    def _create_entity(
+        self, fixture: Fixture, templates: List[etree.Element], index: int
+    ) -> etree.Element:
+        template = templates[index % len(templates)]
+        entity = copy.deepcopy(template)
+        entity.set(
+            'id',
+            _create_id(
+                template.get('id'),
+                fixture.entity_tag,
+                index,
+                index // len(templates),
+            ),
+        )
+        return entity
+
+    def _create_list(
+        self,
+        command: str,
+        fixture: Fixture,
+        kind: Optional[str],
+        first: int,
+        rows: int,
+    ) -> etree.Element:
+        templates = self._get_templates(fixture, kind)
+        count = max(0, min(rows, self.size - first + 1))
+
+        root = etree.Element(f'{command}_response', fixture.root.attrib)
+        inserted = False
+
+        for child in fixture.root:
+            if child.tag == fixture.entity_tag:
+                if not inserted:
+                    for index in range(first - 1, first - 1 + count):
+                        root.append(
+                            self._create_entity(fixture, templates, index)
+                        )
+                    inserted = True
+            elif child.tag not in (fixture.requested_tag, fixture.counts_tag):
+                root.append(copy.deepcopy(child))
+
+        requested = etree.SubElement(root, fixture.requested_tag)
+        requested.set('start', str(first))
+        requested.set('max', str(rows))
+
+        counts = etree.SubElement(root, fixture.counts_tag)
+        counts.text = str(self.size)
+        etree.SubElement(counts, 'filtered').text = str(self.size)
+        etree.SubElement(counts, 'page').text = str(count)
+
+        return root
+
+    def _create_single(
+        self, command: str, fixture: Fixture, kind: Optional[str], id_: str
+    ) -> etree.Element:
+        templates = self._get_templates(fixture, kind)
+
+        root = etree.Element(f'{command}_response', fixture.root.attrib)
+        entity = copy.deepcopy(templates[0])
+        entity.set('id', id_)
+        root.append(entity)
+        return root
+
+    def _create_get_response(
+        self, command: str, request: etree.Element
+    ) -> Optional[bytes]:
+        kind = request.get('type') or request.get('usage_type')
+        kind = kind.lower() if kind else None
+
+        fixture = self.fixtures.get(command, kind)
+        if fixture is None:
+            return None
+
+        if fixture.entity_tag is None:
+            # e.g. get_feeds or get_aggregates
+            root = copy.deepcopy(fixture.root)
+            root.tag = f'{command}_response'
+            return etree.tostring(root)
+
+        entity_id = request.get(f'{fixture.entity_tag}_id')
+        if entity_id:
+            return etree.tostring(
+                self._create_single(command, fixture, kind, entity_id)
+            )
+
+        keywords = _parse_filter(request.get('filter'))
+        first = max(1, keywords.get('first', 1))
+        rows = keywords.get('rows', self.default_rows)
+        if rows < 0:
+            rows = self.size
+
+        key = (command, kind, first, rows)
+        with self._lock:
+            response = self._cache.get(key)
+        if response is not None:
+            return response
+
+        response = etree.tostring(
+            self._create_list(command, fixture, kind, first, rows)
+        )
+        with self._lock:
+            self._cache[key] = response
+
+        return response
+
+    def create_response(self, request: etree.Element) -> bytes:
+        command = request.tag
+
+        if command == 'authenticate':
+            return (
+                b'<authenticate_response status="200" status_text="OK">'
+                b'<role>Admin</role><timezone>UTC</timezone>'
+                b'<severity>nist</severity></authenticate_response>'
+            )
+
+        if command == 'get_version':
+            return (
+                '<get_version_response status="200" status_text="OK">'
+                f'<version>{self.version}</version></get_version_response>'
+            ).encode('utf-8')
+
+        if command == 'get_settings':
+            setting_id = request.get('setting_id', '')
+            return (
+                '<get_settings_response status="200" status_text="OK">'
+                f'<setting id="{setting_id}"><name>Setting</name>'
+                '<value>Browser Language</value></setting>'
+                '</get_settings_response>'
+            ).encode('utf-8')
+
+        if command.startswith('get_'):
+            response = self._create_get_response(command, request)
+            if response is not None:
+                return response
+
+        elif command.startswith('create_'):
+            return (
+                f'<{command}_response status="201" '
+                f'status_text="OK, resource created" id="{uuid.uuid4()}"/>'
+            ).encode('utf-8')
+
+        elif command.startswith(('modify_', 'delete_', 'start_', 'stop_')):
+            return (
+                f'<{command}_response status="200" status_text="OK"/>'
+            ).encode('utf-8')
+
+        return (
+            f'<{command}_response status="400" '
+            'status_text="Bogus command name"/>'
+        ).encode('utf-8')
+
+
+class GmpRequestHandler(socketserver.BaseRequestHandler):
+    def _create_parser(self) -> etree.XMLPullParser:
+        return etree.XMLPullParser(events=('start', 'end'), huge_tree=True)
+
+    def handle(self):
+        parser = self._create_parser()
+        depth = 0
+
+        while True:
+            try:
+                data = self.request.recv(BUFFER_SIZE)
+            except OSError:
+                return
+
+            if not data:
+                return
+
+            try:
+                parser.feed(data)
+            except etree.XMLSyntaxError:
+                return
+
+            for event, element in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth == 0:
+                    response = self.server.generator.create_response(element)
+                    self.request.sendall(response)
+
+                    # gvmd clients wait for the response before sending the
+                    # next command
+                    parser = self._create_parser()
+                    break
+
+
+class FakeGvmd(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A threaded fake gvmd listening on a unix socket
+
+    Can be used as context manager to serve in a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, generator: ResponseGenerator):
+        self.path = path
+        self.generator = generator
+        self._thread: Optional[threading.Thread] = None
+
+        # remove a stale socket of a previous run
+        try:
+            Path(path).unlink()
+        except OSError:
+            pass
+
+        super().__init__(path, GmpRequestHandler)
+
+    def __enter__(self) -> 'FakeGvmd':
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='fake-gvmd', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        self.server_close()
+
+        if self._thread is not None:
+            self._thread.join()
+
+        try:
+            Path(self.path).unlink()
+        except OSError:
+            pass
+
+
+def create_fake_gvmd(
+    path: str,
+    *,
+    size: int = DEFAULT_SIZE,
+    default_rows: int = DEFAULT_ROWS,
+    fixtures_directory: Path = FIXTURES_DIRECTORY,
+) -> FakeGvmd:
+    generator = ResponseGenerator(
+        FixtureStore(fixtures_directory), size=size, default_rows=default_rows
+    )
+    return FakeGvmd(path, generator)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--socket', required=True, help='Path of the socket')
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=DEFAULT_SIZE,
+        help='Number of entities of each type (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Default number of entities per page (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    server = create_fake_gvmd(
+        args.socket, size=args.size, default_rows=args.rows
+    )
+
+    print(f'Fake gvmd listening on {args.socket}')
+    print('Commands: ' + ', '.join(server.generator.fixtures.commands))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            Path(args.socket).unlink()
+        except OSError:
+            pass
+
+
+if __name__ == '__main__':
+    main()
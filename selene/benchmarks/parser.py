@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of parsing the values of large pages
+
+Compares parsing the timestamps and severities of a page of results with the
+functions of selene.schema.parser against the previous implementations,
+which called django for each timestamp and converted each severity again.
+The caches are cleared before each page, so only values repeated within a
+page are served from the caches.
+
+The values are created like gvmd returns them: each result has a distinct
+creation time and an equal modification time and the severities have one
+decimal.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import timeit
+
+from typing import Callable, Dict, List
+
+DEFAULT_ROWS = 1000
+DEFAULT_NUMBER = 10
+
+
+def get_page_values(rows: int) -> Dict[str, List[str]]:
+    """Return the values of a page of results by their type"""
+    rand = random.Random(rows)
+    start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+    timestamps = []
+    for index in range(rows):
+        timestamp = start + datetime.timedelta(seconds=index * 37)
+        value = timestamp.strftime('%Y-%m-%dT%H:%M:%SZ')
+        # creation and modification time
+        timestamps.extend((value, value))
+
+    return {
+        'datetime': timestamps,
+        'severity': [
+            f'{rand.randint(0, 100) / 10:.1f}' for _ in range(rows * 2)
+        ],
+    }
+
+
+def previous_parse_datetime(value: str):
+    # pylint: disable=import-outside-toplevel
+    from django.utils.dateparse import parse_datetime
+
+    return parse_datetime(value)
+
+
+def previous_check_severity(value: str) -> float:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.parser import check_severity
+
+    return check_severity.__wrapped__(value)
+
+
+def get_current_functions() -> Dict[str, Callable[[str], object]]:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.parser import check_severity, parse_datetime
+
+    return {
+        'datetime': parse_datetime,
+        'severity': check_severity,
+    }
+
+
+PREVIOUS_FUNCTIONS = {
+    'datetime': previous_parse_datetime,
+    'severity': previous_check_severity,
+}
+
+
+def measure(
+    func: Callable[[str], object], values: List[str], number: int
+) -> float:
+    """Return the mean duration of parsing all values in milliseconds"""
+
+    def run():
+        cache_clear = getattr(func, 'cache_clear', None)
+        if cache_clear is not None:
+            cache_clear()
+
+        for value in values:
+            func(value)
+
+    duration = min(timeit.repeat(run, number=number, repeat=3))
+    return duration / number * 1e3
+
+
+def run_benchmark(rows: int, number: int) -> Dict[str, Dict[str, float]]:
+    values = get_page_values(rows)
+    current_functions = get_current_functions()
+    report = {}
+
+    for name, previous in PREVIOUS_FUNCTIONS.items():
+        current = current_functions[name]
+
+        for value in values[name]:
+            if previous(value) != current(value):
+                raise ValueError(f'Different {name} value for {value}')
+
+        report[name] = {
+            'values': len(values[name]),
+            'distinct': len(set(values[name])),
+            'previous': measure(previous, values[name], number),
+            'current': measure(current, values[name], number),
+        }
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Number of results per page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=DEFAULT_NUMBER,
+        help='Number of runs over each page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    import django
+
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'selene.benchmarks.settings'
+    )
+    django.setup()
+
+    report = run_benchmark(args.rows, args.number)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print('Mean duration of parsing the values of a page (milliseconds)')
+    for name, durations in report.items():
+        print(
+            f'  {name:<8} {durations["values"]:>6} values '
+            f'({durations["distinct"]} distinct) '
+            f'previous {durations["previous"]:.2f} '
+            f'current {durations["current"]:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
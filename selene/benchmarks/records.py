@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of reading the fields of large pages
+
+Compares looking up each field in the entity element, like the resolvers
+did before, with reading the fields from the records of the entities. The
+pages are created from the example responses of the tests like the fake
+gvmd does. For each entity type the fields of a typical list view are read
+from all entities of a page.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from typing import Callable, Dict, List, Tuple
+
+from lxml import etree
+
+from selene.benchmarks.gvmd import FixtureStore, ResponseGenerator
+
+DEFAULT_ROWS = 1000
+DEFAULT_NUMBER = 10
+
+# GMP command, request attributes and tag of the entity elements
+PAGES = {
+    'results': ('get_results', {}, 'result'),
+    'tasks': ('get_tasks', {}, 'task'),
+    'hosts': ('get_assets', {'type': 'host'}, 'asset'),
+    'nvts': ('get_info', {'type': 'nvt'}, 'info'),
+}
+
+
+def create_page(name: str, rows: int) -> List[etree.Element]:
+    command, attributes, entity_tag = PAGES[name]
+    generator = ResponseGenerator(FixtureStore(), size=rows)
+    request = etree.Element(command, filter=f'rows={rows}', **attributes)
+    response = etree.fromstring(generator.create_response(request))
+    return [
+        element
+        for element in response.iterchildren(entity_tag)
+        if element.get('id')
+    ]
+
+
+def result_element_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.utils import get_owner, get_text_from_element
+
+    return (
+        root.get('id'),
+        get_text_from_element(root, 'name'),
+        get_owner(root),
+        get_text_from_element(root, 'creation_time'),
+        get_text_from_element(root, 'modification_time'),
+        get_text_from_element(root, 'description'),
+        get_text_from_element(root, 'port'),
+        get_text_from_element(root, 'severity'),
+        get_text_from_element(root, 'original_severity'),
+        get_text_from_element(root, 'scan_nvt_version'),
+        root.find('host'),
+        root.find('qod'),
+        root.find('nvt'),
+    )
+
+
+def result_record_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.results.fields import ResultRecord
+    from selene.schema.utils import get_owner
+
+    record = ResultRecord(root)
+    return (
+        record.get('id'),
+        record.text('name'),
+        get_owner(record),
+        record.text('creation_time'),
+        record.text('modification_time'),
+        record.description,
+        record.port,
+        record.severity,
+        record.original_severity,
+        record.scan_nvt_version,
+        record.find('host'),
+        record.find('qod'),
+        record.find('nvt'),
+    )
+
+
+def task_element_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.utils import get_owner, get_text_from_element
+
+    last_report = root.find('last_report')
+    report = last_report.find('report') if last_report is not None else None
+    return (
+        root.get('id'),
+        get_text_from_element(root, 'name'),
+        get_text_from_element(root, 'comment'),
+        get_owner(root),
+        get_text_from_element(root, 'creation_time'),
+        get_text_from_element(root, 'status'),
+        get_text_from_element(root, 'trend'),
+        get_text_from_element(root, 'progress'),
+        get_text_from_element(root, 'average_duration'),
+        get_text_from_element(root, 'alterable'),
+        report.get('id') if report is not None else None,
+        get_text_from_element(report, 'severity'),
+        get_text_from_element(report, 'timestamp'),
+    )
+
+
+def task_record_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.tasks.fields import TaskRecord, TaskReportRecord
+    from selene.schema.utils import get_owner
+
+    record = TaskRecord(root)
+    report = TaskReportRecord.of(record.find('last_report/report'))
+    return (
+        record.get('id'),
+        record.text('name'),
+        record.text('comment'),
+        get_owner(record),
+        record.text('creation_time'),
+        record.status,
+        record.trend,
+        record.progress,
+        record.average_duration,
+        record.alterable,
+        report.get('id') if report is not None else None,
+        report.severity if report is not None else None,
+        report.timestamp if report is not None else None,
+    )
+
+
+def host_element_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.utils import get_text_from_element
+
+    host = root.find('host')
+    return (
+        root.get('id'),
+        get_text_from_element(root, 'name'),
+        get_text_from_element(root, 'comment'),
+        get_text_from_element(root, 'creation_time'),
+        get_text_from_element(root, 'modification_time'),
+        get_text_from_element(host.find('severity'), 'value'),
+        root.find('identifiers'),
+        host.find('routes'),
+    )
+
+
+def host_record_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.hosts.fields import HostRecord
+
+    record = HostRecord(root)
+    return (
+        record.get('id'),
+        record.text('name'),
+        record.text('comment'),
+        record.text('creation_time'),
+        record.text('modification_time'),
+        record.severity,
+        record.find('identifiers'),
+        record.host.find('routes'),
+    )
+
+
+def nvt_element_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.utils import get_text_from_element
+
+    nvt = root.find('nvt')
+    return (
+        root.get('id'),
+        get_text_from_element(root, 'name'),
+        get_text_from_element(root, 'update_time'),
+        get_text_from_element(nvt, 'family'),
+        get_text_from_element(nvt, 'cvss_base'),
+        get_text_from_element(nvt, 'category'),
+        nvt.find('qod'),
+        root.find('nvt/severities'),
+        root.find('nvt/refs'),
+        nvt.find('solution'),
+        nvt.find('tags'),
+    )
+
+
+def nvt_record_fields(root) -> Tuple:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.nvts.fields import NVTRecord
+
+    record = NVTRecord(root)
+    return (
+        record.get('id'),
+        record.text('name'),
+        record.text('update_time'),
+        record.family,
+        record.cvss_base,
+        record.category,
+        record.find_nvt('qod'),
+        record.find_nvt('severities'),
+        record.find_nvt('refs'),
+        record.find_nvt('solution'),
+        record.find_nvt('tags'),
+    )
+
+
+FIELDS: Dict[str, Tuple[Callable, Callable]] = {
+    'results': (result_element_fields, result_record_fields),
+    'tasks': (task_element_fields, task_record_fields),
+    'hosts': (host_element_fields, host_record_fields),
+    'nvts': (nvt_element_fields, nvt_record_fields),
+}
+
+
+def measure(func: Callable, page: List[etree.Element], number: int) -> float:
+    """Return the mean duration of reading a page in milliseconds"""
+
+    def run():
+        for element in page:
+            func(element)
+
+    duration = min(timeit.repeat(run, number=number, repeat=3))
+    return duration / number * 1e3
+
+
+def run_benchmark(rows: int, number: int) -> Dict[str, Dict[str, float]]:
+    report = {}
+
+    for name, (element_fields, record_fields) in FIELDS.items():
+        page = create_page(name, rows)
+
+        for element in page:
+            if element_fields(element) != record_fields(element):
+                raise ValueError(
+                    f'Different fields of {name} {element.get("id")}'
+                )
+
+        report[name] = {
+            'entities': len(page),
+            'elements': measure(element_fields, page, number),
+            'records': measure(record_fields, page, number),
+        }
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Number of entities per page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=DEFAULT_NUMBER,
+        help='Number of runs over each page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    import django
+
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'selene.benchmarks.settings'
+    )
+    django.setup()
+
+    report = run_benchmark(args.rows, args.number)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print('Mean duration of reading the fields of a page (milliseconds)')
+    for name, durations in report.items():
+        print(
+            f'  {name:<8} {durations["entities"]:>6} entities '
+            f'elements {durations["elements"]:.2f} '
+            f'records {durations["records"]:.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Django settings for running the benchmarks in-process"""
+
+import os
+import tempfile
+
+SECRET_KEY = 'benchmark-key'
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['testserver', 'localhost']
+
+INSTALLED_APPS = ['graphene_django']
+
+MIDDLEWARE = ['django.contrib.sessions.middleware.SessionMiddleware']
+
+DATABASES = {}
+
+ROOT_URLCONF = 'selene.urls'
+
+SESSION_ENGINE = 'selene.sessions'
+
+SESSION_TABLE_PATH = os.path.join(
+    os.environ.get('SELENE_BENCHMARK_SESSION_DIR', tempfile.gettempdir()),
+    'selene-benchmark-sessions',
+)
+
+SELENE = {
+    'GMP_SOCKET_PATH': os.environ.get(
+        'SELENE_BENCHMARK_GMP_SOCKET', '/tmp/fake-gvmd.sock'
+    ),
+}
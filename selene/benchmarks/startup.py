@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark of the startup time and memory of worker processes
+
+The cold import time is measured in fresh Python processes. Each process sets
+up Django and imports the views including the schema. Optionally the bytecode
+caches are bypassed to simulate the first start after an installation.
+
+The memory of the workers is measured like uWSGI runs them. A master process
+forks the workers, either after warming up (preloaded) or without warming up,
+in which case every worker builds the schema itself like on its first
+request. The proportional set size (PSS) and the private memory (USS) of each
+worker are read from /proc/<pid>/smaps_rollup.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from statistics import median
+from time import perf_counter
+from typing import Dict, List, Optional
+
+DEFAULT_RUNS = 5
+DEFAULT_WORKERS = 4
+
+SETTINGS_MODULE = 'selene.benchmarks.settings'
+
+IMPORT_SCRIPT = """
+import json, resource, sys
+from time import perf_counter
+
+start = perf_counter()
+
+import django
+django.setup()
+
+setup = perf_counter()
+
+import selene.views
+
+imported = perf_counter()
+
+json.dump(
+    {
+        'setup': setup - start,
+        'import': imported - setup,
+        'maxRss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    },
+    sys.stdout,
+)
+"""
+
+
+def _get_environment(**kwargs) -> Dict[str, str]:
+    path = os.environ.get('PYTHONPATH')
+    cwd = os.getcwd()
+    return {
+        **os.environ,
+        'DJANGO_SETTINGS_MODULE': SETTINGS_MODULE,
+        'PYTHONPATH': f'{cwd}{os.pathsep}{path}' if path else cwd,
+        **kwargs,
+    }
+
+
+def measure_import(*, bytecode_cache: bool = True) -> Dict[str, float]:
+    """Measure the import of the views in a fresh Python process"""
+    with tempfile.TemporaryDirectory() as directory:
+        env = _get_environment()
+        if not bytecode_cache:
+            # an empty prefix directory forces compiling all modules
+            env['PYTHONPYCACHEPREFIX'] = directory
+            env['PYTHONDONTWRITEBYTECODE'] = '1'
+
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            env=env,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout
+
+    return json.loads(output)
+
+
+def read_memory(pid: int) -> Optional[Dict[str, int]]:
+    """Return the PSS and USS of a process in KiB"""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', encoding='ascii') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    values = {}
+    for line in lines[1:]:
+        name, value = line.split(':', 1)
+        values[name] = int(value.split()[0])
+
+    return {
+        'pss': values['Pss'],
+        'uss': values['Private_Clean'] + values['Private_Dirty'],
+    }
+
+
+def run_workers(workers: int, *, preload: bool) -> List[Dict[str, float]]:
+    """Fork workers from the current process and measure their memory
+
+    Django must be set up already. If preload is set the current process is
+    warmed up before forking.
+    """
+    # pylint: disable=import-outside-toplevel
+    from selene.warmup import warmup
+
+    if preload:
+        warmup(freeze=True)
+
+    ready_read, ready_write = os.pipe()
+    exit_read, exit_write = os.pipe()
+    pids = []
+
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            os.close(exit_write)
+
+            start = perf_counter()
+            warmup()
+            duration = perf_counter() - start
+
+            os.write(ready_write, json.dumps(duration).encode() + b'\n')
+            # keep running until all workers have been measured
+            os.read(exit_read, 1)
+            os._exit(0)  # pylint: disable=protected-access
+
+        pids.append(pid)
+
+    os.close(ready_write)
+    os.close(exit_read)
+
+    reports = []
+    with os.fdopen(ready_read) as ready:
+        durations = [json.loads(ready.readline()) for _ in pids]
+
+        for pid, duration in zip(pids, durations):
+            memory = read_memory(pid) or {'pss': None, 'uss': None}
+            reports.append({'warmup': duration, **memory})
+
+    os.close(exit_write)
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    return reports
+
+
+def _run_workers_in_subprocess(workers: int, preload: bool) -> List[Dict]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-m',
+            'selene.benchmarks.startup',
+            '--run-workers',
+            str(workers),
+        ]
+        + (['--preload'] if preload else []),
+        env=_get_environment(),
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ).stdout
+    return json.loads(output)
+
+
+def _summarize(values: List[Optional[float]]) -> Optional[Dict[str, float]]:
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return {'median': median(values), 'min': min(values), 'max': max(values)}
+
+
+def _print_report(report: Dict[str, Dict]):
+    print('Cold import (seconds, peak RSS in MiB)')
+    for name, runs in report['import'].items():
+        setup = _summarize([run['setup'] for run in runs])
+        imported = _summarize([run['import'] for run in runs])
+        rss = max(run['maxRss'] for run in runs) / 1024
+        print(
+            f'  {name:<18} setup {setup["median"]:.3f} '
+            f'import {imported["median"]:.3f} '
+            f'(min {imported["min"]:.3f} max {imported["max"]:.3f}) '
+            f'rss {rss:.1f}'
+        )
+
+    print('Memory per worker (median in MiB)')
+    for name, workers in report['workers'].items():
+        warmup = _summarize([worker['warmup'] for worker in workers])
+        pss = _summarize([worker['pss'] for worker in workers])
+        uss = _summarize([worker['uss'] for worker in workers])
+        memory = (
+            f'pss {pss["median"] / 1024:.1f} uss {uss["median"] / 1024:.1f}'
+            if pss and uss
+            else 'pss n/a uss n/a'
+        )
+        print(f'  {name:<18} warmup {warmup["median"]:.3f}s {memory}')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=DEFAULT_RUNS,
+        help='Number of fresh processes importing the views '
+        '(default: %(default)s)',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help='Number of forked workers (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    parser.add_argument('--run-workers', type=int, help=argparse.SUPPRESS)
+    parser.add_argument(
+        '--preload', action='store_true', help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.run_workers:
+        # pylint: disable=import-outside-toplevel
+        import django
+
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', SETTINGS_MODULE)
+        django.setup()
+
+        json.dump(
+            run_workers(args.run_workers, preload=args.preload), sys.stdout
+        )
+        return
+
+    report = {
+        'import': {
+            'bytecode cache': [measure_import() for _ in range(args.runs)],
+            'no bytecode cache': [
+                measure_import(bytecode_cache=False) for _ in range(args.runs)
+            ],
+        },
+        'workers': {
+            'preloaded': _run_workers_in_subprocess(args.workers, True),
+            'not preloaded': _run_workers_in_subprocess(args.workers, False),
+        },
+    }
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        _print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of encoding large GraphQL responses
+
+Compares encoding the response of a results query into a single JSON string
+with encoding it incrementally via selene.streaming.JsonStream. For both the
+duration until the first bytes can be sent, the total duration and the peak
+memory allocated during the encoding are reported. The memory of the
+response data itself isn't included.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, Iterable
+
+from selene.streaming import DEFAULT_CHUNK_SIZE, JsonStream
+
+DEFAULT_ROWS = 10000
+DEFAULT_NUMBER = 5
+
+DESCRIPTION = (
+    'The remote host is missing an update for the package. '
+    'Successful exploitation allows an attacker to execute arbitrary code. '
+) * 4
+
+
+def create_response(rows: int) -> Dict[str, Any]:
+    """Create the data of a response like selene returns it for a page of
+    results
+    """
+    return {
+        'data': {
+            'results': {
+                'edges': [
+                    {
+                        'node': {
+                            'id': f'{i:08x}-0000-4000-8000-000000000000',
+                            'name': f'Vulnerability {i}',
+                            'description': DESCRIPTION,
+                            'severity': (i % 101) / 10,
+                            'qod': {'value': 80, 'type': 'remote_banner'},
+                            'host': {
+                                'ip': f'192.168.{i // 256 % 256}.{i % 256}',
+                                'hostname': None,
+                            },
+                            'creationTime': '2021-01-01T00:00:00+00:00',
+                        },
+                        'cursor': f'cmVzdWx0OjA{i}',
+                    }
+                    for i in range(rows)
+                ],
+                'pageInfo': {'hasNextPage': False, 'endCursor': None},
+                'counts': {'filtered': rows, 'total': rows},
+            }
+        }
+    }
+
+
+def encode_string(response: Dict[str, Any]) -> Iterable[bytes]:
+    return [json.dumps(response, separators=(',', ':')).encode('utf-8')]
+
+
+def encode_stream(response: Dict[str, Any]) -> Iterable[bytes]:
+    return JsonStream(response, chunk_size=DEFAULT_CHUNK_SIZE)
+
+
+def measure(
+    encode: Callable[[Dict[str, Any]], Iterable[bytes]],
+    rows: int,
+    number: int,
+) -> Dict[str, float]:
+    """Return the best durations in milliseconds and peak memory in MiB"""
+    first_bytes = []
+    totals = []
+
+    for _ in range(number):
+        response = create_response(rows)
+
+        start = time.perf_counter()
+        first = None
+
+        for _chunk in encode(response):
+            if first is None:
+                first = time.perf_counter() - start
+
+        totals.append(time.perf_counter() - start)
+        first_bytes.append(first)
+
+    # tracing the allocations slows down the encoding, therefore the memory
+    # is measured separately
+    response = create_response(rows)
+
+    tracemalloc.start()
+    for _chunk in encode(response):
+        pass
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'first_bytes': min(first_bytes) * 1e3,
+        'total': min(totals) * 1e3,
+        'peak_memory': peak / 2**20,
+    }
+
+
+def run_benchmark(rows: int, number: int) -> Dict[str, Dict[str, float]]:
+    expected = b''.join(encode_string(create_response(rows)))
+    if b''.join(encode_stream(create_response(rows))) != expected:
+        raise ValueError('Different encoded responses')
+
+    return {
+        'string': measure(encode_string, rows, number),
+        'stream': measure(encode_stream, rows, number),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Number of results of the response (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=DEFAULT_NUMBER,
+        help='Number of encoded responses (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    report = run_benchmark(args.rows, args.number)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f'Encoding a response with {args.rows} results')
+    for name, values in report.items():
+        print(
+            f'  {name:<6} first bytes {values["first_bytes"]:8.2f} ms '
+            f'total {values["total"]:8.2f} ms '
+            f'peak memory {values["peak_memory"]:7.2f} MiB'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""End-to-end throughput benchmark of selene against a fake gvmd
+
+By default the GraphQL view is called in-process via the Django test client
+and a fake gvmd is started on a temporary unix socket. Alternatively a
+running WSGI or ASGI server can be benchmarked by passing its GraphQL url.
+The server has to be configured to use a fake gvmd started via
+
+    python -m selene.benchmarks.gvmd --socket /tmp/fake-gvmd.sock
+
+For each query the latency percentiles, the requests per second, the number
+of errors and the peak RSS of the serving process are reported.
+"""
+
+import argparse
+import http.cookiejar
+import json
+import math
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from selene.benchmarks.gvmd import DEFAULT_ROWS, DEFAULT_SIZE
+
+DEFAULT_REQUESTS = 200
+DEFAULT_CONCURRENCY = 4
+
+RSS_SAMPLE_INTERVAL = 0.05
+
+QUERIES = {
+    'version': '{ version }',
+    'tasks': """
+        {
+            tasks(filterString: "rows={rows}") {
+                nodes { id name status progress owner creationTime }
+                counts { filtered total }
+            }
+        }
+    """,
+    'results': """
+        {
+            results(filterString: "rows={rows}") {
+                nodes {
+                    id name severity qod { value type }
+                    host { ip hostname }
+                    information { ... on ResultNVT { id } }
+                }
+                counts { filtered total }
+            }
+        }
+    """,
+    'hosts': """
+        {
+            hosts(filterString: "rows={rows}") {
+                nodes { id name severity modificationTime }
+                counts { filtered total }
+            }
+        }
+    """,
+    'operatingSystems': """
+        {
+            operatingSystems(filterString: "rows={rows}") {
+                nodes { id name modificationTime inUse }
+                counts { filtered total }
+            }
+        }
+    """,
+    'cves': """
+        {
+            cves(filterString: "rows={rows}") {
+                nodes { id name score cvssVector updateTime }
+                counts { filtered total }
+            }
+        }
+    """,
+    'nvts': """
+        {
+            nvts(filterString: "rows={rows}") {
+                nodes { id name family severities { score } }
+                counts { filtered total }
+            }
+        }
+    """,
+    'certBundAdvisories': """
+        {
+            certBundAdvisories(filterString: "rows={rows}") {
+                nodes { id name title cveRefs }
+                counts { filtered total }
+            }
+        }
+    """,
+    'dfnCertAdvisories': """
+        {
+            dfnCertAdvisories(filterString: "rows={rows}") {
+                nodes { id name title score }
+                counts { filtered total }
+            }
+        }
+    """,
+    'notes': """
+        {
+            notes(filterString: "rows={rows}") {
+                nodes { id text active }
+                counts { filtered total }
+            }
+        }
+    """,
+    'overrides': """
+        {
+            overrides(filterString: "rows={rows}") {
+                nodes { id text active newSeverity }
+                counts { filtered total }
+            }
+        }
+    """,
+    'dashboard': """
+        {
+            tasks(filterString: "rows={rows}") {
+                nodes { id name status }
+            }
+            results(filterString: "rows={rows}") {
+                nodes { id name severity }
+            }
+            hosts(filterString: "rows={rows}") {
+                nodes { id name severity }
+            }
+        }
+    """,
+}
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of the sorted values"""
+    if not values:
+        return math.nan
+
+    rank = math.ceil(percent / 100 * len(values))
+    return values[max(rank, 1) - 1]
+
+
+def _get_rss(pid: Optional[int]) -> Optional[int]:
+    try:
+        with open(f'/proc/{pid or "self"}/statm', encoding='ascii') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return pages * resource.getpagesize()
+
+
+class RssSampler:
+    """Sample the peak resident set size of a process in a thread"""
+
+    def __init__(self, pid: Optional[int] = None):
+        self.pid = pid
+        self.peak = 0
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        rss = _get_rss(self.pid)
+        if rss is not None:
+            self.peak = max(self.peak, rss)
+
+    def _run(self):
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            self._sample()
+
+    def __enter__(self) -> 'RssSampler':
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+        if not self.peak and self.pid is None:
+            # ru_maxrss is in KiB on Linux
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.peak *= 1024
+
+
+def _has_errors(status: int, content: bytes) -> bool:
+    if status != 200:
+        return True
+
+    try:
+        return bool(json.loads(content).get('errors'))
+    except ValueError:
+        return True
+
+
+class InProcessClient:
+    """Send queries to the GraphQL view via the Django test client
+
+    Each thread uses its own logged in client.
+    """
+
+    def __init__(self, username: str, password: str):
+        self.username = username
+        self.password = password
+
+        self._local = threading.local()
+
+    def _get_client(self):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            # pylint: disable=import-outside-toplevel
+            from django.test import Client
+
+            client = Client()
+            session = client.session
+            session['username'] = self.username
+            session['password'] = self.password
+            session.save()
+
+            self._local.client = client
+
+        return client
+
+    def query(self, query: str) -> bool:
+        response = self._get_client().post(
+            '/graphql/',
+            json.dumps({'query': query}),
+            content_type='application/json',
+        )
+        content = (
+            b''.join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+        return not _has_errors(response.status_code, content)
+
+
+class HttpClient:
+    """Send queries to a running selene server
+
+    Each thread uses its own session which is logged in via the login
+    mutation.
+    """
+
+    def __init__(self, url: str, username: str, password: str):
+        self.url = url
+        self.username = username
+        self.password = password
+
+        self._local = threading.local()
+
+    def _post(self, opener, query: str) -> bool:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({'query': query}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+        )
+        try:
+            with opener.open(request) as response:
+                return not _has_errors(response.status, response.read())
+        except OSError:
+            return False
+
+    def _get_opener(self):
+        opener = getattr(self._local, 'opener', None)
+        if opener is None:
+            opener = urllib.request.build_opener(
+                urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+            )
+            login = 'mutation { login(username: %s, password: %s) { ok } }' % (
+                json.dumps(self.username),
+                json.dumps(self.password),
+            )
+            if not self._post(opener, login):
+                raise RuntimeError(f'Could not login at {self.url}')
+
+            self._local.opener = opener
+
+        return opener
+
+    def query(self, query: str) -> bool:
+        return self._post(self._get_opener(), query)
+
+
+def run_query(
+    send: Callable[[str], bool],
+    name: str,
+    query: str,
+    *,
+    requests: int,
+    concurrency: int,
+    pid: Optional[int] = None,
+) -> Dict[str, float]:
+    def timed(_index: int) -> float:
+        start = time.perf_counter()
+        ok = send(query)
+        duration = time.perf_counter() - start
+        return duration if ok else -duration
+
+    # warm up each worker, e.g. login and cache the parsed document
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, range(concurrency)))
+
+        with RssSampler(pid) as sampler:
+            start = time.perf_counter()
+            durations = list(pool.map(timed, range(requests)))
+            elapsed = time.perf_counter() - start
+
+    latencies = sorted(abs(duration) for duration in durations)
+
+    return {
+        'query': name,
+        'requests': requests,
+        'errors': sum(1 for duration in durations if duration < 0),
+        'rps': requests / elapsed if elapsed else math.inf,
+        'p50': percentile(latencies, 50) * 1000,
+        'p95': percentile(latencies, 95) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+        'peak_rss': sampler.peak / (1024 * 1024),
+    }
+
+
+def _parse_setting(value: str):
+    key, sep, setting = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError('Setting must be KEY=VALUE')
+
+    try:
+        return key, json.loads(setting)
+    except ValueError:
+        return key, setting
+
+
+def _print_report(reports: List[Dict[str, float]]):
+    header = (
+        f'{"query":<20} {"requests":>8} {"errors":>6} {"req/s":>9} '
+        f'{"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"RSS MiB":>8}'
+    )
+    print(header)
+    print('-' * len(header))
+
+    for report in reports:
+        print(
+            f'{report["query"]:<20} {report["requests"]:>8} '
+            f'{report["errors"]:>6} {report["rps"]:>9.1f} '
+            f'{report["p50"]:>8.2f} {report["p95"]:>8.2f} '
+            f'{report["p99"]:>8.2f} {report["peak_rss"]:>8.1f}'
+        )
+
+
+def _setup_django(socket_path: str, settings: Dict[str, object]):
+    os.environ['SELENE_BENCHMARK_GMP_SOCKET'] = socket_path
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'selene.benchmarks.settings'
+    )
+
+    # pylint: disable=import-outside-toplevel
+    import django
+    from django.conf import settings as django_settings
+
+    django.setup()
+
+    django_settings.SELENE = {**django_settings.SELENE, **settings}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--queries',
+        default=','.join(QUERIES),
+        help='Comma separated list of queries (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help='Number of requests per query (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='Number of concurrent clients (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=DEFAULT_SIZE,
+        help='Number of entities of each type in the fake gvmd '
+        '(default: %(default)s)',
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Number of entities per page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--selene-setting',
+        metavar='KEY=VALUE',
+        type=_parse_setting,
+        action='append',
+        default=[],
+        help='Override a SELENE setting of the in-process view. The value '
+        'is parsed as JSON if possible.',
+    )
+    parser.add_argument(
+        '--url',
+        help='GraphQL url of a running server instead of calling the view '
+        'in-process',
+    )
+    parser.add_argument(
+        '--server-pid',
+        type=int,
+        help='Pid of the server process for measuring the RSS',
+    )
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin')
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.queries.split(',') if name]
+    unknown = [name for name in names if name not in QUERIES]
+    if unknown:
+        parser.error(f'Unknown queries {", ".join(unknown)}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.url:
+            client = HttpClient(args.url, args.username, args.password)
+            pid = args.server_pid
+            server = None
+        else:
+            # pylint: disable=import-outside-toplevel
+            from selene.benchmarks.gvmd import create_fake_gvmd
+
+            socket_path = str(Path(directory) / 'gvmd.sock')
+            os.environ['SELENE_BENCHMARK_SESSION_DIR'] = directory
+            _setup_django(socket_path, dict(args.selene_setting))
+
+            client = InProcessClient(args.username, args.password)
+            pid = None
+            server = create_fake_gvmd(socket_path, size=args.size)
+
+        reports = []
+
+        with server or open(os.devnull, encoding='ascii'):
+            for name in names:
+                query = QUERIES[name].replace('{rows}', str(args.rows))
+                reports.append(
+                    run_query(
+                        client.query,
+                        name,
+                        query,
+                        requests=args.requests,
+                        concurrency=args.concurrency,
+                        pid=pid,
+                    )
+                )
+
+    if args.json:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+    else:
+        _print_report(reports)
+
+    if any(report['errors'] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
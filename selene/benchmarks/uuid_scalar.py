@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Micro-benchmark of resolving the IDs of a large results page
+
+Resolves and serializes the IDs of a query like
+
+    results(first: 10000) {
+        nodes { id task { id } report { id } host { id } }
+    }
+
+once like before, by parsing each ID into an UUID object which is
+serialized into a string again, and once by passing the IDs returned by
+gvmd through the UUID scalar.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from typing import Callable, Dict, List, Optional
+
+from selene.benchmarks.records import create_page
+
+DEFAULT_ROWS = 10000
+DEFAULT_NUMBER = 5
+
+
+def get_page_ids(rows: int) -> List[Optional[str]]:
+    """Return the IDs of the results, tasks, reports and hosts of a page"""
+    ids = []
+
+    for element in create_page('results', rows):
+        ids.append(element.get('id'))
+        ids.append(element.find('task').get('id'))
+        ids.append(element.find('report').get('id'))
+        ids.append(element.find('host/asset').get('asset_id'))
+
+    return ids
+
+
+def previous_resolve(value: Optional[str]) -> Optional[str]:
+    # pylint: disable=import-outside-toplevel
+    import graphene
+
+    from selene.schema.parser import parse_uuid
+
+    uuid = parse_uuid(value)
+    return graphene.UUID.serialize(uuid) if uuid is not None else None
+
+
+def current_resolve(value: Optional[str]) -> Optional[str]:
+    # pylint: disable=import-outside-toplevel
+    from selene.schema.scalars import UUIDType
+
+    value = value or None
+    return UUIDType.serialize(value) if value is not None else None
+
+
+def measure(
+    func: Callable[[Optional[str]], Optional[str]],
+    ids: List[Optional[str]],
+    number: int,
+) -> float:
+    """Return the mean duration of resolving all IDs in milliseconds"""
+
+    def run():
+        for value in ids:
+            func(value)
+
+    duration = min(timeit.repeat(run, number=number, repeat=3))
+    return duration / number * 1e3
+
+
+def run_benchmark(rows: int, number: int) -> Dict[str, float]:
+    ids = get_page_ids(rows)
+
+    for value in ids:
+        if previous_resolve(value) != current_resolve(value):
+            raise ValueError(f'Different ID for {value}')
+
+    return {
+        'ids': len(ids),
+        'previous': measure(previous_resolve, ids, number),
+        'current': measure(current_resolve, ids, number),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n', maxsplit=1)[0]
+    )
+    parser.add_argument(
+        '--rows',
+        type=int,
+        default=DEFAULT_ROWS,
+        help='Number of results of the page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=DEFAULT_NUMBER,
+        help='Number of runs over the page (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the report as JSON'
+    )
+    args = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    import django
+
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'selene.benchmarks.settings'
+    )
+    django.setup()
+
+    report = run_benchmark(args.rows, args.number)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+
+    print(
+        f'Mean duration of resolving {report["ids"]} IDs of {args.rows} '
+        'results (milliseconds)'
+    )
+    print(f'  previous {report["previous"]:.2f}')
+    print(f'  current  {report["current"]:.2f}')
+
+
+if __name__ == '__main__':
+    main()
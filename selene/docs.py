@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Precomputed documentation of the GraphQL schema
+
+Rendering the documentation of the whole schema via graphdoc takes most of a
+second and results in a few MiB of HTML. The documentation is therefore only
+rendered once per version of the schema and kept in memory together with a
+gzip compressed copy. The version is the hash of the printed schema and is
+used as ETag.
+
+The `graphqldocs` management command writes both files below STATIC_ROOT,
+from where the web server can serve them directly.
+"""
+
+import gzip
+import hashlib
+import io
+import threading
+
+from pathlib import Path
+from typing import Dict
+
+import graphdoc
+
+from graphql.type.schema import GraphQLSchema
+from graphql.utils.schema_printer import print_schema
+
+# location of the documentation below STATIC_ROOT and STATIC_URL
+STATIC_DIRECTORY = 'selene/docs'
+
+_lock = threading.Lock()
+_versions: Dict[int, str] = {}
+_docs: Dict[int, 'SchemaDocs'] = {}
+
+
+def get_schema_version(schema: GraphQLSchema) -> str:
+    """Return the hash of the printed schema"""
+    version = _versions.get(id(schema))
+    if version is None:
+        printed = print_schema(schema)
+        version = hashlib.sha256(printed.encode('utf-8')).hexdigest()[:16]
+        _versions[id(schema)] = version
+    return version
+
+
+def get_static_path(version: str) -> str:
+    """Return the path of the documentation relative to STATIC_ROOT"""
+    return f'{STATIC_DIRECTORY}/{version}/index.html'
+
+
+def _compress(content: bytes) -> bytes:
+    # gzip.compress doesn't support setting the mtime in Python 3.7. A fixed
+    # mtime keeps the compressed file identical for the same schema.
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode='wb', compresslevel=9, mtime=0
+    ) as f:
+        f.write(content)
+    return buffer.getvalue()
+
+
+class SchemaDocs:
+    """The rendered documentation of a schema version"""
+
+    def __init__(self, version: str, html: str):
+        self.version = version
+        self.etag = f'"{version}"'
+        self.content = html.encode('utf-8')
+        self.compressed = _compress(self.content)
+
+    def write(self, static_root: Path) -> Path:
+        """Write the documentation and its compressed copy below static_root
+
+        Returns the path of the written HTML file.
+        """
+        path = Path(static_root) / get_static_path(self.version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        path.write_bytes(self.content)
+        path.with_name(path.name + '.gz').write_bytes(self.compressed)
+
+        return path
+
+
+def get_docs(schema: GraphQLSchema) -> SchemaDocs:
+    """Return the documentation of a schema, rendering it on the first call"""
+    docs = _docs.get(id(schema))
+    if docs is not None:
+        return docs
+
+    # render the documentation only once if requested concurrently
+    with _lock:
+        docs = _docs.get(id(schema))
+        if docs is None:
+            docs = SchemaDocs(
+                get_schema_version(schema), graphdoc.to_doc(schema)
+            )
+            _docs[id(schema)] = docs
+        return docs
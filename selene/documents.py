@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Caching of GraphQL documents and support for persisted queries
+
+Parsing and validating a query against the schema is expensive compared to
+the small number of distinct queries sent by a frontend. Valid documents are
+therefore kept in a LRU cache keyed by the SHA-256 hash of the query.
+
+Persisted queries allow clients to send only the SHA-256 hash of a query via
+the `persistedQuery` extension of the automatic persisted queries protocol:
+
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": "..."}}}
+
+The queries are either loaded from a JSON file mapping the hashes to the
+queries or registered by clients sending the hash together with the query.
+"""
+
+import hashlib
+import json
+import threading
+
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, Hashable, List, Optional
+
+from django.http import HttpResponse
+
+from graphene_django.views import HttpError
+
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult, execute
+from graphql.language.ast import Document
+from graphql.language.base import parse
+from graphql.type.schema import GraphQLSchema
+from graphql.validation import validate
+
+DEFAULT_DOCUMENT_CACHE_SIZE = 128
+DEFAULT_PERSISTED_QUERIES_CACHE_SIZE = 256
+
+PERSISTED_QUERY_VERSION = 1
+
+
+def get_query_hash(query: str) -> str:
+    """Return the SHA-256 hash of a query as hex string"""
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+def _invalid_result(
+    errors: List[GraphQLError], *_args, **_kwargs
+) -> ExecutionResult:
+    return ExecutionResult(errors=errors, invalid=True)
+
+
+class CachedDocumentBackend(GraphQLCoreBackend):
+    """A GraphQL backend caching parsed and validated documents
+
+    Only valid documents are cached. Because a cached document has been
+    validated already it isn't validated again on execution.
+
+    Arguments:
+        max_size: Maximum number of cached documents
+        executor: Executor passed to the execution of the documents
+    """
+
+    def __init__(
+        self, *, max_size: int = DEFAULT_DOCUMENT_CACHE_SIZE, executor=None
+    ):
+        super().__init__(executor=executor)
+
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._documents: Dict[Hashable, GraphQLDocument] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._documents)
+
+    def document_from_string(
+        self, schema: GraphQLSchema, document_string: Any
+    ) -> GraphQLDocument:
+        if not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        key = (id(schema), get_query_hash(document_string))
+
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None and document.schema is schema:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document
+
+            self.misses += 1
+
+        document_ast = parse(document_string)
+
+        errors = validate(schema, document_ast)
+        if errors:
+            # return the validation errors on execution like the default
+            # backend does
+            return GraphQLDocument(
+                schema=schema,
+                document_string=document_string,
+                document_ast=document_ast,
+                execute=partial(_invalid_result, errors),
+            )
+
+        return self._add(key, schema, document_string, document_ast)
+
+    def _add(
+        self,
+        key: Hashable,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast: Document,
+    ) -> GraphQLDocument:
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(
+                execute, schema, document_ast, **self.execute_params
+            ),
+        )
+
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+        return document
+
+    def preload(
+        self, schema: GraphQLSchema, document_string: str
+    ) -> List[GraphQLError]:
+        """Parse, validate and cache a document before it is requested
+
+        Returns the syntax or validation errors of the document. Invalid
+        documents are not cached.
+        """
+        try:
+            document_ast = parse(document_string)
+        except GraphQLError as e:
+            return [e]
+
+        errors = validate(schema, document_ast)
+        if not errors:
+            key = (id(schema), get_query_hash(document_string))
+            self._add(key, schema, document_string, document_ast)
+
+        return errors
+
+
+class PersistedQueryError(HttpError):
+    """Error of the persisted queries protocol
+
+    The error code is returned as `code` in the extensions of the error.
+    """
+
+    def __init__(self, message: str, code: str, status: int = 400):
+        super().__init__(HttpResponse(status=status), message)
+
+        self.code = code
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    def __init__(self):
+        # clients only send the query along with the hash after this error
+        # has been returned with a successful status
+        super().__init__(
+            'PersistedQueryNotFound', 'PERSISTED_QUERY_NOT_FOUND', status=200
+        )
+
+
+class PersistedQueryNotSupported(PersistedQueryError):
+    def __init__(self):
+        super().__init__(
+            'PersistedQueryNotSupported',
+            'PERSISTED_QUERY_NOT_SUPPORTED',
+            status=200,
+        )
+
+
+class PersistedQueries:
+    """A store for queries identified by their SHA-256 hash
+
+    Queries passed on creation are always kept. Queries registered by clients
+    are kept in a LRU cache of max_size entries. A max_size of 0 disables the
+    registration of queries by clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_PERSISTED_QUERIES_CACHE_SIZE,
+        queries: Optional[Dict[str, str]] = None,
+    ):
+        self.max_size = max_size
+
+        self._queries = dict(queries or {})
+        self._registered: Dict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+        for query_hash, query in self._queries.items():
+            if get_query_hash(query) != query_hash:
+                raise ValueError(
+                    f'Hash {query_hash} does not match the persisted query'
+                )
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'PersistedQueries':
+        """Load the persisted queries from a JSON file
+
+        The file must contain an object mapping the SHA-256 hashes to the
+        queries.
+        """
+        with open(path, encoding='utf-8') as f:
+            queries = json.load(f)
+
+        return cls(queries=queries, **kwargs)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queries) + len(self._registered)
+
+    @property
+    def persisted(self) -> Dict[str, str]:
+        """The queries passed on creation mapped by their hash"""
+        return dict(self._queries)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._queries) or self.max_size > 0
+
+    def get(self, query_hash: str) -> Optional[str]:
+        query = self._queries.get(query_hash)
+        if query is not None:
+            return query
+
+        with self._lock:
+            query = self._registered.get(query_hash)
+            if query is not None:
+                self._registered.move_to_end(query_hash)
+            return query
+
+    def register(self, query_hash: str, query: str):
+        """Store a query sent by a client"""
+        if get_query_hash(query) != query_hash:
+            raise PersistedQueryError(
+                'provided sha does not match query', 'INVALID_HASH'
+            )
+
+        if self.max_size <= 0 or query_hash in self._queries:
+            return
+
+        with self._lock:
+            self._registered[query_hash] = query
+            self._registered.move_to_end(query_hash)
+
+            while len(self._registered) > self.max_size:
+                self._registered.popitem(last=False)
+
+    def resolve(
+        self, query: Optional[str], persisted_query: Dict[str, Any]
+    ) -> str:
+        """Return the query for the persistedQuery extension of a request
+
+        Registers the query if it is sent along with the hash.
+        """
+        if not self.enabled:
+            raise PersistedQueryNotSupported()
+
+        if not isinstance(persisted_query, dict):
+            raise PersistedQueryError(
+                'Invalid persisted query', 'INVALID_PERSISTED_QUERY'
+            )
+
+        if persisted_query.get('version') != PERSISTED_QUERY_VERSION:
+            raise PersistedQueryError(
+                'Unsupported persisted query version',
+                'INVALID_PERSISTED_QUERY',
+            )
+
+        query_hash = persisted_query.get('sha256Hash')
+        if not query_hash or not isinstance(query_hash, str):
+            raise PersistedQueryError(
+                'Missing sha256Hash of persisted query',
+                'INVALID_PERSISTED_QUERY',
+            )
+
+        if query:
+            self.register(query_hash, query)
+            return query
+
+        query = self.get(query_hash)
+        if query is None:
+            raise PersistedQueryNotFound()
+
+        return query
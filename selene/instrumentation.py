@@ -0,0 +1,564 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Timing instrumentation of requests
+
+If enabled the duration of each GMP command is measured separately for
+writing the command to the socket, waiting for the first bytes of the
+response, reading the rest of the response and parsing it. Additionally the
+time spent in the resolvers of each field and in the serialization of the
+response is measured.
+
+The timings of all requests are aggregated into the metrics of the worker
+process. The timings of a single request are added to the `extensions` of its
+response if the client sends the debug header.
+"""
+
+import inspect
+import json
+import logging
+import re
+import threading
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import unescape
+
+from graphql import ResolveInfo
+from graphql.error import GraphQLError
+from graphql.language.parser import parse
+from graphql.language.printer import print_ast
+from promise import Promise, is_thenable
+
+from gvm.connections import UnixSocketConnection
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.documents import get_query_hash
+from selene.metrics import REGISTRY, Counter, Histogram
+
+slow_query_logger = logging.getLogger('selene.slow_queries')
+
+GMP_COMMAND_PHASES = ('write', 'wait', 'read', 'parse')
+
+COMMAND_NAME_PATTERN = re.compile(r'\s*<([\w-]+)')
+FILTER_PATTERN = re.compile(r'\sfilter=(["\'])(.*?)\1', re.DOTALL)
+OPERATION_PATTERN = re.compile(
+    r'(?:^|[\s},])(query|mutation|subscription)\b\s*([_A-Za-z]\w*)?'
+)
+
+ANONYMOUS_OPERATION = 'anonymous'
+
+# values of variables with matching names are not logged
+SECRET_VARIABLE_PATTERN = re.compile(
+    r'pass|secret|token|private|credential|community|auth', re.IGNORECASE
+)
+REDACTED = '***'
+
+XML_ENTITIES = {'&quot;': '"', '&apos;': "'"}
+
+GMP_COMMAND_DURATION = REGISTRY.register(
+    Histogram(
+        'selene_gmp_command_duration_seconds',
+        'Duration of writing, waiting for, reading and parsing GMP commands',
+        labels=('command', 'phase'),
+    )
+)
+GMP_RECEIVED_BYTES = REGISTRY.register(
+    Counter(
+        'selene_gmp_received_bytes_total',
+        'Size of the GMP responses received from gvmd',
+        labels=('command',),
+    )
+)
+GMP_AUTHENTICATIONS = REGISTRY.register(
+    Counter(
+        'selene_gmp_authentications_total',
+        'Number of authenticate commands sent to gvmd',
+    )
+)
+RESOLVER_DURATION = REGISTRY.register(
+    Histogram(
+        'selene_graphql_resolver_duration_seconds',
+        'Time spent per request in the resolvers of a field',
+        labels=('field',),
+    )
+)
+SERIALIZATION_DURATION = REGISTRY.register(
+    Histogram(
+        'selene_graphql_serialization_duration_seconds',
+        'Duration of serializing GraphQL responses',
+    )
+)
+REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        'selene_graphql_request_duration_seconds',
+        'Duration of GraphQL requests',
+    )
+)
+GRAPHQL_OPERATIONS = REGISTRY.register(
+    Counter(
+        'selene_graphql_operations_total',
+        'Number of executed GraphQL operations',
+        labels=('type', 'operation'),
+    )
+)
+GRAPHQL_OPERATION_ERRORS = REGISTRY.register(
+    Counter(
+        'selene_graphql_operation_errors_total',
+        'Number of GraphQL operations resulting in errors',
+        labels=('type', 'operation'),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        'selene_cache_requests_total',
+        'Number of cache lookups',
+        labels=('cache', 'result'),
+    )
+)
+
+
+def get_command_name(command: Any) -> str:
+    if isinstance(command, bytes):
+        command = command[:128].decode('utf-8', errors='ignore')
+
+    match = COMMAND_NAME_PATTERN.match(str(command))
+    return match.group(1) if match else 'unknown'
+
+
+def get_command_filter(command: Any) -> Optional[str]:
+    """Return the filter string of a GMP command if it has one"""
+    if isinstance(command, bytes):
+        command = command.decode('utf-8', errors='ignore')
+
+    command = str(command)
+    end = command.find('>')
+    match = FILTER_PATTERN.search(command, 0, end if end >= 0 else None)
+    return unescape(match.group(2), XML_ENTITIES) if match else None
+
+
+def get_operation(
+    query: Optional[str], operation_name: Optional[str] = None
+) -> Tuple[str, str]:
+    """Return the type and name of the executed operation of a query
+
+    The query isn't parsed. Therefore the operation is only looked up by a
+    regular expression which is sufficient for the metrics.
+    """
+    if not query:
+        return 'unknown', operation_name or ANONYMOUS_OPERATION
+
+    for match in OPERATION_PATTERN.finditer(query):
+        operation_type, name = match.groups()
+        if not operation_name or name == operation_name:
+            return operation_type, name or ANONYMOUS_OPERATION
+
+    # shorthand query or an unknown operation name
+    return 'query', operation_name or ANONYMOUS_OPERATION
+
+
+def get_normalized_query_hash(query: Optional[str]) -> Optional[str]:
+    """Return the SHA-256 hash of a query independent of its formatting"""
+    if not query:
+        return None
+
+    try:
+        normalized = print_ast(parse(query))
+    except GraphQLError:
+        normalized = ' '.join(query.split())
+
+    return get_query_hash(normalized)
+
+
+def redact_variables(variables: Any) -> Any:
+    """Replace the values of variables which may contain secrets"""
+    if isinstance(variables, dict):
+        return {
+            name: (
+                REDACTED
+                if SECRET_VARIABLE_PATTERN.search(str(name))
+                else redact_variables(value)
+            )
+            for name, value in variables.items()
+        }
+
+    if isinstance(variables, list):
+        return [redact_variables(value) for value in variables]
+
+    return variables
+
+
+class CommandTiming:
+    """Timings of a single GMP command in seconds
+
+    Arguments:
+        command: The XML of the command
+        start: Time when sending the command started
+        write: Duration of writing the command
+    """
+
+    __slots__ = (
+        'command',
+        'filter_string',
+        'start',
+        'write',
+        'wait',
+        'read',
+        'parse',
+        'request_size',
+        'response_size',
+    )
+
+    def __init__(self, command: Any, *, start: float, write: float):
+        self.command = get_command_name(command)
+        self.filter_string = get_command_filter(command)
+        self.start = start
+        self.write = write
+        self.wait = 0.0
+        self.read = 0.0
+        self.parse = 0.0
+        self.request_size = len(command)
+        self.response_size = 0
+
+    @property
+    def duration(self) -> float:
+        return self.write + self.wait + self.read + self.parse
+
+    def observe(self):
+        for phase in GMP_COMMAND_PHASES:
+            GMP_COMMAND_DURATION.observe(
+                getattr(self, phase), self.command, phase
+            )
+
+        GMP_RECEIVED_BYTES.inc(self.command, value=self.response_size)
+
+        if self.command == 'authenticate':
+            GMP_AUTHENTICATIONS.inc()
+
+    def to_dict(self, offset: float = 0.0) -> Dict[str, Any]:
+        """Return the timings. The start is returned relative to offset."""
+        return {
+            'command': self.command,
+            'filter': self.filter_string,
+            'start': self.start - offset,
+            'duration': self.duration,
+            'write': self.write,
+            'wait': self.wait,
+            'read': self.read,
+            'parse': self.parse,
+            'requestSize': self.request_size,
+            'responseSize': self.response_size,
+        }
+
+
+class RequestTimings:
+    """Timings of a single request
+
+    The timings are collected from several threads if the root fields are
+    resolved in parallel.
+
+    Arguments:
+        debug: Whether the timings are returned to the client
+    """
+
+    def __init__(self, *, debug: bool = False):
+        self.debug = debug
+        self.start = perf_counter()
+        self.duration: Optional[float] = None
+        self.serialization: Optional[float] = None
+
+        self.operation_type: Optional[str] = None
+        self.operation_name: Optional[str] = None
+        self.query: Optional[str] = None
+        self.variables: Optional[Dict[str, Any]] = None
+
+        self.commands: List[CommandTiming] = []
+        # maps the fields to the number of resolver calls, the sum and the
+        # maximum of their durations
+        self.resolvers: Dict[str, List[Any]] = {}
+
+        self._lock = threading.Lock()
+
+    def set_operation(
+        self,
+        operation_type: str,
+        operation_name: str,
+        query: Optional[str],
+        variables: Optional[Dict[str, Any]],
+    ):
+        self.operation_type = operation_type
+        self.operation_name = operation_name
+        self.query = query
+        self.variables = variables
+
+    def get_commands(self) -> List[CommandTiming]:
+        """Return the timings of the GMP commands in the order they have been
+        sent
+        """
+        with self._lock:
+            return sorted(self.commands, key=lambda timing: timing.start)
+
+    def add_command(self, timing: CommandTiming):
+        with self._lock:
+            self.commands.append(timing)
+
+    def add_resolver(self, field: str, duration: float):
+        with self._lock:
+            resolver = self.resolvers.get(field)
+            if resolver is None:
+                self.resolvers[field] = [1, duration, duration]
+            else:
+                resolver[0] += 1
+                resolver[1] += duration
+                resolver[2] = max(resolver[2], duration)
+
+    def finish(self):
+        """Stop the timing of the request and add the timings to the
+        histograms
+
+        The GMP commands have been added to the histograms already.
+        """
+        if self.duration is not None:
+            return
+
+        self.duration = perf_counter() - self.start
+
+        REQUEST_DURATION.observe(self.duration)
+
+        if self.serialization is not None:
+            SERIALIZATION_DURATION.observe(self.serialization)
+
+        with self._lock:
+            resolvers = list(self.resolvers.items())
+
+        for field, (_, total, _) in resolvers:
+            RESOLVER_DURATION.observe(total, field)
+
+    def to_dict(self) -> Dict[str, Any]:
+        commands = [
+            timing.to_dict(self.start) for timing in self.get_commands()
+        ]
+
+        with self._lock:
+            resolvers = {
+                field: {'count': count, 'duration': total, 'max': maximum}
+                for field, (count, total, maximum) in self.resolvers.items()
+            }
+
+        gmp = {
+            phase: sum(command[phase] for command in commands)
+            for phase in GMP_COMMAND_PHASES
+        }
+        gmp['duration'] = sum(gmp.values())
+        gmp['commands'] = commands
+
+        duration = self.duration
+        if duration is None:
+            duration = perf_counter() - self.start
+
+        return {
+            'duration': duration,
+            'gmp': gmp,
+            'resolvers': resolvers,
+            'serialization': self.serialization,
+        }
+
+
+class TimedUnixSocketConnection(UnixSocketConnection):
+    """A unix socket connection to gvmd measuring the duration of writing a
+    command, waiting for the response and reading it
+
+    The timings of a command are completed by the TimedTransform of the
+    connection and are added to the timings of the request currently using
+    the connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.timings: Optional[RequestTimings] = None
+
+        self._command: Optional[CommandTiming] = None
+        self._first_data: Optional[float] = None
+        self._received = 0
+
+    def send(self, data):
+        start = perf_counter()
+        result = super().send(data)
+
+        self._command = CommandTiming(
+            data, start=start, write=perf_counter() - start
+        )
+
+        return result
+
+    def _read(self) -> bytes:
+        data = super()._read()
+
+        if self._first_data is None:
+            self._first_data = perf_counter()
+
+        self._received += len(data)
+
+        return data
+
+    def read(self) -> str:
+        self._first_data = None
+        self._received = 0
+
+        start = perf_counter()
+        response = super().read()
+        end = perf_counter()
+
+        command = self._command
+        if command is not None:
+            first_data = self._first_data or end
+            command.wait = first_data - start
+            command.read = end - first_data
+            command.response_size = self._received
+
+        return response
+
+    def finish_command(self, parse: float):
+        command = self._command
+        if command is None:
+            return
+
+        self._command = None
+
+        command.parse = parse
+        command.observe()
+
+        timings = self.timings
+        if timings is not None:
+            timings.add_command(command)
+
+
+class TimedTransform:
+    """Measure the duration of parsing a response of a
+    TimedUnixSocketConnection
+    """
+
+    def __init__(
+        self, transform: Callable[[str], Any], connection: Any
+    ) -> None:
+        self.transform = transform
+        self.connection = connection
+
+    def __call__(self, response: str) -> Any:
+        start = perf_counter()
+        try:
+            return self.transform(response)
+        finally:
+            self.connection.finish_command(perf_counter() - start)
+
+
+@contextmanager
+def record_timings(
+    gmp: Gmp, timings: Optional[RequestTimings]
+) -> Iterator[Gmp]:
+    """Add the timings of the commands sent via the connection of gmp to the
+    timings of a request
+    """
+    # pylint: disable=protected-access
+    connection = getattr(gmp, '_connection', None)
+
+    if timings is None or not isinstance(connection, TimedUnixSocketConnection):
+        yield gmp
+        return
+
+    connection.timings = timings
+    try:
+        yield gmp
+    finally:
+        connection.timings = None
+
+
+class TimingMiddleware:
+    """Graphene middleware measuring the duration of all resolvers
+
+    The durations are summed up per field. For resolvers returning a promise
+    or an awaitable the time until the result is available is measured.
+    """
+
+    def __init__(self, timings: RequestTimings):
+        self.timings = timings
+
+    def resolve(self, next_, root, info: ResolveInfo, **kwargs):
+        start = perf_counter()
+        result = next_(root, info, **kwargs)
+
+        field = f'{info.parent_type.name}.{info.field_name}'
+        timings = self.timings
+
+        if is_thenable(result):
+
+            def resolved(value):
+                timings.add_resolver(field, perf_counter() - start)
+                return value
+
+            def rejected(error):
+                timings.add_resolver(field, perf_counter() - start)
+                raise error
+
+            return Promise.resolve(result).then(resolved, rejected)
+
+        if inspect.isawaitable(result):
+
+            async def wait_for_result():
+                try:
+                    return await result
+                finally:
+                    timings.add_resolver(field, perf_counter() - start)
+
+            return wait_for_result()
+
+        timings.add_resolver(field, perf_counter() - start)
+        return result
+
+
+def log_slow_query(timings: RequestTimings):
+    """Log the operation and the GMP commands of a slow request
+
+    The query itself isn't logged because it may contain secrets, e.g. the
+    password of the login mutation. It is identified by the hash of the
+    normalized query instead.
+    """
+    duration = timings.duration
+    if duration is None:
+        duration = perf_counter() - timings.start
+
+    details = {
+        'type': timings.operation_type,
+        'operation': timings.operation_name,
+        'queryHash': get_normalized_query_hash(timings.query),
+        'variables': redact_variables(timings.variables),
+        'duration': duration,
+        'gmp': [
+            timing.to_dict(timings.start) for timing in timings.get_commands()
+        ],
+    }
+
+    slow_query_logger.warning(
+        'Slow GraphQL %s %s took %.3f s: %s',
+        timings.operation_type or 'operation',
+        timings.operation_name or ANONYMOUS_OPERATION,
+        duration,
+        json.dumps(details, default=str),
+    )
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019-2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Management command writing the documentation of the GraphQL schema"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from selene.docs import get_docs
+from selene.schema import schema
+
+
+class Command(BaseCommand):
+    help = (
+        'Render the documentation of the GraphQL schema and write it together '
+        'with a gzip compressed copy below STATIC_ROOT. Run it after '
+        'collectstatic because collectstatic --clear removes the files.'
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help='Directory to write the documentation to instead of '
+            'STATIC_ROOT',
+        )
+
+    def handle(self, *args, **options):
+        directory = options['output'] or getattr(settings, 'STATIC_ROOT', None)
+        if not directory:
+            raise CommandError('STATIC_ROOT is not set')
+
+        docs = get_docs(schema)
+        path = docs.write(directory)
+
+        self.stdout.write(
+            f'Wrote the documentation of schema version {docs.version} to '
+            f'{path}'
+        )
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2019-2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Management command building the schema and validating persisted queries"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from selene.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        'Import the modules of the schema, build it and validate the '
+        'persisted queries. Running it after an installation or update also '
+        'writes the bytecode caches of all imported modules.'
+    )
+    # the checks import the URLconf which would distort the measured time
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        report = warmup()
+
+        self.stdout.write(
+            f'Imported the views and built the schema in '
+            f'{report["import"]:.3f}s'
+        )
+        self.stdout.write(
+            f'Validated and cached {report["cachedDocuments"]} persisted '
+            f'queries in {report["documents"]:.3f}s'
+        )
+        self.stdout.write(f'Peak RSS {report["maxRss"] // 1024} MiB')
+
+        for query_hash, errors in report['errors'].items():
+            for error in errors:
+                self.stderr.write(f'Persisted query {query_hash}: {error}')
+
+        if report['errors']:
+            raise CommandError(
+                f'{len(report["errors"])} persisted queries are invalid'
+            )
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Request scoped memoization of GMP responses
+
+A single GraphQL document may request the same data several times, e.g. via
+aliases or via a single entity and a list query. The MemoizedGmp wraps the Gmp
+instance of a request and only sends identical read-only commands once.
+"""
+
+import threading
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.schema.parser import get_canonical_filter_string
+
+READ_ONLY_COMMAND_PREFIX = 'get_'
+READ_ONLY_COMMANDS = frozenset(['help'])
+
+
+def is_read_only_command(name: str) -> bool:
+    return name.startswith(READ_ONLY_COMMAND_PREFIX) or (
+        name in READ_ONLY_COMMANDS
+    )
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def get_memo_key(
+    name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """Return a key for a GMP command or None if it can't be memoized
+
+    Equivalent filter strings result in the same key.
+    """
+    filter_string = kwargs.get('filter_string')
+    if isinstance(filter_string, str):
+        kwargs = {
+            **kwargs,
+            'filter_string': get_canonical_filter_string(filter_string),
+        }
+
+    key = (name, _freeze(args), _freeze(kwargs))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class MemoizedGmp:
+    """Wraps a Gmp instance to deduplicate read-only commands
+
+    Responses of `get_*` and `help` commands are memoized for the lifetime of
+    the instance, which is a single HTTP request. All other commands are
+    considered to change data in gvmd and invalidate the memoized responses.
+
+    Args:
+        gmp: The wrapped Gmp instance
+        on_change: Optional callable called after a command which may have
+            changed data in gvmd
+    """
+
+    def __init__(self, gmp: Gmp, on_change: Callable[[], None] = None):
+        self._gmp = gmp
+        self._memo = {}
+        self._lock = threading.Lock()
+        self._on_change = on_change
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def gmp(self) -> Gmp:
+        """The wrapped Gmp instance"""
+        return self._gmp
+
+    def invalidate(self):
+        with self._lock:
+            self._memo.clear()
+
+    def _memoize(self, name: str, command: Callable) -> Callable:
+        def call(*args, **kwargs):
+            key = get_memo_key(name, args, kwargs)
+            if key is None:
+                return command(*args, **kwargs)
+
+            with self._lock:
+                if key in self._memo:
+                    self.hits += 1
+                    return self._memo[key]
+
+            response = command(*args, **kwargs)
+
+            with self._lock:
+                self.misses += 1
+                self._memo[key] = response
+
+            return response
+
+        return call
+
+    def _invalidating(self, command: Callable) -> Callable:
+        def call(*args, **kwargs):
+            self.invalidate()
+            try:
+                return command(*args, **kwargs)
+            finally:
+                # the memo may have been filled while the command was running
+                self.invalidate()
+                if self._on_change is not None:
+                    self._on_change()
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+
+        if not callable(attr) or name.startswith(('_', 'is_')):
+            return attr
+
+        if is_read_only_command(name):
+            return self._memoize(name, attr)
+
+        return self._invalidating(attr)
@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Metrics in the Prometheus text format
+
+The metrics are kept in memory of each worker process. Updating a metric only
+takes a lock and increments a few numbers.
+
+With several worker processes, e.g. when running uWSGI, each worker writes a
+snapshot of its metrics into a shared directory at most once per flush
+interval. The metrics view merges the snapshots of all workers. Counters and
+histograms are summed up, even for workers which have exited already. Gauges
+are exported per process and only for running processes.
+"""
+
+import atexit
+import json
+import logging
+import math
+import os
+import resource
+import tempfile
+import threading
+import time
+
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# upper bounds of the histogram buckets in seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# label values used if a metric has too many distinct label values
+OTHER_LABEL_VALUE = '__other__'
+DEFAULT_MAX_LABEL_VALUES = 500
+
+DEFAULT_FLUSH_INTERVAL = 5  # in seconds
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+SNAPSHOT_PREFIX = 'selene-'
+SNAPSHOT_SUFFIX = '.json'
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """Base class of all metrics
+
+    Metrics with labels keep at most max_label_values distinct label values.
+    Afterwards new label values are replaced by OTHER_LABEL_VALUE.
+    """
+
+    type = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        *,
+        labels: Labels = (),
+        max_label_values: int = DEFAULT_MAX_LABEL_VALUES,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.max_label_values = max_label_values
+
+        self._samples: Dict[Labels, Any] = {}
+        self._lock = threading.Lock()
+
+    def _check_labels(self, label_values: Labels) -> Labels:
+        if len(label_values) != len(self.labels):
+            raise ValueError(
+                f'Metric {self.name} requires the labels '
+                f'{", ".join(self.labels)}'
+            )
+
+        if (
+            label_values not in self._samples
+            and len(self._samples) >= self.max_label_values
+        ):
+            return (OTHER_LABEL_VALUE,) * len(label_values)
+
+        return label_values
+
+    def collect(self) -> Dict[Labels, Any]:
+        with self._lock:
+            return dict(self._samples)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type,
+            'help': self.description,
+            'labels': list(self.labels),
+            'samples': [
+                [list(label_values), value]
+                for label_values, value in self.collect().items()
+            ],
+        }
+
+
+class Counter(Metric):
+    """A monotonically increasing value
+
+    Callbacks returning the values of counters maintained elsewhere, e.g. the
+    hits of a cache, are added to the counted values on collection.
+    """
+
+    type = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._callbacks: List[Callable[[], Dict[Labels, float]]] = []
+
+    def inc(self, *label_values: str, value: float = 1):
+        with self._lock:
+            label_values = self._check_labels(label_values)
+            self._samples[label_values] = (
+                self._samples.get(label_values, 0) + value
+            )
+
+    def add_callback(self, callback: Callable[[], Dict[Labels, float]]):
+        self._callbacks.append(callback)
+
+    def collect(self) -> Dict[Labels, float]:
+        samples = super().collect()
+
+        for callback in self._callbacks:
+            for label_values, value in callback().items():
+                samples[label_values] = samples.get(label_values, 0) + value
+
+        return samples
+
+
+class Gauge(Metric):
+    """A value which is read on collection"""
+
+    type = 'gauge'
+
+    def __init__(self, name: str, description: str, function: Callable):
+        super().__init__(name, description)
+
+        self.function = function
+
+    def collect(self) -> Dict[Labels, float]:
+        value = self.function()
+        return {} if value is None else {(): value}
+
+
+class Histogram(Metric):
+    """A thread safe histogram of observed values
+
+    Like a Prometheus histogram the collected counts of the buckets are
+    cumulative and the last bucket with an infinite upper bound counts all
+    observations.
+    """
+
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        *,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        **kwargs,
+    ):
+        super().__init__(name, description, **kwargs)
+
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            label_values = self._check_labels(label_values)
+
+            # the non-cumulative bucket counts, the sum and the number of
+            # observations
+            sample = self._samples.get(label_values)
+            if sample is None:
+                sample = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._samples[label_values] = sample
+
+            sample[0][index] += 1
+            sample[1] += value
+            sample[2] += 1
+
+    def collect(self) -> Dict[Labels, Tuple[List[int], float, int]]:
+        """Return the cumulative bucket counts, the sum and the number of
+        observations per label values
+        """
+        with self._lock:
+            samples = {
+                label_values: (list(counts), total, count)
+                for label_values, (counts, total, count) in (
+                    self._samples.items()
+                )
+            }
+
+        for counts, _, _ in samples.values():
+            for index in range(1, len(counts)):
+                counts[index] += counts[index - 1]
+
+        return samples
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data['buckets'] = list(self.buckets)
+        return data
+
+
+class Registry:
+    """The metrics exported by a process"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric {metric.name} already registered')
+            self._metrics[metric.name] = metric
+        return metric
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._metrics.values()))
+
+    def clear(self):
+        for metric in self:
+            metric.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {metric.name: metric.to_dict() for metric in self}
+
+
+REGISTRY = Registry()
+
+
+def get_rss() -> Optional[int]:
+    """Return the resident set size of the current process in bytes"""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        pass
+
+    # the maximum resident set size in KiB as fallback
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+PROCESS_RSS = REGISTRY.register(
+    Gauge(
+        'selene_process_resident_memory_bytes',
+        'Resident memory of the worker process',
+        get_rss,
+    )
+)
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_snapshots(
+    snapshots: Iterable[Tuple[int, Dict[str, Dict[str, Any]]]]
+) -> Dict[str, Dict[str, Any]]:
+    """Merge the metric snapshots of several processes
+
+    Counters and histograms are summed up. The samples of gauges get an
+    additional pid label.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    values: Dict[str, Dict[Labels, Any]] = {}
+
+    for pid, snapshot in snapshots:
+        for name, metric in snapshot.items():
+            merged_metric = merged.get(name)
+            if merged_metric is None:
+                merged_metric = {**metric}
+                if metric['type'] == 'gauge':
+                    merged_metric['labels'] = metric['labels'] + ['pid']
+                merged[name] = merged_metric
+                values[name] = {}
+
+            samples = values[name]
+
+            for label_values, value in metric['samples']:
+                label_values = tuple(label_values)
+
+                if metric['type'] == 'gauge':
+                    samples[label_values + (str(pid),)] = value
+                elif metric['type'] == 'histogram':
+                    current = samples.get(label_values)
+                    if current is None:
+                        samples[label_values] = value
+                    else:
+                        samples[label_values] = [
+                            [a + b for a, b in zip(current[0], value[0])],
+                            current[1] + value[1],
+                            current[2] + value[2],
+                        ]
+                else:
+                    samples[label_values] = samples.get(label_values, 0) + value
+
+    for name, merged_metric in merged.items():
+        merged_metric['samples'] = [
+            [list(label_values), value]
+            for label_values, value in values[name].items()
+        ]
+
+    return merged
+
+
+class MetricsStore:
+    """Shares the metrics of the worker processes via an existing directory
+
+    Each process writes its snapshot into its own file. The files are
+    replaced atomically, so they can be read at any time without locking.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        registry: Registry = REGISTRY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.directory = Path(directory)
+        self.registry = registry
+        self.flush_interval = flush_interval
+
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+        atexit.register(self._flush_at_exit)
+
+    def _get_path(self, pid: int) -> Path:
+        return self.directory / f'{SNAPSHOT_PREFIX}{pid}{SNAPSHOT_SUFFIX}'
+
+    def flush(self):
+        """Write the snapshot of the current process"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+
+            data = json.dumps(
+                {'pid': os.getpid(), 'metrics': self.registry.to_dict()},
+                separators=(',', ':'),
+            )
+
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=str(self.directory), prefix='.tmp-'
+                )
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, str(self._get_path(os.getpid())))
+            except OSError as e:
+                logger.warning('Could not write metrics snapshot: %s', e)
+
+    def _flush_at_exit(self):
+        if self.directory.is_dir():
+            self.flush()
+
+    def maybe_flush(self):
+        """Write the snapshot if the flush interval has passed
+
+        Skipped if another thread is writing the snapshot currently.
+        """
+        if time.monotonic() - self._last_flush < self.flush_interval:
+            return
+
+        if self._lock.locked():
+            return
+
+        self.flush()
+
+    def load(self) -> List[Tuple[int, Dict[str, Dict[str, Any]]]]:
+        snapshots = []
+
+        for path in self.directory.glob(f'{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}'):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                pid = int(data['pid'])
+                metrics = data['metrics']
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.debug('Ignoring metrics snapshot %s: %s', path, e)
+                continue
+
+            if not _is_running(pid):
+                # only the counted values of exited processes are kept
+                metrics = {
+                    name: metric
+                    for name, metric in metrics.items()
+                    if metric['type'] != 'gauge'
+                }
+
+            snapshots.append((pid, metrics))
+
+        return snapshots
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Return the merged metrics of all processes"""
+        self.flush()
+        return merge_snapshots(self.load())
+
+
+def _escape(value: str) -> str:
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\n', '\\n')
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    labels = ','.join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return f'{{{labels}}}' if labels else ''
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return f'{value:.1f}'
+    return repr(value)
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == math.inf else repr(float(bound))
+
+
+def render(metrics: Dict[str, Dict[str, Any]]) -> str:
+    """Render metrics in the Prometheus text exposition format"""
+    lines = []
+
+    for name, metric in sorted(metrics.items()):
+        metric_type = metric['type']
+        label_names = metric['labels']
+
+        lines.append(f'# HELP {name} {_escape(metric["help"])}')
+        lines.append(f'# TYPE {name} {metric_type}')
+
+        for label_values, value in sorted(
+            metric['samples'], key=lambda sample: sample[0]
+        ):
+            if metric_type != 'histogram':
+                labels = _format_labels(label_names, label_values)
+                lines.append(f'{name}{labels} {_format_value(value)}')
+                continue
+
+            counts, total, count = value
+            bounds = list(metric['buckets']) + [math.inf]
+
+            for bound, bucket_count in zip(bounds, counts):
+                labels = _format_labels(
+                    label_names + ['le'],
+                    list(label_values) + [_format_bound(bound)],
+                )
+                lines.append(f'{name}_bucket{labels} {bucket_count}')
+
+            labels = _format_labels(label_names, label_values)
+            lines.append(f'{name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{name}_count{labels} {count}')
+
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Parallel resolution of root fields
+
+A query like a dashboard requesting tasks, reports and results at once sends
+independent GMP commands. By default these commands are sent one after
+another via the single connection of the request.
+
+The ParallelRootFieldExecutor resolves the root fields of a query in worker
+threads. The GmpConnectionGroup is used as the Gmp instance of the request and
+sends each command via an exclusively checked out connection. Additional
+authenticated connections are opened on demand up to a limit, which also
+limits the number of commands gvmd has to process in parallel for a request.
+
+Root fields loading single entities via an entity loader are resolved in the
+thread of the request, so their loads are still batched into one command.
+"""
+
+import logging
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, ContextManager, Iterator, List, Tuple
+
+from graphql import GraphQLObjectType, ResolveInfo
+from graphql.language import ast
+from promise import Promise, is_thenable
+
+from gvm.protocols.gmpv214 import Gmp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARALLELISM = 4
+
+# commands changing the state of a connection are only sent via the
+# connection of the request
+CONNECTION_COMMANDS = frozenset(['authenticate', 'connect', 'disconnect'])
+
+
+class GmpConnectionGroup:
+    """The authenticated GMP connections of a single request
+
+    Each GMP command is sent via a connection checked out exclusively for the
+    command. The connection of the request is used first. Additional
+    connections are opened via connect when all connections are busy until
+    max_size connections are open. Afterwards commands wait for a free
+    connection.
+
+    The additional connections are closed when the group is closed.
+    """
+
+    def __init__(
+        self,
+        gmp: Gmp,
+        connect: Callable[[], ContextManager[Gmp]],
+        *,
+        max_size: int = DEFAULT_PARALLELISM,
+    ):
+        self._gmp = gmp
+        self._connect = connect
+        self.max_size = max_size
+
+        self._idle: List[Gmp] = [gmp]
+        self._size = 1
+        self._stack = ExitStack()
+        self._condition = threading.Condition()
+
+    @property
+    def gmp(self) -> Gmp:
+        """The connection of the request"""
+        return self._gmp
+
+    def __len__(self) -> int:
+        """Number of open connections"""
+        with self._condition:
+            return self._size
+
+    def __enter__(self) -> 'GmpConnectionGroup':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        with self._condition:
+            stack = self._stack
+            self._stack = ExitStack()
+            self._idle = [self._gmp]
+            self._size = 1
+
+        stack.close()
+
+    def acquire(self) -> Gmp:
+        with self._condition:
+            while not self._idle and self._size >= self.max_size:
+                self._condition.wait()
+
+            if self._idle:
+                return self._idle.pop()
+
+            # reserve a slot while connecting
+            self._size += 1
+
+        try:
+            # connect outside of the lock. ExitStack isn't thread safe,
+            # therefore the connection gets its own stack.
+            connection_stack = ExitStack()
+            gmp = connection_stack.enter_context(self._connect())
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._stack.push(connection_stack)
+
+        return gmp
+
+    def release(self, gmp: Gmp):
+        with self._condition:
+            self._idle.append(gmp)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Gmp]:
+        gmp = self.acquire()
+        try:
+            yield gmp
+        finally:
+            self.release(gmp)
+
+    def _command(self, name: str) -> Callable:
+        def call(*args, **kwargs):
+            with self.connection() as gmp:
+                return getattr(gmp, name)(*args, **kwargs)
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+
+        if (
+            not callable(attr)
+            or name.startswith(('_', 'is_'))
+            or name in CONNECTION_COMMANDS
+        ):
+            return attr
+
+        return self._command(name)
+
+
+def _uses_entity_loader(query_type: GraphQLObjectType, name: str) -> bool:
+    # the loads of fields using an entity loader are batched in the thread
+    # of the request
+    field = query_type.fields.get(name)
+    return field is not None and getattr(
+        field.resolver, 'uses_entity_loader', False
+    )
+
+
+def _resolve(fn: Callable, args: Tuple[Any, ...], kwargs: dict) -> Any:
+    result = fn(*args, **kwargs)
+
+    # e.g. DataLoaders return a promise. Their state is thread local and they
+    # must be resolved in the thread they have been created in.
+    if is_thenable(result):
+        result = Promise.resolve(result).get()
+
+    return result
+
+
+class ParallelRootFieldExecutor:
+    """A graphql executor resolving the root fields of a query in parallel
+
+    All other fields and the root fields of mutations are resolved
+    synchronously. The results of the root fields are handed to the
+    execution in the thread which called execute, so the nested fields are
+    resolved in this thread.
+    """
+
+    def __init__(self, *, max_workers: int = DEFAULT_PARALLELISM):
+        self.max_workers = max_workers
+
+        self._pool = None
+        self._pending: List[Tuple[Future, Promise]] = []
+
+    def _is_parallel(self, info: ResolveInfo) -> bool:
+        operation = info.operation
+        if (
+            operation.operation != 'query'
+            or info.parent_type is not info.schema.get_query_type()
+            or _uses_entity_loader(info.parent_type, info.field_name)
+        ):
+            return False
+
+        # a single field doesn't need to be resolved in a worker thread
+        parallel_fields = [
+            selection
+            for selection in operation.selection_set.selections
+            if not isinstance(selection, ast.Field)
+            or not _uses_entity_loader(info.parent_type, selection.name.value)
+        ]
+        return len(parallel_fields) > 1
+
+    def execute(self, fn: Callable, *args, **kwargs) -> Any:
+        info = args[1] if len(args) > 1 else None
+
+        if not isinstance(info, ResolveInfo) or not self._is_parallel(info):
+            return fn(*args, **kwargs)
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='selene-root-field',
+            )
+
+        promise = Promise()
+        future = self._pool.submit(_resolve, fn, args, kwargs)
+        self._pending.append((future, promise))
+        return promise
+
+    def wait_until_finished(self):
+        try:
+            while self._pending:
+                pending = self._pending
+                self._pending = []
+
+                for future, promise in pending:
+                    try:
+                        result = future.result()
+                    except Exception as e:  # pylint: disable=broad-except
+                        promise.do_reject(e)
+                    else:
+                        promise.do_resolve(result)
+        finally:
+            self.clean()
+
+    def clean(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
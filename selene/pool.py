@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Pool of authenticated GMP connections
+
+Opening a socket to gvmd and authenticating the user is expensive compared to
+most GMP commands. The pool keeps authenticated connections alive between
+HTTP requests of the same user so they can be reused.
+
+The pool is local to a worker process. Connections are never shared between
+threads at the same time; a connection is checked out exclusively by
+:meth:`GmpConnectionPool.acquire` until it is handed back by
+:meth:`GmpConnectionPool.release`.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+
+from contextlib import ExitStack
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+
+from gvm.errors import GvmError
+from gvm.protocols.gmpv214 import Gmp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 60  # in seconds
+DEFAULT_HEALTH_CHECK_INTERVAL = 10  # in seconds
+
+PoolKey = Tuple[str, bytes]
+
+
+class PooledGmpConnection:
+    """An authenticated GMP connection managed by a GmpConnectionPool"""
+
+    def __init__(self, key: PoolKey, stack: ExitStack, gmp: Gmp, pooled: bool):
+        self.key = key
+        self.gmp = gmp
+        self.pooled = pooled
+        self.discarded = False
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+
+        self._stack = stack
+
+    @property
+    def username(self) -> str:
+        return self.key[0]
+
+    def is_connected(self) -> bool:
+        return bool(self.gmp.is_connected())
+
+    def close(self):
+        try:
+            self._stack.close()
+        except (ConnectionError, GvmError, OSError) as e:
+            logger.debug("Error while closing pooled GMP connection: %s", e)
+
+
+class GmpConnectionPool:
+    """A per worker pool of authenticated GMP connections keyed by user
+
+    Args:
+        connect: Callable returning a context manager which connects to gvmd
+            and yields a Gmp protocol instance, e.g. a `gvm.protocols.gmp.Gmp`
+        max_size: Maximum number of sockets kept by the pool. Connections
+            requested while the pool is exhausted are not pooled and get closed
+            on release.
+        idle_timeout: Seconds after which an unused connection gets closed
+        health_check_interval: Seconds after which an idle connection is
+            checked with a cheap GMP command before it is handed out again
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], ContextManager[Gmp]],
+        *,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+    ):
+        self.connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._lock = threading.Lock()
+        self._idle: Dict[PoolKey, List[PooledGmpConnection]] = {}
+        self._in_use: List[PooledGmpConnection] = []
+        # number of pooled connections currently being opened
+        self._opening = 0
+        # random secret to avoid keeping plain passwords as dict keys
+        self._secret = os.urandom(16)
+
+    def _get_key(self, username: str, password: str) -> PoolKey:
+        digest = hmac.new(
+            self._secret, password.encode('utf-8'), hashlib.sha256
+        ).digest()
+        return username, digest
+
+    def _size(self) -> int:
+        idle = sum(len(connections) for connections in self._idle.values())
+        in_use = len([c for c in self._in_use if c.pooled])
+        return idle + in_use + self._opening
+
+    def _pop_expired(self, now: float) -> List[PooledGmpConnection]:
+        expired = []
+        for key in list(self._idle):
+            connections = self._idle[key]
+            alive = [
+                c for c in connections if now - c.last_used < self.idle_timeout
+            ]
+            expired.extend(c for c in connections if c not in alive)
+
+            if alive:
+                self._idle[key] = alive
+            else:
+                del self._idle[key]
+        return expired
+
+    def _pop_least_recently_used(self) -> Optional[PooledGmpConnection]:
+        candidates = [
+            (connection.last_used, key, connection)
+            for key, connections in self._idle.items()
+            for connection in connections
+        ]
+        if not candidates:
+            return None
+
+        _, key, connection = min(candidates, key=lambda c: c[0])
+        self._idle[key].remove(connection)
+        if not self._idle[key]:
+            del self._idle[key]
+        return connection
+
+    def _is_healthy(self, connection: PooledGmpConnection, now: float) -> bool:
+        if not connection.is_connected():
+            return False
+
+        if now - connection.last_checked < self.health_check_interval:
+            return True
+
+        try:
+            connection.gmp.get_version()
+        except (ConnectionError, GvmError, OSError) as e:
+            logger.debug("Pooled GMP connection is not healthy: %s", e)
+            return False
+
+        connection.last_checked = now
+        return True
+
+    def _open(self, key: PoolKey, password: str, pooled: bool):
+        username, _ = key
+        stack = ExitStack()
+        try:
+            gmp = stack.enter_context(self.connect())
+            gmp.authenticate(username, password)
+        except BaseException:
+            stack.close()
+            raise
+
+        return PooledGmpConnection(key, stack, gmp, pooled)
+
+    def acquire(self, username: str, password: str) -> PooledGmpConnection:
+        """Check out an authenticated connection for the user
+
+        A new connection is opened and authenticated if no healthy idle
+        connection is available. Raises the errors of `Gmp.authenticate` if
+        the authentication fails.
+        """
+        key = self._get_key(username, password)
+        now = time.monotonic()
+        opened = False
+
+        while True:
+            with self._lock:
+                to_close = self._pop_expired(now)
+                connections = self._idle.get(key)
+                connection = connections.pop() if connections else None
+
+                if connections is not None and not connections:
+                    del self._idle[key]
+
+                if connection is None:
+                    pooled = self._size() < self.max_size
+                    if not pooled:
+                        lru = self._pop_least_recently_used()
+                        if lru is not None:
+                            to_close.append(lru)
+                            pooled = True
+
+                    # reserve the slot while the connection is opened outside
+                    # of the lock
+                    if pooled:
+                        self._opening += 1
+
+            for expired in to_close:
+                expired.close()
+
+            if connection is None:
+                try:
+                    connection = self._open(key, password, pooled)
+                    opened = True
+                except BaseException:
+                    if pooled:
+                        with self._lock:
+                            self._opening -= 1
+                    raise
+                break
+
+            if self._is_healthy(connection, now):
+                break
+
+            connection.close()
+
+        connection.last_used = now
+
+        with self._lock:
+            if opened and connection.pooled:
+                # the reservation is replaced by the connection
+                self._opening -= 1
+            self._in_use.append(connection)
+
+        return connection
+
+    def release(self, connection: PooledGmpConnection, discard: bool = False):
+        """Hand a checked out connection back to the pool
+
+        The connection is closed instead if it has been discarded, is not
+        connected anymore or if it exceeded the size of the pool.
+        """
+        with self._lock:
+            if connection in self._in_use:
+                self._in_use.remove(connection)
+
+            keep = (
+                not discard
+                and not connection.discarded
+                and connection.pooled
+                and connection.is_connected()
+            )
+
+            if keep:
+                connection.last_used = time.monotonic()
+                self._idle.setdefault(connection.key, []).append(connection)
+
+        if not keep:
+            connection.close()
+
+    def evict(self, username: str, password: str):
+        """Close all connections authenticated with the credentials
+
+        Connections of the user authenticated with other credentials are
+        kept. Connections currently checked out are closed when they get
+        released.
+        """
+        key = self._get_key(username, password)
+
+        with self._lock:
+            to_close = self._idle.pop(key, [])
+
+            for connection in self._in_use:
+                if connection.key == key:
+                    connection.discarded = True
+
+        for connection in to_close:
+            connection.close()
+
+    def clear(self):
+        """Close all idle connections and discard the checked out ones"""
+        with self._lock:
+            to_close = [
+                connection
+                for connections in self._idle.values()
+                for connection in connections
+            ]
+            self._idle.clear()
+
+            for connection in self._in_use:
+                connection.discarded = True
+
+        for connection in to_close:
+            connection.close()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Speculative prefetching of the following page of a connection
+
+Users paging through long lists like results or NVTs request one page after
+the other. After a page has been returned, the following page is requested
+from gvmd in a background thread via a separate connection. It is kept for a
+few seconds in a cache local to the worker process, keyed by the user, the
+session, the connection field, the normalized filter string and the cursor.
+If the client requests the page in time it is served from the cache.
+
+Commands changing data in gvmd, e.g. of create, modify and delete mutations,
+drop all pages prefetched for the user, so the following pages reflect the
+change.
+"""
+
+import copy
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, Hashable, Optional, Tuple
+
+from graphql import ResolveInfo
+from gvm.protocols.gmpv214 import Gmp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_TTL = 10  # in seconds
+DEFAULT_PREFETCH_CACHE_SIZE = 256
+DEFAULT_PREFETCH_WORKERS = 2
+
+
+class PrefetchCache:
+    """Cache of prefetched pages shared by all requests of a worker process
+
+    The pages are fetched by a pool of threads. Entries expire after ttl
+    seconds and the oldest entries are evicted if the cache is full.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_PREFETCH_TTL,
+        max_size: int = DEFAULT_PREFETCH_CACHE_SIZE,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Future]]' = (
+            OrderedDict()
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='selene-prefetch'
+        )
+
+    def _remove_expired(self, now: float):
+        # all entries have the same ttl, so the oldest entries expire first
+        while self._entries:
+            key, (expires, _) = next(iter(self._entries.items()))
+            if expires > now:
+                return
+            del self._entries[key]
+
+    def submit(self, key: Hashable, fetch: Callable[[], Any]) -> bool:
+        """Run fetch in the background and cache its result for key
+
+        Returns False if the key is already cached or being fetched.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            self._remove_expired(now)
+
+            if key in self._entries:
+                return False
+
+            while len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+
+            future = self._executor.submit(fetch)
+            self._entries[key] = (now + self.ttl, future)
+            return True
+
+    def pop(self, key: Hashable) -> Optional[Future]:
+        """Remove and return the future of a prefetched page"""
+        with self._lock:
+            self._remove_expired(time.monotonic())
+            entry = self._entries.pop(key, None)
+
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, username: str):
+        """Drop the pages prefetched for a user
+
+        Pages still being fetched are dropped too. Their result is discarded.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == username]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def close(self):
+        """Wait for running prefetches and drop all cached pages"""
+        self._executor.shutdown(wait=True)
+        self.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class _PrefetchContext:
+    """Request of a prefetch using another GMP connection"""
+
+    def __init__(self, request, gmp: Gmp):
+        self._request = request
+        self.gmp = gmp
+
+    def __getattr__(self, name: str):
+        return getattr(self._request, name)
+
+
+class Prefetcher:
+    """Prefetches pages for the session of a request
+
+    Args:
+        cache: The cache shared by all requests
+        username: Name of the user of the session
+        session_key: Key of the session of the request
+        connect: Returns a context manager yielding an authenticated GMP
+            connection for the user of the session. Must not depend on the
+            request still being handled.
+    """
+
+    def __init__(
+        self,
+        cache: PrefetchCache,
+        username: str,
+        session_key: str,
+        connect: Callable[[], ContextManager[Gmp]],
+    ):
+        self.cache = cache
+        self.username = username
+        self.session_key = session_key
+        self.connect = connect
+
+    def invalidate(self):
+        """Drop the pages prefetched for the user, e.g. after a mutation"""
+        self.cache.invalidate(self.username)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return a prefetched page or None
+
+        Waits for the page if it is still being fetched. A failed prefetch is
+        ignored, so the page is requested again as usual.
+        """
+        future = self.cache.pop((self.username, self.session_key) + key)
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Prefetching a page failed: %s", e)
+            return None
+
+    def prefetch(
+        self,
+        key: Tuple,
+        info: ResolveInfo,
+        resolve: Callable[[ResolveInfo], Any],
+    ) -> bool:
+        """Call resolve in the background with a separate GMP connection
+
+        resolve gets a copy of info whose context uses the separate
+        connection. It must not return data depending on the connection, e.g.
+        a streamed response.
+        """
+
+        def fetch():
+            with self.connect() as gmp:
+                prefetch_info = copy.copy(info)
+                prefetch_info.context = _PrefetchContext(info.context, gmp)
+                return resolve(prefetch_info)
+
+        return self.cache.submit((self.username, self.session_key) + key, fetch)
@@ -24,6 +24,7 @@ from gvm.protocols.next import (
     get_alert_method_from_string,
 )
 
+from selene.schema.scalars import UUIDType
 from selene.schema.alerts.helper import (
     append_alert_condition_data,
     append_alert_event_data,
@@ -55,11 +56,11 @@ from selene.schema.utils import get_gmp, require_authentication
 
 class ConditionData(graphene.InputObjectType):
     at_least_count = graphene.Int(name='at_least_count')
-    at_least_filter_id = graphene.UUID(name='at_least_filter_id')
+    at_least_filter_id = UUIDType(name='at_least_filter_id')
     count = graphene.Int()
     direction = SeverityDirection()
     severity = SeverityType()
-    filter_id = graphene.UUID(name="filter_id")
+    filter_id = UUIDType(name="filter_id")
 
 
 class EventData(graphene.InputObjectType):
@@ -86,45 +87,43 @@ class MethodData(graphene.InputObjectType):
     )
     defense_center_ip = graphene.String(name="defense_center_ip")
     defense_center_port = graphene.Int(name="defense_center_port")
-    delta_report_id = graphene.UUID(name="delta_report_id")
+    delta_report_id = UUIDType(name="delta_report_id")
     delta_type = DeltaType(name="delta_type")
     details_url = graphene.String(name="details_url")
     from_address = graphene.String(name="from_address")
     message = graphene.String()
     message_attach = graphene.String(name="message_attach")
     notice = graphene.String()
-    notice_attach_format = graphene.UUID(name="notice_attach_format")
-    notice_report_format = graphene.UUID(name="notice_report_format")
+    notice_attach_format = UUIDType(name="notice_attach_format")
+    notice_report_format = UUIDType(name="notice_report_format")
     pkcs12 = graphene.String()
-    pkcs12_credential = graphene.UUID(name="pkcs12_credential")
-    recipient_credential = graphene.UUID(name="recipient_credential")
-    scp_credential = graphene.UUID(name="scp_credential")
+    pkcs12_credential = UUIDType(name="pkcs12_credential")
+    recipient_credential = UUIDType(name="recipient_credential")
+    scp_credential = UUIDType(name="scp_credential")
     scp_host = graphene.String(name="scp_host")
     scp_known_hosts = graphene.String(name="scp_known_hosts")
     scp_path = graphene.String(name="scp_path")
-    scp_report_format = graphene.UUID(name="scp_report_format")
+    scp_report_format = UUIDType(name="scp_report_format")
     send_host = graphene.String(name="send_host")
     send_port = graphene.Int(name="send_port")
-    send_report_format = graphene.UUID(name="send_report_format")
-    smb_credential = graphene.UUID(name="smb_credential")
+    send_report_format = UUIDType(name="send_report_format")
+    smb_credential = UUIDType(name="smb_credential")
     smb_file_path = graphene.String(name="smb_file_path")
-    smb_report_format = graphene.UUID(name="smb_report_format")
+    smb_report_format = UUIDType(name="smb_report_format")
     smb_share_path = graphene.String(name="smb_share_path")
     snmp_agent = graphene.String(name="snmp_agent")
     snmp_community = graphene.String(name="snmp_community")
     snmp_message = graphene.String(name="snmp_message")
-    start_task_task = graphene.UUID(name="start_task_task")
+    start_task_task = UUIDType(name="start_task_task")
     subject = graphene.String(name="subject")
     submethod = graphene.String()
     to_address = graphene.String(name="to_address")
-    tp_sms_credential = graphene.UUID(name="tp_sms_credential")
+    tp_sms_credential = UUIDType(name="tp_sms_credential")
     tp_sms_hostname = graphene.String(name="tp_sms_hostname")
     tp_sms_tls_certificate = graphene.String(name="tp_sms_tls_certificate")
     tp_sms_tls_workaround = graphene.Int(name="tp_sms_tls_workaround")
-    verinice_server_credential = graphene.UUID(
-        name="verinice_server_credential"
-    )
-    verinice_server_report_format = graphene.UUID(
+    verinice_server_credential = UUIDType(name="verinice_server_credential")
+    verinice_server_report_format = UUIDType(
         name="verinice_server_report_format"
     )
     verinice_server_url = graphene.String(name="verinice_server_url")
@@ -165,11 +164,9 @@ class CreateAlertInput(graphene.InputObjectType):
         description="Data that defines the condition"
     )
     comment = graphene.String(description="Comment for the alert")
-    filter_id = graphene.UUID(
-        description="Filter to apply when executing alert"
-    )
+    filter_id = UUIDType(description="Filter to apply when executing alert")
     report_formats = graphene.List(
-        graphene.UUID, description="List of UUIDs to use with Alemba vFire"
+        UUIDType, description="List of UUIDs to use with Alemba vFire"
     )
 
 
@@ -183,7 +180,7 @@ class CreateAlert(graphene.Mutation):
             description="Input ObjectType for creating an alert",
         )
 
-    alert_id = graphene.UUID(name='id', description="UUID of the new alert")
+    alert_id = UUIDType(name='id', description="UUID of the new alert")
 
     @staticmethod
     @require_authentication
@@ -236,7 +233,7 @@ class CreateAlert(graphene.Mutation):
 class ModifyAlertInput(graphene.InputObjectType):
     """Input ObjectType for modifying an alert"""
 
-    alert_id = graphene.UUID(
+    alert_id = UUIDType(
         required=True, name='id', description="UUID of the alert to be modified"
     )
     name = graphene.String(description="Name of the new alert")
@@ -255,11 +252,9 @@ class ModifyAlertInput(graphene.InputObjectType):
         description="Data that defines the condition"
     )
     comment = graphene.String(description="Comment for the alert")
-    filter_id = graphene.UUID(
-        description="Filter to apply when executing the alert"
-    )
+    filter_id = UUIDType(description="Filter to apply when executing the alert")
     report_formats = graphene.List(
-        graphene.UUID, description="List of UUIDs for report formats"
+        UUIDType, description="List of UUIDs for report formats"
     )
 
 
@@ -330,13 +325,13 @@ class CloneAlert(graphene.Mutation):
     """Clone an alert"""
 
     class Arguments:
-        copy_id = graphene.UUID(
+        copy_id = UUIDType(
             required=True,
             name='id',
             description='UUID of the alert to be cloned',
         )
 
-    alert_id = graphene.UUID(name='id', description="UUID of the new alert")
+    alert_id = UUIDType(name='id', description="UUID of the new alert")
 
     @staticmethod
     @require_authentication
@@ -350,7 +345,7 @@ class TestAlert(graphene.Mutation):
     """Test an alert"""
 
     class Arguments:
-        alert_id = graphene.UUID(
+        alert_id = UUIDType(
             required=True, name='id', description='UUID of the alert to test'
         )
 
@@ -22,6 +22,7 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.alerts.fields import Alert
 
 from selene.schema.parser import FilterString
@@ -63,7 +64,7 @@ class GetAlert(graphene.Field):
     def __init__(self):
         super().__init__(
             Alert,
-            alert_id=graphene.UUID(required=True, name='id'),
+            alert_id=UUIDType(required=True, name='id'),
             tasks=graphene.Boolean(default_value=True),
             resolver=self.resolve,
         )
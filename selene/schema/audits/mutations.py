@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_export_by_filter_mutation,
     create_export_by_ids_mutation,
@@ -38,13 +39,13 @@ class CloneAudit(graphene.Mutation):
     """Clone an audit"""
 
     class Arguments:
-        audit_id = graphene.UUID(
+        audit_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the to be cloned Audit",
         )
 
-    audit_id = graphene.UUID(name='id', description="UUID of the new Audit")
+    audit_id = UUIDType(name='id', description="UUID of the new Audit")
 
     @staticmethod
     @require_authentication
@@ -111,19 +112,19 @@ class CreateAuditInput(graphene.InputObjectType):
     """Input ObjectType for creating an audit"""
 
     name = graphene.String(required=True, description="Audit name")
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True,
         description="UUID of the to be used policy. Only for OpenVAS scanners.",
     )
-    target_id = graphene.UUID(
+    target_id = UUIDType(
         required=True, description="UUID of the target to be used"
     )
-    scanner_id = graphene.UUID(
+    scanner_id = UUIDType(
         required=True, description="UUID of the scanner to be used"
     )
 
     alert_ids = graphene.List(
-        graphene.UUID,
+        UUIDType,
         description="List of UUIDs for alerts to be used for the audit",
     )
     alterable = graphene.Boolean(
@@ -133,7 +134,7 @@ class CreateAuditInput(graphene.InputObjectType):
     preferences = graphene.Field(
         AuditPreferencesInput, description="Preferences to set for the audit"
     )
-    schedule_id = graphene.UUID(
+    schedule_id = UUIDType(
         description="UUID of a schedule when the audit should be run"
     )
 
@@ -148,7 +149,7 @@ class CreateAudit(graphene.Mutation):
             description="Input ObjectType for creating a new audit",
         )
 
-    audit_id = graphene.UUID(name='id', description="UUID of the new audit")
+    audit_id = UUIDType(name='id', description="UUID of the new audit")
 
     @staticmethod
     @require_authentication
@@ -240,26 +241,24 @@ class CreateAudit(graphene.Mutation):
 class ModifyAuditInput(graphene.InputObjectType):
     """Input ObjectType for modifying an audit"""
 
-    audit_id = graphene.UUID(
+    audit_id = UUIDType(
         description="UUID of the audit to modify.", name='id', required=True
     )
     name = graphene.String(description="Audit name", required=True)
-    target_id = graphene.UUID(description="UUID of target", required=True)
-    policy_id = graphene.UUID(
+    target_id = UUIDType(description="UUID of target", required=True)
+    policy_id = UUIDType(
         description=("UUID of policy. OpenVAS Default scanners only"),
         required=True,
     )
-    scanner_id = graphene.UUID(description="UUID of scanner", required=True)
+    scanner_id = UUIDType(description="UUID of scanner", required=True)
 
-    alert_ids = graphene.List(
-        graphene.UUID, description="List of UUIDs for alerts"
-    )
+    alert_ids = graphene.List(UUIDType, description="List of UUIDs for alerts")
     alterable = graphene.Boolean(description="Whether the audit is alterable")
     comment = graphene.String(description="Audit comment")
     preferences = graphene.Field(
         AuditPreferencesInput, description="Preferences to set for the audit"
     )
-    schedule_id = graphene.UUID(
+    schedule_id = UUIDType(
         description="UUID of a schedule when the audit should be run."
     )
 
@@ -360,15 +359,13 @@ class StartAudit(graphene.Mutation):
     """Start an audit"""
 
     class Arguments:
-        audit_id = graphene.UUID(
+        audit_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the audit to start a scan for",
         )
 
-    report_id = graphene.UUID(
-        description="UUID of the report for the started scan"
-    )
+    report_id = UUIDType(description="UUID of the report for the started scan")
 
     @staticmethod
     @require_authentication
@@ -384,7 +381,7 @@ class StopAudit(graphene.Mutation):
     """Stop an audit"""
 
     class Arguments:
-        audit_id = graphene.UUID(
+        audit_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the audit to stop the current scan",
@@ -408,7 +405,7 @@ class ResumeAudit(graphene.Mutation):
     """Resume an audit"""
 
     class Arguments:
-        audit_id = graphene.UUID(
+        audit_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the audit which scan should be resumed",
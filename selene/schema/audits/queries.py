@@ -22,6 +22,7 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -63,7 +64,7 @@ class GetAudit(graphene.Field):
     def __init__(self):
         super().__init__(
             Audit,
-            audit_id=graphene.UUID(required=True, name='id'),
+            audit_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -20,6 +20,7 @@ from datetime import timedelta
 
 import graphene
 
+from django.contrib.sessions.backends.base import CreateError, UpdateError
 from django.utils import timezone as django_timezone
 
 from graphql import ResolveInfo
@@ -29,6 +30,7 @@ from gvm.errors import GvmResponseError
 from selene.errors import AuthenticationFailed
 
 from selene.schema.utils import (
+    evict_gmp_connections,
     get_gmp,
     get_request,
     get_subelement,
@@ -112,6 +114,15 @@ class LoginMutation(graphene.Mutation):
             # actually store the timeout in the session
             request.session.set_expiry(timeout)
 
+            try:
+                request.session.save()
+            except (CreateError, UpdateError) as e:
+                # e.g. the session table is full
+                request.session.flush()
+                raise AuthenticationFailed(
+                    f'Could not store the session. {e}'
+                ) from None
+
             setting_response = gmp.get_user_setting(USER_SETTING_LOCALE)
             setting_element = get_subelement(setting_response, 'setting')
             setting = get_text_from_element(setting_element, 'value')
@@ -134,6 +145,7 @@ class LogoutMutation(graphene.Mutation):
     @staticmethod
     def mutate(_root, info: ResolveInfo):
         request = get_request(info)
+        evict_gmp_connections(info)
         request.session.flush()
         return LogoutMutation(ok=True)
 
@@ -151,6 +163,8 @@ class RenewSessionMutation(graphene.Mutation):
     @require_authentication
     def mutate(_root, info: ResolveInfo):
         request = get_request(info)
+        # force a new authentication with the credentials of the session
+        evict_gmp_connections(info)
         modification = django_timezone.now()
         expiry = request.session.get_session_cookie_age()
         session_timeout = modification + timedelta(seconds=expiry)
@@ -20,7 +20,7 @@ from typing import Dict
 
 import graphene
 
-from selene.schema.parser import parse_uuid
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_datetime_from_element, get_text_from_element
 
 
@@ -33,13 +33,12 @@ class NameObjectTypeMixin:
 
 
 class UUIDObjectTypeMixin:
-    uuid = graphene.UUID(
-        name='id', description='Unique identifier of the object'
-    )
+    uuid = UUIDType(name='id', description='Unique identifier of the object')
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        # the ID is checked by UUIDType while serializing
+        return root.get('id') or None
 
 
 class BaseObjectType(
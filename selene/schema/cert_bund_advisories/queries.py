@@ -29,6 +29,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -113,6 +114,7 @@ class GetCertBundAdvisories(EntityConnectionField):
     """
 
     entity_type = CertBundAdvisory
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -138,14 +140,4 @@ class GetCertBundAdvisories(EntityConnectionField):
             details=details,
         )
 
-        requested = None
-        cert_bund_advisory_elements = []
-        info_elements = xml.findall('info')
-        for element in info_elements:
-            if element.get('id'):
-                cert_bund_advisory_elements.append(element)
-            else:
-                requested = element
-        counts = xml.find('info_count')
-
-        return Entities(cert_bund_advisory_elements, counts, requested)
+        return Entities.from_response(xml, 'info', requested_name='info')
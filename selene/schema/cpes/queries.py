@@ -29,6 +29,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -137,6 +138,7 @@ class GetCPEs(EntityConnectionField):
     """
 
     entity_type = CPE
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -159,14 +161,4 @@ class GetCPEs(EntityConnectionField):
             filter_string=filter_string.filter_string, info_type=GvmInfoType.CPE
         )
 
-        requested = None
-        cpe_elements = []
-        info_elements = xml.findall('info')
-        for element in info_elements:
-            if element.get('id'):
-                cpe_elements.append(element)
-            else:
-                requested = element
-        counts = xml.find('info_count')
-
-        return Entities(cpe_elements, counts, requested)
+        return Entities.from_response(xml, 'info', requested_name='info')
@@ -19,6 +19,7 @@
 import graphene
 
 
+from selene.schema.scalars import UUIDType
 from selene.schema.credentials.fields import (
     CredentialType,
     AuthAlgorithm,
@@ -65,9 +66,9 @@ class CloneCredential(graphene.Mutation):
     """
 
     class Arguments:
-        credential_id = graphene.UUID(required=True, name='id')
+        credential_id = UUIDType(required=True, name='id')
 
-    credential_id = graphene.UUID(name='id')
+    credential_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -184,7 +185,7 @@ class CreateCredential(graphene.Mutation):
     class Arguments:
         input_object = CreateCredentialInput(required=True, name='input')
 
-    credential_id = graphene.UUID(name='id')
+    credential_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -275,7 +276,7 @@ class ModifyCredentialInput(graphene.InputObjectType):
 
     """
 
-    credential_id = graphene.UUID(
+    credential_id = UUIDType(
         name='id', required=True, description="Credential ID."
     )
     name = graphene.String(description="Credential name.")
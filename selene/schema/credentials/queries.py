@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.credentials.fields import Credential, CredentialFormat
 
 from selene.schema.parser import FilterString
@@ -70,7 +71,7 @@ class GetCredential(graphene.Field):
     def __init__(self):
         super().__init__(
             Credential,
-            credential_id=graphene.UUID(required=True, name='id'),
+            credential_id=UUIDType(required=True, name='id'),
             scanners=graphene.Boolean(default_value=True),
             targets=graphene.Boolean(default_value=True),
             credential_format=graphene.String(
@@ -29,6 +29,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -126,6 +127,7 @@ class GetCVEs(EntityConnectionField):
     """
 
     entity_type = CVE
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -148,14 +150,4 @@ class GetCVEs(EntityConnectionField):
             filter_string=filter_string.filter_string, info_type=GvmInfoType.CVE
         )
 
-        requested = None
-        cve_elements = []
-        info_elements = xml.findall('info')
-        for element in info_elements:
-            if element.get('id'):
-                cve_elements.append(element)
-            else:
-                requested = element
-        counts = xml.find('info_count')
-
-        return Entities(cve_elements, counts, requested)
+        return Entities.from_response(xml, 'info', requested_name='info')
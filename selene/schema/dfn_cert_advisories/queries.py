@@ -29,6 +29,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -139,6 +140,7 @@ class GetDFNCertAdvisories(EntityConnectionField):
     """
 
     entity_type = DFNCertAdvisory
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -164,14 +166,4 @@ class GetDFNCertAdvisories(EntityConnectionField):
             details=details,
         )
 
-        requested = None
-        dfn_cert_advisory_elements = []
-        info_elements = xml.findall('info')
-        for element in info_elements:
-            if element.get('id'):
-                dfn_cert_advisory_elements.append(element)
-            else:
-                requested = element
-        counts = xml.find('info_count')
-
-        return Entities(dfn_cert_advisory_elements, counts, requested)
+        return Entities.from_response(xml, 'info', requested_name='info')
@@ -17,12 +17,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from typing import List
-from lxml import etree
 
 import graphene
 from gvm.protocols.next import InfoType
 
-from selene.schema.utils import get_gmp, require_authentication, XmlElement
+from selene.schema.scalars import UUIDType
+from selene.schema.utils import (
+    get_gmp,
+    get_uuid_filter_string,
+    require_authentication,
+    XmlElement,
+)
+from selene.transforms import xml_to_string
 
 
 class AbstractExportByFilter(graphene.ObjectType):
@@ -72,7 +78,7 @@ def create_export_by_filter_mutation(
                     filter_string=filter_string, **kwargs
                 )
 
-            serialized_xml = etree.tostring(xml, encoding='unicode')
+            serialized_xml = xml_to_string(xml)
 
             return AbstractExportByFilter(exported_entities=serialized_xml)
 
@@ -82,7 +88,7 @@ def create_export_by_filter_mutation(
 class AbstractExportByIds(graphene.ObjectType):
     class Arguments:
         entity_ids = graphene.List(
-            graphene.UUID,
+            UUIDType,
             required=True,
             name='ids',
             description="List of UUIDs of entities to export.",
@@ -119,10 +125,7 @@ def create_export_by_ids_mutation(
                 else getattr(gmp, f'get_{entity_name}s')
             )
 
-            filter_string = ''
-
-            for entity_id in entity_ids:
-                filter_string += f'uuid={str(entity_id)} '
+            filter_string = get_uuid_filter_string(entity_ids)
 
             if with_details:
                 # not all get_entities function has details argument
@@ -133,7 +136,7 @@ def create_export_by_ids_mutation(
                 xml: XmlElement = get_entities(
                     filter_string=filter_string, **kwargs
                 )
-            serialized_xml = etree.tostring(xml, encoding='unicode')
+            serialized_xml = xml_to_string(xml)
 
             return AbstractExportByIds(exported_entities=serialized_xml)
 
@@ -216,7 +219,7 @@ class AbstractDeleteByIds(graphene.ObjectType):
 
     class Arguments:
         entity_ids = graphene.List(
-            graphene.UUID,
+            UUIDType,
             required=True,
             name='ids',
             description="List of UUIDs of entities to delete..",
@@ -257,9 +260,7 @@ def create_delete_by_ids_mutation(
                 else getattr(gmp, f'get_{entity_name}s')
             )
 
-            filter_string = ''
-            for entity_id in entity_ids:
-                filter_string += f'uuid={str(entity_id)} '
+            filter_string = get_uuid_filter_string(entity_ids)
             # Get the entities via a filter. This is needed because we need to
             # be sure that the entities we want to delete really exist. Else
             # we might only delete some of the entities until an error
@@ -323,15 +324,12 @@ def create_export_secinfos_by_ids_mutation(
 
             get_entities = getattr(gmp, 'get_info_list')
 
-            filter_string = ''
-
-            for entity_id in entity_ids:
-                filter_string += f'uuid={str(entity_id)} '
+            filter_string = get_uuid_filter_string(entity_ids)
 
             xml: XmlElement = get_entities(
                 filter_string=filter_string, info_type=info_type, details=True
             )
-            serialized_xml = etree.tostring(xml, encoding='unicode')
+            serialized_xml = xml_to_string(xml)
 
             return AbstractExportByIds(exported_entities=serialized_xml)
 
@@ -23,6 +23,7 @@ from gvm.protocols.next import (
     get_filter_type_from_string,
 )
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
@@ -48,11 +49,11 @@ class CloneFilter(graphene.Mutation):
     """
 
     class Arguments:
-        copy_id = graphene.UUID(
+        copy_id = UUIDType(
             required=True, name='id', description='UUID of the filter to clone.'
         )
 
-    filter_id = graphene.UUID(name='id')
+    filter_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -86,7 +87,7 @@ class CreateFilter(graphene.Mutation):
     class Arguments:
         input_object = CreateFilterInput(required=True, name='input')
 
-    filter_id = graphene.UUID(name='id')
+    filter_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -116,7 +117,7 @@ class DeleteFilter(graphene.Mutation):
     """
 
     class Arguments:
-        filter_id = graphene.UUID(required=True, name='id')
+        filter_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(name='ultimate')
 
     ok = graphene.Boolean()
@@ -232,7 +233,7 @@ class ModifyFilterInput(graphene.InputObjectType):
         entity_type (FilterType): The entity type applied to the filter
     """
 
-    filter_id = graphene.UUID(
+    filter_id = UUIDType(
         required=True, description="UUID of filter to modify.", name='id'
     )
     name = graphene.String(description=("Name of the filter."))
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.filters.fields import Filter
 
 from selene.schema.parser import FilterString
@@ -70,7 +71,7 @@ class GetFilter(graphene.Field):
     def __init__(self):
         super().__init__(
             Filter,
-            filter_id=graphene.UUID(required=True, name='id'),
+            filter_id=UUIDType(required=True, name='id'),
             alerts=graphene.Boolean(default_value=False),
             resolver=self.resolve,
         )
@@ -18,14 +18,16 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.base import BaseObjectType
 from selene.schema.utils import (
     get_boolean_from_element,
     get_datetime_from_element,
     get_int_from_element,
     get_text_from_element,
+    XmlElement,
 )
-from selene.schema.parser import parse_uuid
+from selene.schema.records import ElementRecord
 from selene.schema.severity import SeverityType
 from selene.schema.resolver import text_resolver
 from selene.schema.entity import EntityObjectType
@@ -112,7 +114,7 @@ class RouteHost(graphene.ObjectType):
 
     @staticmethod
     def resolve_host_id(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_ip(root, _info):
@@ -189,7 +191,7 @@ class HostIdentifier(BaseObjectType):
     def resolve_source_id(root, _info):
         source = root.find('source')
         if source is not None:
-            return parse_uuid(source.get('id'))
+            return source.get('id') or None
         return None
 
     @staticmethod
@@ -224,7 +226,7 @@ class HostIdentifier(BaseObjectType):
     def resolve_os_id(root, _info):
         os = root.find('os')
         if os is not None:
-            return parse_uuid(os.get('id'))
+            return os.get('id') or None
         return None
 
     @staticmethod
@@ -235,9 +237,27 @@ class HostIdentifier(BaseObjectType):
         return None
 
 
+class HostRecord(ElementRecord):
+    """Record of a host asset element"""
+
+    __slots__ = ('host', 'severity')
+
+    fields = {'severity': 'host/severity/value'}
+
+    def __init__(self, element: XmlElement):
+        super().__init__(element)
+
+        self.host = ElementRecord.of(self.find('host'))
+
+        severity = self.host.find('severity') if self.host is not None else None
+        self.severity = get_text_from_element(severity, 'value')
+
+
 class Host(EntityObjectType):
     """Host object type. Is part of the Result object."""
 
+    record_type = HostRecord
+
     identifiers = graphene.List(HostIdentifier)
     severity = graphene.Field(SeverityType)
     details = graphene.List(HostDetail)
@@ -252,21 +272,21 @@ class Host(EntityObjectType):
 
     @staticmethod
     def resolve_severity(root, _info):
-        severity = root.find('host').find('severity')
-        return get_text_from_element(severity, 'value')
+        return HostRecord.read(root, 'severity')
 
     @staticmethod
     def resolve_routes(root, _info):
-        routes = root.find('host').find('routes')
+        host = root.find('host')
+        routes = host.find('routes') if host is not None else None
         if routes is not None:
             return routes.findall('route')
         return None
 
     @staticmethod
     def resolve_details(root, _info):
-        details = root.find('host').findall('detail')
-        if details is not None:
-            return details
+        host = root.find('host')
+        if host is not None:
+            return host.findall('detail')
         return None
 
 
@@ -274,7 +294,7 @@ class ReportHost(graphene.ObjectType):
     """Host object type. Is part of the Report object."""
 
     ip = graphene.String()
-    asset_id = graphene.UUID(name="id")
+    asset_id = UUIDType(name="id")
     start = graphene.DateTime(description="Start time of the scan for the host")
     end = graphene.DateTime(description="End Time of the scan for the host")
     ports = graphene.Field(HostPorts)
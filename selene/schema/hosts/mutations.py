@@ -19,6 +19,7 @@
 import graphene
 
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
@@ -50,7 +51,7 @@ class CreateHost(graphene.Mutation):
     class Arguments:
         input_object = CreateHostInput(required=True, name='input')
 
-    host_id = graphene.UUID(name='id')
+    host_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -73,7 +74,7 @@ class DeleteHost(graphene.Mutation):
     """
 
     class Arguments:
-        host_id = graphene.UUID(required=True, name='id')
+        host_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -187,7 +188,7 @@ class ModifyHostInput(graphene.InputObjectType):
         comment (str, optional): The comment on the host.
     """
 
-    host_id = graphene.UUID(
+    host_id = UUIDType(
         required=True, description="UUID of host to modify.", name='id'
     )
     comment = graphene.String(description="Host comment.")
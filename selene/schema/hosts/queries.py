@@ -22,7 +22,8 @@ import graphene
 
 from graphql import ResolveInfo
 
-from selene.schema.hosts.fields import Host
+from selene.schema.scalars import UUIDType
+from selene.schema.hosts.fields import Host, HostRecord
 
 from selene.schema.parser import FilterString
 
@@ -30,6 +31,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -70,7 +72,7 @@ class GetHost(graphene.Field):
     def __init__(self):
         super().__init__(
             Host,
-            host_id=graphene.UUID(required=True, name='id'),
+            host_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -79,8 +81,10 @@ class GetHost(graphene.Field):
     def resolve(_root, info, host_id: UUID):
         gmp = get_gmp(info)
 
+        # the list form of get_assets doesn't contain the identifiers and
+        # details of the hosts, therefore hosts are not batched via a loader
         xml = gmp.get_host(str(host_id))
-        return xml.find('asset')
+        return HostRecord.of(xml.find('asset'))
 
 
 class GetHosts(EntityConnectionField):
@@ -127,6 +131,7 @@ class GetHosts(EntityConnectionField):
     """
 
     entity_type = Host
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch loading of single entities
+
+A GraphQL document may request several single entities of the same type,
+e.g. via aliases. Instead of sending a `get_<entity>` command for each of
+them, the loaders collect all requested IDs and send a single
+`get_<entities>` command with an uuid filter.
+"""
+
+from typing import Callable, Dict, List
+
+from graphql import ResolveInfo
+
+from gvm.errors import GvmResponseError
+from gvm.protocols.gmpv214 import Gmp
+
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from selene.schema.utils import (
+    get_gmp,
+    get_request,
+    get_uuid_filter_string,
+    XmlElement,
+)
+
+
+class EntityLoader(DataLoader):
+    """Load single entities by their ID
+
+    If only one entity is requested the `get_<entity>` command is used.
+    Otherwise all entities are requested via a single `get_<entities>`
+    command.
+
+    Args:
+        gmp: Gmp instance of the current request
+        entity_name: Name of the entity e.g. 'task'
+        entities_name: Plural of the entity name. Defaults to entity_name
+            with an appended s.
+        element_name: Name of the entity XML element in the response.
+            Defaults to entity_name.
+        filter_string: Additional filter terms for requesting several
+            entities
+        kwargs: Additional arguments for the `get_<entities>` command
+    """
+
+    def __init__(
+        self,
+        gmp: Gmp,
+        entity_name: str,
+        *,
+        entities_name: str = None,
+        element_name: str = None,
+        filter_string: str = None,
+        **kwargs,
+    ):
+        super().__init__()
+
+        self.gmp = gmp
+        self.entity_name = entity_name
+        self.entities_name = entities_name or f'{entity_name}s'
+        self.element_name = element_name or entity_name
+        self.filter_string = filter_string
+        self.kwargs = kwargs
+
+    def get_filter_string(self, entity_ids: List[str]) -> str:
+        filter_string = get_uuid_filter_string(entity_ids)
+        filter_string += f'first=1 rows={len(entity_ids)}'
+
+        if self.filter_string:
+            filter_string += f' {self.filter_string}'
+
+        return filter_string
+
+    def load_entity(self, entity_id: str) -> XmlElement:
+        get_entity = getattr(self.gmp, f'get_{self.entity_name}')
+
+        xml = get_entity(entity_id)
+        return xml.find(self.element_name)
+
+    def load_entities(self, entity_ids: List[str]) -> Dict[str, XmlElement]:
+        get_entities = getattr(self.gmp, f'get_{self.entities_name}')
+
+        xml = get_entities(
+            filter_string=self.get_filter_string(entity_ids), **self.kwargs
+        )
+        return {
+            element.get('id'): element
+            for element in xml.findall(self.element_name)
+        }
+
+    def batch_load_fn(self, keys: List[str]) -> Promise:
+        # pylint: disable=method-hidden
+        if len(keys) == 1:
+            return Promise.resolve([self.load_entity(keys[0])])
+
+        elements = self.load_entities(keys)
+
+        return Promise.resolve(
+            [
+                elements.get(key)
+                if key in elements
+                else GvmResponseError(
+                    status='404',
+                    message=f"Failed to find {self.entity_name} '{key}'",
+                )
+                for key in keys
+            ]
+        )
+
+
+def uses_entity_loader(resolver: Callable) -> Callable:
+    """Mark the resolver of a root field as loading its entity via a loader
+
+    The loads of these fields are only batched if the fields are resolved
+    in the same thread. Therefore they are not resolved in parallel.
+    """
+    resolver.uses_entity_loader = True
+    return resolver
+
+
+def get_entity_loader(
+    info: ResolveInfo, entity_name: str, **kwargs
+) -> EntityLoader:
+    """Return the loader for an entity type of the current request
+
+    The loader is created on first use and shared by all resolvers of the
+    request.
+    """
+    request = get_request(info)
+
+    loaders = getattr(request, 'entity_loaders', None)
+    if loaders is None:
+        loaders = {}
+        request.entity_loaders = loaders
+
+    loader = loaders.get(entity_name)
+    if loader is None:
+        loader = EntityLoader(get_gmp(info), entity_name, **kwargs)
+        loaders[entity_name] = loader
+
+    return loader
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Inspect the fields requested by a client before calling gvmd
+
+Several GMP commands support returning less data, e.g. via details=False.
+The functions in this module allow resolvers to check which fields of the
+returned object are selected and to request only the data that is required.
+
+Field names are the GraphQL names (camelCase). Directives like @include and
+@skip are ignored, which means a field is considered selected if it is
+contained in the document at all.
+"""
+
+from typing import Iterable, Iterator, List, Set
+
+from graphql import ResolveInfo
+from graphql.language import ast
+
+
+def _iter_selections(
+    info: ResolveInfo, selection_set: ast.SelectionSet
+) -> Iterator[ast.Field]:
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.InlineFragment):
+            yield from _iter_selections(info, selection.selection_set)
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = info.fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from _iter_selections(info, fragment.selection_set)
+
+
+def _get_sub_fields(
+    info: ResolveInfo, fields: List[ast.Field]
+) -> Iterator[ast.Field]:
+    for field in fields:
+        yield from _iter_selections(info, field.selection_set)
+
+
+def get_selected_fields(info: ResolveInfo, *path: str) -> Set[str]:
+    """Return the names of the fields selected for the resolved field
+
+    Args:
+        info: ResolveInfo of the resolved field
+        path: Names of sub fields to descend into before collecting the
+            selected field names, e.g. 'edges', 'node'
+    """
+    fields = list(info.field_asts)
+
+    for name in path:
+        fields = [
+            field
+            for field in _get_sub_fields(info, fields)
+            if field.name.value == name
+        ]
+
+    return {field.name.value for field in _get_sub_fields(info, fields)}
+
+
+def get_selected_node_fields(info: ResolveInfo) -> Set[str]:
+    """Return the names of the fields selected for the nodes of a connection
+
+    Considers the fields of `nodes` and `edges { node }`.
+    """
+    return get_selected_fields(info, 'nodes') | get_selected_fields(
+        info, 'edges', 'node'
+    )
+
+
+def is_any_field_selected(selected: Set[str], fields: Iterable[str]) -> bool:
+    return not selected.isdisjoint(fields)
+
+
+def is_only_fields_selected(selected: Set[str], fields: Iterable[str]) -> bool:
+    """Return True if no other fields than the passed ones are selected"""
+    return selected.issubset(set(fields) | {'__typename'})
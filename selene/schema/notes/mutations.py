@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 
 from selene.schema.entities import (
@@ -39,11 +40,11 @@ class CloneNote(graphene.Mutation):
     """
 
     class Arguments:
-        copy_id = graphene.UUID(
+        copy_id = UUIDType(
             required=True, name='id', description='UUID of the note to clone.'
         )
 
-    note_id = graphene.UUID(name='id')
+    note_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -72,11 +73,9 @@ class CreateNoteInput(graphene.InputObjectType):
         graphene.String, description="A list of hosts addresses"
     )
     port = graphene.String(description="Port to which the note applies")
-    result_id = graphene.UUID(
-        description="UUID of a result to which note applies"
-    )
+    result_id = UUIDType(description="UUID of a result to which note applies")
     severity = graphene.Float(description="Severity to which note applies")
-    task_id = graphene.UUID(description="UUID of task to which note applies")
+    task_id = UUIDType(description="UUID of task to which note applies")
 
 
 class CreateNote(graphene.Mutation):
@@ -89,7 +88,7 @@ class CreateNote(graphene.Mutation):
     class Arguments:
         input_object = CreateNoteInput(required=True, name='input')
 
-    note_id = graphene.UUID(name='id')
+    note_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -138,7 +137,7 @@ class ModifyNoteInput(graphene.InputObjectType):
         nvt (NVT): The NVT of the note
     """
 
-    note_id = graphene.UUID(
+    note_id = UUIDType(
         required=True, name='id', description='UUID of the note to modify'
     )
     text = graphene.String(description='Text of the note')
@@ -149,11 +148,9 @@ class ModifyNoteInput(graphene.InputObjectType):
         graphene.String, description="A list of hosts addresses"
     )
     port = graphene.String(description="Port to which the note applies")
-    result_id = graphene.UUID(
-        description="UUID of a result to which note applies"
-    )
+    result_id = UUIDType(description="UUID of a result to which note applies")
     severity = graphene.Float(description="Severity to which note applies")
-    task_id = graphene.UUID(description="UUID of task to which note applies")
+    task_id = UUIDType(description="UUID of task to which note applies")
 
 
 class ModifyNote(graphene.Mutation):
@@ -220,7 +217,7 @@ class DeleteNote(graphene.Mutation):
     """
 
     class Arguments:
-        note_id = graphene.UUID(required=True, name='id')
+        note_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(name='ultimate')
 
     ok = graphene.Boolean()
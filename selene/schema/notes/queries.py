@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.notes.fields import Note
 from selene.schema.parser import FilterString
 
@@ -29,6 +30,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -69,7 +71,7 @@ class GetNote(graphene.Field):
     def __init__(self):
         super().__init__(
             Note,
-            note_id=graphene.UUID(required=True, name='id'),
+            note_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -126,6 +128,7 @@ class GetNotes(EntityConnectionField):
     """
 
     entity_type = Note
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Optional, Union
+
 import graphene
 
 from selene.schema.utils import (
@@ -23,7 +25,10 @@ from selene.schema.utils import (
     get_int_from_element,
     get_text_from_element,
     get_text,
+    XmlElement,
 )
+from selene.schema.parser import parse_int, parse_nvt_tags
+from selene.schema.records import ElementRecord
 from selene.schema.severity import SeverityType
 
 from selene.schema.entity import EntityObjectType
@@ -277,7 +282,10 @@ class NvtSolution(graphene.ObjectType):
 
 
 class NvtTags(graphene.ObjectType):
-    """A NVT Tags field, dissolving the tags element of an NVT"""
+    """A NVT Tags field, dissolving the tags element of an NVT
+
+    Resolved from the mapping returned by parse_nvt_tags.
+    """
 
     class Meta:
         default_resolver = nvt_tags_resolver
@@ -447,7 +455,9 @@ class ScanConfigNVT(graphene.ObjectType):
 
     @staticmethod
     def resolve_tags(root, _info):
-        return root.find('tags')
+        tags = root.find('tags')
+        if tags is not None:
+            return parse_nvt_tags(tags.text)
 
     @staticmethod
     def resolve_preferences(root, _info):
@@ -460,9 +470,69 @@ class ScanConfigNVT(graphene.ObjectType):
         return root.find('solution')
 
 
+class NVTRecord(ElementRecord):
+    """Record of an info element of a NVT"""
+
+    __slots__ = (
+        'nvt',
+        'family',
+        'cvss_base',
+        'category',
+        'preference_count',
+        'timeout',
+        'default_timeout',
+    )
+
+    fields = {
+        'family': 'nvt/family',
+        'cvss_base': 'nvt/cvss_base',
+        'category': 'nvt/category',
+        'preference_count': 'nvt/preference_count',
+        'timeout': 'nvt/timeout',
+        'default_timeout': 'nvt/default_timeout',
+    }
+
+    def __init__(self, element: XmlElement):
+        super().__init__(element)
+
+        self.nvt = ElementRecord.of(self.find('nvt'))
+
+        self.family = self.nvt_text('family')
+        self.cvss_base = self.nvt_text('cvss_base')
+        self.category = self.nvt_text('category')
+        self.preference_count = self.nvt_text('preference_count')
+        self.timeout = self.nvt_text('timeout')
+        self.default_timeout = self.nvt_text('default_timeout')
+
+    def find_nvt(self, tag: str) -> Optional[XmlElement]:
+        """Return a child of the nvt element"""
+        if self.nvt is None:
+            return None
+        return self.nvt.find(tag)
+
+    @classmethod
+    def find_nvt_child(
+        cls, root: Union[XmlElement, ElementRecord], tag: str
+    ) -> Optional[XmlElement]:
+        """Return a child of the nvt element from a record or a plain
+        element
+        """
+        if isinstance(root, cls):
+            return root.find_nvt(tag)
+        return root.find(f'nvt/{tag}')
+
+    def nvt_text(self, tag: str) -> Optional[str]:
+        """Return the text of a child of the nvt element"""
+        if self.nvt is None:
+            return None
+        return self.nvt.text(tag)
+
+
 class NVT(EntityObjectType):
     """Definition of a secinfo NVT (API call: get_info/get_info_list)"""
 
+    record_type = NVTRecord
+
     uuid = graphene.String(name='id', description='OID of the vulnerability')
     update_time = graphene.DateTime(
         description='Time stamp of the last update of the vulnerability'
@@ -517,70 +587,53 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_family(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_text_from_element(nvt, 'family')
-        return None
+        return NVTRecord.read(root, 'family')
 
     @staticmethod
     def resolve_cvss_base(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_text_from_element(nvt, 'cvss_base')
-        return None
+        return NVTRecord.read(root, 'cvss_base')
 
     @staticmethod
     def resolve_score(root, _info):
-        severities = root.find('nvt/severities')
+        severities = NVTRecord.find_nvt_child(root, 'severities')
         if severities is not None:
             return severities.get('score')
 
     @staticmethod
     def resolve_tags(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return nvt.find('tags')
-        return None
+        tags = NVTRecord.find_nvt_child(root, 'tags')
+        if tags is not None:
+            return parse_nvt_tags(tags.text)
 
     @staticmethod
     def resolve_category(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_int_from_element(nvt, 'category')
+        return parse_int(NVTRecord.read(root, 'category'))
 
     @staticmethod
     def resolve_preference_count(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_int_from_element(nvt, 'preference_count')
+        return parse_int(NVTRecord.read(root, 'preference_count'))
 
     @staticmethod
     def resolve_timeout(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_int_from_element(nvt, 'timeout')
+        return parse_int(NVTRecord.read(root, 'timeout'))
 
     @staticmethod
     def resolve_default_timeout(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return get_int_from_element(nvt, 'default_timeout')
+        return parse_int(NVTRecord.read(root, 'default_timeout'))
 
     @staticmethod
     def resolve_qod(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return nvt.find('qod')
+        return NVTRecord.find_nvt_child(root, 'qod')
 
     @staticmethod
     def resolve_severities(root, _info):
-        severities = root.find('nvt/severities')
+        severities = NVTRecord.find_nvt_child(root, 'severities')
         if severities is not None:
             return severities.findall('severity')
 
     @staticmethod
     def resolve_other_references(root, _info):
-        refs = root.find('nvt/refs')
+        refs = NVTRecord.find_nvt_child(root, 'refs')
         if refs is not None:
             return [
                 ref for ref in refs.findall('ref') if ref.get('type') == 'url'
@@ -588,7 +641,7 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_cert_references(root, _info):
-        refs = root.find('nvt/refs')
+        refs = NVTRecord.find_nvt_child(root, 'refs')
         if refs is not None:
             return [
                 ref
@@ -601,7 +654,7 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_bid_references(root, _info):
-        refs = root.find('nvt/refs')
+        refs = NVTRecord.find_nvt_child(root, 'refs')
         if refs is not None:
             return [
                 ref
@@ -611,7 +664,7 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_cve_references(root, _info):
-        refs = root.find('nvt/refs')
+        refs = NVTRecord.find_nvt_child(root, 'refs')
         if refs is not None:
             return [
                 ref
@@ -621,18 +674,16 @@ class NVT(EntityObjectType):
 
     @staticmethod
     def resolve_reference_warning(root, _info):
-        refs = root.find('nvt/refs')
+        refs = NVTRecord.find_nvt_child(root, 'refs')
         if refs is not None:
             return get_text_from_element(refs, 'warning')
 
     @staticmethod
     def resolve_preferences(root, _info):
-        preferences = root.find('nvt/preferences')
+        preferences = NVTRecord.find_nvt_child(root, 'preferences')
         if preferences is not None:
             return preferences.findall('preference')
 
     @staticmethod
     def resolve_solution(root, _info):
-        nvt = root.find('nvt')
-        if nvt is not None:
-            return nvt.find('solution')
+        return NVTRecord.find_nvt_child(root, 'solution')
@@ -27,6 +27,7 @@ from selene.schema.nvts.fields import (
     NvtFamily,
     NvtPreference,
     NVT,
+    NVTRecord,
 )
 
 from selene.schema.parser import FilterString
@@ -35,6 +36,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import require_authentication, get_gmp, XmlElement
@@ -310,7 +312,7 @@ class GetNVT(graphene.Field):
         gmp = get_gmp(info)
 
         xml = gmp.get_info(str(nvt_id), info_type=GvmInfoType.NVT)
-        return xml.find('info')
+        return NVTRecord.of(xml.find('info'))
 
 
 class GetNVTs(EntityConnectionField):
@@ -357,6 +359,8 @@ class GetNVTs(EntityConnectionField):
     """
 
     entity_type = NVT
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
+    prefetch = True
 
     @staticmethod
     @require_authentication
@@ -379,14 +383,4 @@ class GetNVTs(EntityConnectionField):
             filter_string=filter_string.filter_string, info_type=GvmInfoType.NVT
         )
 
-        requested = None
-        nvt_elements = []
-        info_elements = xml.findall('info')
-        for element in info_elements:
-            if element.get('id'):
-                nvt_elements.append(element)
-            else:
-                requested = element
-        counts = xml.find('info_count')
-
-        return Entities(nvt_elements, counts, requested)
+        return Entities.from_response(xml, 'info', requested_name='info')
@@ -20,7 +20,6 @@ import graphene
 
 from selene.schema.base import BaseObjectType
 from selene.schema.utils import get_int_from_element, get_text_from_element
-from selene.schema.parser import parse_uuid
 from selene.schema.severity import SeverityType
 from selene.schema.entity import EntityObjectType
 
@@ -63,7 +62,7 @@ class OperatingSystemInformation(graphene.ObjectType):
     def resolve_title(root, _info):
         source = root.find('source')
         if source is not None:
-            return parse_uuid(source.get('id'))
+            return source.get('id') or None
         return None
 
     @staticmethod
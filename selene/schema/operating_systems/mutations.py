@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 from selene.schema.entities import (
     create_delete_by_filter_mutation,
@@ -38,7 +39,7 @@ class DeleteOperatingSystem(graphene.Mutation):
     """
 
     class Arguments:
-        operating_system_id = graphene.UUID(required=True, name='id')
+        operating_system_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -158,7 +159,7 @@ class ModifyOperatingSystemInput(graphene.InputObjectType):
         comment (str, optional): The comment on the asset.
     """
 
-    operating_system_id = graphene.UUID(
+    operating_system_id = UUIDType(
         required=True,
         description="UUID of operating_system to modify.",
         name='id',
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.operating_systems.fields import OperatingSystem
 
 from selene.schema.parser import FilterString
@@ -30,6 +31,7 @@ from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -70,7 +72,7 @@ class GetOperatingSystem(graphene.Field):
     def __init__(self):
         super().__init__(
             OperatingSystem,
-            operating_system_id=graphene.UUID(required=True, name='id'),
+            operating_system_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -127,6 +129,7 @@ class GetOperatingSystems(EntityConnectionField):
     """
 
     entity_type = OperatingSystem
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
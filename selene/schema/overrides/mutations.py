@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 
 from selene.schema.entities import (
@@ -41,13 +42,13 @@ class CloneOverride(graphene.Mutation):
     """
 
     class Arguments:
-        copy_id = graphene.UUID(
+        copy_id = UUIDType(
             required=True,
             name='id',
             description='UUID of the override to clone.',
         )
 
-    override_id = graphene.UUID(name='id')
+    override_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -90,13 +91,11 @@ class CreateOverrideInput(graphene.InputObjectType):
         description="Severity to which should be overridden",
     )
     port = graphene.String(description="Port to which the override applies")
-    result_id = graphene.UUID(
+    result_id = UUIDType(
         description="UUID of a result to which override applies"
     )
     severity = graphene.Float(description="Severity to which override applies")
-    task_id = graphene.UUID(
-        description="UUID of task to which override applies"
-    )
+    task_id = UUIDType(description="UUID of task to which override applies")
 
 
 class CreateOverride(graphene.Mutation):
@@ -109,7 +108,7 @@ class CreateOverride(graphene.Mutation):
     class Arguments:
         input_object = CreateOverrideInput(required=True, name='input')
 
-    override_id = graphene.UUID(name='id')
+    override_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -160,7 +159,7 @@ class ModifyOverrideInput(graphene.InputObjectType):
         nvt (NVT): The NVT of the override
     """
 
-    override_id = graphene.UUID(
+    override_id = UUIDType(
         required=True, name='id', description='UUID of the override to modify'
     )
     text = graphene.String(description='Text of the override')
@@ -176,13 +175,11 @@ class ModifyOverrideInput(graphene.InputObjectType):
         description="Severity to which should be overridden",
     )
     port = graphene.String(description="Port to which the override applies")
-    result_id = graphene.UUID(
+    result_id = UUIDType(
         description="UUID of a result to which override applies"
     )
     severity = graphene.Float(description="Severity to which override applies")
-    task_id = graphene.UUID(
-        description="UUID of task to which override applies"
-    )
+    task_id = UUIDType(description="UUID of task to which override applies")
 
 
 class ModifyOverride(graphene.Mutation):
@@ -251,7 +248,7 @@ class DeleteOverride(graphene.Mutation):
     """
 
     class Arguments:
-        override_id = graphene.UUID(required=True, name='id')
+        override_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(name='ultimate')
 
     ok = graphene.Boolean()
@@ -22,12 +22,14 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -70,7 +72,7 @@ class GetOverride(graphene.Field):
     def __init__(self):
         super().__init__(
             Override,
-            override_id=graphene.UUID(required=True, name='id'),
+            override_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -127,6 +129,7 @@ class GetOverrides(EntityConnectionField):
     """
 
     entity_type = Override
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
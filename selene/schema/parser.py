@@ -19,46 +19,257 @@
 import datetime
 import re
 
+from functools import lru_cache
+
 from uuid import UUID
 
-from typing import Union, Optional
+from types import MappingProxyType
+from typing import (
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from django.utils.dateparse import parse_datetime as django_parse_datatime
+from django.utils.timezone import get_fixed_timezone, utc
+
+# timestamps as returned by gvmd e.g. 2021-01-01T12:00:00Z. All other formats
+# supported by django are parsed by django.
+ISO_DATETIME_RE = re.compile(
+    r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:Z|[+-]\d\d:\d\d)?', re.ASCII
+)
+
+# the canonical form of an UUID as returned by gvmd
+UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+)
+
+# a term consists of quoted and unquoted parts not separated by whitespace.
+# An unterminated quote extends to the end of the filter string.
+TERM_RE = re.compile(r'(?:"[^"]*"?|[^\s"]+)+')
+KEYWORD_RE = re.compile(r'([^\s"=~<>:]+)([=~<>:])(.*)', re.DOTALL)
+
+# relations between the column and the value of a keyword
+RELATIONS = '=~<>:'
+# prefixes of terms without a column
+PREFIXES = '-=~'
+OPERATORS = ('and', 'or', 'not')
+
+# keywords controlling the returned entities instead of selecting them. gvmd
+# evaluates them independently of their position in the filter.
+CONTROL_KEYWORDS = (
+    'apply_overrides',
+    'first',
+    'levels',
+    'min_qod',
+    'notes',
+    'overrides',
+    'result_hosts_only',
+    'rows',
+    'sort',
+    'sort-reverse',
+    'timezone',
+)
+INT_CONTROL_KEYWORDS = ('apply_overrides', 'first', 'min_qod', 'rows')
+
+# the tags of a NVT are joined by | but the values may contain | too. Only
+# split before something looking like the name of a tag.
+NVT_TAG_SEPARATOR_RE = re.compile(r'\|(?=\s*[A-Za-z_][A-Za-z0-9_]*=)')
+
+
+class FilterTerm(NamedTuple):
+    """A single term of a gvmd filter
+
+    Keywords like name~foo have a column and a relation. Other terms like
+    -foo or "foo bar" only have a value and an optional prefix. raw contains
+    the term as it has been passed.
+    """
+
+    column: Optional[str]
+    relation: Optional[str]
+    value: str
+    quoted: bool
+    prefix: str
+    raw: str
+
+    @property
+    def is_keyword(self) -> bool:
+        return self.column is not None
+
+    @property
+    def is_control(self) -> bool:
+        return self.column in CONTROL_KEYWORDS
+
+    @property
+    def is_operator(self) -> bool:
+        return (
+            self.column is None
+            and not self.quoted
+            and not self.prefix
+            and self.value.lower() in OPERATORS
+        )
+
+    def canonical(self) -> str:
+        """Return the term in a normalized notation
 
-ROWS_RE = re.compile(r'(^|\s+)rows=\S+\s*')
-FIRST_RE = re.compile(r'(^|\s+)first=\S+\s*')
+        Only the values of unquoted integer control keywords are normalized.
+        All other terms are kept byte-exact because gvmd may evaluate them
+        differently depending on quotes or case.
+        """
+        if self.column in INT_CONTROL_KEYWORDS and not self.quoted:
+            number = parse_int(self.value)
+            if number is not None:
+                return f'{self.column}{self.relation}{number}'
+
+        return self.raw
+
+
+# terms like rows=10 or sort=name are repeated in most filter strings
+@lru_cache(maxsize=4096)
+def parse_filter_term(raw: str) -> FilterTerm:
+    """Parse a single term of a gvmd filter"""
+    match = KEYWORD_RE.fullmatch(raw)
+    if match:
+        column, relation, value = match.groups()
+        return FilterTerm(
+            column,
+            relation,
+            value.replace('"', ''),
+            '"' in value,
+            '',
+            raw,
+        )
+
+    prefix = ''
+    value = raw
+    if len(raw) > 1 and raw[0] in PREFIXES:
+        prefix = raw[0]
+        value = raw[1:]
+
+    return FilterTerm(
+        None, None, value.replace('"', ''), '"' in value, prefix, raw
+    )
+
+
+def tokenize_filter_string(filter_string: str) -> List[FilterTerm]:
+    """Split a gvmd filter string into its terms"""
+    return [
+        parse_filter_term(raw) for raw in TERM_RE.findall(filter_string or '')
+    ]
 
 
 class FilterString:
-    """Very simplified representation of a gvmd filter"""
+    """Representation of a gvmd filter
+
+    The filter string is split into its terms on demand. Modified filter
+    strings are created from the terms, keeping the original notation of the
+    remaining terms.
+    """
 
     def __init__(self, filter_string: str = None):
         self.filter_string = filter_string
+        self._terms: Optional[List[FilterTerm]] = None
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[FilterTerm]) -> "FilterString":
+        terms = list(terms)
+        filter_string = cls(' '.join(term.raw for term in terms))
+        filter_string._terms = terms  # pylint: disable=protected-access
+        return filter_string
+
+    @property
+    def terms(self) -> List[FilterTerm]:
+        if self._terms is None:
+            self._terms = tokenize_filter_string(self.filter_string)
+        return self._terms
+
+    def remove_keyword(self, column: str) -> "FilterString":
+        """Remove all keywords of a column from the filter string"""
+        return FilterString.from_terms(
+            term for term in self.terms if term.column != column
+        )
 
     def remove_rows(self) -> "FilterString":
         """Remove rows term from filter string"""
-        filter_string = ROWS_RE.sub(' ', self.filter_string)
-        return FilterString(filter_string.strip())
+        return self.remove_keyword('rows')
 
     def remove_first(self) -> "FilterString":
         """Remove first term from filter string"""
-        filter_string = FIRST_RE.sub(' ', self.filter_string)
-        return FilterString(filter_string.strip())
+        return self.remove_keyword('first')
 
     def add_rows(self, rows: int) -> "FilterString":
         """Add rows filter term"""
-        filter_string = self.filter_string + f' rows={rows}'
-        return FilterString(filter_string)
+        return self.add_term(f'rows={rows}')
 
     def add_first(self, first: int) -> "FilterString":
         """Add first filter term"""
-        filter_string = self.filter_string + f' first={first}'
-        return FilterString(filter_string)
+        return self.add_term(f'first={first}')
+
+    def add_term(self, term: str) -> "FilterString":
+        """Add a filter term like created>1617235200"""
+        return FilterString.from_terms(
+            self.terms + tokenize_filter_string(term)
+        )
+
+    def get_keyword(self, column: str) -> Optional[str]:
+        """Return the value of the first keyword of a column"""
+        for term in self.terms:
+            if term.column == column:
+                return term.value
+        return None
+
+    def get_rows(self) -> Optional[int]:
+        """Return the value of the rows term or None if it isn't set"""
+        for term in self.terms:
+            if term.column == 'rows':
+                rows = parse_int(term.value)
+                if rows is not None:
+                    return rows
+        return None
+
+    def get_sort(self) -> Optional[Tuple[str, bool]]:
+        """Return the sort column and whether it is sorted in reverse order
+
+        Returns None if the filter string doesn't contain a sort term.
+        """
+        for term in self.terms:
+            if term.column in ('sort', 'sort-reverse') and term.value:
+                return term.value, term.column == 'sort-reverse'
+        return None
+
+    def canonical(self) -> str:
+        """Return a canonical notation of the filter
+
+        Equivalent filters which only differ in whitespace, the notation of
+        integer control keywords or the position of control keywords like
+        rows and sort have the same canonical notation. The order of the other terms is kept
+        because it is relevant for the operators.
+        """
+        criteria = [term for term in self.terms if not term.is_control]
+        controls = sorted(
+            (term for term in self.terms if term.is_control),
+            key=lambda term: term.column,
+        )
+        return ' '.join(term.canonical() for term in criteria + controls)
 
     def __str__(self) -> str:
         return self.filter_string or ''
 
 
+@lru_cache(maxsize=1024)
+def get_canonical_filter_string(filter_string: Optional[str]) -> str:
+    """Return the canonical notation of a filter string
+
+    Usable as a key for caching responses of equivalent filters.
+    """
+    return FilterString(filter_string).canonical()
+
+
+@lru_cache(maxsize=1024)
 def check_severity(value):
     test_val = int(float(value) * 10)
     # From gvmd ...
@@ -72,6 +283,21 @@ def check_severity(value):
     return None
 
 
+def check_uuid(value: Optional[str]) -> Optional[str]:
+    """Return an UUID string in canonical form
+
+    IDs in canonical form are returned as is without creating an UUID object.
+    Raises a ValueError for invalid UUIDs like parse_uuid.
+    """
+    if not value:
+        return None
+
+    if UUID_RE.fullmatch(value):
+        return value
+
+    return str(UUID(value))
+
+
 def parse_bool(value: Union[str, int]) -> Optional[bool]:
     """Parse a string or int as boolean"""
     if value is None:
@@ -82,11 +308,33 @@ def parse_bool(value: Union[str, int]) -> Optional[bool]:
     return False
 
 
+@lru_cache(maxsize=256)
+def _get_timezone(value: str) -> datetime.tzinfo:
+    # same as django for the time zones of ISO_DATETIME_RE
+    if value == 'Z':
+        return utc
+
+    offset = 60 * int(value[1:3]) + int(value[4:6])
+    return get_fixed_timezone(-offset if value[0] == '-' else offset)
+
+
+@lru_cache(maxsize=4096)
 def parse_datetime(value: str) -> Optional[datetime.datetime]:
-    """Parse a string as datetime"""
-    if value is not None:
+    """Parse a string as datetime
+
+    The results are cached because pages often contain the same timestamps
+    several times.
+    """
+    if value is None:
+        return None
+
+    if not ISO_DATETIME_RE.fullmatch(value):
         return django_parse_datatime(value)
-    return None
+
+    parsed = datetime.datetime.fromisoformat(value[:19])
+    if len(value) > 19:
+        parsed = parsed.replace(tzinfo=_get_timezone(value[19:]))
+    return parsed
 
 
 def parse_filter_string(value: str) -> FilterString:
@@ -106,6 +354,24 @@ def parse_int(value: str, *, safe: bool = True) -> Optional[int]:
         raise e from None
 
 
+@lru_cache(maxsize=1024)
+def parse_nvt_tags(value: Optional[str]) -> Mapping[str, str]:
+    """Parse the tags of a NVT like "summary=foo|insight=bar"
+
+    The values may contain = and | characters. Parts without a tag name are
+    ignored. The returned mapping is cached and therefore read-only.
+    """
+    tags = {}
+
+    if value:
+        for tag in NVT_TAG_SEPARATOR_RE.split(value):
+            name, separator, tag_value = tag.strip().partition('=')
+            if separator and name:
+                tags.setdefault(name, tag_value)
+
+    return MappingProxyType(tags)
+
+
 def parse_uuid(value: str) -> Optional[UUID]:
     """Parse a string as UUID"""
     if not value:
@@ -23,7 +23,7 @@ from gvm.protocols.next import (
     EntityType as GvmEntityType,
 )
 
-from selene.schema.parser import parse_uuid
+from selene.schema.scalars import UUIDType
 
 from selene.schema.entity import EntityObjectType, EntityPermission
 
@@ -44,14 +44,14 @@ class PermissionSubjectType(graphene.Enum):
 class PermissionSubject(graphene.ObjectType):
     """The subject the permission applies to."""
 
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     name = graphene.String()
     subject_type = graphene.String(name='type')
     trash = graphene.Boolean()
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_name(root, _info):
@@ -69,7 +69,7 @@ class PermissionSubject(graphene.ObjectType):
 class PermissionResource(graphene.ObjectType):
     """The resource the permission applies to."""
 
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     name = graphene.String()
     permission_type = graphene.String(name='type')
     trash = graphene.Boolean()
@@ -78,7 +78,7 @@ class PermissionResource(graphene.ObjectType):
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_name(root, _info):
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.permissions.fields import (
     PermissionEntityType,
     PermissionSubjectType,
@@ -65,9 +66,9 @@ class ClonePermission(graphene.Mutation):
     """
 
     class Arguments:
-        permission_id = graphene.UUID(required=True, name='id')
+        permission_id = UUIDType(required=True, name='id')
 
-    permission_id = graphene.UUID(name='id')
+    permission_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -94,7 +95,7 @@ class CreatePermissionInput(graphene.InputObjectType):
     name = graphene.String(
         required=True, description="Name of the new permission."
     )
-    subject_id = graphene.UUID(
+    subject_id = UUIDType(
         required=True,
         description="UUID of subject to whom the permission is granted.",
     )
@@ -103,7 +104,7 @@ class CreatePermissionInput(graphene.InputObjectType):
     )
 
     comment = graphene.String(description="Comment for the permission.")
-    resource_id = graphene.UUID(
+    resource_id = UUIDType(
         description="UUID of entity to which the permission applies."
     )
     resource_type = PermissionEntityType(
@@ -214,20 +215,20 @@ class ModifyPermissionInput(graphene.InputObjectType):
             For Super permissions user, group or role.
     """
 
-    permission_id = graphene.UUID(
+    permission_id = UUIDType(
         required=True, description="ID of permission to modify.", name='id'
     )
 
     comment = graphene.String(description="Permission comment.")
     name = graphene.String(description="Permission name.")
-    subject_id = graphene.UUID(
+    subject_id = UUIDType(
         description="Id of subject whom the permission is granted."
     )
     subject_type = PermissionSubjectType(
         description="Type of the subject user, group or role."
     )
 
-    resource_id = graphene.UUID(
+    resource_id = UUIDType(
         description="UUID of entity to which the permission applies."
     )
     resource_type = PermissionEntityType(
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import require_authentication, get_gmp
 
 from selene.schema.entities import (
@@ -60,7 +61,7 @@ class DeletePolicy(graphene.Mutation):
     """
 
     class Arguments:
-        policy_id = graphene.UUID(required=True, name='id')
+        policy_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(required=False)
 
     ok = graphene.Boolean()
@@ -186,9 +187,9 @@ class ClonePolicy(graphene.Mutation):
     """
 
     class Arguments:
-        policy_id = graphene.UUID(required=True, name='id')
+        policy_id = UUIDType(required=True, name='id')
 
-    policy_id = graphene.UUID(name='id')
+    policy_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -255,7 +256,7 @@ class ImportPolicy(graphene.Mutation):
     class Arguments:
         policy = graphene.String()
 
-    policy_id = graphene.UUID(name='id')
+    policy_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -274,9 +275,7 @@ class CreatePolicyInput(graphene.InputObjectType):
         comment (str): A comment on the policy
     """
 
-    policy_id = graphene.UUID(
-        required=True, description="UUID of policy to clone."
-    )
+    policy_id = UUIDType(required=True, description="UUID of policy to clone.")
     name = graphene.String(required=True, description="Name of the new policy.")
     comment = graphene.String(description="A comment on the policy.")
 
@@ -347,7 +346,7 @@ class ModifyPolicySetNameInput(graphene.InputObjectType):
         name (str): New name for the policy.
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     name = graphene.String(required=True, description="Name of a policy.")
@@ -413,7 +412,7 @@ class ModifyPolicySetCommentInput(graphene.InputObjectType):
         comment (str, optional): Comment to set on a policy. Default: ‘’
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     comment = graphene.String(description="Comment of a policy.")
@@ -483,7 +482,7 @@ class ModifyPolicySetFamilySelectionInput(graphene.InputObjectType):
             be added to the policy automatically. Default: True.
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     families = graphene.List(
@@ -585,7 +584,7 @@ class ModifyPolicySetNvtPreferenceInput(graphene.InputObjectType):
             None to delete the preference and to use the default instead.
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     name = graphene.String(
@@ -674,7 +673,7 @@ class ModifyPolicySetNvtSelectionInput(graphene.InputObjectType):
         nvt_oids (List[str]): List of NVTs to select for the family.
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     family = graphene.String(
@@ -765,7 +764,7 @@ class ModifyPolicySetScannerPreferenceInput(graphene.InputObjectType):
             None to delete the preference and to use the default instead.
     """
 
-    policy_id = graphene.UUID(
+    policy_id = UUIDType(
         required=True, description="ID of policy to modify.", name='id'
     )
     name = graphene.String(
@@ -22,6 +22,7 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -70,7 +71,7 @@ class GetPolicy(graphene.Field):
     def __init__(self):
         super().__init__(
             Policy,
-            policy_id=graphene.UUID(required=True, name='id'),
+            policy_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
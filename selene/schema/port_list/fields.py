@@ -20,10 +20,10 @@ import graphene
 
 from gvm.protocols.next import PortRangeType as GvmPortRangeType
 
+from selene.schema.scalars import UUIDType
 from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityObjectType
 
-from selene.schema.parser import parse_uuid
 
 from selene.schema.resolver import find_resolver
 
@@ -40,7 +40,7 @@ class PortRangeType(graphene.Enum):
 class PortRange(graphene.ObjectType):
     """A range of ports in a port list"""
 
-    uuid = graphene.UUID(name='id', description='ID of the port range')
+    uuid = UUIDType(name='id', description='ID of the port range')
     start = graphene.Int(description='Starting port of the range')
     end = graphene.Int(description='Ending port of the range')
     port_range_type = graphene.Field(
@@ -49,7 +49,7 @@ class PortRange(graphene.ObjectType):
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_start(root, _info):
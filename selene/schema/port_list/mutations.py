@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
@@ -33,7 +34,7 @@ from selene.schema.utils import require_authentication, get_gmp
 class CreatePortRangeInput(graphene.InputObjectType):
     """Input object for createPortRange"""
 
-    port_list_id = graphene.UUID(
+    port_list_id = UUIDType(
         required=True,
         description="UUID of the port list to which to add the range",
     )
@@ -59,7 +60,7 @@ class CreatePortRange(graphene.Mutation):
             description="Input ObjectType for creating a port range",
         )
 
-    port_range_id = graphene.UUID(
+    port_range_id = UUIDType(
         name='id', description="ID of the created port range"
     )
 
@@ -82,7 +83,7 @@ class DeletePortRange(graphene.Mutation):
     """Delete a port range"""
 
     class Arguments:
-        port_range_id = graphene.UUID(required=True, name='id')
+        port_range_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -123,13 +124,11 @@ class ClonePortList(graphene.Mutation):
     """
 
     class Arguments:
-        port_list_id = graphene.UUID(
+        port_list_id = UUIDType(
             required=True, name='id', description="ID of the port list to clone"
         )
 
-    port_list_id = graphene.UUID(
-        name='id', description="ID of the new port list"
-    )
+    port_list_id = UUIDType(name='id', description="ID of the new port list")
 
     @staticmethod
     @require_authentication
@@ -162,9 +161,7 @@ class CreatePortList(graphene.Mutation):
             description="Input ObjectType to create a port list",
         )
 
-    port_list_id = graphene.UUID(
-        name='id', description="ID of the new port list"
-    )
+    port_list_id = UUIDType(name='id', description="ID of the new port list")
 
     @staticmethod
     @require_authentication
@@ -185,7 +182,7 @@ class CreatePortList(graphene.Mutation):
 class ModifyPortListInput(graphene.InputObjectType):
     """Input object for modifyPortList"""
 
-    port_list_id = graphene.UUID(
+    port_list_id = UUIDType(
         name='id', required=True, description="ID of to be modified port list"
     )
     name = graphene.String(description="Port list name")
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 from selene.schema.port_list.fields import PortList
 
@@ -78,7 +79,7 @@ class GetPortList(graphene.Field):
     def __init__(self):
         super().__init__(
             PortList,
-            port_list_id=graphene.UUID(
+            port_list_id=UUIDType(
                 required=True, name='id', description="ID of the port list"
             ),
             resolver=self.resolve,
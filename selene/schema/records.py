@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact records of entity elements
+
+Resolvers look up the sub-elements of an entity by their tag name, e.g. via
+get_text_from_element(root, 'severity'). Each lookup searches the children
+of the element, so resolving a large page runs one search per field and
+node. A record walks the children of an entity element once and stores them
+by their tag name. Subclasses additionally extract the values of their
+commonly requested fields into slots while walking the element.
+
+Records can be passed to all resolvers expecting an element. Lookups of
+direct children are answered from the record, everything else is delegated
+to the wrapped element. Resolvers read the fields via `read`, which only
+uses the slots if the entity is a record already. Building a record for a
+plain element would walk all of its children for a single field.
+"""
+
+from typing import (
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from selene.schema.utils import XmlElement, get_text_from_element
+
+RecordType = TypeVar('RecordType', bound='ElementRecord')
+
+
+class ElementRecord:
+    """Record of an element and its direct children
+
+    Args:
+        element: The wrapped XML element
+    """
+
+    __slots__ = ('element', 'children')
+
+    # paths of the text values stored in the slots of a subclass relative to
+    # the element
+    fields: ClassVar[Dict[str, str]] = {}
+
+    def __init__(self, element: XmlElement):
+        children = {}
+        for child in element:
+            # keep the first child like element.find does
+            children.setdefault(child.tag, child)
+
+        self.element = element
+        self.children: Dict[str, XmlElement] = children
+
+    @classmethod
+    def of(
+        cls: Type[RecordType],
+        element: Union[XmlElement, 'ElementRecord', None],
+    ) -> Optional[RecordType]:
+        """Return a record of the element if it isn't one already"""
+        if element is None or isinstance(element, cls):
+            return element
+        if isinstance(element, ElementRecord):
+            element = element.element
+        return cls(element)
+
+    @classmethod
+    def read(
+        cls, root: Union[XmlElement, 'ElementRecord'], name: str
+    ) -> Optional[str]:
+        """Return the value of a field from a record or a plain element"""
+        if isinstance(root, cls):
+            return getattr(root, name)
+        return get_text_from_element(root, cls.fields[name])
+
+    def text(self, tag: str) -> Optional[str]:
+        """Return the text of the first child with the tag or None"""
+        child = self.children.get(tag)
+        if child is None:
+            return None
+        return child.text
+
+    def find(self, path: str) -> Optional[XmlElement]:
+        child = self.children.get(path)
+        if child is not None or path.isidentifier():
+            # a plain tag name which isn't a child of the element
+            return child
+        return self.element.find(path)
+
+    def findall(self, path: str) -> List[XmlElement]:
+        return self.element.findall(path)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.element.get(key, default)
+
+    def __len__(self) -> int:
+        return len(self.element)
+
+    def __iter__(self) -> Iterator[XmlElement]:
+        return iter(self.element)
+
+    def __getattr__(self, name: str):
+        if name == 'element':
+            # not initialized yet e.g. while being copied
+            raise AttributeError(name)
+        return getattr(self.element, name)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.element.tag}>'
@@ -19,19 +19,40 @@
 from base64 import b64encode, b64decode
 
 from collections import OrderedDict
-from typing import List, Optional, Type, Tuple, Iterable
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    Tuple,
+    Iterable,
+    Union,
+)
 
 import graphene
 
 from graphql import ResolveInfo
 from graphql.language import ast
 
+from selene.schema.lookahead import (
+    get_selected_fields,
+    get_selected_node_fields,
+    is_any_field_selected,
+    is_only_fields_selected,
+)
 from selene.schema.parser import (
+    parse_datetime,
     parse_int,
     parse_filter_string,
     FilterString as FilterStringModel,
 )
+from selene.schema.records import ElementRecord
 from selene.schema.utils import get_int_from_element, get_text, XmlElement
+from selene.transforms import StreamingResponse
 
 
 def get_cursor(entity_type_name: str, offset: int) -> str:
@@ -44,9 +65,57 @@ def get_cursor(entity_type_name: str, offset: int) -> str:
 def get_offset_from_cursor(cursor: str) -> str:
     plain_cursor = b64decode(cursor.encode('utf-8')).decode('utf-8')
     _, offset = plain_cursor.split(':', 1)
+    # keyset cursors contain additional fields after the offset
+    offset = offset.split(':', 1)[0]
     return parse_int(offset, safe=False)
 
 
+# sort columns of gvmd which can be compared in a filter term mapped to the
+# child element of an entity containing the value
+TIMESTAMP_SORT_FIELDS = {
+    'created': 'creation_time',
+    'modified': 'modification_time',
+}
+
+
+class KeysetCursor(NamedTuple):
+    """Position of an entity in a list sorted by a timestamp column
+
+    offset is the zero based index of the entity, key the value of the sort
+    column as seconds since the epoch and ties the number of entities up to
+    and including this entity sharing the same key.
+    """
+
+    offset: int
+    sort_field: str
+    key: int
+    entity_id: str
+    ties: int
+
+
+def get_keyset_cursor(entity_type_name: str, keyset: KeysetCursor) -> str:
+    str_cursor = ':'.join([entity_type_name] + [str(value) for value in keyset])
+    encoded_cursor = b64encode(str_cursor.encode('utf-8'))
+    return encoded_cursor.decode('utf-8')
+
+
+def get_keyset_from_cursor(cursor: str) -> Optional[KeysetCursor]:
+    """Return the keyset of a cursor or None for an offset cursor"""
+    plain_cursor = b64decode(cursor.encode('utf-8')).decode('utf-8')
+    values = plain_cursor.split(':')
+    if len(values) != 6:
+        return None
+
+    _, offset, sort_field, key, entity_id, ties = values
+    return KeysetCursor(
+        parse_int(offset, safe=False),
+        sort_field,
+        parse_int(key, safe=False),
+        entity_id,
+        parse_int(ties, safe=False),
+    )
+
+
 def get_filter_string_for_pagination(
     filter_string: FilterStringModel,
     *,
@@ -177,6 +246,549 @@ class Entities:
             length=self.get_length(),
         )
 
+    @classmethod
+    def from_response(
+        cls,
+        response: Union[XmlElement, StreamingResponse],
+        entity_name: str,
+        *,
+        counts_name: str = None,
+        requested_name: str = None,
+    ) -> 'Entities':
+        """Create Entities from a get_<entities> response
+
+        Args:
+            response: The response of the get_<entities> command
+            entity_name: Tag name of the entity elements e.g. 'result'
+            counts_name: Tag name of the counts element. Defaults to
+                <entity_name>_count.
+            requested_name: Tag name of the element containing the requested
+                start and max values. Defaults to <entity_name>s.
+        """
+        counts_name = counts_name or f'{entity_name}_count'
+        requested_name = requested_name or f'{entity_name}s'
+
+        if isinstance(response, StreamingResponse):
+            return StreamedEntities(
+                response, entity_name, counts_name, requested_name
+            )
+
+        entity_elements = []
+        requested_element = None
+
+        for element in response.iterchildren(entity_name, requested_name):
+            if _is_entity_element(element, entity_name, requested_name):
+                entity_elements.append(element)
+            elif element.tag == requested_name and requested_element is None:
+                requested_element = element
+
+        return cls(
+            entity_elements, response.find(counts_name), requested_element
+        )
+
+
+def _is_entity_element(
+    element: XmlElement, entity_name: str, requested_name: str
+) -> bool:
+    # for get_info responses the requested element has the same tag as the
+    # entities but no id
+    return element.tag == entity_name and (
+        entity_name != requested_name or bool(element.get('id'))
+    )
+
+
+class StreamedEntities(Entities):
+    """Entities of a StreamingResponse
+
+    The entity elements are parsed while they are iterated and each element
+    is freed after it has been resolved. The counts are read on demand,
+    either while iterating the entity elements or by an additional pass over
+    the response which doesn't keep the entity elements.
+    """
+
+    def __init__(
+        self,
+        response: StreamingResponse,
+        entity_name: str,
+        counts_name: str,
+        requested_name: str,
+    ):  # pylint: disable=super-init-not-called
+        self._response = response
+        self._entity_name = entity_name
+        self._counts_name = counts_name
+        self._requested_name = requested_name
+
+        self._scanned = False
+        self._length = 0
+        self._counts_element = None
+        self._requested_element = None
+
+    def _iter_entity_elements(self) -> Iterator[XmlElement]:
+        length = 0
+
+        for element in self._response.iterchildren(
+            self._entity_name, self._counts_name, self._requested_name
+        ):
+            if _is_entity_element(
+                element, self._entity_name, self._requested_name
+            ):
+                length += 1
+                yield element
+            elif element.tag == self._counts_name:
+                self._counts_element = element
+            elif element.tag == self._requested_name:
+                self._requested_element = element
+
+        self._length = length
+        self._scanned = True
+
+    def _scan(self):
+        if not self._scanned:
+            for _ in self._iter_entity_elements():
+                pass
+
+    @property
+    def entity_elements(self) -> Iterator[XmlElement]:
+        return self._iter_entity_elements()
+
+    @property
+    def counts_element(self) -> Optional[XmlElement]:
+        self._scan()
+        return self._counts_element
+
+    @property
+    def requested_element(self) -> Optional[XmlElement]:
+        self._scan()
+        return self._requested_element
+
+    def get_length(self) -> int:
+        self._scan()
+        return self._length
+
+
+def _get_sort_keys(
+    elements: List[XmlElement], key_name: str
+) -> List[Optional[int]]:
+    keys = []
+    for element in elements:
+        value = parse_datetime(get_text(element.find(key_name)))
+        keys.append(int(value.timestamp()) if value is not None else None)
+    return keys
+
+
+def _count_ties(keys: List[Optional[int]]) -> List[int]:
+    ties = []
+    for index, key in enumerate(keys):
+        if index > 0 and key is not None and key == keys[index - 1]:
+            ties.append(ties[-1] + 1)
+        else:
+            ties.append(1)
+    return ties
+
+
+class KeysetEntities(Entities):
+    """Entities of a page sorted by a timestamp column
+
+    The cursors of the entities contain the sort key and the id of the
+    entity besides the offset. They allow requesting the following page via
+    a range filter on the sort column instead of letting gvmd skip all
+    previous entities.
+    """
+
+    def __init__(
+        self,
+        entity_elements: List[XmlElement],
+        counts_element: XmlElement,
+        requested_element: XmlElement,
+        *,
+        sort_field: str,
+        keys: List[Optional[int]],
+        ties: List[int],
+        offset: int = None,
+        filtered: int = None,
+        limit: int = None,
+    ):
+        super().__init__(entity_elements, counts_element, requested_element)
+        self.sort_field = sort_field
+        self._keys = keys
+        self._ties = ties
+        self._offset = offset
+        self._filtered = filtered
+        self._limit = limit
+
+    def get_filtered_count(self) -> Optional[int]:
+        if self._filtered is not None:
+            return self._filtered
+        return super().get_filtered_count()
+
+    def get_offset(self) -> Optional[int]:
+        if self._offset is not None:
+            return self._offset
+        return super().get_offset()
+
+    def get_limit(self) -> Optional[int]:
+        if self._limit is not None:
+            return self._limit
+        return super().get_limit()
+
+    def get_keyset(self, offset: int) -> Optional[KeysetCursor]:
+        """Return the keyset of the entity at offset
+
+        Returns None if the entity isn't part of the page or has no sort key.
+        """
+        index = offset - (self.get_offset() or 0)
+        if index < 0 or index >= len(self._keys) or self._keys[index] is None:
+            return None
+
+        return KeysetCursor(
+            offset,
+            self.sort_field,
+            self._keys[index],
+            self.entity_elements[index].get('id'),
+            self._ties[index],
+        )
+
+    @classmethod
+    def from_entities(
+        cls, entities: Entities, sort_field: str, key_name: str
+    ) -> 'KeysetEntities':
+        """Create KeysetEntities from a page requested by offset"""
+        elements = list(entities.entity_elements)
+        keys = _get_sort_keys(elements, key_name)
+        return cls(
+            elements,
+            entities.counts_element,
+            entities.requested_element,
+            sort_field=sort_field,
+            keys=keys,
+            ties=_count_ties(keys),
+        )
+
+    @classmethod
+    def from_range(
+        cls,
+        entities: Entities,
+        cursor: KeysetCursor,
+        key_name: str,
+        first: int,
+    ) -> Optional['KeysetEntities']:
+        """Create the page following cursor from the entities of a range
+
+        The range must start with the first entity sharing the key of the
+        cursor. Returns None if the entity of the cursor isn't found in the
+        range anymore, e.g. because it has been deleted or modified, or the
+        page would be incomplete.
+        """
+        elements = list(entities.entity_elements)
+        filtered = get_int_from_element(entities.counts_element, 'filtered')
+        if filtered is None:
+            return None
+
+        index = cursor.ties - 1
+        if (
+            index >= len(elements)
+            or elements[index].get('id') != cursor.entity_id
+        ):
+            ids = [element.get('id') for element in elements]
+            if cursor.entity_id not in ids:
+                return None
+            index = ids.index(cursor.entity_id)
+
+        start = index + 1
+        end = start + first
+        if end > len(elements) and filtered > len(elements):
+            return None
+
+        keys = _get_sort_keys(elements, key_name)
+        ties = _count_ties(keys)
+        offset = cursor.offset + 1
+
+        return cls(
+            elements[start:end],
+            entities.counts_element,
+            entities.requested_element,
+            sort_field=cursor.sort_field,
+            keys=keys[start:end],
+            ties=ties[start:end],
+            offset=offset,
+            filtered=filtered - start + offset,
+            limit=first,
+        )
+
+
+def resolve_keyset_entities(
+    resolve_entities: Callable[..., Entities],
+    sort_fields: Dict[str, str],
+    root,
+    info: ResolveInfo,
+    filter_string: FilterStringModel = None,
+    after: str = None,
+    before: str = None,
+    first: int = None,
+    last: int = None,
+    **kwargs,
+) -> Entities:
+    """Resolve entities using keyset cursors if possible
+
+    Keyset cursors are only used for forward pagination if the filter string
+    sorts by one of sort_fields. A page following a keyset cursor is
+    requested by a range filter on the sort column. gvmd neither supports
+    comparing tuples nor >= in filters. Therefore the range starts with all
+    entities sharing the key of the cursor and the number of entities up to
+    the cursor is requested additionally. If the entity of the cursor can't
+    be found in the range the offset of the cursor is used instead.
+    """
+    sort = filter_string.get_sort() if filter_string else None
+    if (
+        sort is None
+        or sort[0] not in sort_fields
+        or first is None
+        or last is not None
+        or before is not None
+    ):
+        return resolve_entities(
+            root,
+            info,
+            filter_string=filter_string,
+            after=after,
+            before=before,
+            first=first,
+            last=last,
+            **kwargs,
+        )
+
+    sort_field, reverse = sort
+    key_name = sort_fields[sort_field]
+
+    cursor = get_keyset_from_cursor(after) if after else None
+    if cursor is not None and cursor.sort_field == sort_field:
+        if reverse:
+            term = f'{sort_field}<{cursor.key + 1}'
+        else:
+            term = f'{sort_field}>{cursor.key - 1}'
+
+        entities = resolve_entities(
+            root,
+            info,
+            filter_string=filter_string.remove_first().add_term(term),
+            first=first + cursor.ties,
+            **kwargs,
+        )
+        page = KeysetEntities.from_range(entities, cursor, key_name, first)
+        if page is not None:
+            return page
+
+    entities = resolve_entities(
+        root,
+        info,
+        filter_string=filter_string,
+        after=after,
+        first=first,
+        **kwargs,
+    )
+    return KeysetEntities.from_entities(entities, sort_field, key_name)
+
+
+class CountsEntities(Entities):
+    """Counts of a page of entities without the entity elements
+
+    The limit and the length are those of the page which would have been
+    returned for the requested number of rows.
+    """
+
+    def __init__(
+        self,
+        counts_element: XmlElement,
+        requested_element: XmlElement,
+        rows: Optional[int],
+    ):
+        super().__init__([], counts_element, requested_element)
+        self.rows = rows
+
+    def get_limit(self) -> Optional[int]:
+        return self.rows
+
+    def get_length(self) -> int:
+        filtered = self.get_filtered_count() or 0
+        remaining = max(filtered - (self.get_offset() or 0), 0)
+        if self.rows is None or self.rows < 0:
+            return remaining
+        return min(self.rows, remaining)
+
+
+# fields of EntitiesCounts which don't depend on the number of rows
+ROWS_INDEPENDENT_COUNTS = ('filtered', 'total', 'offset')
+
+
+def resolve_counts_only(
+    resolve_entities: Callable[..., Entities],
+    root,
+    info: ResolveInfo,
+    filter_string: FilterStringModel = None,
+    after: str = None,
+    before: str = None,
+    first: int = None,
+    last: int = None,
+    **kwargs,
+) -> Entities:
+    """Resolve only the counts of a connection if possible
+
+    If neither nodes nor edges are selected a single entity is requested
+    from gvmd instead of a whole page, because rows=0 doesn't result in an
+    empty page. The limit and length of the counts and the page info are
+    calculated from the requested rows. If the rows are neither passed nor
+    contained in the filter string, gvmd uses the page size setting of the
+    user. In that case a whole page is requested if anything besides the
+    filtered and total counts is selected.
+    """
+    selected = get_selected_fields(info)
+    rows = first if first is not None else last
+    if rows is None and filter_string:
+        rows = filter_string.get_rows()
+
+    if is_any_field_selected(selected, ('nodes', 'edges')) or (
+        rows is None
+        and not (
+            is_only_fields_selected(selected, ('counts',))
+            and is_only_fields_selected(
+                get_selected_fields(info, 'counts'), ROWS_INDEPENDENT_COUNTS
+            )
+        )
+    ):
+        return resolve_entities(
+            root,
+            info,
+            filter_string=filter_string,
+            after=after,
+            before=before,
+            first=first,
+            last=last,
+            **kwargs,
+        )
+
+    filter_string = get_filter_string_for_pagination(
+        filter_string, first=first, last=last, after=after, before=before
+    )
+    if filter_string.filter_string:
+        filter_string = filter_string.remove_rows()
+    filter_string = filter_string.add_term('rows=1')
+
+    entities = resolve_entities(
+        root, info, filter_string=filter_string, **kwargs
+    )
+    return CountsEntities(
+        entities.counts_element, entities.requested_element, rows
+    )
+
+
+def _get_prefetch_key(
+    info: ResolveInfo,
+    filter_string: Optional[FilterStringModel],
+    first: int,
+    after: Optional[str],
+    kwargs: Dict,
+) -> Tuple:
+    # the nodes fields are part of the key because resolvers may request
+    # less data from gvmd depending on the selected fields
+    return (
+        info.field_name,
+        filter_string.canonical() if filter_string else '',
+        first,
+        after,
+        tuple(sorted(kwargs.items())),
+        frozenset(get_selected_node_fields(info)),
+    )
+
+
+def _get_next_cursor(info: ResolveInfo, entities: Entities) -> Optional[str]:
+    counts = entities.get_entities_counts()
+    if counts.length <= 0 or counts.offset + counts.length >= counts.filtered:
+        return None
+
+    edge = info.return_type.graphene_type._meta.edge
+    offset = counts.offset + counts.length - 1
+    if isinstance(entities, KeysetEntities):
+        return KeysetEdgeCursors(edge, entities).get_cursor(offset)
+    return edge.get_cursor(offset)
+
+
+def _load_entities(entities: Entities) -> Entities:
+    # streamed entities can't be read after the connection has been released
+    if isinstance(entities, StreamedEntities):
+        elements = list(entities.entity_elements)
+        return Entities(
+            elements, entities.counts_element, entities.requested_element
+        )
+    return entities
+
+
+def resolve_prefetched(
+    resolve_entities: Callable[..., Entities],
+    root,
+    info: ResolveInfo,
+    filter_string: FilterStringModel = None,
+    after: str = None,
+    before: str = None,
+    first: int = None,
+    last: int = None,
+    **kwargs,
+) -> Entities:
+    """Resolve a page of entities and prefetch the following page
+
+    Only used for forward pagination if prefetching is enabled for the
+    request. A page which has been prefetched for the same filter string and
+    cursor is returned without requesting it from gvmd again.
+    """
+    prefetcher = getattr(info.context, 'prefetcher', None)
+    if (
+        prefetcher is None
+        or first is None
+        or last is not None
+        or before is not None
+    ):
+        return resolve_entities(
+            root,
+            info,
+            filter_string=filter_string,
+            after=after,
+            before=before,
+            first=first,
+            last=last,
+            **kwargs,
+        )
+
+    entities = prefetcher.get(
+        _get_prefetch_key(info, filter_string, first, after, kwargs)
+    )
+    if entities is None:
+        entities = resolve_entities(
+            root,
+            info,
+            filter_string=filter_string,
+            after=after,
+            first=first,
+            **kwargs,
+        )
+
+    next_cursor = _get_next_cursor(info, entities)
+    if next_cursor is not None:
+        prefetcher.prefetch(
+            _get_prefetch_key(info, filter_string, first, next_cursor, kwargs),
+            info,
+            lambda prefetch_info: _load_entities(
+                resolve_entities(
+                    root,
+                    prefetch_info,
+                    filter_string=filter_string,
+                    after=next_cursor,
+                    first=first,
+                    **kwargs,
+                )
+            ),
+        )
+
+    return entities
+
 
 def create_edge_graphene_type(
     name: str, type_name, entity: Type[graphene.ObjectType]
@@ -195,13 +807,16 @@ def create_edge_graphene_type(
 
         @staticmethod
         def resolve_node(root: Tuple[int, XmlElement], _info: ResolveInfo):
-            _, element = root
-            return element
+            return root[1]
 
         @classmethod
         def resolve_cursor(
             cls, root: Tuple[int, XmlElement], _info: ResolveInfo
         ):
+            if len(root) > 2:
+                # edges of KeysetEntities contain their cursor
+                return root[2]
+
             offset, _ = root
             return cls.get_cursor(offset)
 
@@ -209,12 +824,33 @@ def create_edge_graphene_type(
         def get_cursor(cls, entity_id: str):
             return get_cursor(type_name, entity_id)
 
+        @classmethod
+        def get_keyset_cursor(cls, keyset: KeysetCursor):
+            return get_keyset_cursor(type_name, keyset)
+
     class EdgeMeta:
         description = f"A edge containing a `{name}` entity and its cursor."
 
     return type(f'{name}Edge', (EdgeBase,), {'Meta': EdgeMeta})
 
 
+class KeysetEdgeCursors:
+    """Creates keyset cursors for the entities of a page
+
+    Offsets outside of the page, e.g. of the last page, get offset cursors.
+    """
+
+    def __init__(self, edge: Type[graphene.ObjectType], root: KeysetEntities):
+        self.edge = edge
+        self.root = root
+
+    def get_cursor(self, offset: int) -> str:
+        keyset = self.root.get_keyset(offset)
+        if keyset is None:
+            return self.edge.get_cursor(offset)
+        return self.edge.get_keyset_cursor(keyset)
+
+
 class EntitiesPageInfo(graphene.PageInfo):
     last_page_cursor = graphene.String(description="A cursor to the last page.")
 
@@ -293,6 +929,8 @@ class EntityConnection(graphene.ObjectType):
         )
         _meta = graphene.types.objecttype.ObjectTypeOptions(cls)
         _meta.edge = edge
+        # entity types may provide a record class for their elements
+        _meta.record_type = getattr(entity_type, 'record_type', None)
         _meta.fields = OrderedDict(
             [
                 (
@@ -325,22 +963,49 @@ class EntityConnection(graphene.ObjectType):
             _meta=_meta, name=name, **options
         )
 
-    @staticmethod
-    def resolve_nodes(root: Entities, _info: ResolveInfo) -> List[XmlElement]:
-        return root.entity_elements
+    @classmethod
+    def get_nodes(
+        cls, root: Entities
+    ) -> Iterable[Union[XmlElement, ElementRecord]]:
+        """Return the entity elements or their records
+
+        The records are created lazily to keep the elements of a streamed
+        response from being parsed all at once.
+        """
+        record_type = cls._meta.record_type
+        if record_type is None:
+            return root.entity_elements
+        return map(record_type, root.entity_elements)
+
+    @classmethod
+    def resolve_nodes(
+        cls, root: Entities, _info: ResolveInfo
+    ) -> Iterable[Union[XmlElement, ElementRecord]]:
+        return cls.get_nodes(root)
 
     @classmethod
     def resolve_page_info(
         cls, root: Entities, _info: ResolveInfo
     ) -> Tuple[graphene.ObjectType, EntitiesCounts]:
+        if isinstance(root, KeysetEntities):
+            return (
+                KeysetEdgeCursors(cls._meta.edge, root),
+                root.get_entities_counts(),
+            )
         return cls._meta.edge, root.get_entities_counts()
 
-    @staticmethod
+    @classmethod
     def resolve_edges(
-        root: Entities, _info: ResolveInfo
+        cls, root: Entities, _info: ResolveInfo
     ) -> Iterable[Tuple[int, XmlElement]]:
         offset = root.get_offset()
-        return enumerate(root.entity_elements, offset)
+        if isinstance(root, KeysetEntities):
+            cursors = KeysetEdgeCursors(cls._meta.edge, root)
+            return [
+                (index, element, cursors.get_cursor(index))
+                for index, element in enumerate(cls.get_nodes(root), offset)
+            ]
+        return enumerate(cls.get_nodes(root), offset)
 
     @staticmethod
     def resolve_counts(root: Entities, _info: ResolveInfo):
@@ -418,6 +1083,14 @@ class EntityConnectionField(graphene.Field):
     connection_type = None
     entity_type = None
 
+    # sort columns supporting keyset cursors mapped to the child element of
+    # the entities containing their value e.g. TIMESTAMP_SORT_FIELDS
+    keyset_sort_fields: Dict[str, str] = {}
+
+    # prefetch the following page in the background if prefetching is
+    # enabled via the CONNECTION_PREFETCH setting
+    prefetch = False
+
     def __init__(
         self,
         connection_type: Type[EntityConnection] = None,
@@ -434,6 +1107,15 @@ class EntityConnectionField(graphene.Field):
         if description is None:
             description = self.__doc__
 
+        resolver = self.resolve_entities
+        if self.keyset_sort_fields:
+            resolver = partial(
+                resolve_keyset_entities, resolver, self.keyset_sort_fields
+            )
+        if self.prefetch:
+            resolver = partial(resolve_prefetched, resolver)
+        resolver = partial(resolve_counts_only, resolver)
+
         super().__init__(
             connection_type,
             filter_string=FilterString(
@@ -457,7 +1139,7 @@ class EntityConnectionField(graphene.Field):
                 description="Show the last number of nodes using the before "
                 "cursor"
             ),
-            resolver=self.resolve_entities,
+            resolver=resolver,
             description=description,
             **kwargs,
         )
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 
 from selene.schema.entities import (
@@ -37,7 +38,7 @@ class DeleteReportFormat(graphene.Mutation):
     """
 
     class Arguments:
-        report_format_id = graphene.UUID(required=True, name='id')
+        report_format_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -64,7 +65,7 @@ class ImportReportFormat(graphene.Mutation):
     class Arguments:
         report_format = graphene.String(required=True)
 
-    report_format_id = graphene.UUID(name='id')
+    report_format_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -87,7 +88,7 @@ class ModifyReportFormatInput(graphene.InputObjectType):
         param_value (str): The value of the param.
     """
 
-    report_format_id = graphene.UUID(
+    report_format_id = UUIDType(
         name='id', required=True, description="UUID of report format to modify."
     )
     active = graphene.Boolean(
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 from selene.schema.report_formats.fields import ReportFormat
 from selene.schema.relay import (
@@ -67,7 +68,7 @@ class GetReportFormat(graphene.Field):
     def __init__(self):
         super().__init__(
             ReportFormat,
-            report_format_id=graphene.UUID(required=True, name='id'),
+            report_format_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
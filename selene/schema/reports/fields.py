@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.resolver import text_resolver, int_resolver
 from selene.schema.base import BaseObjectType
 from selene.schema.entity import EntityUserTags
@@ -31,8 +32,9 @@ from selene.schema.utils import (
     get_int_from_element,
     get_text_from_element,
 )
-from selene.schema.parser import parse_uuid, parse_int
+from selene.schema.parser import parse_int
 from selene.schema.tasks.fields import Task
+from selene.schema.results.fields import ResultRecord
 from selene.schema.results.queries import Result
 from selene.schema.hosts.fields import ReportHost
 from selene.schema.nvts.fields import ScanConfigNVT
@@ -133,7 +135,7 @@ class ReportPort(graphene.ObjectType):
 class DeltaReport(graphene.ObjectType):
     """DeltaReport object type. Is part of the Delta object."""
 
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     scan_run_status = graphene.String()
 
     timestamp = graphene.DateTime()
@@ -166,7 +168,7 @@ class ErrorHost(graphene.ObjectType):
     """ErrorHost object type. Is part of the Error object."""
 
     name = graphene.String()
-    asset_id = graphene.UUID(name="id")
+    asset_id = UUIDType(name="id")
 
     @staticmethod
     def resolve_name(root, _info):
@@ -175,7 +177,7 @@ class ErrorHost(graphene.ObjectType):
     @staticmethod
     def resolve_asset_id(root, _info):
         asset = root.find('asset')
-        return parse_uuid(asset.get('asset_id'))
+        return asset.get('asset_id') or None
 
 
 class Error(graphene.ObjectType):
@@ -250,7 +252,7 @@ class Report(graphene.ObjectType):
         report_format (str): Format from this report
     """
 
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     name = graphene.String()
 
     owner = graphene.String()
@@ -311,12 +313,12 @@ class Report(graphene.ObjectType):
     timezone = graphene.String()
     timezone_abbreviation = graphene.String()
 
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     name = graphene.String()
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.outer_report.get('id'))
+        return root.outer_report.get('id') or None
 
     @staticmethod
     def resolve_name(root, _info):
@@ -463,7 +465,10 @@ class Report(graphene.ObjectType):
     def resolve_results(root, _info):
         results = root.inner_report.find('results')
         if results is not None:
-            results = results.findall('result')
+            # read the fields of the results from their records
+            results = [
+                ResultRecord(result) for result in results.findall('result')
+            ]
             if len(results) > 0:
                 return results
         return None
@@ -20,6 +20,7 @@ from uuid import UUID
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_export_by_filter_mutation,
     create_export_by_ids_mutation,
@@ -100,10 +101,10 @@ class ImportReport(graphene.Mutation):
     class Arguments:
         report = graphene.String(required=True)
 
-        task_id = graphene.UUID()
+        task_id = UUIDType()
         in_assets = graphene.String()
 
-    report_id = graphene.UUID(name='id')
+    report_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -22,15 +22,38 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
+from selene.schema.lookahead import get_selected_fields, is_any_field_selected
 from selene.schema.reports.fields import Report, ReportModel
 from selene.schema.parser import FilterString
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
+# fields of a report requiring the full report details. gmp doesn't allow to
+# request only some of them like the hosts or results of a report.
+REPORT_DETAILS_FIELDS = (
+    'applications',
+    'closedCves',
+    'deltaReport',
+    'errorCount',
+    'errors',
+    'hosts',
+    'hostsCount',
+    'operatingSystems',
+    'ports',
+    'portsCount',
+    'results',
+    'resultsCount',
+    'severity',
+    'tlsCertificates',
+    'vulnerabilities',
+)
+
 
 class GetReport(graphene.Field):
     """Gets a single report.
@@ -70,9 +93,9 @@ class GetReport(graphene.Field):
     def __init__(self):
         super().__init__(
             Report,
-            report_id=graphene.UUID(required=True, name='id'),
-            report_format_id=graphene.UUID(),
-            delta_report_id=graphene.UUID(),
+            report_id=UUIDType(required=True, name='id'),
+            report_format_id=UUIDType(),
+            delta_report_id=UUIDType(),
             resolver=self.resolve,
         )
 
@@ -87,6 +110,15 @@ class GetReport(graphene.Field):
     ):
         gmp = get_gmp(info)
         report = ReportModel()
+
+        details = (
+            report_format_id is not None
+            or delta_report_id is not None
+            or is_any_field_selected(
+                get_selected_fields(info), REPORT_DETAILS_FIELDS
+            )
+        )
+
         xml: XmlElement = gmp.get_report(
             str(report_id),
             report_format_id=(
@@ -95,7 +127,7 @@ class GetReport(graphene.Field):
             delta_report_id=(
                 str(delta_report_id) if delta_report_id is not None else None
             ),
-            details=True,
+            details=details,
         )
         report.outer_report = xml.find('report')
         report.inner_report = report.outer_report.find('report')
@@ -150,6 +182,7 @@ class GetReports(EntityConnectionField):
     """
 
     entity_type = Report
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -17,7 +17,6 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from selene.schema.utils import (
-    get_text,
     get_text_from_element,
     get_boolean_from_element,
     get_int_from_element,
@@ -46,11 +45,5 @@ def find_resolver(attname, default_value, root, info, **args):
 
 def nvt_tags_resolver(attname, default_value, root, info, **args):
     # pylint: disable=unused-argument
-    tags = get_text(root)
-    if tags is not None:
-        tags = tags.split('|')
-        for tag in tags:
-            key, value = tag.strip().split('=', 1)
-            if key == attname:
-                return value
-    return None
+    # root is the mapping returned by parse_nvt_tags
+    return root.get(attname)
@@ -20,6 +20,7 @@ import graphene
 
 from lxml import etree
 
+from selene.schema.scalars import UUIDType
 from selene.schema.severity import SeverityType
 
 from selene.schema.base import BaseObjectType, UUIDObjectTypeMixin
@@ -28,14 +29,15 @@ from selene.schema.entity import (
     CreationModifactionObjectTypeMixin,
     OwnerObjectTypeMixin,
 )
+from selene.schema.records import ElementRecord
 from selene.schema.resolver import find_resolver, text_resolver
 from selene.schema.utils import (
     get_text,
     get_text_from_element,
     get_boolean_from_element,
     get_datetime_from_element,
+    XmlElement,
 )
-from selene.schema.parser import parse_uuid
 
 from selene.schema.notes.fields import Note
 from selene.schema.nvts.fields import QoD, ScanConfigNVT
@@ -123,9 +125,7 @@ class ResultType(graphene.Enum):
 
 class ResultHost(graphene.ObjectType):
     ip = graphene.String(description='The host the result applies to.')
-    asset_id = graphene.UUID(
-        name="id", description='ID of asset linked to host.'
-    )
+    asset_id = UUIDType(name="id", description='ID of asset linked to host.')
     hostname = graphene.String(
         description=(
             'If available, the hostname the result was created for, '
@@ -140,7 +140,7 @@ class ResultHost(graphene.ObjectType):
     @staticmethod
     def resolve_asset_id(root, _info):
         asset = root.find('asset')
-        return parse_uuid(asset.get('asset_id'))
+        return asset.get('asset_id') or None
 
     @staticmethod
     def resolve_hostname(root, _info):
@@ -195,6 +195,35 @@ class ResultOverride(
         return get_datetime_from_element(root, 'end_time')
 
 
+class ResultRecord(ElementRecord):
+    """Record of a result element"""
+
+    __slots__ = (
+        'description',
+        'port',
+        'severity',
+        'original_severity',
+        'scan_nvt_version',
+    )
+
+    fields = {
+        'description': 'description',
+        'port': 'port',
+        'severity': 'severity',
+        'original_severity': 'original_severity',
+        'scan_nvt_version': 'scan_nvt_version',
+    }
+
+    def __init__(self, element: XmlElement):
+        super().__init__(element)
+
+        self.description = self.text('description')
+        self.port = self.text('port')
+        self.severity = self.text('severity')
+        self.original_severity = self.text('original_severity')
+        self.scan_nvt_version = self.text('scan_nvt_version')
+
+
 class Result(  # changed mixin to remove comment mixin
     UserTagsObjectTypeMixin,
     OwnerObjectTypeMixin,
@@ -206,6 +235,8 @@ class Result(  # changed mixin to remove comment mixin
     class Meta:
         default_resolver = find_resolver
 
+    record_type = ResultRecord
+
     description = graphene.String(description='Description of the result')
 
     origin_result = graphene.Field(
@@ -256,7 +287,7 @@ class Result(  # changed mixin to remove comment mixin
 
     @staticmethod
     def resolve_description(root, _info):
-        return get_text_from_element(root, 'description')
+        return ResultRecord.read(root, 'description')
 
     @staticmethod
     def resolve_origin_result(root, _info):
@@ -269,7 +300,7 @@ class Result(  # changed mixin to remove comment mixin
     def resolve_report_id(root, _info):
         report = root.find('report')
         if report is not None:
-            return parse_uuid(root.find('report').get('id'))
+            return report.get('id') or None
 
     @staticmethod
     def resolve_task(root, _info):
@@ -277,15 +308,15 @@ class Result(  # changed mixin to remove comment mixin
 
     @staticmethod
     def resolve_location(root, _info):
-        return get_text_from_element(root, 'port')
+        return ResultRecord.read(root, 'port')
 
     @staticmethod
     def resolve_severity(root, _info):
-        return get_text_from_element(root, 'severity')
+        return ResultRecord.read(root, 'severity')
 
     @staticmethod
     def resolve_original_severity(root, _info):
-        return get_text_from_element(root, 'original_severity')
+        return ResultRecord.read(root, 'original_severity')
 
     @staticmethod
     def resolve_notes(root, _info):
@@ -313,14 +344,17 @@ class Result(  # changed mixin to remove comment mixin
         result_info = root.find('nvt')
         info_type = get_text_from_element(result_info, 'type')
 
-        scan_nvt_version = get_text_from_element(root, 'scan_nvt_version')
+        scan_nvt_version = ResultRecord.read(root, 'scan_nvt_version')
 
         if info_type == 'nvt':
-            # append scan_nvt_version as version element
-            # to nvt result type for parsing
+            # add scan_nvt_version as version element to nvt result type for
+            # parsing. The response may be shared by several resolvers and
+            # requests, therefore only a record of the element gets the
+            # additional child.
             version_element = etree.Element('version')
             version_element.text = scan_nvt_version
-            result_info.append(version_element)
+            result_info = ElementRecord(result_info)
+            result_info.children.setdefault('version', version_element)
 
         return result_info
 
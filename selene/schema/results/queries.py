@@ -22,14 +22,18 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
+from selene.schema.lookahead import get_selected_node_fields
 from selene.schema.parser import FilterString
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
+from selene.schema.loaders import get_entity_loader, uses_entity_loader
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
-from selene.schema.results.fields import Result
+from selene.schema.results.fields import Result, ResultRecord
 
 
 class GetResult(graphene.Field):
@@ -53,23 +57,26 @@ class GetResult(graphene.Field):
     def __init__(self):
         super().__init__(
             Result,
-            result_id=graphene.UUID(required=True, name='id'),
+            result_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
     @staticmethod
+    @uses_entity_loader
     @require_authentication
     def resolve(_root, info, result_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_result(str(result_id))
-        return xml.find('result')
+        loader = get_entity_loader(
+            info, 'result', filter_string='min_qod=0', details=True
+        )
+        return loader.load(str(result_id)).then(ResultRecord.of)
 
 
 class GetResults(EntityConnectionField):
     """Gets a list of results with pagination"""
 
     entity_type = Result
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
+    prefetch = True
 
     @staticmethod
     @require_authentication
@@ -88,12 +95,14 @@ class GetResults(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        # only request the details containing the detection information if
+        # they are required
+        kwargs = {}
+        if 'originResult' in get_selected_node_fields(info):
+            kwargs['details'] = True
+
         xml: XmlElement = gmp.get_results(
-            filter_string=filter_string.filter_string
+            filter_string=filter_string.filter_string, **kwargs
         )
 
-        result_elements = xml.findall('result')
-        counts = xml.find('result_count')
-        requested = xml.find('results')
-
-        return Entities(result_elements, counts, requested)
+        return Entities.from_response(xml, 'result')
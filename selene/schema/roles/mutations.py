@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import require_authentication, get_gmp
 
 from selene.schema.entities import (
@@ -60,9 +61,9 @@ class CloneRole(graphene.Mutation):
     """
 
     class Arguments:
-        role_id = graphene.UUID(required=True, name='id')
+        role_id = UUIDType(required=True, name='id')
 
-    role_id = graphene.UUID(name='id')
+    role_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -153,7 +154,7 @@ class ModifyRoleInput(graphene.InputObjectType):
         users (List[str], optional): List of user names.
     """
 
-    role_id = graphene.UUID(
+    role_id = UUIDType(
         required=True, description="UUID of role to modify.", name='id'
     )
 
@@ -230,7 +231,7 @@ class DeleteRole(graphene.Mutation):
     """
 
     class Arguments:
-        role_id = graphene.UUID(required=True, name='id')
+        role_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(required=False)
 
     ok = graphene.Boolean()
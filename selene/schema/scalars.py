@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from uuid import UUID
+
+import graphene
+
+from graphql.language import ast
+
+from selene.schema.parser import check_uuid
+
+
+class UUIDType(graphene.Scalar):
+    """
+    A scalar type representing an UUID
+
+    Input values are parsed as python UUID objects. For output the resolvers
+    may return UUID objects or the IDs returned by gvmd as strings, which are
+    passed through if they are in the canonical form already.
+    """
+
+    class Meta:
+        name = 'UUID'
+
+    @staticmethod
+    def serialize(value):
+        if isinstance(value, str):
+            return check_uuid(value)
+
+        assert isinstance(
+            value, UUID
+        ), f"Expected UUID instance, received {value}"
+        return str(value)
+
+    @staticmethod
+    def parse_literal(node):
+        if isinstance(node, ast.StringValue):
+            return UUID(node.value)
+
+    @staticmethod
+    def parse_value(value):
+        return UUID(value)
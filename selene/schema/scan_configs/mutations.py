@@ -18,7 +18,12 @@
 
 import graphene
 
-from selene.schema.utils import require_authentication, get_gmp
+from selene.schema.scalars import UUIDType
+from selene.schema.utils import (
+    require_authentication,
+    get_gmp,
+    get_uuid_filter_string,
+)
 
 from selene.schema.entities import (
     create_export_by_ids_mutation,
@@ -56,7 +61,7 @@ class DeleteScanConfig(graphene.Mutation):
     """
 
     class Arguments:
-        config_id = graphene.UUID(required=True, name='id')
+        config_id = UUIDType(required=True, name='id')
         ultimate = graphene.Boolean(required=False)
 
     ok = graphene.Boolean()
@@ -83,7 +88,7 @@ class DeleteScanConfigsByIds(graphene.Mutation):
 
     class Arguments:
         scan_config_ids = graphene.List(
-            graphene.UUID,
+            UUIDType,
             required=True,
             name='ids',
             description="List of UUIDs of entities to delete.",
@@ -97,9 +102,7 @@ class DeleteScanConfigsByIds(graphene.Mutation):
     def mutate(_root, info, scan_config_ids=None, ultimate=None):
         gmp = get_gmp(info)
 
-        filter_string = ''
-        for scan_config_id in scan_config_ids:
-            filter_string += f'uuid={str(scan_config_id)} '
+        filter_string = get_uuid_filter_string(scan_config_ids)
         # Get the configs via a filter. This is needed because we need to
         # be sure that the configs we want to delete really exist. Else
         # we might only delete some of the entities until an error
@@ -190,9 +193,9 @@ class CloneScanConfig(graphene.Mutation):
     """
 
     class Arguments:
-        config_id = graphene.UUID(required=True, name='id')
+        config_id = UUIDType(required=True, name='id')
 
-    config_id = graphene.UUID(name='id')
+    config_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -259,7 +262,7 @@ class ImportScanConfig(graphene.Mutation):
     class Arguments:
         config = graphene.String()
 
-    config_id = graphene.UUID(name='id')
+    config_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -278,7 +281,7 @@ class CreateScanConfigInput(graphene.InputObjectType):
         comment (str): A comment on the config
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="UUID of scan config to clone."
     )
     name = graphene.String(
@@ -355,9 +358,7 @@ class CreateScanConfigFromOspScannerInput(graphene.InputObjectType):
         comment (str): A comment on the config
     """
 
-    scanner_id = graphene.UUID(
-        required=True, description="UUID of an OSP scanner."
-    )
+    scanner_id = UUIDType(required=True, description="UUID of an OSP scanner.")
     name = graphene.String(
         required=True, description="Name of the new scan config."
     )
@@ -435,7 +436,7 @@ class ModifyScanConfigSetNameInput(graphene.InputObjectType):
         name (str): New name for the config.
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     name = graphene.String(required=True, description="Name of a scan config.")
@@ -501,7 +502,7 @@ class ModifyScanConfigSetCommentInput(graphene.InputObjectType):
         comment (str, optional): Comment to set on a config. Default: ‘’
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     comment = graphene.String(description="Comment of a scan config.")
@@ -600,7 +601,7 @@ class ModifyScanConfigSetFamilySelectionInput(graphene.InputObjectType):
             be added to the scan config automatically. Default: True.
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     families = graphene.List(
@@ -700,7 +701,7 @@ class ModifyScanConfigSetNvtPreferenceInput(graphene.InputObjectType):
             None to delete the preference and to use the default instead.
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     name = graphene.String(
@@ -789,7 +790,7 @@ class ModifyScanConfigSetNvtSelectionInput(graphene.InputObjectType):
         nvt_oids (List[str]): List of NVTs to select for the family.
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     family = graphene.String(
@@ -880,7 +881,7 @@ class ModifyScanConfigSetScannerPreferenceInput(graphene.InputObjectType):
             None to delete the preference and to use the default instead.
     """
 
-    config_id = graphene.UUID(
+    config_id = UUIDType(
         required=True, description="ID of scan config to modify.", name='id'
     )
     name = graphene.String(
@@ -22,6 +22,8 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
+from selene.schema.lookahead import get_selected_fields
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -70,7 +72,7 @@ class GetScanConfig(graphene.Field):
     def __init__(self):
         super().__init__(
             ScanConfig,
-            config_id=graphene.UUID(required=True, name='id'),
+            config_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -86,7 +88,9 @@ class GetScanConfig(graphene.Field):
         #   <config_count>
         gmp = get_gmp(info)
 
-        xml = gmp.get_scan_config(str(config_id), tasks=True)
+        tasks = 'tasks' in get_selected_fields(info)
+
+        xml = gmp.get_scan_config(str(config_id), tasks=tasks)
         return xml.find('config')
 
 
@@ -180,7 +184,7 @@ class GetScanConfigPreference(graphene.Field):
             ScannerPreference,
             name=graphene.String(required=True),
             nvt_oid=graphene.String(),
-            config_id=graphene.UUID(),
+            config_id=UUIDType(),
             resolver=self.resolve,
         )
 
@@ -218,7 +222,7 @@ class GetScanConfigPreferences(graphene.List):
             ScannerPreference,
             resolver=self.resolve,
             nvt_oid=graphene.String(),
-            config_id=graphene.UUID(),
+            config_id=UUIDType(),
         )
 
     @staticmethod
@@ -20,6 +20,7 @@ from uuid import UUID
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import (
     require_authentication,
     get_gmp,
@@ -46,7 +47,7 @@ class DeleteScanner(graphene.Mutation):
     """
 
     class Arguments:
-        scanner_id = graphene.UUID(required=True, name='id')
+        scanner_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -78,7 +79,7 @@ class CreateScannerInput(graphene.InputObjectType):
     )
     host = graphene.String(required=True, description="Scanner host or path.")
     port = graphene.Int(description="Scanner port.")
-    credential_id = graphene.UUID(
+    credential_id = UUIDType(
         required=True, description=("UUID of credential."), name="credentialId"
     )
     ca_pub = graphene.String(description="CA public key.")
@@ -95,7 +96,7 @@ class CreateScanner(graphene.Mutation):
     class Arguments:
         input_object = CreateScannerInput(required=True, name='input')
 
-    scanner_id = graphene.UUID(name='id')
+    scanner_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -144,7 +145,7 @@ class ModifyScannerInput(graphene.InputObjectType):
         ca_pub (str): CA public key.
     """
 
-    scanner_id = graphene.UUID(
+    scanner_id = UUIDType(
         required=True, description="ID of scanner to modify.", name='id'
     )
     name = graphene.String(description="Scanner name.")
@@ -152,7 +153,7 @@ class ModifyScannerInput(graphene.InputObjectType):
     scanner_type = ScannerType(name="type", description="Scanner type.")
     host = graphene.String(description="Scanner host or path.")
     port = graphene.Int(description="Scanner port.")
-    credential_id = graphene.UUID(
+    credential_id = UUIDType(
         description=("UUID of credential."), name="credentialId"
     )
     ca_pub = graphene.String(description="CA public key.")
@@ -224,7 +225,7 @@ class VerifyScanner(graphene.Field):
     def __init__(self):
         super().__init__(
             VerifyScannerType,
-            scanner_id=graphene.UUID(required=True, name='id'),
+            scanner_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -247,9 +248,9 @@ class CloneScanner(graphene.Mutation):
     """
 
     class Arguments:
-        scanner_id = graphene.UUID(required=True, name='id')
+        scanner_id = UUIDType(required=True, name='id')
 
-    scanner_id = graphene.UUID(name='id')
+    scanner_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -70,7 +71,7 @@ class GetScanner(graphene.Field):
     def __init__(self):
         super().__init__(
             Scanner,
-            scanner_id=graphene.UUID(required=True, name='id'),
+            scanner_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
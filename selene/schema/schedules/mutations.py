@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import require_authentication, get_gmp
 
 from selene.schema.entities import (
@@ -65,7 +66,7 @@ class CreateSchedule(graphene.Mutation):
     class Arguments:
         input_object = CreateScheduleInput(required=True, name='input')
 
-    schedule_id = graphene.UUID(name='id')
+    schedule_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -97,7 +98,7 @@ class ModifyScheduleInput(graphene.InputObjectType):
         comment: Comment on schedule.
     """
 
-    schedule_id = graphene.UUID(
+    schedule_id = UUIDType(
         name='id',
         required=True,
         description='UUID of the schedule to be modified',
@@ -172,11 +173,11 @@ class CloneSchedule(graphene.Mutation):
     """
 
     class Arguments:
-        schedule_id = graphene.UUID(required=True, name='id')
+        schedule_id = UUIDType(required=True, name='id')
 
     # it is really awkward to reuse the same variable
     # name here, but it seems working ...?!
-    schedule_id = graphene.UUID(name='id')
+    schedule_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -22,6 +22,7 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -72,7 +73,7 @@ class GetSchedule(graphene.Field):
     def __init__(self):
         super().__init__(
             Schedule,
-            schedule_id=graphene.UUID(required=True, name='id'),
+            schedule_id=UUIDType(required=True, name='id'),
             tasks=graphene.Boolean(default_value=True),
             resolver=self.resolve,
         )
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.system_reports.fields import SystemReport
 from selene.schema.utils import require_authentication, get_gmp
 
@@ -85,7 +86,7 @@ class GetSystemReport(graphene.Field):
             name=graphene.String(
                 required=True, description='Name of the system report to get.'
             ),
-            sensor_id=graphene.UUID(
+            sensor_id=UUIDType(
                 description='Optional scanner ID of a sensor to collect'
                 ' the data from.'
             ),
@@ -109,7 +110,7 @@ class GetSystemReport(graphene.Field):
         _root,
         info,
         name: graphene.String,
-        sensor_id: graphene.UUID = None,
+        sensor_id: UUIDType = None,
         duration: graphene.Int = None,
         start_time: graphene.DateTime = None,
         end_time: graphene.DateTime = None,
@@ -178,7 +179,7 @@ class GetSystemReports(graphene.List):
     ):
         super().__init__(
             SystemReport,
-            sensor_id=graphene.UUID(
+            sensor_id=UUIDType(
                 description='Optional scanner ID of a sensor to collect'
                 ' the data from.'
             ),
@@ -189,7 +190,7 @@ class GetSystemReports(graphene.List):
 
     @staticmethod
     @require_authentication
-    def resolve(_root, info, sensor_id: graphene.UUID = None):
+    def resolve(_root, info, sensor_id: UUIDType = None):
         gmp = get_gmp(info)
 
         sensor_id_str = str(sensor_id) if sensor_id is not None else None
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.relay import FilterString
 from selene.schema.tags.fields import EntityType, ResourceAction
 from selene.schema.utils import get_gmp, require_authentication
@@ -41,11 +42,11 @@ class CloneTag(graphene.Mutation):
     """
 
     class Arguments:
-        copy_id = graphene.UUID(
+        copy_id = UUIDType(
             required=True, name='id', description='UUID of the tag to clone.'
         )
 
-    tag_id = graphene.UUID(name='id')
+    tag_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -96,7 +97,7 @@ class CreateTag(graphene.Mutation):
     class Arguments:
         input_object = CreateTagInput(required=True, name='input')
 
-    tag_id = graphene.UUID(name='id')
+    tag_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -134,7 +135,7 @@ class ModifyTagInput(graphene.InputObjectType):
         active (bool, optional): Whether the tag should be active.
     """
 
-    tag_id = graphene.UUID(
+    tag_id = UUIDType(
         name='id', required=True, description='ID of target to modify.'
     )
     name = graphene.String(
@@ -292,7 +293,7 @@ class ToggleTagInput(graphene.InputObjectType):
         active (bool): Whether the tag should be active.
     """
 
-    tag_id = graphene.UUID(
+    tag_id = UUIDType(
         name='id', required=True, description='ID of target to modify.'
     )
     active = graphene.Boolean(
@@ -327,7 +328,7 @@ class RemoveTagInput(graphene.InputObjectType):
             the tag is to be removed from.
     """
 
-    tag_id = graphene.UUID(
+    tag_id = UUIDType(
         name='id', required=True, description='ID of target to remove.'
     )
     resource_type = EntityType(
@@ -372,7 +373,7 @@ class AddTagInput(graphene.InputObjectType):
             the tag is to be added to.
     """
 
-    tag_id = graphene.UUID(
+    tag_id = UUIDType(
         name='id', required=True, description='ID of target to add.'
     )
     resource_type = EntityType(
@@ -421,7 +422,7 @@ class BulkTagInput(graphene.InputObjectType):
             argument is given, resource_ids is not used
     """
 
-    tag_id = graphene.UUID(
+    tag_id = UUIDType(
         name='id', required=True, description='ID of target to add.'
     )
     resource_type = EntityType(
@@ -23,6 +23,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -71,7 +72,7 @@ class GetTag(graphene.Field):
     def __init__(self):
         super().__init__(
             Tag,
-            tag_id=graphene.UUID(required=True, name='id'),
+            tag_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
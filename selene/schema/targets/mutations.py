@@ -20,6 +20,7 @@ import graphene
 
 from selene.errors import InvalidRequest
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
@@ -33,14 +34,14 @@ from selene.schema.utils import require_authentication, get_gmp
 
 
 class SSHTargetCredentialInput(graphene.InputObjectType):
-    ssh_id = graphene.UUID(
+    ssh_id = UUIDType(
         name="id", description="UUID of a ssh credential to use on target"
     )
     port = graphene.Int(description="The port to use for ssh credential")
 
 
 class TargetCredentialInput(graphene.InputObjectType):
-    credential_id = graphene.UUID(
+    credential_id = UUIDType(
         name="id", description="UUID of a credential to use on target"
     )
 
@@ -74,14 +75,14 @@ class CreateTargetInput(graphene.InputObjectType):
     exclude_hosts = graphene.List(
         graphene.String, description="List of hosts to exclude from scan"
     )
-    port_list_id = graphene.UUID(
+    port_list_id = UUIDType(
         required=True, description="UUID of the port list to use on target"
     )
     comment = graphene.String(description="Comment for the target")
     credentials = graphene.Field(
         TargetCredentialsInput, description="Credentials to use for the target"
     )
-    esxi_credential_id = graphene.UUID(
+    esxi_credential_id = UUIDType(
         description="UUID of a esxi credential to use on target"
     )
     alive_test = graphene.Field(
@@ -114,7 +115,7 @@ class CreateTarget(graphene.Mutation):
             description='Input ObjectType for creating a new target',
         )
 
-    target_id = graphene.UUID(name='id')
+    target_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -206,7 +207,7 @@ class CreateTarget(graphene.Mutation):
 class ModifyTargetInput(graphene.InputObjectType):
     """Input object for modifyTarget"""
 
-    target_id = graphene.UUID(
+    target_id = UUIDType(
         required=True, description="ID of target to modify", name='id'
     )
     name = graphene.String(description="Target name")
@@ -237,7 +238,7 @@ class ModifyTargetInput(graphene.InputObjectType):
             "multiple IPs have the same name"
         )
     )
-    port_list_id = graphene.UUID(
+    port_list_id = UUIDType(
         description="UUID of the port list to use on target"
     )
 
@@ -360,7 +361,7 @@ class DeleteTarget(graphene.Mutation):
     """Delete a target"""
 
     class Arguments:
-        target_id = graphene.UUID(
+        target_id = UUIDType(
             required=True,
             name='id',
             description='ID of the target to be deleted',
@@ -380,13 +381,13 @@ class CloneTarget(graphene.Mutation):
     """Clone a target"""
 
     class Arguments:
-        target_id = graphene.UUID(
+        target_id = UUIDType(
             required=True,
             name='id',
             description="ID of the target to be cloned",
         )
 
-    target_id = graphene.UUID(name='id', description='UUID of the new target')
+    target_id = UUIDType(name='id', description='UUID of the new target')
 
     @staticmethod
     @require_authentication
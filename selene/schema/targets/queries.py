@@ -22,6 +22,7 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
@@ -68,7 +69,7 @@ class GetTarget(graphene.Field):
     def __init__(self):
         super().__init__(
             Target,
-            target_id=graphene.UUID(
+            target_id=UUIDType(
                 required=True,
                 name='id',
                 description='Target ID to request details for',
@@ -22,11 +22,16 @@ import graphene
 
 from selene.schema.resolver import find_resolver, text_resolver
 
-from selene.schema.parser import parse_int, parse_yes_no
+from selene.schema.parser import (
+    parse_bool,
+    parse_datetime,
+    parse_int,
+    parse_yes_no,
+)
+from selene.schema.records import ElementRecord
 from selene.schema.utils import (
     get_text,
     get_boolean_from_element,
-    get_datetime_from_element,
     get_int_from_element,
     get_subelement,
     get_sub_element_if_id_available,
@@ -57,6 +62,22 @@ class TaskReportsCounts(graphene.ObjectType):
         return get_text(parent)
 
 
+class TaskReportRecord(ElementRecord):
+    """Record of the last or current report element of a task"""
+
+    __slots__ = ('severity', 'timestamp', 'scan_start', 'scan_end')
+
+    fields = {name: name for name in __slots__}
+
+    def __init__(self, element: XmlElement):
+        super().__init__(element)
+
+        self.severity = self.text('severity')
+        self.timestamp = self.text('timestamp')
+        self.scan_start = self.text('scan_start')
+        self.scan_end = self.text('scan_end')
+
+
 class LastReport(graphene.ObjectType):
     """The last report of a task for a finished scan"""
 
@@ -71,31 +92,24 @@ class LastReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
-        uuid = report.get('id')
-        return uuid
+    def resolve_uuid(parent: TaskReportRecord, _info):
+        return parent.get('id')
 
     @staticmethod
-    def resolve_severity(parent, _info):
-        report = parent.find('report')
-        severity = report.find('severity')
-        return get_text(severity)
+    def resolve_severity(parent: TaskReportRecord, _info):
+        return parent.severity
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'timestamp')
+    def resolve_creation_time(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.timestamp)
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'scan_start')
+    def resolve_scan_start(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.scan_start)
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'scan_end')
+    def resolve_scan_end(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.scan_end)
 
 
 class CurrentReport(graphene.ObjectType):
@@ -109,24 +123,20 @@ class CurrentReport(graphene.ObjectType):
     )
 
     @staticmethod
-    def resolve_uuid(parent, _info):
-        report = parent.find('report')
-        return report.get('id')
+    def resolve_uuid(parent: TaskReportRecord, _info):
+        return parent.get('id')
 
     @staticmethod
-    def resolve_scan_start(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'scan_start')
+    def resolve_scan_start(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.scan_start)
 
     @staticmethod
-    def resolve_scan_end(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'scan_end')
+    def resolve_scan_end(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.scan_end)
 
     @staticmethod
-    def resolve_creation_time(parent, _info):
-        report = parent.find('report')
-        return get_datetime_from_element(report, 'timestamp')
+    def resolve_creation_time(parent: TaskReportRecord, _info):
+        return parse_datetime(parent.timestamp)
 
 
 class TaskReports(graphene.ObjectType):
@@ -151,6 +161,14 @@ class TaskReports(graphene.ObjectType):
     def resolve_counts(root, _info):
         return get_subelement(root, 'report_count')
 
+    @staticmethod
+    def resolve_current_report(root, _info):
+        return TaskReportRecord.of(root.find('current_report/report'))
+
+    @staticmethod
+    def resolve_last_report(root, _info):
+        return TaskReportRecord.of(root.find('last_report/report'))
+
 
 class TaskSubObjectType(BaseObjectType):
 
@@ -347,12 +365,31 @@ class TaskStatus(graphene.Enum):
     DONE = 'Done'
 
 
+class TaskRecord(ElementRecord):
+    """Record of a task element"""
+
+    __slots__ = ('average_duration', 'trend', 'status', 'alterable', 'progress')
+
+    fields = {name: name for name in __slots__}
+
+    def __init__(self, element: XmlElement):
+        super().__init__(element)
+
+        self.average_duration = self.text('average_duration')
+        self.trend = self.text('trend')
+        self.status = self.text('status')
+        self.alterable = self.text('alterable')
+        self.progress = self.text('progress')
+
+
 class Task(EntityObjectType):
     """Task object type"""
 
     class Meta:
         default_resolver = find_resolver
 
+    record_type = TaskRecord
+
     average_duration = graphene.Int(
         description="Average duration of scans for this task in seconds"
     )
@@ -397,23 +434,26 @@ class Task(EntityObjectType):
 
     @staticmethod
     def resolve_average_duration(root, _info):
-        return get_int_from_element(root, 'average_duration')
+        return parse_int(TaskRecord.read(root, 'average_duration'))
 
     @staticmethod
     def resolve_trend(root, _info):
-        return get_text_from_element(root, 'trend')
+        return TaskRecord.read(root, 'trend')
 
     @staticmethod
     def resolve_status(root, _info):
-        return get_text_from_element(root, 'status')
+        return TaskRecord.read(root, 'status')
 
     @staticmethod
     def resolve_alterable(root, _info):
-        return get_boolean_from_element(root, 'alterable')
+        alterable = TaskRecord.read(root, 'alterable')
+        if alterable is None:
+            return None
+        return parse_bool(alterable.strip())
 
     @staticmethod
     def resolve_progress(root, _info):
-        return get_int_from_element(root, 'progress')
+        return parse_int(TaskRecord.read(root, 'progress'))
 
     @staticmethod
     def resolve_scan_config(root, _info):
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_export_by_filter_mutation,
     create_export_by_ids_mutation,
@@ -38,9 +39,9 @@ class CloneTask(graphene.Mutation):
     """Clone a task"""
 
     class Arguments:
-        task_id = graphene.UUID(required=True, name='id')
+        task_id = UUIDType(required=True, name='id')
 
-    task_id = graphene.UUID(name='id')
+    task_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -85,9 +86,7 @@ class CreateContainerTask(graphene.Mutation):
             description="Input ObjectType for creating a new container task",
         )
 
-    task_id = graphene.UUID(
-        name='id', description="UUID of the new task container"
-    )
+    task_id = UUIDType(name='id', description="UUID of the new task container")
 
     @staticmethod
     @require_authentication
@@ -135,22 +134,22 @@ class CreateTaskInput(graphene.InputObjectType):
     """Input ObjectType for creating a task"""
 
     name = graphene.String(required=True, description="Task name")
-    scan_config_id = graphene.UUID(
+    scan_config_id = UUIDType(
         required=True,
         description=(
             "UUID of the scan config to use for the scanner. "
             "Only for OpenVAS scanners"
         ),
     )
-    target_id = graphene.UUID(
+    target_id = UUIDType(
         required=True, description="UUID of the target to be used"
     )
-    scanner_id = graphene.UUID(
+    scanner_id = UUIDType(
         required=True, description="UUID of the scanner to be used"
     )
 
     alert_ids = graphene.List(
-        graphene.UUID,
+        UUIDType,
         description="List of UUIDs for alerts to be used for the task",
     )
     alterable = graphene.Boolean(
@@ -160,7 +159,7 @@ class CreateTaskInput(graphene.InputObjectType):
     preferences = graphene.Field(
         TaskPreferencesInput, description="Preferences to set for the task"
     )
-    schedule_id = graphene.UUID(
+    schedule_id = UUIDType(
         description="UUID of a schedule when the task should be run"
     )
 
@@ -175,7 +174,7 @@ class CreateTask(graphene.Mutation):
             description="Input ObjectType for creating a new task",
         )
 
-    task_id = graphene.UUID(name='id', description="UUID of the new task")
+    task_id = UUIDType(name='id', description="UUID of the new task")
 
     @staticmethod
     @require_authentication
@@ -268,18 +267,18 @@ class CreateTask(graphene.Mutation):
 class ModifyTaskInput(graphene.InputObjectType):
     """Input ObjectType for modifying a task"""
 
-    task_id = graphene.UUID(
+    task_id = UUIDType(
         description="UUID of task to modify", name='id', required=True
     )
     name = graphene.String(description="Task name", required=True)
-    target_id = graphene.UUID(
+    target_id = UUIDType(
         description="UUID of the target to be used", required=True
     )
-    scanner_id = graphene.UUID(
+    scanner_id = UUIDType(
         description="UUID of the scanner to be used", required=True
     )
 
-    scan_config_id = graphene.UUID(
+    scan_config_id = UUIDType(
         description=(
             "UUID of the scan config to use for the scanner. "
             "Only for OpenVAS scanners"
@@ -288,7 +287,7 @@ class ModifyTaskInput(graphene.InputObjectType):
     )
 
     alert_ids = graphene.List(
-        graphene.UUID,
+        UUIDType,
         description="List of UUIDs for alerts to be used for the task",
     )
     alterable = graphene.Boolean(
@@ -298,7 +297,7 @@ class ModifyTaskInput(graphene.InputObjectType):
     preferences = graphene.Field(
         TaskPreferencesInput, description="Preferences to set for the task"
     )
-    schedule_id = graphene.UUID(
+    schedule_id = UUIDType(
         description="UUID of a schedule when the task should be run"
     )
 
@@ -401,15 +400,13 @@ class StartTask(graphene.Mutation):
     """Starts a scan for a task"""
 
     class Arguments:
-        task_id = graphene.UUID(
+        task_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the task to start a scan for",
         )
 
-    report_id = graphene.UUID(
-        description="UUID of the report for the started scan"
-    )
+    report_id = UUIDType(description="UUID of the report for the started scan")
 
     @staticmethod
     @require_authentication
@@ -425,7 +422,7 @@ class StopTask(graphene.Mutation):
     """Stop a task"""
 
     class Arguments:
-        task_id = graphene.UUID(
+        task_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the task to stop the current task",
@@ -449,7 +446,7 @@ class ResumeTask(graphene.Mutation):
     """Resume a task"""
 
     class Arguments:
-        task_id = graphene.UUID(
+        task_id = UUIDType(
             required=True,
             name='id',
             description="UUID of the task which scan should be resumed",
@@ -22,18 +22,28 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
+from selene.schema.lookahead import (
+    get_selected_node_fields,
+    is_any_field_selected,
+)
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
-from selene.schema.tasks.fields import Task
+from selene.schema.tasks.fields import Task, TaskRecord
 
+from selene.schema.loaders import get_entity_loader, uses_entity_loader
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
 
+# fields of a task only returned by gvmd if details are requested
+TASK_DETAILS_FIELDS = ('averageDuration', 'results')
+
 
 class GetTask(graphene.Field):
     """Get a single task.
@@ -63,17 +73,16 @@ class GetTask(graphene.Field):
     def __init__(self):
         super().__init__(
             Task,
-            task_id=graphene.UUID(required=True, name='id'),
+            task_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
     @staticmethod
+    @uses_entity_loader
     @require_authentication
     def resolve(_root, info, task_id: UUID):
-        gmp = get_gmp(info)
-
-        xml = gmp.get_task(str(task_id))
-        return xml.find('task')
+        loader = get_entity_loader(info, 'task', details=True)
+        return loader.load(str(task_id)).then(TaskRecord.of)
 
 
 class GetTasks(EntityConnectionField):
@@ -120,6 +129,7 @@ class GetTasks(EntityConnectionField):
     """
 
     entity_type = Task
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -138,8 +148,12 @@ class GetTasks(EntityConnectionField):
             filter_string, first=first, last=last, after=after, before=before
         )
 
+        details = is_any_field_selected(
+            get_selected_node_fields(info), TASK_DETAILS_FIELDS
+        )
+
         xml: XmlElement = gmp.get_tasks(
-            filter_string=filter_string.filter_string, details=True
+            filter_string=filter_string.filter_string, details=details
         )
 
         task_elements = xml.findall('task')
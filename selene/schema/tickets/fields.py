@@ -20,9 +20,9 @@ import graphene
 
 from gvm.protocols.next import TicketStatus as GvmTicketStatus
 
+from selene.schema.scalars import UUIDType
 from selene.schema.resolver import text_resolver
 
-from selene.schema.parser import parse_uuid
 from selene.schema.utils import (
     get_boolean_from_element,
     get_datetime_from_element,
@@ -39,12 +39,12 @@ class TicketStatus(graphene.Enum):
 
 
 class TicketReport(graphene.ObjectType):
-    id = graphene.UUID()
+    id = UUIDType()
     timestamp = graphene.DateTime()
 
     @staticmethod
     def resolve_id(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_timestamp(root, _info):
@@ -76,7 +76,7 @@ class RemediationTicket(EntityObjectType):
     nvt_oid = graphene.String()
     task = graphene.Field(Task)
     report = graphene.Field(TicketReport)
-    result = graphene.UUID()
+    result = UUIDType()
     orphan = graphene.Boolean()
 
     @staticmethod
@@ -109,7 +109,7 @@ class RemediationTicket(EntityObjectType):
 
     @staticmethod
     def resolve_result(root, _info):
-        return parse_uuid(root.find('result').get('id'))
+        return root.find('result').get('id') or None
 
     @staticmethod
     def resolve_orphan(root, _info):
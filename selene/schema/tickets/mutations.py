@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_export_by_filter_mutation,
     create_export_by_ids_mutation,
@@ -40,9 +41,9 @@ class CloneTicket(graphene.Mutation):
     """
 
     class Arguments:
-        ticket_id = graphene.UUID(required=True, name='id')
+        ticket_id = UUIDType(required=True, name='id')
 
-    ticket_id = graphene.UUID(name='id')
+    ticket_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -94,10 +95,10 @@ class CreateTicketInput(graphene.InputObjectType):
 
     note = graphene.String(required=True, description="Ticket note.")
     comment = graphene.String(description="Ticket comment.")
-    result_id = graphene.UUID(
+    result_id = UUIDType(
         required=True, description=("UUID of result for the ticket.")
     )
-    assigned_to_user_id = graphene.UUID(
+    assigned_to_user_id = UUIDType(
         required=True, description="UUID of assigned user."
     )
 
@@ -113,7 +114,7 @@ class CreateTicket(graphene.Mutation):
     class Arguments:
         input_object = CreateTicketInput(required=True, name='input')
 
-    ticket_id = graphene.UUID(name='id')
+    ticket_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -153,12 +154,12 @@ class ModifyTicketInput(graphene.InputObjectType):
         status (TicketStatus, optional): New status for the ticket
     """
 
-    ticket_id = graphene.UUID(
+    ticket_id = UUIDType(
         required=True, description="UUID of ticket to modify.", name='id'
     )
     note = graphene.String(description="Ticket note.")
     comment = graphene.String(description="Ticket comment.")
-    assigned_to_user_id = graphene.UUID(description="UUID of assigned user.")
+    assigned_to_user_id = UUIDType(description="UUID of assigned user.")
     ticket_status = TicketStatus(description="Status of the Ticket")
 
 
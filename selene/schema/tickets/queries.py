@@ -22,12 +22,14 @@ from graphql import ResolveInfo
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.relay import (
     EntityConnectionField,
     Entities,
     get_filter_string_for_pagination,
+    TIMESTAMP_SORT_FIELDS,
 )
 
 from selene.schema.tickets.fields import RemediationTicket
@@ -70,7 +72,7 @@ class GetTicket(graphene.Field):
     def __init__(self):
         super().__init__(
             RemediationTicket,
-            ticket_id=graphene.UUID(required=True, name='id'),
+            ticket_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -135,6 +137,7 @@ class GetTickets(EntityConnectionField):
     """
 
     entity_type = RemediationTicket
+    keyset_sort_fields = TIMESTAMP_SORT_FIELDS
 
     @staticmethod
     @require_authentication
@@ -18,25 +18,25 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import (
     get_boolean_from_element,
     get_datetime_from_element,
     get_int_from_element,
     get_text_from_element,
 )
-from selene.schema.parser import parse_uuid
 from selene.schema.entity import EntityObjectType
 
 
 class TLSSourceLocation(graphene.ObjectType):
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     host_ip = graphene.String()
-    host_id = graphene.UUID()
+    host_id = UUIDType()
     port = graphene.Int()
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_host_ip(root, _info):
@@ -46,7 +46,7 @@ class TLSSourceLocation(graphene.ObjectType):
     @staticmethod
     def resolve_host_id(root, _info):
         host = root.find('host')
-        return parse_uuid(host.find('asset').get('id'))
+        return host.find('asset').get('id') or None
 
     @staticmethod
     def resolve_port(root, _info):
@@ -54,14 +54,14 @@ class TLSSourceLocation(graphene.ObjectType):
 
 
 class TLSSourceOrigin(graphene.ObjectType):
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     origin_type = graphene.String()
-    origin_id = graphene.UUID()
+    origin_id = UUIDType()
     origin_data = graphene.String()
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_origin_type(root, _info):
@@ -77,7 +77,7 @@ class TLSSourceOrigin(graphene.ObjectType):
 
 
 class TLSSource(graphene.ObjectType):
-    uuid = graphene.UUID(name='id')
+    uuid = UUIDType(name='id')
     timestamp = graphene.DateTime()
     tls_versions = graphene.List(graphene.String)
     location = graphene.Field(TLSSourceLocation)
@@ -85,7 +85,7 @@ class TLSSource(graphene.ObjectType):
 
     @staticmethod
     def resolve_uuid(root, _info):
-        return parse_uuid(root.get('id'))
+        return root.get('id') or None
 
     @staticmethod
     def resolve_timestamp(root, _info):
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.entities import (
     create_delete_by_ids_mutation,
     create_delete_by_filter_mutation,
@@ -51,7 +52,7 @@ class CreateTLSCertificate(graphene.Mutation):
     class Arguments:
         input_object = CreateTLSCertificateInput(required=True, name='input')
 
-    tls_certificate_id = graphene.UUID(name='id')
+    tls_certificate_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -79,9 +80,9 @@ class CloneTLSCertificate(graphene.Mutation):
     """
 
     class Arguments:
-        tls_certificate_id = graphene.UUID(required=True, name='id')
+        tls_certificate_id = UUIDType(required=True, name='id')
 
-    cloned_tls_certificate_id = graphene.UUID(name='id')
+    cloned_tls_certificate_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -102,7 +103,7 @@ class DeleteTLSCertificate(graphene.Mutation):
     """
 
     class Arguments:
-        tls_certificate_id = graphene.UUID(required=True, name='id')
+        tls_certificate_id = UUIDType(required=True, name='id')
 
     ok = graphene.Boolean()
 
@@ -212,7 +213,7 @@ class ModifyTLSCertificateInput(graphene.InputObjectType):
         comment (str, optional): The comment on the tls certificate.
     """
 
-    tls_certificate_id = graphene.UUID(
+    tls_certificate_id = UUIDType(
         required=True,
         description="UUID of tls certificate to modify.",
         name='id',
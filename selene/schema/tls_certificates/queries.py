@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.tls_certificates.fields import TLSCertificate
 
 from selene.schema.parser import FilterString
@@ -70,7 +71,7 @@ class GetTLSCertificate(graphene.Field):
     def __init__(self):
         super().__init__(
             TLSCertificate,
-            tls_certificate_id=graphene.UUID(required=True, name='id'),
+            tls_certificate_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 
 
@@ -46,7 +47,7 @@ class RestoreFromTrashcan(graphene.Mutation):
     """
 
     class Arguments:
-        restore_id = graphene.UUID(
+        restore_id = UUIDType(
             required=True,
             name='id',
             description='UUID of the entity to restore from the trashcan.',
@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.utils import get_gmp, require_authentication
 
 
@@ -28,7 +29,7 @@ class ModifyUserSetting(graphene.Mutation):
     """
 
     class Arguments:
-        setting_id = graphene.UUID(
+        setting_id = UUIDType(
             required=True,
             name='id',
             description='UUID of the user setting to modify',
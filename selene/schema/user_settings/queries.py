@@ -18,6 +18,7 @@
 
 import graphene
 
+from selene.schema.scalars import UUIDType
 from selene.schema.user_settings.fields import UserSetting
 from selene.schema.utils import require_authentication, get_gmp
 
@@ -26,13 +27,13 @@ class GetUserSetting(graphene.Field):
     def __init__(self):
         super().__init__(
             UserSetting,
-            user_setting_id=graphene.UUID(required=True, name='id'),
+            user_setting_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
     @staticmethod
     @require_authentication
-    def resolve(_root, info, user_setting_id: graphene.UUID):
+    def resolve(_root, info, user_setting_id: UUIDType):
         gmp = get_gmp(info)
 
         xml = gmp.get_user_setting(str(user_setting_id))
@@ -24,7 +24,12 @@ import graphene
 
 from gvm.protocols.next import UserAuthType as GvmUserAuthType
 
-from selene.schema.utils import require_authentication, get_gmp
+from selene.schema.scalars import UUIDType
+from selene.schema.utils import (
+    require_authentication,
+    get_gmp,
+    get_uuid_filter_string,
+)
 
 from selene.schema.entities import (
     create_export_by_ids_mutation,
@@ -66,9 +71,9 @@ class CloneUser(graphene.Mutation):
     """
 
     class Arguments:
-        user_id = graphene.UUID(required=True, name='id')
+        user_id = UUIDType(required=True, name='id')
 
-    user_id = graphene.UUID(name='id')
+    user_id = UUIDType(name='id')
 
     @staticmethod
     @require_authentication
@@ -111,7 +116,7 @@ class CreateUserInput(graphene.InputObjectType):
         description="Allow access only to passed ifaces."
     )
     role_ids = graphene.List(
-        graphene.UUID, description="A list of role UUIDs for the use"
+        UUIDType, description="A list of role UUIDs for the use"
     )
 
 
@@ -264,7 +269,7 @@ class DeleteUserByIdsInput(graphene.InputObjectType):
     """Input Object for DeleteUsersByIds"""
 
     user_ids = graphene.List(
-        graphene.UUID,
+        UUIDType,
         required=True,
         name='ids',
         description="List of UUIDs of users to delete..",
@@ -306,9 +311,7 @@ class DeleteUsersByIds(graphene.Mutation):
         )
 
         gmp = get_gmp(info)
-        filter_string = ''
-        for user_id in user_ids:
-            filter_string += f'uuid={str(user_id)} '
+        filter_string = get_uuid_filter_string(user_ids)
 
         get_users_xml_response = gmp.get_users(filter_string=filter_string)
         xml_users = get_users_xml_response.findall("user")
@@ -365,17 +368,17 @@ class ModifyUserInput(graphene.InputObjectType):
             user.
     """
 
-    user_id = graphene.UUID(
+    user_id = UUIDType(
         required=True, description="UUID of the user to be modified.", name='id'
     )
     name = graphene.String(description="The name for the user.")
     comment = graphene.String(description="The comment for the user.")
     password = graphene.String(description="The password for the user.")
     role_ids = graphene.List(
-        graphene.UUID, description="A list of role UUIDs for the user."
+        UUIDType, description="A list of role UUIDs for the user."
     )
     group_ids = graphene.List(
-        graphene.UUID, description="A list of group UUIDs for the user."
+        UUIDType, description="A list of group UUIDs for the user."
     )
 
     hosts = graphene.List(
@@ -22,6 +22,7 @@ import graphene
 
 from graphql import ResolveInfo
 
+from selene.schema.scalars import UUIDType
 from selene.schema.parser import FilterString
 
 from selene.schema.utils import get_gmp, require_authentication, XmlElement
@@ -40,7 +41,7 @@ class GetUser(graphene.Field):
     def __init__(self):
         super().__init__(
             User,
-            user_id=graphene.UUID(required=True, name='id'),
+            user_id=UUIDType(required=True, name='id'),
             resolver=self.resolve,
         )
 
@@ -17,7 +17,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from datetime import datetime
-from typing import Optional, Callable, List
+from typing import TYPE_CHECKING, Optional, Callable, Iterable, List
 from xml.etree import ElementTree
 
 from django.http import HttpRequest
@@ -30,6 +30,11 @@ from selene.errors import AuthenticationRequired
 
 from selene.schema.parser import parse_bool, parse_datetime, parse_int
 
+if TYPE_CHECKING:
+    # only required for the annotations. The transport pulls in the
+    # instrumentation and metrics.
+    from selene.transport import AsyncGmpMixin
+
 XmlElement = ElementTree.Element  # pylint: disable=invalid-name
 
 RESET_UUID = "0"
@@ -106,10 +111,28 @@ def get_gmp(info: ResolveInfo) -> Gmp:
     return info.context.gmp
 
 
+def get_async_gmp(info: ResolveInfo) -> 'AsyncGmpMixin':
+    """Return the asyncio GMP protocol of the request
+
+    Only available if the request is handled by the AsyncSeleneView. The GMP
+    commands of the returned protocol must be awaited.
+    """
+    return info.context.async_gmp
+
+
 def get_request(info: ResolveInfo) -> HttpRequest:
     return info.context
 
 
+def evict_gmp_connections(info: ResolveInfo):
+    """Close the pooled GMP connections of the session if pooling is enabled"""
+    request = get_request(info)
+    pool = getattr(request, 'gmp_pool', None)
+    username = request.session.get('username')
+    if pool is not None and username:
+        pool.evict(username, request.session.get('password', ''))
+
+
 def check_authentication(info: ResolveInfo):
     request = get_request(info)
     if not request.session.get('username'):
@@ -124,6 +147,16 @@ def require_authentication(resolver) -> Callable:
     return resolve
 
 
+def get_uuid_filter_string(entity_ids: Iterable) -> str:
+    """Return a filter string matching all entities with the passed IDs"""
+    filter_string = ''
+
+    for entity_id in entity_ids:
+        filter_string += f'uuid={str(entity_id)} '
+
+    return filter_string
+
+
 def csv_to_list(csv_list: str) -> List[str]:
     if not csv_list:
         return []
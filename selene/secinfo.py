@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cache for SecInfo responses
+
+CVEs, CPEs, NVTs, CERT-Bund and DFN-CERT advisories only change when the
+corresponding feed is synchronized. Responses of `get_info` and
+`get_info_list` are therefore cached across requests and keyed by the version
+of the feed they are provided by.
+
+The feed versions are requested via `get_feeds` at most every
+`feed_check_interval` seconds. If the version or the syncing state of a feed
+changes, all cached responses of that feed are dropped. While a feed is
+syncing or if the feeds can't be requested, responses are not cached at all.
+
+The in-process tier is a LRU cache local to a worker process. Optionally the
+responses are also stored as XML files in a directory shared by all workers.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+from lxml import etree
+
+from gvm.errors import GvmError
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.memo import get_memo_key
+from selene.transforms import StreamingCheckCommandTransform, xml_to_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_FEED_CHECK_INTERVAL = 30  # in seconds
+
+CACHED_COMMANDS = frozenset(['get_info', 'get_info_list'])
+
+# feed type providing the data of an info type
+INFO_TYPE_FEEDS = {
+    'CERT_BUND_ADV': 'CERT',
+    'CPE': 'SCAP',
+    'CVE': 'SCAP',
+    'DFN_CERT_ADV': 'CERT',
+    'NVT': 'NVT',
+    'OVALDEF': 'SCAP',
+}
+
+
+class FeedState(NamedTuple):
+    version: Optional[str]
+    currently_syncing: bool
+
+
+class SecInfoCache:
+    """A cache for SecInfo responses shared by all requests of a worker
+
+    Arguments:
+        max_size: Maximum number of responses kept in memory
+        directory: Optional directory for storing the responses on disk
+        feed_check_interval: Number of seconds after which the feed versions
+            are requested again
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        directory: Optional[str] = None,
+        feed_check_interval: int = DEFAULT_FEED_CHECK_INTERVAL,
+    ):
+        self.max_size = max_size
+        self.directory = Path(directory) if directory else None
+        self.feed_check_interval = feed_check_interval
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Dict[Hashable, Any] = OrderedDict()
+        self._feeds: Dict[str, FeedState] = {}
+        self._feeds_checked: Optional[float] = None
+        self._lock = threading.Lock()
+        self._transform = StreamingCheckCommandTransform()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def needs_feed_check(self) -> bool:
+        with self._lock:
+            return (
+                self._feeds_checked is None
+                or time.monotonic() - self._feeds_checked
+                >= self.feed_check_interval
+            )
+
+    def check_feeds(self, gmp: Gmp):
+        """Request the feed versions if the check interval has passed"""
+        if self.needs_feed_check():
+            self.update_feeds(gmp.get_feeds())
+
+    def update_feeds(self, response: Any):
+        """Update the feed states from a get_feeds response
+
+        Drops the cached responses of all feeds with a changed state.
+        """
+        feeds = {}
+        for feed in response.findall('feed'):
+            feed_type = feed.findtext('type')
+            if feed_type:
+                feeds[feed_type] = FeedState(
+                    version=feed.findtext('version'),
+                    currently_syncing=feed.find('currently_syncing')
+                    is not None,
+                )
+
+        with self._lock:
+            self._feeds_checked = time.monotonic()
+
+            changed = [
+                feed_type
+                for feed_type in set(self._feeds) | set(feeds)
+                if self._feeds.get(feed_type) != feeds.get(feed_type)
+            ]
+            self._feeds = feeds
+
+        for feed_type in changed:
+            self.invalidate(feed_type)
+
+    def get_feed_state(self, feed_type: str) -> Optional[FeedState]:
+        with self._lock:
+            return self._feeds.get(feed_type)
+
+    def invalidate(self, feed_type: Optional[str] = None):
+        """Drop all cached responses or only the ones of a feed"""
+        with self._lock:
+            if feed_type is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == feed_type]:
+                    del self._entries[key]
+
+        if self.directory is not None:
+            self._remove_files(feed_type)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+
+        response = self._read_file(key)
+
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._put(key, response)
+
+        return response
+
+    def put(self, key: Hashable, response: Any):
+        with self._lock:
+            self._put(key, response)
+
+        self._write_file(key, response)
+
+    def _put(self, key: Hashable, response: Any):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _get_path(self, key: Hashable) -> Path:
+        feed_type, version = key[0], key[1]
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return self.directory / feed_type / version / f'{digest}.xml'
+
+    def _read_file(self, key: Hashable) -> Optional[Any]:
+        if self.directory is None:
+            return None
+
+        path = self._get_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            return self._transform(data.decode('utf-8'))
+        except (etree.XMLSyntaxError, GvmError):
+            logger.warning("Removing invalid SecInfo cache file %s", path)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+    def _write_file(self, key: Hashable, response: Any):
+        if self.directory is None:
+            return
+
+        path = self._get_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # write to a temporary file first to never expose partial files to
+            # other workers
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(xml_to_string(response).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write SecInfo cache file %s: %s", path, e)
+
+    def _remove_files(self, feed_type: Optional[str]):
+        if feed_type is None:
+            paths = [self.directory]
+        else:
+            state = self.get_feed_state(feed_type)
+            feed_path = self.directory / feed_type
+            # keep the files of the current version if they were written by
+            # another worker already
+            keep = (
+                state.version
+                if state is not None and not state.currently_syncing
+                else None
+            )
+            try:
+                paths = [p for p in feed_path.iterdir() if p.name != keep]
+            except OSError:
+                paths = []
+
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class CachedSecInfoGmp:
+    """Wraps a Gmp instance to cache SecInfo responses across requests
+
+    Responses are cached per user because the content of a list depends on
+    the settings of the user, e.g. the default number of rows.
+    """
+
+    def __init__(self, gmp: Gmp, cache: SecInfoCache, username: str):
+        self._gmp = gmp
+        self._cache = cache
+        self._username = username
+
+    @property
+    def gmp(self) -> Gmp:
+        """The wrapped Gmp instance"""
+        return self._gmp
+
+    def get_cache_key(
+        self, name: str, args: tuple, kwargs: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        info_type = getattr(kwargs.get('info_type'), 'name', None)
+        feed_type = INFO_TYPE_FEEDS.get(info_type)
+        if feed_type is None:
+            return None
+
+        try:
+            self._cache.check_feeds(self._gmp)
+        except GvmError as e:
+            # e.g. the user isn't allowed to get the feeds
+            logger.debug("Not caching %s. Could not get the feeds: %s", name, e)
+            return None
+
+        state = self._cache.get_feed_state(feed_type)
+        if state is None or state.currently_syncing or not state.version:
+            return None
+
+        memo_key = get_memo_key(name, args, kwargs)
+        if memo_key is None:
+            return None
+
+        return (feed_type, state.version, self._username, memo_key)
+
+    def _cached(self, name: str, command: Callable) -> Callable:
+        def call(*args, **kwargs):
+            key = self.get_cache_key(name, args, kwargs)
+            if key is None:
+                return command(*args, **kwargs)
+
+            response = self._cache.get(key)
+            if response is None:
+                response = command(*args, **kwargs)
+                self._cache.put(key, response)
+
+            return response
+
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+
+        if name in CACHED_COMMANDS and self._username:
+            return self._cached(name, attr)
+
+        return attr
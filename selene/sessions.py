@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Session engine backed by a memory mapped file
+
+Set ``SESSION_ENGINE = 'selene.sessions'`` to use it. The sessions are kept in
+a fixed size hash table within a file which is mapped into the memory of all
+worker processes. The file is set by ``SESSION_TABLE_PATH`` and defaults to
+selene-<uid>/sessions below /dev/shm. The directory is only accessible by the
+user running selene and the file is created with 0600 permissions. The
+sessions contain the passwords of the gvmd users in plain text.
+``SESSION_TABLE_SLOT_COUNT`` limits the number of concurrent sessions.
+Loading a session reads a single slot of the table instead of opening,
+reading and unpickling a file.
+
+Each slot holds the session key, the expiry time and the session data encoded
+by the :class:`CompactSerializer`. Accessing the table is guarded by a POSIX
+record lock on the file, which also works for workers forked after the file
+got mapped, and by a thread lock within a process.
+
+Sessions not fitting into a slot of ``SESSION_TABLE_SLOT_SIZE`` bytes, e.g.
+because of a very long password, are stored by Django's file based session
+backend in the directory of the table. Their slot only marks them as stored
+in a file.
+
+GMP doesn't provide a token for resuming an authentication, therefore the
+password has to be kept for authenticating new gvmd connections. Only the
+pool of authenticated connections (see :mod:`selene.pool`) avoids sending
+the credentials again by reusing an idle connection of the user.
+"""
+
+import datetime
+import fcntl
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.sessions.backends import file as file_backend
+from django.contrib.sessions.backends.base import (
+    CreateError,
+    SessionBase,
+    UpdateError,
+)
+
+DEFAULT_SLOT_COUNT = 4096
+DEFAULT_SLOT_SIZE = 512  # in bytes
+
+MAGIC = b'SELENESS'
+HEADER = struct.Struct('<8sII')
+HEADER_SIZE = 64
+
+# state, session key, expiry as unix timestamp, length of the data
+SLOT_HEADER = struct.Struct('<B3x40sdI')
+MAX_KEY_LENGTH = 40
+
+EMPTY = 0
+USED = 1
+DELETED = 2
+
+DATETIME_KEY = '$dt'
+
+# data of a slot whose session is stored in a file. Serialized sessions are
+# JSON objects and can't be confused with it.
+FILE_MARKER = b'@file'
+
+
+class SessionTableFull(RuntimeError):
+    """No free slot for storing a new session"""
+
+
+class SessionDataTooLarge(ValueError):
+    """The data of a session doesn't fit into a slot"""
+
+
+def _check_private(path: Path, info: os.stat_result, file_type: int):
+    if (
+        stat.S_IFMT(info.st_mode) != file_type
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f'{path} must be owned by the current user and must not be '
+            'accessible by other users'
+        )
+
+
+def _private_directory(directory: Path) -> Path:
+    """Create a directory only accessible by the current user"""
+    try:
+        directory.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+
+    # the directory may have been created by another user before
+    _check_private(directory, os.lstat(directory), stat.S_IFDIR)
+    return directory
+
+
+def _default_path() -> Path:
+    shm = Path('/dev/shm')
+    parent = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return _private_directory(parent / f'selene-{os.getuid()}') / 'sessions'
+
+
+def _encode_datetime(obj: Any) -> Any:
+    if isinstance(obj, datetime.datetime):
+        return {DATETIME_KEY: obj.isoformat()}
+    raise TypeError(
+        f'Object of type {obj.__class__.__name__} is not serializable'
+    )
+
+
+def _decode_datetime(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and DATETIME_KEY in obj:
+        return datetime.datetime.fromisoformat(obj[DATETIME_KEY])
+    return obj
+
+
+# json.dumps and json.loads create a new encoder and decoder on each call if
+# any option is passed
+_encoder = json.JSONEncoder(separators=(',', ':'), default=_encode_datetime)
+_decoder = json.JSONDecoder(object_hook=_decode_datetime)
+
+
+class CompactSerializer:
+    """Serialize sessions as compact JSON
+
+    Contrary to Django's JSONSerializer datetimes are supported, which are
+    required for the session expiry set on login.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return _encoder.encode(obj).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return _decoder.decode(data.decode('utf-8'))
+
+
+class SharedSessionTable:
+    """A hash table of sessions in a memory mapped file
+
+    Args:
+        path: File containing the table. It is created if it doesn't exist.
+            An existing file keeps its number and size of slots.
+        slot_count: Maximum number of sessions
+        slot_size: Size of a slot in bytes. The data of a session must fit
+            into a slot together with the slot header.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        slot_count: int = DEFAULT_SLOT_COUNT,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+    ):
+        if slot_size <= SLOT_HEADER.size:
+            raise ValueError(
+                f'The slot size must be larger than {SLOT_HEADER.size} bytes'
+            )
+
+        self.path = Path(path)
+
+        self._lock = threading.Lock()
+        self._fd = os.open(
+            str(self.path),
+            os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW | os.O_CLOEXEC,
+            0o600,
+        )
+
+        try:
+            _check_private(self.path, os.fstat(self._fd), stat.S_IFREG)
+
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size < HEADER_SIZE:
+                    # independent of the umask
+                    os.fchmod(self._fd, 0o600)
+                    os.ftruncate(self._fd, HEADER_SIZE + slot_count * slot_size)
+                    os.pwrite(
+                        self._fd, HEADER.pack(MAGIC, slot_count, slot_size), 0
+                    )
+
+                magic, slot_count, slot_size = HEADER.unpack(
+                    os.pread(self._fd, HEADER.size, 0)
+                )
+                if magic != MAGIC:
+                    raise ValueError(f'{self.path} is not a session table')
+
+                self._mmap = mmap.mmap(
+                    self._fd, HEADER_SIZE + slot_count * slot_size
+                )
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+
+    @property
+    def max_data_size(self) -> int:
+        return self.slot_size - SLOT_HEADER.size
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        with self._lock:
+            fcntl.lockf(self._fd, operation)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, index: int) -> int:
+        return HEADER_SIZE + index * self.slot_size
+
+    def _read_header(self, index: int) -> Tuple[int, bytes, float, int]:
+        return SLOT_HEADER.unpack_from(self._mmap, self._offset(index))
+
+    def _write(self, index: int, key: bytes, expiry: float, data: bytes):
+        offset = self._offset(index)
+        data_offset = offset + SLOT_HEADER.size
+        self._mmap[data_offset : data_offset + len(data)] = data
+        SLOT_HEADER.pack_into(self._mmap, offset, USED, key, expiry, len(data))
+
+    def _set_state(self, index: int, state: int):
+        self._mmap[self._offset(index)] = state
+
+    def _find(
+        self, key: bytes, now: float
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Return the slot of a key and the first slot for inserting it"""
+        start = zlib.crc32(key) % self.slot_count
+        free = None
+
+        for i in range(self.slot_count):
+            index = (start + i) % self.slot_count
+            state, slot_key, expiry, _ = self._read_header(index)
+
+            if state == EMPTY:
+                return None, index if free is None else free
+
+            if state == USED and slot_key == key:
+                if expiry > now:
+                    return index, index
+                return None, index if free is None else free
+
+            if free is None and (state == DELETED or expiry <= now):
+                free = index
+
+        return None, free
+
+    def _delete(self, index: int):
+        # a slot followed by an empty slot isn't part of any probe sequence
+        # anymore. Therefore it and preceding deleted slots can become empty.
+        following = (index + 1) % self.slot_count
+        if self._read_header(following)[0] != EMPTY:
+            self._set_state(index, DELETED)
+            return
+
+        while True:
+            self._set_state(index, EMPTY)
+            index = (index - 1) % self.slot_count
+            if self._read_header(index)[0] != DELETED:
+                return
+
+    @staticmethod
+    def _encode_key(session_key: str) -> bytes:
+        key = session_key.encode('ascii')
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValueError(f'Invalid session key {session_key}')
+        return key.ljust(MAX_KEY_LENGTH, b'\0')
+
+    def get(self, session_key: str) -> Optional[bytes]:
+        key = self._encode_key(session_key)
+
+        with self._locked(fcntl.LOCK_SH):
+            index, _ = self._find(key, time.time())
+            if index is None:
+                return None
+
+            offset = self._offset(index) + SLOT_HEADER.size
+            length = self._read_header(index)[3]
+            return self._mmap[offset : offset + length]
+
+    def set(
+        self,
+        session_key: str,
+        data: bytes,
+        expiry: float,
+        *,
+        must_create: bool = False,
+        must_exist: bool = False,
+    ) -> bool:
+        """Store the data of a session until the expiry unix timestamp
+
+        Returns False if the session already exists and must_create is set or
+        if it doesn't exist and must_exist is set.
+        """
+        if len(data) > self.max_data_size:
+            raise SessionDataTooLarge(
+                f'Session data of {len(data)} bytes exceeds the maximum of '
+                f'{self.max_data_size} bytes'
+            )
+
+        key = self._encode_key(session_key)
+
+        with self._locked(fcntl.LOCK_EX):
+            index, free = self._find(key, time.time())
+
+            if index is not None and must_create:
+                return False
+            if index is None and must_exist:
+                return False
+
+            if index is None:
+                if free is None:
+                    raise SessionTableFull(
+                        f'Session table {self.path} is full. Increase the '
+                        'number of slots.'
+                    )
+                index = free
+
+            self._write(index, key, expiry, data)
+            return True
+
+    def delete(self, session_key: str):
+        key = self._encode_key(session_key)
+
+        with self._locked(fcntl.LOCK_EX):
+            index, _ = self._find(key, time.time())
+            if index is not None:
+                self._delete(index)
+
+    def clear_expired(self):
+        """Remove expired sessions and rebuild the probe sequences"""
+        with self._locked(fcntl.LOCK_EX):
+            now = time.time()
+            sessions = []
+
+            for index in range(self.slot_count):
+                state, key, expiry, length = self._read_header(index)
+                if state == USED and expiry > now:
+                    offset = self._offset(index) + SLOT_HEADER.size
+                    data = self._mmap[offset : offset + length]
+                    sessions.append((key, expiry, data))
+
+                self._set_state(index, EMPTY)
+
+            for key, expiry, data in sessions:
+                _, index = self._find(key, now)
+                self._write(index, key, expiry, data)
+
+    def __len__(self) -> int:
+        with self._locked(fcntl.LOCK_SH):
+            now = time.time()
+            headers = (self._read_header(i) for i in range(self.slot_count))
+            return sum(
+                1
+                for state, _, expiry, _ in headers
+                if state == USED and expiry > now
+            )
+
+    def close(self):
+        self._mmap.close()
+        os.close(self._fd)
+
+
+_tables: Dict[Tuple[str, int, int], SharedSessionTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_session_table() -> SharedSessionTable:
+    """Return the session table configured by the SESSION_TABLE_* settings"""
+    path = getattr(settings, 'SESSION_TABLE_PATH', None) or _default_path()
+    slot_count = getattr(
+        settings, 'SESSION_TABLE_SLOT_COUNT', DEFAULT_SLOT_COUNT
+    )
+    slot_size = getattr(settings, 'SESSION_TABLE_SLOT_SIZE', DEFAULT_SLOT_SIZE)
+    key = (str(path), slot_count, slot_size)
+
+    table = _tables.get(key)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(key)
+            if table is None:
+                table = SharedSessionTable(
+                    path, slot_count=slot_count, slot_size=slot_size
+                )
+                _tables[key] = table
+    return table
+
+
+class FileSessionStore(file_backend.SessionStore):
+    """Django's file based session store for sessions too large for a slot
+
+    The files are kept in the directory of the session table and are
+    serialized by the CompactSerializer.
+    """
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self.serializer = CompactSerializer
+
+    @classmethod
+    def _get_storage_path(cls) -> str:
+        return str(get_session_table().path.parent)
+
+
+class SessionStore(SessionBase):
+    """Sessions stored in a SharedSessionTable
+
+    The session data is kept unsigned and serialized by the CompactSerializer
+    because it never leaves the server.
+    """
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self.serializer = CompactSerializer
+        self._table = get_session_table()
+        self._in_file = False
+
+    def load(self) -> Dict[str, Any]:
+        data = None
+        if self.session_key is not None:
+            try:
+                data = self._table.get(self.session_key)
+            except ValueError:
+                data = None
+
+        if data == FILE_MARKER:
+            file_store = FileSessionStore(self.session_key)
+            session = file_store.load()
+            if file_store.session_key is not None:
+                self._in_file = True
+                return session
+        elif data is not None:
+            try:
+                return self.serializer().loads(data)
+            except ValueError:
+                pass
+
+        self._session_key = None
+        return {}
+
+    def exists(self, session_key: str) -> bool:
+        try:
+            return (
+                bool(session_key) and self._table.get(session_key) is not None
+            )
+        except ValueError:
+            return False
+
+    def create(self):
+        while True:
+            self._session_key = self._get_new_session_key()
+            if self._store(must_create=True):
+                break
+            # key collision
+
+        self.modified = True
+
+    def save(self, must_create: bool = False):
+        if self.session_key is None:
+            return self.create()
+
+        if not self._store(must_create):
+            raise CreateError if must_create else UpdateError
+
+    def _store(self, must_create: bool) -> bool:
+        session = self._get_session(no_load=must_create)
+        data = self.serializer().dumps(session)
+        in_file = len(data) > self._table.max_data_size
+
+        try:
+            stored = self._table.set(
+                self.session_key,
+                FILE_MARKER if in_file else data,
+                time.time() + self.get_expiry_age(),
+                must_create=must_create,
+                must_exist=not must_create,
+            )
+        except SessionTableFull as e:
+            error = CreateError if must_create else UpdateError
+            raise error(str(e)) from e
+
+        if not stored:
+            return False
+
+        if in_file:
+            # the slot reserves the session key, therefore the file is only
+            # written for this session
+            file_store = FileSessionStore(self.session_key)
+            # pylint: disable=protected-access
+            file_store._session_cache = session
+            file_store.save(must_create=not file_store.exists(self.session_key))
+        elif self._in_file:
+            FileSessionStore().delete(self.session_key)
+
+        self._in_file = in_file
+        return True
+
+    def delete(self, session_key: Optional[str] = None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+
+        try:
+            data = self._table.get(session_key)
+            self._table.delete(session_key)
+        except ValueError:
+            return
+
+        if data == FILE_MARKER:
+            FileSessionStore().delete(session_key)
+
+    @classmethod
+    def clear_expired(cls):
+        get_session_table().clear_expired()
+        FileSessionStore.clear_expired()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Incremental JSON encoding of large GraphQL responses
+
+Responses containing large lists like the edges of a connection with 10000
+results are not encoded into a single JSON string. Instead the lists are
+encoded part by part while the response is sent and the items are released
+after they have been encoded. The encoded response is the same as the one of
+`json.dumps` with compact separators.
+"""
+
+import json
+
+from typing import Any, Iterator, List
+
+# number of bytes sent at once
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# number of list items encoded at once
+ITEMS_PER_PART = 32
+
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def contains_large_list(value: Any, min_items: int) -> bool:
+    """Whether a list with at least min_items is reachable via the dicts of
+    the value
+    """
+    if isinstance(value, list):
+        return len(value) >= min_items
+
+    if isinstance(value, dict):
+        return any(
+            contains_large_list(item, min_items) for item in value.values()
+        )
+
+    return False
+
+
+def _iterencode(value: Any) -> Iterator[str]:
+    if isinstance(value, dict):
+        separator = '{'
+        for key, item in value.items():
+            yield separator
+            yield _encode(str(key))
+            yield ':'
+            yield from _iterencode(item)
+            separator = ','
+        yield '}' if separator == ',' else '{}'
+    elif isinstance(value, list):
+        separator = '['
+        for start in range(0, len(value), ITEMS_PER_PART):
+            stop = start + ITEMS_PER_PART
+            yield separator
+            # strip the brackets of the encoded slice
+            yield _encode(value[start:stop])[1:-1]
+            separator = ','
+            # the items aren't required anymore
+            value[start:stop] = [None] * len(value[start:stop])
+        yield ']' if separator == ',' else '[]'
+    else:
+        yield _encode(value)
+
+
+class JsonStream:
+    """A JSON document which is encoded while it is iterated
+
+    Dicts are encoded key by key and lists in parts of ITEMS_PER_PART items.
+    The items of a part are encoded at once and replaced by None afterwards,
+    therefore the document can only be iterated once. The encoded parts are
+    joined into chunks of about chunk_size bytes.
+    """
+
+    def __init__(self, value: Any, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.value = value
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        value = self.value
+        self.value = None
+
+        parts: List[str] = []
+        size = 0
+
+        for part in _iterencode(value):
+            parts.append(part)
+            size += len(part)
+
+            if size >= self.chunk_size:
+                # ensure_ascii is set, therefore the parts are ASCII only
+                yield ''.join(parts).encode('ascii')
+                parts = []
+                size = 0
+
+        if parts:
+            yield ''.join(parts).encode('ascii')
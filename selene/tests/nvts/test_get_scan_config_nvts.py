@@ -233,3 +233,39 @@ class GetScanConfigsNvtsTestCase(SeleneTestCase):
             sort_order=None,
             timeout=None,
         )
+
+    def test_keep_explicit_arguments(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_scan_config_nvts', '<get_config_nvts_response/>'
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                scanConfigNvts (
+                    details: true,
+                    preferences: true,
+                    preferenceCount: true,
+                    timeout: true,
+                ) {
+                    id
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_scan_config_nvts.assert_called_with(
+            config_id=None,
+            details=True,
+            family=None,
+            preference_count=True,
+            preferences=True,
+            preferences_config_id=None,
+            sort_field=None,
+            sort_order=None,
+            timeout=True,
+        )
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from unittest.mock import patch
+
+from selene.schema.parser import FilterString
+from selene.schema.relay import get_cursor
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+def compose_response(start, rows, filtered):
+    return f'''
+        <get_tasks_response status="200" status_text="OK">
+            <task id="e9b98e26-9fff-4ee8-9378-bc44fe3d6f2b">
+                <name>foo</name>
+            </task>
+            <tasks start="{start}" max="{rows}"/>
+            <task_count>100<filtered>{filtered}</filtered>
+                <page>1</page>
+            </task_count>
+        </get_tasks_response>
+    '''
+
+
+class FilterStringRowsTestCase(unittest.TestCase):
+    def test_get_rows(self):
+        self.assertEqual(FilterString('foo rows=10 first=1').get_rows(), 10)
+        self.assertEqual(FilterString('rows=-1').get_rows(), -1)
+
+    def test_no_rows(self):
+        self.assertIsNone(FilterString('foo first=1').get_rows())
+        self.assertIsNone(FilterString().get_rows())
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class CountsOnlyTestCase(SeleneTestCase):
+    def test_counts_only(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_tasks', compose_response(21, 1, 25))
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                tasks (
+                    filterString: "name~foo",
+                    first: 10,
+                    after: "{get_cursor('task', 19)}"
+                ) {{
+                    counts {{
+                        filtered
+                        total
+                        offset
+                        limit
+                        length
+                    }}
+                    pageInfo {{
+                        hasNextPage
+                        hasPreviousPage
+                        endCursor
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter_string='name~foo first=21 rows=1', details=False
+        )
+
+        tasks = response.json()['data']['tasks']
+        self.assertEqual(
+            tasks['counts'],
+            {
+                'filtered': 25,
+                'total': 100,
+                'offset': 20,
+                'limit': 10,
+                'length': 5,
+            },
+        )
+        self.assertEqual(
+            tasks['pageInfo'],
+            {
+                'hasNextPage': False,
+                'hasPreviousPage': True,
+                'endCursor': get_cursor('task', 24),
+            },
+        )
+
+    def test_filtered_count_without_rows(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_tasks', compose_response(1, 1, 25))
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks {
+                    counts {
+                        filtered
+                        total
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter_string='rows=1', details=False
+        )
+
+        counts = response.json()['data']['tasks']['counts']
+        self.assertEqual(counts, {'filtered': 25, 'total': 100})
+
+    def test_page_info_without_rows(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_tasks', compose_response(1, 10, 25))
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "name~foo") {
+                    pageInfo {
+                        hasNextPage
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        # the number of rows is unknown, request the page of the user
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter_string='name~foo', details=False
+        )
+
+    def test_nodes_selected(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_tasks', compose_response(1, 10, 1))
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks (filterString: "rows=10") {
+                    nodes {
+                        id
+                    }
+                    counts {
+                        filtered
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter_string='rows=10', details=False
+        )
+
+        self.assertEqual(len(response.json()['data']['tasks']['nodes']), 1)
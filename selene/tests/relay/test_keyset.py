@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from lxml import etree
+
+from selene.schema.parser import FilterString
+from selene.schema.relay import (
+    Entities,
+    KeysetCursor,
+    KeysetEntities,
+    TIMESTAMP_SORT_FIELDS,
+    get_cursor,
+    get_keyset_cursor,
+    get_keyset_from_cursor,
+    get_offset_from_cursor,
+    resolve_keyset_entities,
+)
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+# 2021-01-01T00:00:00Z
+KEY = 1609459200
+
+ID_A = '08b69003-5fc2-4037-a479-93b440211c73'
+ID_B = '6b2db524-9fb0-45b8-9b56-d958f84cb546'
+ID_C = '291a7547-c6a1-4bf0-9a2b-1d6c1b1a2c5d'
+
+
+def compose_response(*results, filtered=None, start=1, rows=10):
+    elements = ''.join(
+        f'<result id="{result_id}">'
+        f'<creation_time>2021-01-01T00:00:{second:02d}Z</creation_time>'
+        f'</result>'
+        for result_id, second in results
+    )
+    filtered = len(results) if filtered is None else filtered
+    return (
+        f'<get_results_response>{elements}'
+        f'<results start="{start}" max="{rows}"/>'
+        f'<result_count>100<filtered>{filtered}</filtered></result_count>'
+        f'</get_results_response>'
+    )
+
+
+def create_entities(*results, **kwargs):
+    return Entities.from_response(
+        etree.fromstring(compose_response(*results, **kwargs)), 'result'
+    )
+
+
+class KeysetCursorTestCase(unittest.TestCase):
+    def test_encode_decode(self):
+        keyset = KeysetCursor(12, 'created', KEY, 'foo', 2)
+        cursor = get_keyset_cursor('result', keyset)
+
+        self.assertEqual(get_keyset_from_cursor(cursor), keyset)
+        self.assertEqual(get_offset_from_cursor(cursor), 12)
+
+    def test_offset_cursor(self):
+        self.assertIsNone(get_keyset_from_cursor(get_cursor('result', 12)))
+
+
+class FilterStringSortTestCase(unittest.TestCase):
+    def test_get_sort(self):
+        self.assertEqual(
+            FilterString('foo sort=created rows=10').get_sort(),
+            ('created', False),
+        )
+        self.assertEqual(
+            FilterString('sort-reverse=modified').get_sort(),
+            ('modified', True),
+        )
+
+    def test_no_sort(self):
+        self.assertIsNone(FilterString('foo rows=10').get_sort())
+        self.assertIsNone(FilterString().get_sort())
+
+    def test_add_term(self):
+        self.assertEqual(
+            str(FilterString('sort=created').add_term('created>1')),
+            'sort=created created>1',
+        )
+
+
+class ResolveKeysetEntitiesTestCase(unittest.TestCase):
+    def resolve(self, resolve_entities, **kwargs):
+        return resolve_keyset_entities(
+            resolve_entities, TIMESTAMP_SORT_FIELDS, None, None, **kwargs
+        )
+
+    def test_unsupported_sort(self):
+        entities = create_entities(('a', 0))
+        resolve_entities = MagicMock(return_value=entities)
+        filter_string = FilterString('sort=name')
+
+        page = self.resolve(
+            resolve_entities, filter_string=filter_string, first=1
+        )
+
+        self.assertIs(page, entities)
+        resolve_entities.assert_called_once_with(
+            None,
+            None,
+            filter_string=filter_string,
+            after=None,
+            before=None,
+            first=1,
+            last=None,
+        )
+
+    def test_first_page(self):
+        resolve_entities = MagicMock(
+            return_value=create_entities(('a', 0), ('b', 1), ('c', 1))
+        )
+
+        page = self.resolve(
+            resolve_entities,
+            filter_string=FilterString('sort=created'),
+            first=3,
+        )
+
+        self.assertIsInstance(page, KeysetEntities)
+        self.assertEqual(
+            page.get_keyset(2), KeysetCursor(2, 'created', KEY + 1, 'c', 2)
+        )
+        self.assertIsNone(page.get_keyset(3))
+
+    def test_following_page(self):
+        resolve_entities = MagicMock(
+            return_value=create_entities(
+                ('b', 1), ('c', 1), ('d', 1), ('e', 2), filtered=5, rows=4
+            )
+        )
+        cursor = get_keyset_cursor(
+            'result', KeysetCursor(2, 'created', KEY + 1, 'c', 2)
+        )
+
+        page = self.resolve(
+            resolve_entities,
+            filter_string=FilterString('sort=created first=3'),
+            after=cursor,
+            first=2,
+        )
+
+        args = resolve_entities.call_args[1]
+        self.assertEqual(
+            str(args['filter_string']), f'sort=created created>{KEY}'
+        )
+        self.assertEqual(args['first'], 4)
+        self.assertNotIn('after', args)
+
+        self.assertEqual(
+            [element.get('id') for element in page.entity_elements],
+            ['d', 'e'],
+        )
+
+        counts = page.get_entities_counts()
+        self.assertEqual(counts.offset, 3)
+        self.assertEqual(counts.filtered, 6)
+        self.assertEqual(counts.limit, 2)
+        self.assertEqual(counts.length, 2)
+
+        # the ties are continued from the previous page
+        self.assertEqual(
+            page.get_keyset(3), KeysetCursor(3, 'created', KEY + 1, 'd', 3)
+        )
+
+    def test_following_page_reverse(self):
+        resolve_entities = MagicMock(
+            return_value=create_entities(('c', 1), ('a', 0))
+        )
+        cursor = get_keyset_cursor(
+            'result', KeysetCursor(0, 'created', KEY + 1, 'c', 1)
+        )
+
+        page = self.resolve(
+            resolve_entities,
+            filter_string=FilterString('sort-reverse=created'),
+            after=cursor,
+            first=1,
+        )
+
+        args = resolve_entities.call_args[1]
+        self.assertEqual(
+            str(args['filter_string']),
+            f'sort-reverse=created created<{KEY + 2}',
+        )
+        self.assertEqual(
+            [element.get('id') for element in page.entity_elements], ['a']
+        )
+
+    def test_fallback_to_offset(self):
+        resolve_entities = MagicMock(
+            side_effect=[
+                # the entity of the cursor has been deleted
+                create_entities(('d', 1), ('e', 2)),
+                create_entities(('d', 1), ('e', 2), start=4),
+            ]
+        )
+        cursor = get_keyset_cursor(
+            'result', KeysetCursor(2, 'created', KEY + 1, 'c', 1)
+        )
+
+        page = self.resolve(
+            resolve_entities,
+            filter_string=FilterString('sort=created'),
+            after=cursor,
+            first=2,
+        )
+
+        self.assertEqual(resolve_entities.call_count, 2)
+        self.assertEqual(resolve_entities.call_args[1]['after'], cursor)
+        self.assertEqual(page.get_offset(), 3)
+        self.assertEqual(page.get_keyset(3).entity_id, 'd')
+
+    def test_backward_pagination(self):
+        entities = create_entities(('a', 0))
+        resolve_entities = MagicMock(return_value=entities)
+
+        page = self.resolve(
+            resolve_entities,
+            filter_string=FilterString('sort=created'),
+            before=get_cursor('result', 2),
+            last=1,
+        )
+
+        self.assertIs(page, entities)
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class KeysetPaginationTestCase(SeleneTestCase):
+    def test_keyset_cursors(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_results',
+            compose_response((ID_A, 0), (ID_B, 1), filtered=5, rows=2),
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                results (filterString: "sort=created", first: 2) {
+                    edges {
+                        cursor
+                        node {
+                            id
+                        }
+                    }
+                    pageInfo {
+                        endCursor
+                        lastPageCursor
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        results = response.json()['data']['results']
+        end_cursor = get_keyset_cursor(
+            'result', KeysetCursor(1, 'created', KEY + 1, ID_B, 1)
+        )
+
+        self.assertEqual(results['edges'][1]['cursor'], end_cursor)
+        self.assertEqual(results['pageInfo']['endCursor'], end_cursor)
+        self.assertEqual(
+            results['pageInfo']['lastPageCursor'], get_cursor('result', 3)
+        )
+
+    def test_after_keyset_cursor(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_results', compose_response((ID_B, 1), (ID_C, 2), filtered=2)
+        )
+        cursor = get_keyset_cursor(
+            'result', KeysetCursor(1, 'created', KEY + 1, ID_B, 1)
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                results (
+                    filterString: "sort=created",
+                    first: 2,
+                    after: "{cursor}"
+                ) {{
+                    nodes {{
+                        id
+                    }}
+                    counts {{
+                        offset
+                        filtered
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_results.assert_called_with(
+            filter_string=f'sort=created created>{KEY} rows=3'
+        )
+
+        results = response.json()['data']['results']
+        self.assertEqual(results['nodes'], [{'id': ID_C}])
+        self.assertEqual(results['counts'], {'offset': 2, 'filtered': 3})
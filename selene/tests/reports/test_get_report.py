@@ -71,7 +71,7 @@ class ReportTestCase(SeleneTestCase):
         )
 
         mock_gmp.gmp_protocol.get_report.assert_called_with(
-            self.id, report_format_id=None, delta_report_id=None, details=True
+            self.id, report_format_id=None, delta_report_id=None, details=False
         )
 
         json = response.json()
@@ -84,6 +84,44 @@ class ReportTestCase(SeleneTestCase):
         self.assertEqual(report['id'], self.id)
         self.assertIsNone(report['owner'])
 
+    def test_get_report_details(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_report',
+            f'''
+            <get_report_response>
+                <report id="{self.id}">
+                    <name>a</name>
+                    <report id="{self.id}">
+                        <results/>
+                    </report>
+                </report>
+            </get_report_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                report(id: "{self.id}") {{
+                    id
+                    ... on Report {{
+                        results {{
+                            id
+                        }}
+                    }}
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_report.assert_called_with(
+            self.id, report_format_id=None, delta_report_id=None, details=True
+        )
+
     def test_get_report_none_fields(self, mock_gmp: GmpMockFactory):
         mock_gmp.mock_response(
             'get_report',
@@ -69,6 +69,60 @@ class ResultsTestCase(SeleneTestCase):
         self.assertEqual(result['name'], 'abc')
         self.assertEqual(result['id'], '1f3261c9-e47c-4a21-b677-826ea92d1d59')
 
+    def test_information_keeps_response(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_result',
+            '''
+            <get_results_response>
+                <result id="1f3261c9-e47c-4a21-b677-826ea92d1d59">
+                    <name>abc</name>
+                    <scan_nvt_version>2021-01-01</scan_nvt_version>
+                    <nvt oid="1.3.6.1.4.1.25623.1.0.117130">
+                        <type>nvt</type>
+                        <name>foo</name>
+                    </nvt>
+                </result>
+            </get_results_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                first: result(id: "1f3261c9-e47c-4a21-b677-826ea92d1d59") {
+                    information {
+                        ... on ResultNVT {
+                            version
+                        }
+                    }
+                }
+                second: result(id: "1f3261c9-e47c-4a21-b677-826ea92d1d59") {
+                    information {
+                        ... on ResultNVT {
+                            version
+                        }
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        for alias in ('first', 'second'):
+            self.assertEqual(
+                json['data'][alias]['information']['version'], '2021-01-01'
+            )
+
+        # the memoized response is shared and must not be modified
+        nvt = mock_gmp.gmp_protocol.get_result.return_value.find('result/nvt')
+
+        self.assertIsNone(nvt.find('version'))
+
     def test_get_full_result_nvt_type(self, mock_gmp: GmpMockFactory):
         result_xml_path = CWD / 'example-result.xml'
         result_xml_str = result_xml_path.read_text()
@@ -107,6 +107,34 @@ class ResultsTestCase(SeleneTestCase):
         self.assertEqual(result2['name'], 'def')
         self.assertEqual(result2['id'], '83c907a4-b2e4-403e-a5ba-9f831092b106')
 
+        mock_gmp.gmp_protocol.get_results.assert_called_with(filter_string=None)
+
+    def test_get_results_details(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response('get_results', self.resp)
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                results {
+                    nodes {
+                        id
+                        originResult {
+                            id
+                        }
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_results.assert_called_with(
+            filter_string=None, details=True
+        )
+
 
 class ResultsPaginationTestCase(SeleneTestCase):
     entity_name = 'result'
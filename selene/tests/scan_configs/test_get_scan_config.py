@@ -321,5 +321,5 @@ class ScanConfigGetEntityTestCase(SeleneTestCase):
     selene_name = 'scanConfig'
     gmp_cmd = 'get_scan_config'
     test_get_entity = make_test_get_entity(
-        gmp_name=gmp_name, selene_name=selene_name, gmp_cmd=gmp_cmd, tasks=True
+        gmp_name=gmp_name, selene_name=selene_name, gmp_cmd=gmp_cmd, tasks=False
     )
@@ -1,3 +1,8 @@
+import atexit
+import os
+import shutil
+import tempfile
+
 SECRET_KEY = 'fake-key'
 
 INSTALLED_APPS = ['graphene_django']
@@ -17,10 +22,13 @@ LOGGING = {
     'loggers': {'graphql.execution': {'handlers': ['null'], 'level': 'NOTSET'}},
 }
 
-SESSION_ENGINE = 'django.contrib.sessions.backends.file'
+SESSION_ENGINE = 'selene.sessions'
+
+# each test run uses its own session table
+_SESSION_TABLE_DIR = tempfile.mkdtemp(prefix='selene-test-sessions-')
+atexit.register(shutil.rmtree, _SESSION_TABLE_DIR, ignore_errors=True)
 
-# use pickle as serializer to allow seralizing of datetime for session expiry
-SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
+SESSION_TABLE_PATH = os.path.join(_SESSION_TABLE_DIR, 'sessions')
 
 # 5 minutes
 SESSION_COOKIE_AGE = 300
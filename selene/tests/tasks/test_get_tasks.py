@@ -145,23 +145,65 @@ class TasksTestCase(SeleneTestCase):
         self.assertEqual(task2['name'], 'b')
         self.assertEqual(task2['id'], '0778ac90-3d24-11ea-b722-fff755412c48')
 
+    def test_get_tasks_details(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            '''
+            <get_tasks_response>
+                <task id="15085a9a-3d24-11ea-944a-6f78adc016ea">
+                    <name>a</name>
+                    <result_count>5</result_count>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                tasks {
+                    nodes {
+                        id
+                        ...TaskResults
+                    }
+                }
+            }
+
+            fragment TaskResults on Task {
+                results {
+                    counts {
+                        current
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_with(
+            filter_string=None, details=True
+        )
+
 
 class TasksPaginationTestCase(SeleneTestCase):
     entity_name = 'task'
     test_pagination_with_after_and_first = make_test_after_first(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_counts = make_test_counts(entity_name)
     test_page_info = make_test_page_info(entity_name, query=GetTasks)
     test_edges = make_test_edges(entity_name)
     test_pagination_with_before_and_last = make_test_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
     test_after_first_before_last = make_test_after_first_before_last(
-        entity_name, details=True
+        entity_name, details=False
     )
 
 
 class TaskGetEntitiesTestCase(SeleneTestCase):
     gmp_name = 'task'
-    test_get_entities = make_test_get_entities(gmp_name, details=True)
+    test_get_entities = make_test_get_entities(gmp_name, details=False)
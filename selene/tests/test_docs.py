@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+import tempfile
+import unittest
+
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from selene.docs import SchemaDocs, get_docs, get_schema_version
+from selene.management.commands.graphqldocs import Command
+from selene.schema import schema
+
+
+class GetSchemaVersionTestCase(unittest.TestCase):
+    def test_version(self):
+        version = get_schema_version(schema)
+
+        self.assertEqual(len(version), 16)
+        self.assertEqual(get_schema_version(schema), version)
+
+
+class SchemaDocsTestCase(unittest.TestCase):
+    def test_compressed(self):
+        docs = SchemaDocs('foo', '<html>ä</html>')
+
+        self.assertEqual(docs.etag, '"foo"')
+        self.assertEqual(gzip.decompress(docs.compressed), docs.content)
+        # the compressed content doesn't depend on the time of creation
+        self.assertEqual(
+            SchemaDocs('foo', '<html>ä</html>').compressed, docs.compressed
+        )
+
+    def test_write(self):
+        docs = SchemaDocs('foo', '<html></html>')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = docs.write(directory)
+
+            self.assertEqual(
+                path, Path(directory) / 'selene' / 'docs' / 'foo' / 'index.html'
+            )
+            self.assertEqual(path.read_bytes(), b'<html></html>')
+            self.assertEqual(
+                path.with_name('index.html.gz').read_bytes(), docs.compressed
+            )
+
+
+class GraphqlDocViewTestCase(SimpleTestCase):
+    def setUp(self):
+        self.docs = get_docs(schema)
+
+    def test_get(self):
+        response = self.client.get('/docs/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.docs.content)
+        self.assertEqual(response['ETag'], self.docs.etag)
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_gzip(self):
+        response = self.client.get(
+            '/docs/', HTTP_ACCEPT_ENCODING='gzip, deflate'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.docs.content)
+
+    def test_not_modified(self):
+        response = self.client.get('/docs/', HTTP_IF_NONE_MATCH=self.docs.etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_static(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.docs.write(directory)
+
+            with self.settings(
+                SELENE={'GRAPHQL_DOCS_STATIC': True},
+                STATIC_ROOT=directory,
+                STATIC_URL='/static/',
+            ):
+                response = self.client.get('/docs/')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            response['Location'],
+            '/static/' + str(path.relative_to(directory)),
+        )
+
+    def test_static_not_written(self):
+        with tempfile.TemporaryDirectory() as directory, self.settings(
+            SELENE={'GRAPHQL_DOCS_STATIC': True},
+            STATIC_ROOT=directory,
+            STATIC_URL='/static/',
+        ):
+            response = self.client.get('/docs/')
+
+        self.assertEqual(response.status_code, 200)
+
+
+class GraphqlDocsCommandTestCase(SimpleTestCase):
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.settings(STATIC_ROOT=directory):
+                call_command(Command(), stdout=StringIO())
+
+            version = get_schema_version(schema)
+            path = Path(directory) / 'selene' / 'docs' / version
+
+            self.assertTrue((path / 'index.html').is_file())
+            self.assertTrue((path / 'index.html.gz').is_file())
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from graphql.error import GraphQLSyntaxError
+
+from selene.documents import (
+    CachedDocumentBackend,
+    PersistedQueries,
+    PersistedQueryError,
+    PersistedQueryNotFound,
+    get_query_hash,
+)
+from selene.schema import schema
+from selene.tests import SeleneTestCase, GmpMockFactory
+from selene.views import SeleneView
+
+QUERY = 'query { currentUser { username } }'
+
+
+class CachedDocumentBackendTestCase(unittest.TestCase):
+    def setUp(self):
+        self.backend = CachedDocumentBackend(max_size=2)
+
+    def test_cache_document(self):
+        document = self.backend.document_from_string(schema, QUERY)
+        other = self.backend.document_from_string(schema, QUERY)
+
+        self.assertIs(document, other)
+        self.assertEqual(self.backend.hits, 1)
+        self.assertEqual(self.backend.misses, 1)
+
+    def test_lru(self):
+        self.backend.document_from_string(schema, 'query A { version }')
+        self.backend.document_from_string(schema, 'query B { version }')
+        self.backend.document_from_string(schema, 'query A { version }')
+        self.backend.document_from_string(schema, 'query C { version }')
+
+        self.assertEqual(len(self.backend), 2)
+
+        # B was the least recently used document
+        self.backend.document_from_string(schema, 'query B { version }')
+
+        self.assertEqual(self.backend.misses, 4)
+
+    def test_invalid_document(self):
+        document = self.backend.document_from_string(schema, 'query { foo }')
+        result = document.execute()
+
+        self.assertTrue(result.invalid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(len(self.backend), 0)
+
+    def test_syntax_error(self):
+        with self.assertRaises(GraphQLSyntaxError):
+            self.backend.document_from_string(schema, 'query {')
+
+    def test_preload(self):
+        self.assertEqual(self.backend.preload(schema, QUERY), [])
+
+        self.backend.document_from_string(schema, QUERY)
+
+        self.assertEqual(self.backend.hits, 1)
+        self.assertEqual(self.backend.misses, 0)
+
+    def test_preload_invalid_document(self):
+        self.assertEqual(len(self.backend.preload(schema, 'query { foo }')), 1)
+        self.assertEqual(len(self.backend.preload(schema, 'query {')), 1)
+        self.assertEqual(len(self.backend), 0)
+
+
+class PersistedQueriesTestCase(unittest.TestCase):
+    def test_register(self):
+        queries = PersistedQueries(max_size=1)
+        query_hash = get_query_hash(QUERY)
+
+        persisted_query = {'version': 1, 'sha256Hash': query_hash}
+
+        with self.assertRaises(PersistedQueryNotFound):
+            queries.resolve(None, persisted_query)
+
+        self.assertEqual(queries.resolve(QUERY, persisted_query), QUERY)
+        self.assertEqual(queries.resolve(None, persisted_query), QUERY)
+
+    def test_invalid_hash(self):
+        queries = PersistedQueries()
+
+        with self.assertRaises(PersistedQueryError):
+            queries.resolve(QUERY, {'version': 1, 'sha256Hash': 'foo'})
+
+    def test_invalid_version(self):
+        queries = PersistedQueries()
+
+        with self.assertRaises(PersistedQueryError):
+            queries.resolve(
+                QUERY, {'version': 2, 'sha256Hash': get_query_hash(QUERY)}
+            )
+
+    def test_lru(self):
+        queries = PersistedQueries(max_size=1)
+        query_a = 'query A { version }'
+        query_b = 'query B { version }'
+
+        queries.register(get_query_hash(query_a), query_a)
+        queries.register(get_query_hash(query_b), query_b)
+
+        self.assertIsNone(queries.get(get_query_hash(query_a)))
+        self.assertEqual(queries.get(get_query_hash(query_b)), query_b)
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / 'queries.json'
+            path.write_text(json.dumps({get_query_hash(QUERY): QUERY}))
+
+            queries = PersistedQueries.from_file(str(path), max_size=0)
+
+        self.assertEqual(queries.get(get_query_hash(QUERY)), QUERY)
+
+        # registration is disabled
+        query = 'query A { version }'
+        queries.register(get_query_hash(query), query)
+
+        self.assertIsNone(queries.get(get_query_hash(query)))
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewPersistedQueriesTestCase(SeleneTestCase):
+    def tearDown(self):
+        SeleneView.document_backend = None
+        SeleneView.persisted_queries = None
+
+    def post(self, data: dict):
+        return self.client.post(
+            self.GRAPHQL_URL, json.dumps(data), content_type="application/json"
+        )
+
+    def test_automatic_persisted_query(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '''
+            <get_version_response status="200" status_text="OK">
+                <version>21.4</version>
+            </get_version_response>
+            ''',
+        )
+
+        query = 'query { version }'
+        extensions = {
+            'persistedQuery': {
+                'version': 1,
+                'sha256Hash': get_query_hash(query),
+            }
+        }
+
+        response = self.post({'extensions': extensions})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                'errors': [
+                    {
+                        'message': 'PersistedQueryNotFound',
+                        'extensions': {'code': 'PERSISTED_QUERY_NOT_FOUND'},
+                    }
+                ]
+            },
+        )
+
+        response = self.post({'query': query, 'extensions': extensions})
+
+        self.assertResponseNoErrors(response)
+
+        response = self.client.get(
+            self.GRAPHQL_URL,
+            {'extensions': json.dumps(extensions)},
+            HTTP_ACCEPT='application/json',
+        )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(response.json()['data']['version'], '21.4')
+
+    def test_not_found_before_connecting(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        mock_gmp.gmp_protocol.reset_mock()
+
+        response = self.post(
+            {
+                'extensions': {
+                    'persistedQuery': {
+                        'version': 1,
+                        'sha256Hash': get_query_hash('query { version }'),
+                    }
+                }
+            }
+        )
+
+        self.assertEqual(
+            response.json()['errors'][0]['message'], 'PersistedQueryNotFound'
+        )
+
+        mock_gmp.gmp_protocol.authenticate.assert_not_called()
+        mock_gmp.gmp_protocol.get_version.assert_not_called()
+
+    def test_hash_mismatch(self, _mock_gmp: GmpMockFactory):
+        response = self.post(
+            {
+                'query': 'query { version }',
+                'extensions': {
+                    'persistedQuery': {'version': 1, 'sha256Hash': 'foo'}
+                },
+            }
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()['errors'][0]['extensions'],
+            {'code': 'INVALID_HASH'},
+        )
+
+    @override_settings(SELENE={'PERSISTED_QUERIES_CACHE_SIZE': 0})
+    def test_not_supported(self, _mock_gmp: GmpMockFactory):
+        response = self.post(
+            {
+                'extensions': {
+                    'persistedQuery': {'version': 1, 'sha256Hash': 'foo'}
+                },
+            }
+        )
+
+        self.assertEqual(
+            response.json()['errors'][0]['message'],
+            'PersistedQueryNotSupported',
+        )
+
+    def test_document_cache(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '''
+            <get_version_response status="200" status_text="OK">
+                <version>21.4</version>
+            </get_version_response>
+            ''',
+        )
+
+        for _ in range(2):
+            response = self.query('query { version }')
+
+            self.assertResponseNoErrors(response)
+
+        backend = SeleneView.document_backend
+
+        self.assertEqual(backend.hits, 1)
+        self.assertEqual(backend.misses, 1)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from gvm.connections import UnixSocketConnection
+from gvm.errors import GvmResponseError
+from gvm.protocols.gmp import Gmp
+from gvm.transforms import EtreeCheckCommandTransform
+
+from selene.benchmarks.gvmd import create_fake_gvmd
+from selene.benchmarks.throughput import percentile
+
+
+class FakeGvmdTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / 'gvmd.sock')
+
+        self.server = create_fake_gvmd(self.path, size=30, default_rows=10)
+        self.server.__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.directory.cleanup()
+
+    def connect(self) -> Gmp:
+        return Gmp(
+            UnixSocketConnection(path=self.path),
+            transform=EtreeCheckCommandTransform(),
+        )
+
+    def test_version(self):
+        with self.connect() as gmp:
+            self.assertEqual(gmp.get_protocol_version(), (21, 4))
+
+    def test_authenticate(self):
+        with self.connect() as gmp:
+            gmp.authenticate('foo', 'bar')
+
+            self.assertTrue(gmp.is_authenticated())
+
+    def test_list_paging(self):
+        with self.connect() as gmp:
+            first_page = gmp.get_tasks(filter_string='rows=20')
+            second_page = gmp.get_tasks(filter_string='first=21 rows=20')
+
+        first_ids = [task.get('id') for task in first_page.findall('task')]
+        second_ids = [task.get('id') for task in second_page.findall('task')]
+
+        self.assertEqual(len(first_ids), 20)
+        self.assertEqual(len(second_ids), 10)
+        self.assertEqual(len(set(first_ids + second_ids)), 30)
+
+        counts = second_page.find('task_count')
+        self.assertEqual(counts.find('filtered').text, '30')
+        self.assertEqual(counts.find('page').text, '10')
+
+    def test_list_default_rows(self):
+        with self.connect() as gmp:
+            response = gmp.get_results()
+
+        self.assertEqual(len(response.findall('result')), 10)
+
+    def test_list_all_rows(self):
+        with self.connect() as gmp:
+            response = gmp.get_hosts(filter_string='rows=-1')
+
+        self.assertEqual(len(response.findall('asset')), 30)
+
+    def test_single_entity(self):
+        with self.connect() as gmp:
+            task_id = gmp.get_tasks().find('task').get('id')
+            response = gmp.get_task(task_id)
+
+        tasks = response.findall('task')
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].get('id'), task_id)
+
+    def test_unknown_command(self):
+        with self.connect() as gmp:
+            with self.assertRaises(GvmResponseError):
+                gmp.send_command('<foo_bar/>')
+
+
+class PercentileTestCase(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile([3.0], 99), 3.0)
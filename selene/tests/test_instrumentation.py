@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+
+from promise import Promise
+
+from selene.benchmarks.gvmd import create_fake_gvmd
+from selene.instrumentation import (
+    GMP_COMMAND_DURATION,
+    REQUEST_DURATION,
+    RESOLVER_DURATION,
+    REDACTED,
+    RequestTimings,
+    TimingMiddleware,
+    get_command_filter,
+    get_command_name,
+    get_normalized_query_hash,
+    get_operation,
+    redact_variables,
+)
+from selene.metrics import REGISTRY
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class GetCommandNameTestCase(unittest.TestCase):
+    def test_command_name(self):
+        self.assertEqual(
+            get_command_name('<get_tasks filter="rows=10"/>'), 'get_tasks'
+        )
+        self.assertEqual(get_command_name(b'<get_version/>'), 'get_version')
+        self.assertEqual(get_command_name('foo'), 'unknown')
+
+
+class GetCommandFilterTestCase(unittest.TestCase):
+    def test_filter(self):
+        self.assertEqual(
+            get_command_filter('<get_tasks filter="rows=-1 first=1"/>'),
+            'rows=-1 first=1',
+        )
+
+    def test_escaped_filter(self):
+        self.assertEqual(
+            get_command_filter(
+                '<get_tasks filter="name=&quot;a &amp; b&quot;">' '</get_tasks>'
+            ),
+            'name="a & b"',
+        )
+
+    def test_no_filter(self):
+        self.assertIsNone(get_command_filter('<get_version/>'))
+        self.assertIsNone(
+            get_command_filter('<create_filter><term filter="a"/>')
+        )
+
+
+class RedactVariablesTestCase(unittest.TestCase):
+    def test_redact(self):
+        self.assertEqual(
+            redact_variables(
+                {
+                    'filterString': 'rows=10',
+                    'password': 'foo',
+                    'input': {
+                        'name': 'bar',
+                        'authPassword': 'baz',
+                        'privacy': [{'privateKey': 'key'}],
+                    },
+                }
+            ),
+            {
+                'filterString': 'rows=10',
+                'password': REDACTED,
+                'input': {
+                    'name': 'bar',
+                    'authPassword': REDACTED,
+                    'privacy': [{'privateKey': REDACTED}],
+                },
+            },
+        )
+
+    def test_none(self):
+        self.assertIsNone(redact_variables(None))
+
+
+class GetNormalizedQueryHashTestCase(unittest.TestCase):
+    def test_ignore_formatting(self):
+        self.assertEqual(
+            get_normalized_query_hash('query { tasks { nodes { id } } }'),
+            get_normalized_query_hash(
+                'query {\n  tasks {\n    # comment\n    nodes { id }\n  }\n}'
+            ),
+        )
+
+    def test_different_queries(self):
+        self.assertNotEqual(
+            get_normalized_query_hash('{ tasks { nodes { id } } }'),
+            get_normalized_query_hash('{ tasks { nodes { name } } }'),
+        )
+
+    def test_invalid_query(self):
+        self.assertEqual(
+            get_normalized_query_hash('{ tasks'),
+            get_normalized_query_hash('{  tasks '),
+        )
+        self.assertIsNone(get_normalized_query_hash(None))
+
+
+class GetOperationTestCase(unittest.TestCase):
+    def test_shorthand_query(self):
+        self.assertEqual(
+            get_operation('{ tasks { id } }'), ('query', 'anonymous')
+        )
+
+    def test_named_operation(self):
+        self.assertEqual(
+            get_operation('query GetTasks($filterString: String) { tasks }'),
+            ('query', 'GetTasks'),
+        )
+        self.assertEqual(
+            get_operation('mutation { login }'), ('mutation', 'anonymous')
+        )
+
+    def test_operation_name(self):
+        self.assertEqual(
+            get_operation('query A { a } mutation B { b }', 'B'),
+            ('mutation', 'B'),
+        )
+
+    def test_field_prefix(self):
+        self.assertEqual(
+            get_operation('{ queryFoo { id } }'), ('query', 'anonymous')
+        )
+
+
+class TimingMiddlewareTestCase(unittest.TestCase):
+    def setUp(self):
+        self.timings = RequestTimings()
+        self.middleware = TimingMiddleware(self.timings)
+
+        self.info = MagicMock()
+        self.info.parent_type.name = 'Query'
+        self.info.field_name = 'tasks'
+
+    def test_resolve(self):
+        result = self.middleware.resolve(
+            lambda root, info: 'foo', None, self.info
+        )
+
+        self.assertEqual(result, 'foo')
+        self.assertEqual(self.timings.resolvers['Query.tasks'][0], 1)
+
+    def test_resolve_promise(self):
+        promise = Promise()
+
+        result = self.middleware.resolve(
+            lambda root, info: promise, None, self.info
+        )
+
+        self.assertNotIn('Query.tasks', self.timings.resolvers)
+
+        promise.do_resolve('foo')
+
+        self.assertEqual(result.get(), 'foo')
+        self.assertEqual(self.timings.resolvers['Query.tasks'][0], 1)
+
+    def test_sum_up_resolvers(self):
+        for _ in range(3):
+            self.middleware.resolve(lambda root, info: 'foo', None, self.info)
+
+        count, total, maximum = self.timings.resolvers['Query.tasks']
+
+        self.assertEqual(count, 3)
+        self.assertGreaterEqual(total, maximum)
+
+
+class InstrumentationTestCase(SeleneTestCase):
+    def setUp(self):
+        REGISTRY.clear()
+
+    def post(self, query: str, **headers):
+        return self.client.post(
+            '/graphql/',
+            json.dumps({'query': query}),
+            content_type='application/json',
+            **headers,
+        )
+
+
+@override_settings(SELENE={'INSTRUMENTATION': True})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewInstrumentationTestCase(InstrumentationTestCase):
+    def test_timings_extension(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.post('query { version }', HTTP_X_SELENE_DEBUG='1')
+
+        self.assertResponseNoErrors(response)
+
+        timings = response.json()['extensions']['timings']
+
+        self.assertGreater(timings['duration'], 0)
+        self.assertIsNotNone(timings['serialization'])
+        self.assertEqual(timings['resolvers']['Query.version']['count'], 1)
+        self.assertIn('commands', timings['gmp'])
+
+    def test_no_extension_without_header(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.post('query { version }')
+
+        self.assertResponseNoErrors(response)
+        self.assertNotIn('extensions', response.json())
+
+        # the timings are aggregated nevertheless
+        self.assertEqual(REQUEST_DURATION.collect()[()][2], 1)
+        self.assertEqual(RESOLVER_DURATION.collect()[('Query.version',)][2], 1)
+
+    @override_settings(SELENE={'INSTRUMENTATION': False})
+    def test_disabled(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.post('query { version }', HTTP_X_SELENE_DEBUG='1')
+
+        self.assertResponseNoErrors(response)
+        self.assertNotIn('extensions', response.json())
+        self.assertEqual(REQUEST_DURATION.collect(), {})
+
+
+class GmpCommandInstrumentationTestCase(InstrumentationTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / 'gvmd.sock')
+
+        self.server = create_fake_gvmd(self.path, size=5)
+        self.server.__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.directory.cleanup()
+
+    def test_gmp_command_timings(self):
+        self.login('foo', 'bar')
+
+        with self.settings(
+            SELENE={'INSTRUMENTATION': True, 'GMP_SOCKET_PATH': self.path}
+        ):
+            response = self.post(
+                'query { tasks { nodes { id } } }', HTTP_X_SELENE_DEBUG='1'
+            )
+
+        self.assertResponseNoErrors(response)
+
+        gmp = response.json()['extensions']['timings']['gmp']
+        commands = [command['command'] for command in gmp['commands']]
+
+        self.assertEqual(commands, ['authenticate', 'get_tasks'])
+
+        get_tasks = gmp['commands'][1]
+        for phase in ('write', 'wait', 'read', 'parse'):
+            self.assertGreaterEqual(get_tasks[phase], 0)
+
+        self.assertGreater(get_tasks['responseSize'], 0)
+        self.assertAlmostEqual(
+            get_tasks['duration'],
+            sum(
+                get_tasks[phase] for phase in ('write', 'wait', 'read', 'parse')
+            ),
+        )
+
+        samples = GMP_COMMAND_DURATION.collect()
+        self.assertEqual(samples[('get_tasks', 'parse')][2], 1)
+
+    def test_slow_query_log(self):
+        self.login('foo', 'bar')
+
+        with self.settings(
+            SELENE={'SLOW_QUERY_THRESHOLD': 0, 'GMP_SOCKET_PATH': self.path}
+        ), self.assertLogs('selene.slow_queries', level='WARNING') as logs:
+            response = self.client.post(
+                '/graphql/',
+                json.dumps(
+                    {
+                        'query': 'query GetTasks($filterString: FilterString) '
+                        '{ tasks(filterString: $filterString) '
+                        '{ nodes { id } } }',
+                        # not declared variables are ignored on execution
+                        'variables': {
+                            'filterString': 'rows=-1',
+                            'password': 'secret',
+                        },
+                    }
+                ),
+                content_type='application/json',
+            )
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(len(logs.records), 1)
+
+        message = logs.records[0].getMessage()
+
+        self.assertIn('Slow GraphQL query GetTasks took', message)
+        self.assertNotIn('secret', message)
+
+        details = json.loads(message.split(': ', 1)[1])
+
+        self.assertEqual(details['operation'], 'GetTasks')
+        self.assertEqual(
+            details['variables'],
+            {'filterString': 'rows=-1', 'password': REDACTED},
+        )
+        self.assertEqual(len(details['queryHash']), 64)
+
+        commands = [command['command'] for command in details['gmp']]
+        self.assertEqual(commands, ['authenticate', 'get_tasks'])
+
+        get_tasks = details['gmp'][1]
+        self.assertEqual(get_tasks['filter'], 'rows=-1')
+        self.assertGreater(get_tasks['responseSize'], 0)
+        self.assertGreaterEqual(get_tasks['start'], 0)
+
+    def test_fast_query_not_logged(self):
+        self.login('foo', 'bar')
+
+        with self.settings(
+            SELENE={'SLOW_QUERY_THRESHOLD': 60, 'GMP_SOCKET_PATH': self.path}
+        ), patch('selene.views.log_slow_query') as log_slow_query:
+            response = self.post('query { tasks { nodes { id } } }')
+
+        self.assertResponseNoErrors(response)
+        log_slow_query.assert_not_called()
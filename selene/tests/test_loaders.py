@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import patch
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class EntityLoaderTestCase(SeleneTestCase):
+    def setUp(self):
+        self.id1 = '08b69003-5fc2-4037-a479-93b440211c73'
+        self.id2 = '6b2db524-9fb0-45b8-9b56-d958f84cb546'
+
+    def test_batch_tasks(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'''
+            <get_tasks_response>
+                <task id="{self.id2}">
+                    <name>bar</name>
+                </task>
+                <task id="{self.id1}">
+                    <name>foo</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                first: task(id: "{self.id1}") {{
+                    name
+                }}
+                second: task(id: "{self.id2}") {{
+                    name
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['first']['name'], 'foo')
+        self.assertEqual(json['data']['second']['name'], 'bar')
+
+        mock_gmp.gmp_protocol.get_tasks.assert_called_once_with(
+            filter_string=f'uuid={self.id1} uuid={self.id2} first=1 rows=2',
+            details=True,
+        )
+        mock_gmp.gmp_protocol.get_task.assert_not_called()
+
+    def test_batch_results(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_results',
+            f'''
+            <get_results_response>
+                <result id="{self.id1}">
+                    <name>foo</name>
+                </result>
+                <result id="{self.id2}">
+                    <name>bar</name>
+                </result>
+            </get_results_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                first: result(id: "{self.id1}") {{
+                    name
+                }}
+                second: result(id: "{self.id2}") {{
+                    name
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_results.assert_called_once_with(
+            filter_string=f'uuid={self.id1} uuid={self.id2} first=1 rows=2 '
+            'min_qod=0',
+            details=True,
+        )
+
+    def test_hosts_not_batched(self, mock_gmp: GmpMockFactory):
+        # the list form of get_assets doesn't contain identifiers and details
+        mock_gmp.mock_response(
+            'get_host',
+            f'''
+            <get_assets_response>
+                <asset id="{self.id1}">
+                    <name>foo</name>
+                    <identifiers>
+                        <identifier id="1">
+                            <name>ip</name>
+                            <value>192.168.10.1</value>
+                        </identifier>
+                    </identifiers>
+                    <host>
+                        <detail>
+                            <name>best_os_cpe</name>
+                            <value>cpe:/o:canonical:ubuntu_linux</value>
+                        </detail>
+                    </host>
+                </asset>
+            </get_assets_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                first: host(id: "{self.id1}") {{
+                    name
+                    identifiers {{
+                        name
+                        value
+                    }}
+                    details {{
+                        name
+                        value
+                    }}
+                }}
+                second: host(id: "{self.id2}") {{
+                    name
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        host = response.json()['data']['first']
+
+        self.assertEqual(host['name'], 'foo')
+        self.assertEqual(
+            host['identifiers'], [{'name': 'ip', 'value': '192.168.10.1'}]
+        )
+        self.assertEqual(
+            host['details'],
+            [{'name': 'best_os_cpe', 'value': 'cpe:/o:canonical:ubuntu_linux'}],
+        )
+
+        mock_gmp.gmp_protocol.get_host.assert_any_call(self.id1)
+        mock_gmp.gmp_protocol.get_host.assert_any_call(self.id2)
+        mock_gmp.gmp_protocol.get_hosts.assert_not_called()
+
+    def test_missing_entity(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'''
+            <get_tasks_response>
+                <task id="{self.id1}">
+                    <name>foo</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                first: task(id: "{self.id1}") {{
+                    name
+                }}
+                second: task(id: "{self.id2}") {{
+                    name
+                }}
+            }}
+            '''
+        )
+
+        json = response.json()
+
+        self.assertEqual(json['data']['first']['name'], 'foo')
+        self.assertIsNone(json['data']['second'])
+        self.assertEqual(
+            json['errors'][0]['message'],
+            f"Response Error 404. Failed to find task '{self.id2}'",
+        )
+
+    def test_single_entity(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_task',
+            f'''
+            <get_tasks_response>
+                <task id="{self.id1}">
+                    <name>foo</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                task(id: "{self.id1}") {{
+                    name
+                }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.get_task.assert_called_once_with(self.id1)
+        mock_gmp.gmp_protocol.get_tasks.assert_not_called()
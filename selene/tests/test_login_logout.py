@@ -22,6 +22,7 @@ from unittest.mock import patch
 
 from django.conf import settings
 
+from selene.sessions import SessionTableFull
 from selene.tests import SeleneTestCase, GmpMockFactory
 
 
@@ -59,6 +60,47 @@ class LoginLogoutTestCase(SeleneTestCase):
         self.assertResponseStatusCode(response, 200)
         self.assertResponseHasErrorMessage(response, 'Authentication failed')
 
+    def test_login_long_password(self, mock_gmp: GmpMockFactory):
+        password = 'x' * 1024
+
+        response = self.query(
+            f'''
+            mutation {{
+              login(username: "foo", password: "{password}") {{
+                ok
+              }}
+            }}
+            '''
+        )
+
+        mock_gmp.assert_authenticated_with('foo', password)
+
+        self.assertResponseNoErrors(response)
+        self.assertEqual(self.client.session['password'], password)
+
+    def test_login_session_not_stored(self, mock_gmp: GmpMockFactory):
+        with patch(
+            'selene.sessions.SharedSessionTable.set',
+            side_effect=SessionTableFull('Session table is full'),
+        ):
+            response = self.query(
+                '''
+                mutation {
+                  login(username: "foo", password: "bar") {
+                    ok
+                  }
+                }
+                '''
+            )
+
+        mock_gmp.assert_authenticated_with('foo', 'bar')
+
+        self.assertResponseStatusCode(response, 200)
+        self.assertResponseHasErrorMessage(
+            response, 'Could not store the session. Session table is full'
+        )
+        self.assertNotIn('username', self.client.session)
+
     def test_login_success_with_timezone(self, mock_gmp: GmpMockFactory):
         mock_gmp.mock_response(
             'authenticate',
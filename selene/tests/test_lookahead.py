@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from types import SimpleNamespace
+
+from graphql import parse
+from graphql.language import ast
+
+from selene.schema.lookahead import (
+    get_selected_fields,
+    get_selected_node_fields,
+    is_any_field_selected,
+    is_only_fields_selected,
+)
+
+
+def create_info(query: str):
+    document = parse(query)
+    operation = None
+    fragments = {}
+    for definition in document.definitions:
+        if isinstance(definition, ast.FragmentDefinition):
+            fragments[definition.name.value] = definition
+        else:
+            operation = definition
+
+    return SimpleNamespace(
+        field_asts=[operation.selection_set.selections[0]],
+        fragments=fragments,
+    )
+
+
+class GetSelectedFieldsTestCase(unittest.TestCase):
+    def test_fields(self):
+        info = create_info('query { task { id name owner { name } } }')
+
+        self.assertEqual(get_selected_fields(info), {'id', 'name', 'owner'})
+        self.assertEqual(get_selected_fields(info, 'owner'), {'name'})
+        self.assertEqual(get_selected_fields(info, 'foo'), set())
+
+    def test_fragments(self):
+        info = create_info(
+            '''
+            query {
+                task {
+                    id
+                    ... on Task { comment }
+                    ...TaskFields
+                }
+            }
+            fragment TaskFields on Task {
+                name
+                ... on Task { averageDuration }
+            }
+            '''
+        )
+
+        self.assertEqual(
+            get_selected_fields(info),
+            {'id', 'comment', 'name', 'averageDuration'},
+        )
+
+    def test_node_fields(self):
+        info = create_info(
+            '''
+            query {
+                tasks {
+                    counts { total }
+                    nodes { id }
+                    edges { cursor node { name } }
+                }
+            }
+            '''
+        )
+
+        self.assertEqual(get_selected_node_fields(info), {'id', 'name'})
+
+    def test_aliases_and_directives(self):
+        info = create_info(
+            '''
+            query {
+                task {
+                    foo: name
+                    comment @skip(if: true)
+                }
+            }
+            '''
+        )
+
+        self.assertEqual(get_selected_fields(info), {'name', 'comment'})
+
+
+class SelectedFieldsTestCase(unittest.TestCase):
+    def test_is_any_field_selected(self):
+        self.assertTrue(is_any_field_selected({'id', 'name'}, ['name']))
+        self.assertFalse(is_any_field_selected({'id', 'name'}, ['foo']))
+
+    def test_is_only_fields_selected(self):
+        self.assertTrue(
+            is_only_fields_selected({'id', '__typename'}, ['id', 'name'])
+        )
+        self.assertFalse(is_only_fields_selected({'id', 'foo'}, ['id']))
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from unittest.mock import Mock, create_autospec, patch
+
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.memo import MemoizedGmp, get_memo_key, is_read_only_command
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class IsReadOnlyCommandTestCase(unittest.TestCase):
+    def test_read_only(self):
+        self.assertTrue(is_read_only_command('get_tasks'))
+        self.assertTrue(is_read_only_command('get_feeds'))
+        self.assertTrue(is_read_only_command('get_version'))
+        self.assertTrue(is_read_only_command('help'))
+
+    def test_not_read_only(self):
+        self.assertFalse(is_read_only_command('create_task'))
+        self.assertFalse(is_read_only_command('modify_task'))
+        self.assertFalse(is_read_only_command('authenticate'))
+
+
+class GetMemoKeyTestCase(unittest.TestCase):
+    def test_equal_keys(self):
+        self.assertEqual(
+            get_memo_key('get_tasks', (), {'filter_string': 'a', 'details': 1}),
+            get_memo_key('get_tasks', (), {'details': 1, 'filter_string': 'a'}),
+        )
+        self.assertEqual(
+            get_memo_key('get_task', (['a', 'b'],), {}),
+            get_memo_key('get_task', (['a', 'b'],), {}),
+        )
+
+    def test_different_keys(self):
+        self.assertNotEqual(
+            get_memo_key('get_task', ('a',), {}),
+            get_memo_key('get_task', ('b',), {}),
+        )
+        self.assertNotEqual(
+            get_memo_key('get_task', ('a',), {}),
+            get_memo_key('get_result', ('a',), {}),
+        )
+
+    def test_equivalent_filter_strings(self):
+        self.assertEqual(
+            get_memo_key('get_tasks', (), {'filter_string': 'rows=10  a'}),
+            get_memo_key('get_tasks', (), {'filter_string': 'a rows=10'}),
+        )
+
+    def test_unhashable(self):
+        self.assertIsNone(get_memo_key('get_task', (bytearray(),), {}))
+
+
+class MemoizedGmpTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gmp = create_autospec(Gmp)
+        self.memoized = MemoizedGmp(self.gmp)
+
+    def test_deduplicate(self):
+        response = self.memoized.get_task('foo')
+        response2 = self.memoized.get_task('foo')
+
+        self.assertIs(response, response2)
+        self.gmp.get_task.assert_called_once_with('foo')
+        self.assertEqual(self.memoized.hits, 1)
+        self.assertEqual(self.memoized.misses, 1)
+
+    def test_different_arguments(self):
+        self.memoized.get_tasks(filter_string='rows=1')
+        self.memoized.get_tasks(filter_string='rows=2')
+
+        self.assertEqual(self.gmp.get_tasks.call_count, 2)
+
+    def test_mutation_invalidates(self):
+        self.memoized.get_task('foo')
+        self.memoized.modify_task('foo', name='bar')
+        self.memoized.get_task('foo')
+
+        self.assertEqual(self.gmp.get_task.call_count, 2)
+        self.gmp.modify_task.assert_called_once_with('foo', name='bar')
+
+    def test_mutation_calls_on_change(self):
+        on_change = Mock()
+        memoized = MemoizedGmp(self.gmp, on_change=on_change)
+
+        memoized.get_task('foo')
+        on_change.assert_not_called()
+
+        memoized.modify_task('foo', name='bar')
+        on_change.assert_called_once_with()
+
+    def test_mutations_are_not_memoized(self):
+        self.memoized.start_task('foo')
+        self.memoized.start_task('foo')
+
+        self.assertEqual(self.gmp.start_task.call_count, 2)
+
+    def test_errors_are_not_memoized(self):
+        self.gmp.get_task.side_effect = [ValueError('foo'), 'bar']
+
+        with self.assertRaises(ValueError):
+            self.memoized.get_task('foo')
+
+        self.assertEqual(self.memoized.get_task('foo'), 'bar')
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewMemoTestCase(SeleneTestCase):
+    def test_deduplicate_aliases(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_task',
+            '''
+            <get_tasks_response>
+                <task id="75d23ba8-3d23-11ea-858e-b7c2cb43e815">
+                    <name>a</name>
+                </task>
+            </get_tasks_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                first: task(id: "75d23ba8-3d23-11ea-858e-b7c2cb43e815") {
+                    id
+                }
+                second: task(id: "75d23ba8-3d23-11ea-858e-b7c2cb43e815") {
+                    name
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['second']['name'], 'a')
+
+        mock_gmp.gmp_protocol.get_task.assert_called_once_with(
+            '75d23ba8-3d23-11ea-858e-b7c2cb43e815'
+        )
+
+    def test_memo_is_request_scoped(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        for _ in range(2):
+            response = self.query('query { tasks { nodes { id } } }')
+
+            self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.get_tasks.call_count, 2)
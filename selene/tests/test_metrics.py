@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from selene.metrics import (
+    OTHER_LABEL_VALUE,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsStore,
+    Registry,
+    merge_snapshots,
+    render,
+)
+from selene.tests import SeleneTestCase, GmpMockFactory
+from selene.views import SeleneView
+
+
+class HistogramTestCase(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram('foo', 'Foo', buckets=(0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2)
+
+        counts, total, count = histogram.collect()[()]
+
+        self.assertEqual(counts, [2, 3, 4])
+        self.assertAlmostEqual(total, 2.65)
+        self.assertEqual(count, 4)
+
+    def test_labels(self):
+        histogram = Histogram('foo', 'Foo', labels=('command',))
+
+        histogram.observe(0.1, 'get_tasks')
+        histogram.observe(0.1, 'get_tasks')
+        histogram.observe(0.1, 'get_results')
+
+        samples = histogram.collect()
+
+        self.assertEqual(samples[('get_tasks',)][2], 2)
+        self.assertEqual(samples[('get_results',)][2], 1)
+
+    def test_missing_labels(self):
+        histogram = Histogram('foo', 'Foo', labels=('command',))
+
+        with self.assertRaises(ValueError):
+            histogram.observe(0.1)
+
+    def test_clear(self):
+        histogram = Histogram('foo', 'Foo')
+        histogram.observe(0.1)
+
+        histogram.clear()
+
+        self.assertEqual(histogram.collect(), {})
+
+
+class CounterTestCase(unittest.TestCase):
+    def test_inc(self):
+        counter = Counter('foo', 'Foo', labels=('operation',))
+
+        counter.inc('a')
+        counter.inc('a', value=2)
+        counter.inc('b')
+
+        self.assertEqual(counter.collect(), {('a',): 3, ('b',): 1})
+
+    def test_max_label_values(self):
+        counter = Counter(
+            'foo', 'Foo', labels=('operation',), max_label_values=2
+        )
+
+        counter.inc('a')
+        counter.inc('b')
+        counter.inc('c')
+        counter.inc('d')
+        counter.inc('a')
+
+        self.assertEqual(
+            counter.collect(),
+            {('a',): 2, ('b',): 1, (OTHER_LABEL_VALUE,): 2},
+        )
+
+    def test_callback(self):
+        counter = Counter('foo', 'Foo', labels=('cache',))
+        counter.inc('memo')
+        counter.add_callback(lambda: {('memo',): 2, ('document',): 5})
+
+        self.assertEqual(counter.collect(), {('memo',): 3, ('document',): 5})
+
+
+class GaugeTestCase(unittest.TestCase):
+    def test_collect(self):
+        self.assertEqual(Gauge('foo', 'Foo', lambda: 42).collect(), {(): 42})
+        self.assertEqual(Gauge('foo', 'Foo', lambda: None).collect(), {})
+
+
+class RegistryTestCase(unittest.TestCase):
+    def test_register_twice(self):
+        registry = Registry()
+        registry.register(Counter('foo', 'Foo'))
+
+        with self.assertRaises(ValueError):
+            registry.register(Counter('foo', 'Foo'))
+
+
+class RenderTestCase(unittest.TestCase):
+    def test_render(self):
+        registry = Registry()
+        counter = registry.register(
+            Counter('selene_foo_total', 'Foo', labels=('operation',))
+        )
+        histogram = registry.register(
+            Histogram('selene_bar_seconds', 'Bar', buckets=(0.1,))
+        )
+
+        counter.inc('Get"Tasks')
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+        self.assertEqual(
+            render(registry.to_dict()),
+            '# HELP selene_bar_seconds Bar\n'
+            '# TYPE selene_bar_seconds histogram\n'
+            'selene_bar_seconds_bucket{le="0.1"} 1\n'
+            'selene_bar_seconds_bucket{le="+Inf"} 2\n'
+            'selene_bar_seconds_sum 0.55\n'
+            'selene_bar_seconds_count 2\n'
+            '# HELP selene_foo_total Foo\n'
+            '# TYPE selene_foo_total counter\n'
+            'selene_foo_total{operation="Get\\"Tasks"} 1\n',
+        )
+
+
+class MergeSnapshotsTestCase(unittest.TestCase):
+    def test_merge(self):
+        registry = Registry()
+        counter = registry.register(
+            Counter('foo', 'Foo', labels=('operation',))
+        )
+        histogram = registry.register(Histogram('bar', 'Bar', buckets=(0.1,)))
+        registry.register(Gauge('baz', 'Baz', lambda: 42))
+
+        counter.inc('a')
+        histogram.observe(0.05)
+
+        snapshot = json.loads(json.dumps(registry.to_dict()))
+        merged = merge_snapshots([(1, snapshot), (2, snapshot)])
+
+        self.assertEqual(merged['foo']['samples'], [[['a'], 2]])
+        self.assertEqual(merged['bar']['samples'], [[[], [[2, 2], 0.1, 2]]])
+        self.assertEqual(merged['baz']['labels'], ['pid'])
+        self.assertEqual(merged['baz']['samples'], [[['1'], 42], [['2'], 42]])
+
+
+class MetricsStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.registry = Registry()
+        self.counter = self.registry.register(Counter('foo', 'Foo'))
+        self.registry.register(Gauge('bar', 'Bar', lambda: 1))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_snapshot(self, pid: int):
+        path = Path(self.directory.name) / f'selene-{pid}.json'
+        path.write_text(
+            json.dumps({'pid': pid, 'metrics': self.registry.to_dict()})
+        )
+
+    def test_collect(self):
+        store = MetricsStore(self.directory.name, registry=self.registry)
+
+        self.counter.inc(value=3)
+
+        metrics = store.collect()
+
+        self.assertEqual(metrics['foo']['samples'], [[[], 3]])
+
+    def test_merge_exited_processes(self):
+        # pid of an exited process
+        process = subprocess.Popen([sys.executable, '-c', 'pass'])
+        process.wait()
+
+        self.counter.inc(value=2)
+        self.write_snapshot(process.pid)
+
+        store = MetricsStore(self.directory.name, registry=self.registry)
+        metrics = store.collect()
+
+        # the counter values of exited processes are kept
+        self.assertEqual(metrics['foo']['samples'], [[[], 4]])
+        # gauges are only exported for running processes
+        self.assertEqual(len(metrics['bar']['samples']), 1)
+
+    def test_ignore_invalid_snapshot(self):
+        path = Path(self.directory.name) / 'selene-1.json'
+        path.write_text('foo')
+
+        store = MetricsStore(self.directory.name, registry=self.registry)
+        self.counter.inc()
+
+        self.assertEqual(store.collect()['foo']['samples'], [[[], 1]])
+
+    def test_maybe_flush(self):
+        store = MetricsStore(
+            self.directory.name, registry=self.registry, flush_interval=60
+        )
+
+        store.maybe_flush()
+        self.assertEqual(len(store.load()), 1)
+
+        self.counter.inc()
+        store.maybe_flush()
+
+        # the snapshot has not been written again within the interval
+        _, metrics = store.load()[0]
+        self.assertEqual(metrics['foo']['samples'], [])
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class MetricsViewTestCase(SeleneTestCase):
+    def setUp(self):
+        REGISTRY.clear()
+
+    def tearDown(self):
+        SeleneView.metrics_store = None
+        SeleneView.document_backend = None
+
+    def query_version(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query('query GetVersion { version }')
+
+        self.assertResponseNoErrors(response)
+
+    def test_disabled(self, _mock_gmp: GmpMockFactory):
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(
+        SELENE={'METRICS': True, 'METRICS_ALLOWED_ADDRESSES': ['127.0.0.1']}
+    )
+    def test_metrics(self, mock_gmp: GmpMockFactory):
+        self.query_version(mock_gmp)
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+
+        content = response.content.decode()
+
+        self.assertIn(
+            'selene_graphql_operations_total'
+            '{type="query",operation="GetVersion"} 1',
+            content,
+        )
+        self.assertIn(
+            'selene_graphql_request_duration_seconds_count 1', content
+        )
+        self.assertIn(
+            'selene_cache_requests_total{cache="document",result="miss"} 1',
+            content,
+        )
+        self.assertIn('selene_process_resident_memory_bytes ', content)
+
+    @override_settings(
+        SELENE={'METRICS': True, 'METRICS_ALLOWED_ADDRESSES': ['127.0.0.1']}
+    )
+    def test_no_resolver_timings(self, mock_gmp: GmpMockFactory):
+        self.query_version(mock_gmp)
+
+        response = self.client.get('/metrics')
+
+        self.assertNotIn(
+            'selene_graphql_resolver_duration_seconds_count',
+            response.content.decode(),
+        )
+
+    @override_settings(SELENE={'METRICS': True})
+    def test_forbidden(self, _mock_gmp: GmpMockFactory):
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(
+        SELENE={'METRICS': True, 'METRICS_ALLOWED_ADDRESSES': ['10.0.0.1']}
+    )
+    def test_other_address(self, _mock_gmp: GmpMockFactory):
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(SELENE={'METRICS': True, 'METRICS_TOKEN': 'foo'})
+    def test_token(self, _mock_gmp: GmpMockFactory):
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer foo')
+
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer bar')
+
+        self.assertEqual(response.status_code, 403)
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_metrics_dir(self, mock_gmp: GmpMockFactory):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.settings(
+                SELENE={
+                    'METRICS': True,
+                    'METRICS_ALLOWED_ADDRESSES': ['127.0.0.1'],
+                    'METRICS_DIR': directory,
+                }
+            ):
+                self.query_version(mock_gmp)
+
+                response = self.client.get('/metrics')
+
+            self.assertTrue(list(Path(directory).glob('selene-*.json')))
+
+        content = response.content.decode()
+
+        self.assertIn(
+            'selene_graphql_operations_total'
+            '{type="query",operation="GetVersion"} 1',
+            content,
+        )
+        self.assertIn('selene_process_resident_memory_bytes{pid=', content)
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import unittest
+
+from unittest.mock import MagicMock, create_autospec, patch
+
+from django.test import override_settings
+
+from lxml import etree
+
+from gvm.errors import GvmResponseError
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.parallel import GmpConnectionGroup
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class FakeConnect:
+    def __init__(self):
+        self.protocols = []
+        self.contexts = []
+
+    def __call__(self):
+        protocol = create_autospec(Gmp)
+        self.protocols.append(protocol)
+
+        context = MagicMock()
+        context.__enter__.return_value = protocol
+        self.contexts.append(context)
+        return context
+
+
+class GmpConnectionGroupTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gmp = create_autospec(Gmp)
+        self.connect = FakeConnect()
+
+    def test_use_connection_of_request(self):
+        group = GmpConnectionGroup(self.gmp, self.connect, max_size=2)
+
+        group.get_tasks()
+        group.get_tasks()
+
+        self.assertEqual(self.gmp.get_tasks.call_count, 2)
+        self.assertEqual(len(self.connect.protocols), 0)
+
+    def test_open_connection_if_busy(self):
+        group = GmpConnectionGroup(self.gmp, self.connect, max_size=2)
+
+        with group.connection() as gmp:
+            self.assertIs(gmp, self.gmp)
+
+            group.get_tasks()
+
+        self.connect.protocols[0].get_tasks.assert_called_once_with()
+        self.assertEqual(len(group), 2)
+
+        # the additional connection is reused
+        with group.connection():
+            group.get_tasks()
+
+        self.assertEqual(len(self.connect.protocols), 1)
+
+    def test_max_size(self):
+        group = GmpConnectionGroup(self.gmp, self.connect, max_size=1)
+        acquired = threading.Event()
+
+        def run():
+            with group.connection():
+                acquired.set()
+
+        with group.connection():
+            thread = threading.Thread(target=run)
+            thread.start()
+
+            self.assertFalse(acquired.wait(0.1))
+
+        thread.join(5)
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(len(self.connect.protocols), 0)
+
+    def test_close(self):
+        group = GmpConnectionGroup(self.gmp, self.connect, max_size=2)
+
+        with group.connection():
+            group.get_tasks()
+
+        group.close()
+
+        self.connect.contexts[0].__exit__.assert_called_once()
+        self.assertEqual(len(group), 1)
+
+    def test_authenticate_via_connection_of_request(self):
+        group = GmpConnectionGroup(self.gmp, self.connect, max_size=2)
+
+        with group.connection():
+            group.authenticate('foo', 'bar')
+
+        self.gmp.authenticate.assert_called_once_with('foo', 'bar')
+        self.assertEqual(len(self.connect.protocols), 0)
+
+
+@override_settings(SELENE={'GMP_PARALLELISM': 2})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class ParallelRootFieldsTestCase(SeleneTestCase):
+    def test_resolve_root_fields_in_parallel(self, mock_gmp: GmpMockFactory):
+        # both commands only return if they are sent at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_version():
+            barrier.wait()
+            return etree.fromstring(
+                '<get_version_response><version>21.4</version>'
+                '</get_version_response>'
+            )
+
+        def get_tasks(**_kwargs):
+            barrier.wait()
+            return etree.fromstring(
+                '<get_tasks_response>'
+                '<task id="15085a9a-3d24-11ea-944a-6f78adc016ea">'
+                '<name>a</name></task></get_tasks_response>'
+            )
+
+        mock_gmp.gmp_protocol.get_version.side_effect = get_version
+        mock_gmp.gmp_protocol.get_tasks.side_effect = get_tasks
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                version
+                tasks {
+                    nodes {
+                        name
+                    }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['version'], '21.4')
+        self.assertEqual(json['data']['tasks']['nodes'], [{'name': 'a'}])
+
+        # the second connection got authenticated too
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_error_in_root_field(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+        mock_gmp.gmp_protocol.get_tasks.side_effect = GvmResponseError(
+            status='400', message='Failed'
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                version
+                tasks {
+                    nodes {
+                        name
+                    }
+                }
+            }
+            '''
+        )
+
+        json = response.json()
+
+        self.assertEqual(json['data']['version'], '21.4')
+        self.assertIsNone(json['data']['tasks'])
+        self.assertEqual(
+            json['errors'][0]['message'], 'Response Error 400. Failed'
+        )
+
+    def test_batched_entity_loader(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+        mock_gmp.mock_response(
+            'get_task',
+            '<get_tasks_response>'
+            '<task id="15085a9a-3d24-11ea-944a-6f78adc016ea">'
+            '<name>a</name></task></get_tasks_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                version
+                task(id: "15085a9a-3d24-11ea-944a-6f78adc016ea") {
+                    name
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['task']['name'], 'a')
+
+
+@override_settings(SELENE={'GMP_PARALLELISM': 4})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class ParallelEntityLoaderTestCase(SeleneTestCase):
+    task_ids = [f'15085a9a-3d24-11ea-944a-{i:012}' for i in range(6)]
+
+    def setUp(self):
+        self.tasks = ''.join(
+            f'<task id="{task_id}"><name>{i}</name></task>'
+            for i, task_id in enumerate(self.task_ids)
+        )
+
+    def test_batched_aliases(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'<get_tasks_response>{self.tasks}</get_tasks_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        aliases = ''.join(
+            f't{i}: task(id: "{task_id}") {{ name }} '
+            for i, task_id in enumerate(self.task_ids)
+        )
+        response = self.query(f'query {{ {aliases} }}')
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(
+            [json['data'][f't{i}']['name'] for i in range(6)],
+            [str(i) for i in range(6)],
+        )
+
+        # a single connection and a single batched command
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 1)
+        self.assertEqual(mock_gmp.gmp_protocol.get_tasks.call_count, 1)
+        mock_gmp.gmp_protocol.get_task.assert_not_called()
+
+    def test_batched_aliases_with_parallel_fields(
+        self, mock_gmp: GmpMockFactory
+    ):
+        mock_gmp.mock_response(
+            'get_version',
+            '<get_version_response><version>21.4</version>'
+            '</get_version_response>',
+        )
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'<get_tasks_response>{self.tasks}</get_tasks_response>',
+        )
+        mock_gmp.mock_response(
+            'get_results',
+            '<get_results_response><results start="1" max="0"/>'
+            '<result_count>0<filtered>0</filtered></result_count>'
+            '</get_results_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            f'''
+            query {{
+                version
+                results {{ nodes {{ id }} }}
+                a: task(id: "{self.task_ids[0]}") {{ name }}
+                b: task(id: "{self.task_ids[1]}") {{ name }}
+            }}
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+
+        self.assertEqual(json['data']['version'], '21.4')
+        self.assertEqual(json['data']['a']['name'], '0')
+        self.assertEqual(json['data']['b']['name'], '1')
+
+        # version and results are resolved in parallel via two connections,
+        # the tasks are loaded via a single command
+        self.assertLessEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+        self.assertEqual(mock_gmp.gmp_protocol.get_tasks.call_count, 1)
+        mock_gmp.gmp_protocol.get_task.assert_not_called()
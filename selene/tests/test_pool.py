@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import unittest
+
+from unittest.mock import MagicMock, create_autospec, patch
+
+from django.test import override_settings
+
+from gvm.errors import GvmError, GvmResponseError
+from gvm.protocols.gmpv214 import Gmp
+
+from selene.pool import GmpConnectionPool
+from selene.views import SeleneView
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+class FakeConnect:
+    def __init__(self):
+        self.protocols = []
+        self.contexts = []
+
+    def __call__(self):
+        protocol = create_autospec(Gmp)
+        protocol.is_connected.return_value = True
+        self.protocols.append(protocol)
+
+        context = MagicMock()
+        context.__enter__.return_value = protocol
+        self.contexts.append(context)
+        return context
+
+
+class GmpConnectionPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.connect = FakeConnect()
+
+    def test_reuse_connection(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertIs(connection, connection2)
+        self.assertEqual(len(self.connect.protocols), 1)
+        self.connect.protocols[0].authenticate.assert_called_once_with(
+            'foo', 'bar'
+        )
+
+    def test_no_reuse_with_other_password(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        connection2 = pool.acquire('foo', 'baz')
+
+        self.assertIsNot(connection, connection2)
+        self.connect.protocols[1].authenticate.assert_called_once_with(
+            'foo', 'baz'
+        )
+
+    def test_no_reuse_while_in_use(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection2)
+
+    def test_failed_authentication(self):
+        pool = GmpConnectionPool(self.connect)
+
+        context = self.connect()
+        self.connect.protocols[0].authenticate.side_effect = GvmResponseError(
+            status='400', message='Authentication failed'
+        )
+        pool.connect = MagicMock(return_value=context)
+
+        with self.assertRaises(GvmResponseError):
+            pool.acquire('foo', 'bar')
+
+        context.__exit__.assert_called_once()
+
+    def test_idle_timeout(self):
+        pool = GmpConnectionPool(self.connect, idle_timeout=0)
+
+        connection = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection2)
+        self.connect.protocols[0].authenticate.assert_called_once()
+        self.connect.protocols[1].authenticate.assert_called_once()
+
+    def test_health_check(self):
+        pool = GmpConnectionPool(self.connect, health_check_interval=0)
+
+        connection = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        self.connect.protocols[0].get_version.side_effect = GvmError('closed')
+
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection2)
+        self.connect.protocols[0].get_version.assert_called_once()
+
+    def test_disconnected(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        self.connect.protocols[0].is_connected.return_value = False
+        pool.release(connection)
+
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection2)
+
+    def test_max_size(self):
+        pool = GmpConnectionPool(self.connect, max_size=1)
+
+        connection = pool.acquire('foo', 'bar')
+        connection2 = pool.acquire('foo', 'bar')
+
+        self.assertTrue(connection.pooled)
+        self.assertFalse(connection2.pooled)
+
+        pool.release(connection2)
+
+        self.connect.contexts[0].__exit__.assert_not_called()
+        self.connect.contexts[1].__exit__.assert_called_once()
+
+    def test_max_size_concurrent_acquire(self):
+        pool = GmpConnectionPool(self.connect, max_size=2)
+        barrier = threading.Barrier(4, timeout=5)
+        connections = []
+
+        def acquire():
+            connections.append(pool.acquire('foo', 'bar'))
+
+        def connect():
+            context = FakeConnect.__call__(self.connect)
+            # all connections are opened at the same time
+            context.__enter__.return_value.authenticate.side_effect = (
+                lambda *args: barrier.wait()
+            )
+            return context
+
+        pool.connect = connect
+
+        threads = [threading.Thread(target=acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(connections), 4)
+        self.assertEqual(len([c for c in connections if c.pooled]), 2)
+
+    def test_max_size_failed_open(self):
+        pool = GmpConnectionPool(self.connect, max_size=1)
+
+        context = self.connect()
+        self.connect.protocols[0].authenticate.side_effect = GvmResponseError(
+            status='400', message='Authentication failed'
+        )
+        pool.connect = MagicMock(return_value=context)
+
+        with self.assertRaises(GvmResponseError):
+            pool.acquire('foo', 'bar')
+
+        pool.connect = self.connect
+
+        # the reserved slot has been released
+        self.assertTrue(pool.acquire('foo', 'bar').pooled)
+
+    def test_max_size_replaces_least_recently_used(self):
+        pool = GmpConnectionPool(self.connect, max_size=1)
+
+        connection = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        connection2 = pool.acquire('lorem', 'ipsum')
+
+        self.assertTrue(connection2.pooled)
+
+        pool.release(connection2)
+
+        connection3 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection3)
+
+    def test_evict(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        connection2 = pool.acquire('foo', 'bar')
+        pool.release(connection)
+
+        pool.evict('foo', 'bar')
+
+        self.assertTrue(connection2.discarded)
+
+        pool.release(connection2)
+
+        connection3 = pool.acquire('foo', 'bar')
+
+        self.assertIsNot(connection, connection3)
+        self.assertIsNot(connection2, connection3)
+
+    def test_evict_other_credentials(self):
+        pool = GmpConnectionPool(self.connect)
+
+        connection = pool.acquire('foo', 'bar')
+        connection2 = pool.acquire('foo', 'baz')
+        pool.release(connection)
+
+        pool.evict('foo', 'baz')
+
+        self.assertTrue(connection2.discarded)
+        self.assertIs(pool.acquire('foo', 'bar'), connection)
+        self.connect.contexts[0].__exit__.assert_not_called()
+
+
+@override_settings(SELENE={'GMP_POOL_SIZE': 2})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewGmpPoolTestCase(SeleneTestCase):
+    def tearDown(self):
+        SeleneView.gmp_pool.clear()
+        SeleneView.gmp_pool = None
+
+    def test_authenticate_once(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        for _ in range(3):
+            response = self.query('query { tasks { nodes { id } } }')
+
+            self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp_protocol.authenticate.assert_called_once_with('foo', 'bar')
+        mock_gmp.gmp.__exit__.assert_not_called()
+
+    def test_logout_evicts_connection(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertResponseNoErrors(response)
+
+        response = self.query('mutation { logout { ok } }')
+
+        self.assertResponseNoErrors(response)
+
+        mock_gmp.gmp.__exit__.assert_called_once()
+
+    def test_renew_session_evicts_connection(self, mock_gmp: GmpMockFactory):
+        self.login('foo', 'bar')
+
+        response = self.query(
+            'mutation { renewSession { currentUser { username } } }'
+        )
+
+        self.assertResponseNoErrors(response)
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertResponseNoErrors(response)
+
+        self.assertEqual(mock_gmp.gmp_protocol.authenticate.call_count, 2)
+
+    def test_failed_authentication(self, mock_gmp: GmpMockFactory):
+        mock_gmp.fail_authentication()
+
+        self.login('foo', 'bar')
+
+        response = self.query('query { tasks { nodes { id } } }')
+
+        self.assertResponseStatusCode(response, 403)
+        self.assertResponseHasErrorMessage(
+            response, 'Response Error 401. Authentication failed'
+        )
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+import threading
+import unittest
+
+from unittest.mock import patch
+
+from django.test import override_settings
+from lxml import etree
+
+from selene.prefetch import PrefetchCache
+from selene.views import SeleneView
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+FILTERED = 3
+
+
+def get_result_id(index: int) -> str:
+    return f'00000000-0000-0000-0000-{index:012d}'
+
+
+def get_results(filter_string: str, **_kwargs):
+    match = re.search(r'first=(\d+)', filter_string)
+    start = int(match.group(1)) if match else 1
+    return etree.fromstring(
+        f'''
+        <get_results_response status="200" status_text="OK">
+            <result id="{get_result_id(start)}"/>
+            <results start="{start}" max="1"/>
+            <result_count>{FILTERED}<filtered>{FILTERED}</filtered>
+            </result_count>
+        </get_results_response>
+        '''
+    )
+
+
+class PrefetchCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = PrefetchCache(ttl=10, max_size=2, max_workers=1)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_submit_pop(self):
+        self.assertTrue(self.cache.submit('foo', lambda: 'bar'))
+
+        self.assertEqual(self.cache.pop('foo').result(), 'bar')
+        self.assertIsNone(self.cache.pop('foo'))
+
+    def test_submit_once(self):
+        event = threading.Event()
+
+        self.assertTrue(self.cache.submit('foo', event.wait))
+        self.assertFalse(self.cache.submit('foo', event.wait))
+
+        event.set()
+
+    @patch('selene.prefetch.time')
+    def test_expire(self, time_mock):
+        time_mock.monotonic.return_value = 100
+
+        self.cache.submit('foo', lambda: 'bar')
+
+        time_mock.monotonic.return_value = 110
+
+        self.assertIsNone(self.cache.pop('foo'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_evict_oldest(self):
+        for key in ('foo', 'bar', 'baz'):
+            self.cache.submit(key, lambda: None)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.pop('foo'))
+        self.assertIsNotNone(self.cache.pop('baz'))
+
+    def test_invalidate(self):
+        self.cache.submit(('foo', 's1', 'a'), lambda: None)
+        self.cache.submit(('bar', 's2', 'a'), lambda: None)
+
+        self.cache.invalidate('foo')
+
+        self.assertIsNone(self.cache.pop(('foo', 's1', 'a')))
+        self.assertIsNotNone(self.cache.pop(('bar', 's2', 'a')))
+
+
+@override_settings(SELENE={'CONNECTION_PREFETCH': True})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewPrefetchTestCase(SeleneTestCase):
+    query_string = '''
+        query {{
+            results (filterString: "{filter_string}", first: 1{after}) {{
+                nodes {{
+                    id
+                }}
+                pageInfo {{
+                    endCursor
+                }}
+            }}
+        }}
+    '''
+
+    def tearDown(self):
+        if SeleneView.prefetch_cache is not None:
+            SeleneView.prefetch_cache.close()
+        SeleneView.prefetch_cache = None
+
+    def query_results(self, filter_string: str = 'name~foo', after=None):
+        response = self.query(
+            self.query_string.format(
+                filter_string=filter_string,
+                after=f', after: "{after}"' if after else '',
+            )
+        )
+
+        self.assertResponseNoErrors(response)
+
+        return response.json()['data']['results']
+
+    def get_filter_strings(self, mock_gmp: GmpMockFactory):
+        SeleneView.prefetch_cache.close()
+        return [
+            call[1]['filter_string']
+            for call in mock_gmp.gmp_protocol.get_results.call_args_list
+        ]
+
+    def test_prefetch_next_page(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_results.side_effect = get_results
+
+        self.login('foo', 'bar')
+
+        results = self.query_results()
+        results = self.query_results(after=results['pageInfo']['endCursor'])
+
+        self.assertEqual(results['nodes'], [{'id': get_result_id(2)}])
+
+        # the last page isn't followed by another page
+        self.assertEqual(
+            self.get_filter_strings(mock_gmp),
+            [
+                'name~foo rows=1',
+                'name~foo rows=1 first=2',
+                'name~foo rows=1 first=3',
+            ],
+        )
+
+    def test_different_filter(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_results.side_effect = get_results
+
+        self.login('foo', 'bar')
+
+        results = self.query_results()
+        results = self.query_results(
+            'name~bar', after=results['pageInfo']['endCursor']
+        )
+
+        self.assertEqual(results['nodes'], [{'id': get_result_id(2)}])
+        self.assertIn(
+            'name~bar rows=1 first=2', self.get_filter_strings(mock_gmp)
+        )
+
+    def test_mutation_drops_prefetched_pages(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_results.side_effect = get_results
+        mock_gmp.mock_response(
+            'clone_note',
+            '''
+            <create_note_response status="201" status_text="OK,
+            resource created" id="e1438fb2-ab2c-4f4a-ad6b-de97005256e8"/>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        results = self.query_results()
+
+        response = self.query(
+            '''
+            mutation {
+                cloneNote(id: "08b69003-5fc2-4037-a479-93b440211c73") {
+                    id
+                }
+            }
+            '''
+        )
+        self.assertResponseNoErrors(response)
+
+        self.query_results(after=results['pageInfo']['endCursor'])
+
+        # the prefetched second page has been dropped and is requested again
+        self.assertEqual(
+            self.get_filter_strings(mock_gmp).count('name~foo rows=1 first=2'),
+            2,
+        )
+
+    @override_settings(SELENE={})
+    def test_disabled(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_results.side_effect = get_results
+
+        self.login('foo', 'bar')
+
+        self.query_results()
+
+        self.assertIsNone(SeleneView.prefetch_cache)
+        mock_gmp.gmp_protocol.get_results.assert_called_once_with(
+            filter_string='name~foo rows=1'
+        )
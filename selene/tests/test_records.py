@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from unittest.mock import MagicMock
+
+from lxml import etree
+
+from selene.schema.hosts.fields import HostRecord
+from selene.schema.nvts.fields import NVTRecord
+from selene.schema.records import ElementRecord
+from selene.schema.relay import Entities
+from selene.schema.reports.fields import Report, ReportModel
+from selene.schema.results.fields import ResultRecord
+from selene.schema.tasks.fields import TaskRecord
+from selene.schema.results.queries import GetResults
+from selene.schema.utils import get_text_from_element
+
+
+class ElementRecordTestCase(unittest.TestCase):
+    def setUp(self):
+        self.element = etree.fromstring(
+            '<result id="foo">'
+            '<name>foo</name>'
+            '<host>192.168.0.1<hostname>bar</hostname></host>'
+            '<note id="a"/>'
+            '<note id="b"/>'
+            '</result>'
+        )
+        self.record = ElementRecord(self.element)
+
+    def test_find_child(self):
+        self.assertIs(self.record.find('name'), self.element.find('name'))
+        self.assertEqual(self.record.find('note').get('id'), 'a')
+        self.assertIsNone(self.record.find('comment'))
+
+    def test_find_path(self):
+        self.assertEqual(self.record.find('host/hostname').text, 'bar')
+        self.assertIsNone(self.record.find('host/comment'))
+
+    def test_findall(self):
+        self.assertEqual(len(self.record.findall('note')), 2)
+
+    def test_text(self):
+        self.assertEqual(self.record.text('name'), 'foo')
+        self.assertIsNone(self.record.text('comment'))
+
+    def test_element_access(self):
+        self.assertEqual(self.record.get('id'), 'foo')
+        self.assertEqual(self.record.tag, 'result')
+        self.assertEqual(len(self.record), 4)
+        self.assertEqual(list(self.record), list(self.element))
+        self.assertEqual(get_text_from_element(self.record, 'name'), 'foo')
+
+    def test_of(self):
+        self.assertIs(ElementRecord.of(self.record), self.record)
+        self.assertIsNone(ElementRecord.of(None))
+
+        result = ResultRecord.of(self.record)
+
+        self.assertIsInstance(result, ResultRecord)
+        self.assertIs(result.element, self.element)
+
+
+class EntityRecordsTestCase(unittest.TestCase):
+    def test_result_record(self):
+        record = ResultRecord(
+            etree.fromstring(
+                '<result><port>80/tcp</port><severity>5.0</severity></result>'
+            )
+        )
+
+        self.assertEqual(record.port, '80/tcp')
+        self.assertEqual(record.severity, '5.0')
+        self.assertIsNone(record.original_severity)
+
+    def test_host_record(self):
+        record = HostRecord(
+            etree.fromstring(
+                '<asset><host><severity><value>10.0</value></severity>'
+                '</host></asset>'
+            )
+        )
+
+        self.assertEqual(record.severity, '10.0')
+        self.assertIsNone(HostRecord(etree.Element('asset')).severity)
+
+    def test_nvt_record(self):
+        record = NVTRecord(
+            etree.fromstring(
+                '<info><nvt><family>Web</family><refs/></nvt></info>'
+            )
+        )
+
+        self.assertEqual(record.family, 'Web')
+        self.assertIsNotNone(record.find_nvt('refs'))
+        self.assertIsNone(record.find_nvt('tags'))
+
+        record = NVTRecord(etree.Element('info'))
+
+        self.assertIsNone(record.family)
+        self.assertIsNone(record.find_nvt('refs'))
+
+    def test_read_plain_element(self):
+        elements = {
+            ResultRecord: '<result><port>80/tcp</port>'
+            '<severity>5.0</severity><description>foo</description></result>',
+            TaskRecord: '<task><status>Done</status><trend>up</trend>'
+            '<progress>-1</progress></task>',
+            HostRecord: '<asset><host><severity><value>10.0</value>'
+            '</severity></host></asset>',
+            NVTRecord: '<info><nvt><family>Web</family><timeout>5</timeout>'
+            '</nvt></info>',
+        }
+
+        for record_type, xml in elements.items():
+            element = etree.fromstring(xml)
+            record = record_type(element)
+
+            for name in record_type.fields:
+                self.assertEqual(
+                    record_type.read(element, name),
+                    getattr(record, name),
+                    f'{record_type.__name__}.{name}',
+                )
+                self.assertEqual(
+                    record_type.read(record, name), getattr(record, name)
+                )
+
+    def test_find_nvt_child(self):
+        element = etree.fromstring('<info><nvt><refs/></nvt></info>')
+
+        self.assertIs(
+            NVTRecord.find_nvt_child(element, 'refs'), element.find('nvt/refs')
+        )
+        self.assertIs(
+            NVTRecord.find_nvt_child(NVTRecord(element), 'refs'),
+            element.find('nvt/refs'),
+        )
+        self.assertIsNone(NVTRecord.find_nvt_child(element, 'tags'))
+
+    def test_connection_nodes(self):
+        entities = Entities(
+            [etree.Element('result', id='a'), etree.Element('result', id='b')],
+            None,
+            None,
+        )
+        connection = GetResults().type
+
+        nodes = list(connection.resolve_nodes(entities, MagicMock()))
+
+        self.assertEqual(len(nodes), 2)
+        self.assertIsInstance(nodes[0], ResultRecord)
+        self.assertEqual(nodes[1].get('id'), 'b')
+
+    def test_report_results(self):
+        report = ReportModel()
+        report.inner_report = etree.fromstring(
+            '<report><results>'
+            '<result id="a"><detection><result id="c"/></detection></result>'
+            '<result id="b"/>'
+            '</results></report>'
+        )
+
+        results = Report.resolve_results(report, MagicMock())
+
+        self.assertEqual([result.get('id') for result in results], ['a', 'b'])
+        self.assertIsInstance(results[0], ResultRecord)
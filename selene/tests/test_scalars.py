@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest import TestCase
+from uuid import UUID
+
+from graphql.language import ast
+
+from selene.schema import schema
+from selene.schema.scalars import UUIDType
+
+ID = '75d23ba8-3d23-11ea-858e-b7c2cb43e815'
+
+
+class UUIDTypeTestCase(TestCase):
+    def test_serialize_string(self):
+        self.assertIs(UUIDType.serialize(ID), ID)
+        self.assertEqual(UUIDType.serialize(ID.upper()), ID)
+
+    def test_serialize_uuid(self):
+        self.assertEqual(UUIDType.serialize(UUID(ID)), ID)
+
+    def test_serialize_invalid(self):
+        with self.assertRaises(ValueError):
+            UUIDType.serialize('foo')
+
+        with self.assertRaises(AssertionError):
+            UUIDType.serialize(1)
+
+    def test_parse(self):
+        self.assertEqual(UUIDType.parse_value(ID), UUID(ID))
+        self.assertEqual(
+            UUIDType.parse_literal(ast.StringValue(value=ID)), UUID(ID)
+        )
+
+    def test_schema_type_name(self):
+        self.assertEqual(schema.get_type('UUID').graphene_type, UUIDType)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import create_autospec, patch
+
+from django.test import override_settings
+
+from lxml import etree
+
+from gvm.errors import GvmResponseError
+from gvm.protocols.gmpv214 import Gmp
+from gvm.protocols.next import InfoType
+
+from selene.secinfo import CachedSecInfoGmp, SecInfoCache
+from selene.tests import SeleneTestCase, GmpMockFactory
+from selene.views import SeleneView
+
+
+def feeds_response(
+    nvt_version: str = '202010220502', nvt_syncing: bool = False
+) -> etree.Element:
+    syncing = (
+        '<currently_syncing><timestamp>foo</timestamp></currently_syncing>'
+        if nvt_syncing
+        else ''
+    )
+    return etree.fromstring(
+        f'''
+        <get_feeds_response>
+            <feed>
+                <type>NVT</type>
+                <version>{nvt_version}</version>
+                {syncing}
+            </feed>
+            <feed>
+                <type>SCAP</type>
+                <version>202011130230</version>
+            </feed>
+        </get_feeds_response>
+        '''
+    )
+
+
+def info_response(name: str = 'foo') -> etree.Element:
+    return etree.fromstring(
+        f'<get_info_response status="200"><info id="1"><name>{name}</name>'
+        '</info></get_info_response>'
+    )
+
+
+class CachedSecInfoGmpTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gmp = create_autospec(Gmp)
+        self.gmp.get_feeds.return_value = feeds_response()
+        self.gmp.get_info.return_value = info_response()
+        self.gmp.get_info_list.return_value = info_response()
+
+        self.cache = SecInfoCache(max_size=2)
+
+    def test_cache_across_instances(self):
+        for _ in range(2):
+            gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+            response = gmp.get_info('1', info_type=InfoType.NVT)
+
+            self.assertEqual(response.find('info/name').text, 'foo')
+
+        self.gmp.get_info.assert_called_once_with('1', info_type=InfoType.NVT)
+        self.gmp.get_feeds.assert_called_once_with()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_cache_per_user(self):
+        CachedSecInfoGmp(self.gmp, self.cache, 'foo').get_info_list(
+            filter_string='rows=10', info_type=InfoType.CVE
+        )
+        CachedSecInfoGmp(self.gmp, self.cache, 'bar').get_info_list(
+            filter_string='rows=10', info_type=InfoType.CVE
+        )
+
+        self.assertEqual(self.gmp.get_info_list.call_count, 2)
+
+    def test_different_filters(self):
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info_list(filter_string='rows=10', info_type=InfoType.CVE)
+        gmp.get_info_list(filter_string='rows=20', info_type=InfoType.CVE)
+        gmp.get_info_list(filter_string='rows=10', info_type=InfoType.CPE)
+
+        self.assertEqual(self.gmp.get_info_list.call_count, 3)
+
+    def test_lru(self):
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+        gmp.get_info('2', info_type=InfoType.NVT)
+        gmp.get_info('1', info_type=InfoType.NVT)
+        gmp.get_info('3', info_type=InfoType.NVT)
+
+        self.assertEqual(len(self.cache), 2)
+
+        # 2 was the least recently used response
+        gmp.get_info('2', info_type=InfoType.NVT)
+
+        self.assertEqual(self.gmp.get_info.call_count, 4)
+
+    def test_feed_version_changed(self):
+        self.cache.feed_check_interval = 0
+
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+        gmp.get_info('1', info_type=InfoType.CVE)
+
+        self.gmp.get_feeds.return_value = feeds_response('202010230502')
+
+        gmp.get_info('1', info_type=InfoType.NVT)
+        gmp.get_info('1', info_type=InfoType.CVE)
+
+        # only the NVT response got dropped
+        self.assertEqual(self.gmp.get_info.call_count, 3)
+
+    def test_feed_syncing(self):
+        self.cache.feed_check_interval = 0
+        self.gmp.get_feeds.return_value = feeds_response(nvt_syncing=True)
+
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+        gmp.get_info('1', info_type=InfoType.NVT)
+
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_feed_check_interval(self):
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+
+        self.gmp.get_feeds.return_value = feeds_response('202010230502')
+
+        gmp.get_info('1', info_type=InfoType.NVT)
+
+        # the new version isn't known before the interval has passed
+        self.gmp.get_info.assert_called_once_with('1', info_type=InfoType.NVT)
+
+    def test_get_feeds_failed(self):
+        self.gmp.get_feeds.side_effect = GvmResponseError(
+            status='403', message='Permission denied'
+        )
+
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+        response = gmp.get_info('1', info_type=InfoType.NVT)
+
+        self.assertEqual(response.find('info/name').text, 'foo')
+        self.assertEqual(self.gmp.get_info.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_other_commands(self):
+        gmp = CachedSecInfoGmp(self.gmp, self.cache, 'foo')
+        gmp.get_tasks()
+        gmp.get_tasks()
+
+        self.assertEqual(self.gmp.get_tasks.call_count, 2)
+        self.gmp.get_feeds.assert_not_called()
+
+
+class SecInfoCacheDirectoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.gmp = create_autospec(Gmp)
+        self.gmp.get_feeds.return_value = feeds_response()
+        self.gmp.get_info.return_value = info_response()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_shared_between_caches(self):
+        cache = SecInfoCache(directory=self.tempdir.name)
+        CachedSecInfoGmp(self.gmp, cache, 'foo').get_info(
+            '1', info_type=InfoType.NVT
+        )
+
+        # e.g. another worker process
+        other_cache = SecInfoCache(directory=self.tempdir.name)
+        response = CachedSecInfoGmp(self.gmp, other_cache, 'foo').get_info(
+            '1', info_type=InfoType.NVT
+        )
+
+        self.assertEqual(response.find('info/name').text, 'foo')
+        self.gmp.get_info.assert_called_once_with('1', info_type=InfoType.NVT)
+
+    def test_remove_old_versions(self):
+        cache = SecInfoCache(directory=self.tempdir.name, feed_check_interval=0)
+        gmp = CachedSecInfoGmp(self.gmp, cache, 'foo')
+        gmp.get_info('1', info_type=InfoType.NVT)
+
+        nvt_path = Path(self.tempdir.name) / 'NVT'
+
+        self.assertEqual([p.name for p in nvt_path.iterdir()], ['202010220502'])
+
+        self.gmp.get_feeds.return_value = feeds_response('202010230502')
+        gmp.get_info('1', info_type=InfoType.NVT)
+
+        self.assertEqual([p.name for p in nvt_path.iterdir()], ['202010230502'])
+
+
+@override_settings(SELENE={'SECINFO_CACHE_SIZE': 10})
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewSecInfoCacheTestCase(SeleneTestCase):
+    def tearDown(self):
+        SeleneView.secinfo_cache = None
+
+    def test_cache_across_requests(self, mock_gmp: GmpMockFactory):
+        mock_gmp.mock_response(
+            'get_feeds', etree.tostring(feeds_response()).decode()
+        )
+        mock_gmp.mock_response(
+            'get_info',
+            '''
+            <get_info_response>
+                <info id="CVE-2020-1234">
+                    <name>CVE-2020-1234</name>
+                    <cve />
+                </info>
+            </get_info_response>
+            ''',
+        )
+
+        self.login('foo', 'bar')
+
+        for _ in range(2):
+            response = self.query(
+                'query { cve(id: "CVE-2020-1234") { id name } }'
+            )
+
+            self.assertResponseNoErrors(response)
+
+            json = response.json()
+
+            self.assertEqual(json['data']['cve']['name'], 'CVE-2020-1234')
+
+        mock_gmp.gmp_protocol.get_info.assert_called_once_with(
+            'CVE-2020-1234', info_type=InfoType.CVE
+        )
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import datetime
+import os
+import tempfile
+import time
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError, UpdateError
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from selene.sessions import (
+    CompactSerializer,
+    FileSessionStore,
+    SessionDataTooLarge,
+    SessionStore,
+    SessionTableFull,
+    SharedSessionTable,
+    _private_directory,
+)
+
+
+def get_slot_states(table: SharedSessionTable):
+    # pylint: disable=protected-access
+    return [table._read_header(index)[0] for index in range(table.slot_count)]
+
+
+class CompactSerializerTestCase(unittest.TestCase):
+    def test_datetime(self):
+        serializer = CompactSerializer()
+        expiry = timezone.now()
+
+        data = serializer.dumps({'username': 'foo', '_session_expiry': expiry})
+
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(
+            serializer.loads(data),
+            {'username': 'foo', '_session_expiry': expiry},
+        )
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            CompactSerializer().dumps({'foo': object()})
+
+
+class SharedSessionTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'sessions'
+        self.table = SharedSessionTable(self.path, slot_count=4, slot_size=128)
+
+    def tearDown(self):
+        self.table.close()
+        self.directory.cleanup()
+
+    def test_set_get(self):
+        self.assertIsNone(self.table.get('foo'))
+
+        self.assertTrue(self.table.set('foo', b'bar', time.time() + 60))
+
+        self.assertEqual(self.table.get('foo'), b'bar')
+        self.assertEqual(len(self.table), 1)
+
+    def test_must_create(self):
+        self.table.set('foo', b'bar', time.time() + 60)
+
+        self.assertFalse(
+            self.table.set('foo', b'baz', time.time() + 60, must_create=True)
+        )
+        self.assertEqual(self.table.get('foo'), b'bar')
+
+    def test_must_exist(self):
+        self.assertFalse(
+            self.table.set('foo', b'bar', time.time() + 60, must_exist=True)
+        )
+        self.assertIsNone(self.table.get('foo'))
+
+    def test_expired(self):
+        self.table.set('foo', b'bar', time.time() - 1)
+
+        self.assertIsNone(self.table.get('foo'))
+        self.assertEqual(len(self.table), 0)
+
+    def test_delete(self):
+        self.table.set('foo', b'bar', time.time() + 60)
+
+        self.table.delete('foo')
+
+        self.assertIsNone(self.table.get('foo'))
+
+    def test_delete_colliding_key(self):
+        with patch('selene.sessions.zlib.crc32', return_value=0):
+            for key in ('a', 'b', 'c'):
+                self.table.set(key, key.encode(), time.time() + 60)
+
+            self.table.delete('a')
+
+            # the keys following in the probe sequence are still found
+            self.assertEqual(self.table.get('b'), b'b')
+            self.assertEqual(self.table.get('c'), b'c')
+
+            self.table.delete('c')
+            self.table.delete('b')
+
+        self.assertEqual(get_slot_states(self.table), [0, 0, 0, 0])
+
+    def test_full(self):
+        for key in ('a', 'b', 'c', 'd'):
+            self.table.set(key, b'', time.time() + 60)
+
+        with self.assertRaises(SessionTableFull):
+            self.table.set('e', b'', time.time() + 60)
+
+        # expired sessions are replaced
+        self.table.set('a', b'', time.time() - 1)
+        self.table.set('e', b'e', time.time() + 60)
+
+        self.assertEqual(self.table.get('e'), b'e')
+
+    def test_data_too_large(self):
+        with self.assertRaises(SessionDataTooLarge):
+            self.table.set('foo', b'x' * 128, time.time() + 60)
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            self.table.get('x' * 41)
+
+    def test_clear_expired(self):
+        self.table.set('foo', b'foo', time.time() - 1)
+        self.table.set('bar', b'bar', time.time() + 60)
+
+        self.table.clear_expired()
+
+        self.assertEqual(self.table.get('bar'), b'bar')
+        self.assertEqual(sorted(get_slot_states(self.table)), [0, 0, 0, 1])
+
+    def test_shared_between_processes(self):
+        pid = os.fork()
+        if pid == 0:
+            # pylint: disable=protected-access
+            try:
+                table = SharedSessionTable(self.path)
+                table.set('foo', b'bar', time.time() + 60)
+            finally:
+                os._exit(0)
+
+        os.waitpid(pid, 0)
+
+        self.assertEqual(self.table.get('foo'), b'bar')
+
+    def test_keep_geometry_of_existing_file(self):
+        table = SharedSessionTable(self.path, slot_count=8, slot_size=256)
+
+        self.assertEqual(table.slot_count, 4)
+        self.assertEqual(table.slot_size, 128)
+
+        table.close()
+
+    def test_invalid_file(self):
+        path = Path(self.directory.name) / 'invalid'
+        path.write_bytes(b'x' * 128)
+        path.chmod(0o600)
+
+        with self.assertRaises(ValueError):
+            SharedSessionTable(path)
+
+    def test_symlink(self):
+        path = Path(self.directory.name) / 'link'
+        path.symlink_to(self.path)
+
+        with self.assertRaises(OSError):
+            SharedSessionTable(path)
+
+    def test_file_accessible_by_others(self):
+        path = Path(self.directory.name) / 'public'
+        path.touch(mode=0o644)
+        path.chmod(0o644)
+
+        with self.assertRaises(PermissionError):
+            SharedSessionTable(path)
+
+    def test_new_file_is_private(self):
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o600)
+
+    def test_new_file_ignores_umask(self):
+        path = Path(self.directory.name) / 'umask'
+
+        umask = os.umask(0o377)
+        try:
+            table = SharedSessionTable(path, slot_count=4)
+        finally:
+            os.umask(umask)
+
+        table.close()
+
+        self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+
+
+class PrivateDirectoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'selene'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_create(self):
+        self.assertEqual(_private_directory(self.path), self.path)
+        self.assertEqual(self.path.stat().st_mode & 0o777, 0o700)
+
+        # an existing private directory is used
+        self.assertEqual(_private_directory(self.path), self.path)
+
+    def test_directory_accessible_by_others(self):
+        self.path.mkdir()
+        self.path.chmod(0o777)
+
+        with self.assertRaises(PermissionError):
+            _private_directory(self.path)
+
+    def test_symlink(self):
+        target = Path(self.directory.name) / 'target'
+        target.mkdir(mode=0o700)
+        self.path.symlink_to(target)
+
+        with self.assertRaises(PermissionError):
+            _private_directory(self.path)
+
+
+class SessionStoreTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(
+            SESSION_TABLE_PATH=str(Path(self.directory.name) / 'sessions')
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.directory.cleanup()
+
+    def test_save_load(self):
+        session = SessionStore()
+        session['username'] = 'foo'
+        session.set_expiry(timezone.now() + datetime.timedelta(seconds=60))
+        session.save()
+
+        loaded = SessionStore(session.session_key)
+
+        self.assertEqual(loaded['username'], 'foo')
+        self.assertEqual(loaded.get_expiry_date(), session.get_expiry_date())
+        self.assertTrue(loaded.exists(session.session_key))
+
+    def test_unknown_key(self):
+        session = SessionStore('a' * 32)
+
+        self.assertIsNone(session.get('username'))
+        self.assertIsNone(session.session_key)
+        self.assertFalse(session.exists('a' * 32))
+
+    def test_flush(self):
+        session = SessionStore()
+        session['username'] = 'foo'
+        session.save()
+        key = session.session_key
+
+        session.flush()
+
+        self.assertFalse(session.exists(key))
+
+    def test_update_deleted_session(self):
+        session = SessionStore()
+        session['username'] = 'foo'
+        session.save()
+
+        SessionStore().delete(session.session_key)
+
+        session['username'] = 'bar'
+        with self.assertRaises(UpdateError):
+            session.save()
+
+    def test_data_too_large(self):
+        session = SessionStore()
+        session['password'] = 'x' * 1024
+        session.save()
+
+        loaded = SessionStore(session.session_key)
+
+        self.assertEqual(loaded['password'], 'x' * 1024)
+        self.assertTrue(loaded.exists(session.session_key))
+        self.assertTrue(
+            FileSessionStore().exists(session.session_key),
+        )
+
+    def test_data_shrinks(self):
+        session = SessionStore()
+        session['username'] = 'foo'
+        session.save()
+
+        session['password'] = 'x' * 1024
+        session.save()
+
+        self.assertEqual(
+            SessionStore(session.session_key)['password'], 'x' * 1024
+        )
+
+        loaded = SessionStore(session.session_key)
+        del loaded['password']
+        loaded.save()
+
+        self.assertNotIn('password', SessionStore(session.session_key))
+        self.assertFalse(FileSessionStore().exists(session.session_key))
+
+    def test_session_file_is_private(self):
+        session = SessionStore()
+        session['password'] = 'x' * 1024
+        session.save()
+
+        path = Path(self.directory.name) / (
+            settings.SESSION_COOKIE_NAME + session.session_key
+        )
+
+        self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+
+    def test_delete_session_in_file(self):
+        session = SessionStore()
+        session['password'] = 'x' * 1024
+        session.save()
+        key = session.session_key
+
+        session.flush()
+
+        self.assertFalse(session.exists(key))
+        self.assertFalse(FileSessionStore().exists(key))
+
+    @override_settings(SESSION_TABLE_SLOT_COUNT=2)
+    def test_table_full(self):
+        for username in ('foo', 'bar'):
+            session = SessionStore()
+            session['username'] = username
+            session.save()
+
+        session = SessionStore()
+        session['username'] = 'baz'
+
+        with self.assertRaises(CreateError):
+            session.save()
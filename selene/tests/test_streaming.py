@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import unittest
+
+from collections import OrderedDict
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from selene.streaming import JsonStream, contains_large_list
+
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+def create_response(count: int = 3) -> dict:
+    return {
+        'errors': [{'message': 'foo', 'locations': [{'line': 1}]}],
+        'data': OrderedDict(
+            results=OrderedDict(
+                edges=[
+                    OrderedDict(
+                        node=OrderedDict(
+                            id=f'{i:08}-0000-0000-0000-000000000000',
+                            name=f'résult "{i}"',
+                            severity=i / 10,
+                            qod=None,
+                            tags=[],
+                        )
+                    )
+                    for i in range(count)
+                ],
+                pageInfo={'hasNextPage': True, 'endCursor': None},
+                counts={},
+            ),
+        ),
+    }
+
+
+class JsonStreamTestCase(unittest.TestCase):
+    def encode(self, value, chunk_size: int = 1024) -> bytes:
+        return b''.join(JsonStream(value, chunk_size=chunk_size))
+
+    def test_same_as_json_dumps(self):
+        expected = json.dumps(create_response(), separators=(',', ':'))
+
+        self.assertEqual(self.encode(create_response()), expected.encode())
+
+    def test_values(self):
+        for value in (None, 1, 'foo', [], {}, [[1, 2], {'a': []}], {1: 2}):
+            expected = json.dumps(value, separators=(',', ':')).encode()
+
+            self.assertEqual(self.encode(value), expected)
+
+    @patch('selene.streaming.ITEMS_PER_PART', 1)
+    def test_chunks(self):
+        chunks = list(JsonStream(create_response(100), chunk_size=256))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 512 for chunk in chunks))
+        self.assertEqual(json.loads(b''.join(chunks)), create_response(100))
+
+    def test_release_items(self):
+        response = create_response()
+        edges = response['data']['results']['edges']
+
+        self.encode(response)
+
+        self.assertEqual(edges, [None, None, None])
+
+    @patch('selene.streaming.ITEMS_PER_PART', 2)
+    def test_parts(self):
+        for count in range(5):
+            expected = json.dumps(create_response(count), separators=(',', ':'))
+
+            self.assertEqual(
+                self.encode(create_response(count)), expected.encode()
+            )
+
+
+class ContainsLargeListTestCase(unittest.TestCase):
+    def test_large_list(self):
+        self.assertTrue(contains_large_list(create_response(3)['data'], 3))
+        self.assertFalse(contains_large_list(create_response(2)['data'], 3))
+
+    def test_nested_lists(self):
+        # lists within lists are encoded at once
+        self.assertFalse(contains_large_list({'foo': [[1, 2, 3]]}, 3))
+
+    def test_values(self):
+        self.assertFalse(contains_large_list(None, 1))
+        self.assertFalse(contains_large_list('foo', 1))
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class SeleneViewStreamingTestCase(SeleneTestCase):
+    query_string = '''
+        query {
+            tasks {
+                nodes {
+                    id
+                    name
+                }
+            }
+        }
+    '''
+
+    def setUp(self):
+        self.tasks = ''.join(
+            f'<task id="{i:08}-0000-0000-0000-000000000000">'
+            f'<name>t{i}</name></task>'
+            for i in range(3)
+        )
+
+    def query_tasks(self, mock_gmp: GmpMockFactory, **kwargs):
+        mock_gmp.mock_response(
+            'get_tasks',
+            f'<get_tasks_response>{self.tasks}</get_tasks_response>',
+        )
+
+        self.login('foo', 'bar')
+
+        return self.query(self.query_string, **kwargs)
+
+    @override_settings(SELENE={'STREAMING_RESPONSE_MIN_ITEMS': 3})
+    def test_streamed(self, mock_gmp: GmpMockFactory):
+        response = self.query_tasks(mock_gmp)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        content = json.loads(b''.join(response.streaming_content))
+
+        self.assertIsNone(content.get('errors'))
+        self.assertEqual(
+            content['data']['tasks']['nodes'],
+            [
+                {'id': f'{i:08}-0000-0000-0000-000000000000', 'name': f't{i}'}
+                for i in range(3)
+            ],
+        )
+
+    @override_settings(SELENE={'STREAMING_RESPONSE_MIN_ITEMS': 4})
+    def test_small_response(self, mock_gmp: GmpMockFactory):
+        response = self.query_tasks(mock_gmp)
+
+        self.assertFalse(response.streaming)
+        self.assertResponseNoErrors(response)
+
+    @override_settings(
+        SELENE={
+            'STREAMING_RESPONSE_MIN_ITEMS': 1,
+            'INSTRUMENTATION': True,
+        }
+    )
+    def test_debug_timings(self, mock_gmp: GmpMockFactory):
+        response = self.query_tasks(
+            mock_gmp, headers={'HTTP_X_SELENE_DEBUG': '1'}
+        )
+
+        self.assertFalse(response.streaming)
+        self.assertIn('timings', response.json()['extensions'])
+
+    def test_disabled(self, mock_gmp: GmpMockFactory):
+        response = self.query_tasks(mock_gmp)
+
+        self.assertFalse(response.streaming)
+        self.assertResponseNoErrors(response)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from unittest.mock import patch
+
+from lxml import etree
+
+from gvm.errors import GvmResponseError
+
+from selene.schema.relay import Entities, StreamedEntities
+from selene.transforms import (
+    StreamingCheckCommandTransform,
+    StreamingResponse,
+    xml_to_string,
+)
+from selene.tests import SeleneTestCase, GmpMockFactory
+
+
+def results_response(count: int = 3) -> str:
+    results = ''.join(
+        f'<result id="{i:08}-0000-0000-0000-000000000000"><name>r{i}</name>'
+        f'<detection><result id="d{i}"/></detection></result>'
+        for i in range(count)
+    )
+    return (
+        '<get_results_response status="200" status_text="OK">'
+        f'{results}'
+        '<filters id=""><term>first=1 rows=10</term></filters>'
+        f'<results start="1" max="10"/>'
+        f'<result_count>{count}<filtered>{count}</filtered>'
+        f'<page>{count}</page></result_count>'
+        '</get_results_response>'
+    )
+
+
+class StreamingCheckCommandTransformTestCase(unittest.TestCase):
+    def setUp(self):
+        self.transform = StreamingCheckCommandTransform(min_size=0)
+
+    def test_streaming_response(self):
+        response = self.transform(results_response())
+
+        self.assertIsInstance(response, StreamingResponse)
+        self.assertEqual(response.tag, 'get_results_response')
+        self.assertEqual(response.get('status'), '200')
+
+    def test_small_response(self):
+        transform = StreamingCheckCommandTransform()
+        response = transform(results_response())
+
+        self.assertNotIsInstance(response, StreamingResponse)
+        self.assertEqual(len(response.findall('result')), 3)
+
+    def test_other_response(self):
+        response = self.transform(
+            '<get_tasks_response status="200" status_text="OK"/>'
+        )
+
+        self.assertNotIsInstance(response, StreamingResponse)
+
+    def test_error_response(self):
+        with self.assertRaises(GvmResponseError):
+            self.transform(
+                '<get_results_response status="400" status_text="foo"/>'
+            )
+
+
+class StreamingResponseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.response = StreamingCheckCommandTransform(min_size=0)(
+            results_response()
+        )
+
+    def test_iterchildren(self):
+        results = self.response.iterchildren('result')
+
+        first = next(results)
+        self.assertEqual(first.find('name').text, 'r0')
+        self.assertIsNotNone(first.getparent())
+
+        second = next(results)
+        self.assertEqual(second.find('name').text, 'r1')
+
+        # the first element has been freed but can still be used
+        self.assertIsNone(first.getparent())
+        self.assertEqual(first.find('name').text, 'r0')
+
+        self.assertEqual([e.find('name').text for e in results], ['r2'])
+
+    def test_iterchildren_multiple_tags(self):
+        tags = [
+            e.tag for e in self.response.iterchildren('results', 'result_count')
+        ]
+
+        self.assertEqual(tags, ['results', 'result_count'])
+
+    def test_find(self):
+        self.assertEqual(self.response.find('result_count/filtered').text, '3')
+        self.assertEqual(len(self.response.findall('result')), 3)
+
+    def test_xml_to_string(self):
+        xml = etree.fromstring(xml_to_string(self.response))
+
+        self.assertEqual(len(xml.findall('result')), 3)
+
+
+class StreamedEntitiesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.response = StreamingCheckCommandTransform(min_size=0)(
+            results_response()
+        )
+
+    def test_from_response(self):
+        entities = Entities.from_response(self.response, 'result')
+
+        self.assertIsInstance(entities, StreamedEntities)
+        self.assertEqual(
+            [e.find('name').text for e in entities.entity_elements],
+            ['r0', 'r1', 'r2'],
+        )
+
+        counts = entities.get_entities_counts()
+
+        self.assertEqual(counts.filtered, 3)
+        self.assertEqual(counts.total, 3)
+        self.assertEqual(counts.offset, 0)
+        self.assertEqual(counts.limit, 10)
+        self.assertEqual(counts.length, 3)
+
+    def test_counts_first(self):
+        entities = Entities.from_response(self.response, 'result')
+
+        self.assertEqual(entities.get_length(), 3)
+        self.assertEqual(entities.get_offset(), 0)
+        self.assertEqual(len(list(entities.entity_elements)), 3)
+
+    def test_info_response(self):
+        response = StreamingCheckCommandTransform(min_size=0)(
+            '<get_info_response status="200" status_text="OK">'
+            '<info id="CVE-1"><name>CVE-1</name></info>'
+            '<info id="CVE-2"><name>CVE-2</name></info>'
+            '<info start="1" max="2"/>'
+            '<info_count>5<filtered>2</filtered></info_count>'
+            '</get_info_response>'
+        )
+
+        entities = Entities.from_response(
+            response, 'info', requested_name='info'
+        )
+
+        self.assertEqual(
+            [e.get('id') for e in entities.entity_elements], ['CVE-1', 'CVE-2']
+        )
+        self.assertEqual(entities.get_limit(), 2)
+        self.assertEqual(entities.get_total_count(), 5)
+        self.assertEqual(entities.get_filtered_count(), 2)
+
+
+@patch('selene.views.Gmp', new_callable=GmpMockFactory)
+class StreamedResultsTestCase(SeleneTestCase):
+    def test_get_results(self, mock_gmp: GmpMockFactory):
+        mock_gmp.gmp_protocol.get_results.return_value = (
+            StreamingCheckCommandTransform(min_size=0)(results_response())
+        )
+
+        self.login('foo', 'bar')
+
+        response = self.query(
+            '''
+            query {
+                results {
+                    counts { filtered length }
+                    nodes { id name }
+                    edges { node { id } }
+                    pageInfo { hasNextPage }
+                }
+            }
+            '''
+        )
+
+        self.assertResponseNoErrors(response)
+
+        json = response.json()
+        results = json['data']['results']
+
+        self.assertEqual(results['counts'], {'filtered': 3, 'length': 3})
+        self.assertEqual(
+            results['nodes'],
+            [
+                {'id': '00000000-0000-0000-0000-000000000000', 'name': 'r0'},
+                {'id': '00000001-0000-0000-0000-000000000000', 'name': 'r1'},
+                {'id': '00000002-0000-0000-0000-000000000000', 'name': 'r2'},
+            ],
+        )
+        self.assertEqual(
+            [edge['node']['id'] for edge in results['edges']],
+            [node['id'] for node in results['nodes']],
+        )
+        self.assertFalse(results['pageInfo']['hasNextPage'])
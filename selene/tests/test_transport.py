@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+import tempfile
+
+from pathlib import Path
+from typing import Dict
+
+from lxml import etree
+
+from django.contrib.sessions.backends.file import SessionStore
+from django.test import AsyncRequestFactory, SimpleTestCase, override_settings
+
+from gvm.errors import GvmResponseError
+from gvm.transforms import EtreeCheckCommandTransform
+
+from selene.documents import get_query_hash
+from selene.transport import (
+    AsyncGmp,
+    AsyncGmpv214,
+    AsyncUnixSocketConnection,
+    SyncGmp,
+)
+from selene.views import main_async
+
+TASKS_RESPONSE = '''
+<get_tasks_response status="200" status_text="OK">
+    <task id="08b69003-5fc2-4037-a479-93b440211c73">
+        <name>foo</name>
+    </task>
+    <task id="6b2db524-9fb0-45b8-9b56-d958f84cb546">
+        <name>bar</name>
+    </task>
+    <filters id=""><term>first=1 rows=2</term></filters>
+    <tasks start="1" max="2"/>
+    <task_count>2<filtered>2</filtered><page>2</page></task_count>
+</get_tasks_response>
+'''
+
+
+class FakeGvmd:
+    """A minimal gvmd replying to GMP commands with canned responses"""
+
+    def __init__(self, path: Path, responses: Dict[str, str] = None):
+        self.path = path
+        self.responses = {
+            'get_version': '<get_version_response status="200" '
+            'status_text="OK"><version>21.4</version></get_version_response>',
+            'authenticate': '<authenticate_response status="200" '
+            'status_text="OK"/>',
+        }
+        self.responses.update(responses or {})
+        self.commands = []
+        self.server = None
+
+    async def handle(self, reader, writer):
+        while True:
+            parser = etree.XMLPullParser(events=('start', 'end'))
+            root_tag = None
+            done = False
+
+            while not done:
+                data = await reader.read(1024)
+                if not data:
+                    writer.close()
+                    return
+
+                parser.feed(data)
+                for event, element in parser.read_events():
+                    if event == 'start' and root_tag is None:
+                        root_tag = element.tag
+                    elif event == 'end' and element.tag == root_tag:
+                        done = True
+
+            self.commands.append(root_tag)
+
+            # simulate a slow gvmd
+            await asyncio.sleep(0.01)
+
+            response = self.responses.get(
+                root_tag,
+                f'<{root_tag}_response status="200" status_text="OK"/>',
+            )
+            writer.write(response.encode('utf-8'))
+            await writer.drain()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_unix_server(
+            self.handle, path=str(self.path)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class AsyncGmpTestCase(SimpleTestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / 'gvmd.sock'
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def create_gmp(self):
+        return AsyncGmp(
+            AsyncUnixSocketConnection(path=str(self.path)),
+            transform=EtreeCheckCommandTransform(),
+        )
+
+    async def test_determine_version(self):
+        async with FakeGvmd(self.path):
+            async with self.create_gmp() as gmp:
+                self.assertIsInstance(gmp, AsyncGmpv214)
+                self.assertTrue(gmp.is_connected())
+
+            self.assertFalse(gmp.is_connected())
+
+    async def test_send_command(self):
+        async with FakeGvmd(self.path, {'get_tasks': TASKS_RESPONSE}) as gvmd:
+            async with self.create_gmp() as gmp:
+                response = await gmp.get_tasks(filter_string='rows=2')
+
+            self.assertEqual(len(response.findall('task')), 2)
+            self.assertEqual(gvmd.commands, ['get_version', 'get_tasks'])
+
+    async def test_concurrent_commands(self):
+        async with FakeGvmd(self.path, {'get_tasks': TASKS_RESPONSE}) as gvmd:
+            async with self.create_gmp() as gmp:
+                responses = await asyncio.gather(
+                    *[gmp.get_tasks() for _ in range(5)]
+                )
+
+            for response in responses:
+                self.assertEqual(response.tag, 'get_tasks_response')
+
+            self.assertEqual(len(gvmd.commands), 6)
+
+    async def test_authentication_failed(self):
+        responses = {
+            'authenticate': '<authenticate_response status="400" '
+            'status_text="Authentication failed"/>'
+        }
+        async with FakeGvmd(self.path, responses):
+            async with self.create_gmp() as gmp:
+                with self.assertRaises(GvmResponseError):
+                    await gmp.authenticate('foo', 'bar')
+
+    async def test_sync_facade(self):
+        async with FakeGvmd(self.path, {'get_tasks': TASKS_RESPONSE}):
+            async with self.create_gmp() as gmp:
+                sync_gmp = SyncGmp(gmp, asyncio.get_running_loop())
+
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(None, sync_gmp.get_tasks)
+
+            self.assertEqual(response.tag, 'get_tasks_response')
+
+
+class AsyncSeleneViewTestCase(SimpleTestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / 'gvmd.sock'
+        self.factory = AsyncRequestFactory()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def create_request(self, query: str, username: str = None):
+        request = self.factory.post(
+            '/graphql/',
+            json.dumps({'query': query}),
+            content_type='application/json',
+        )
+        request.session = SessionStore()
+        if username:
+            request.session['username'] = username
+            request.session['password'] = 'bar'
+        return request
+
+    async def test_query(self):
+        view = main_async()
+
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+
+        with override_settings(SELENE={'GMP_SOCKET_PATH': str(self.path)}):
+            async with FakeGvmd(
+                self.path, {'get_tasks': TASKS_RESPONSE}
+            ) as gvmd:
+                request = self.create_request(
+                    'query { tasks { nodes { id name } } }', username='foo'
+                )
+                response = await view(request)
+
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(response.content)
+
+        self.assertIsNone(content.get('errors'))
+        self.assertEqual(
+            content['data']['tasks']['nodes'],
+            [
+                {'id': '08b69003-5fc2-4037-a479-93b440211c73', 'name': 'foo'},
+                {'id': '6b2db524-9fb0-45b8-9b56-d958f84cb546', 'name': 'bar'},
+            ],
+        )
+        self.assertEqual(
+            gvmd.commands, ['get_version', 'authenticate', 'get_tasks']
+        )
+
+    async def test_streamed_query(self):
+        view = main_async()
+
+        with override_settings(
+            SELENE={
+                'GMP_SOCKET_PATH': str(self.path),
+                'STREAMING_RESPONSE_MIN_ITEMS': 2,
+            }
+        ):
+            async with FakeGvmd(self.path, {'get_tasks': TASKS_RESPONSE}):
+                request = self.create_request(
+                    'query { tasks { nodes { id } } }', username='foo'
+                )
+                response = await view(request)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.status_code, 200)
+
+        content = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(
+            content['data']['tasks']['nodes'],
+            [
+                {'id': '08b69003-5fc2-4037-a479-93b440211c73'},
+                {'id': '6b2db524-9fb0-45b8-9b56-d958f84cb546'},
+            ],
+        )
+
+    async def test_authentication_required(self):
+        view = main_async()
+
+        with override_settings(SELENE={'GMP_SOCKET_PATH': str(self.path)}):
+            async with FakeGvmd(self.path):
+                request = self.create_request(
+                    'query { tasks { nodes { id } } }'
+                )
+                response = await view(request)
+
+        self.assertEqual(response.status_code, 401)
+
+    async def test_authentication_failed(self):
+        view = main_async()
+        responses = {
+            'authenticate': '<authenticate_response status="400" '
+            'status_text="Authentication failed"/>'
+        }
+
+        with override_settings(SELENE={'GMP_SOCKET_PATH': str(self.path)}):
+            async with FakeGvmd(self.path, responses):
+                request = self.create_request(
+                    'query { tasks { nodes { id } } }', username='foo'
+                )
+                response = await view(request)
+
+        self.assertEqual(response.status_code, 403)
+
+    async def test_persisted_query_not_found(self):
+        view = main_async()
+        extensions = {
+            'persistedQuery': {
+                'version': 1,
+                'sha256Hash': get_query_hash('query { version }'),
+            }
+        }
+
+        with override_settings(SELENE={'GMP_SOCKET_PATH': str(self.path)}):
+            async with FakeGvmd(self.path) as gvmd:
+                request = self.factory.post(
+                    '/graphql/',
+                    json.dumps({'extensions': extensions}),
+                    content_type='application/json',
+                )
+                request.session = SessionStore()
+                request.session['username'] = 'foo'
+                request.session['password'] = 'bar'
+
+                response = await view(request)
+
+        self.assertEqual(
+            json.loads(response.content)['errors'][0]['message'],
+            'PersistedQueryNotFound',
+        )
+        self.assertEqual(gvmd.commands, [])
+
+    async def test_entity_loads_not_batched(self):
+        view = main_async()
+        tasks = {
+            'get_tasks': '<get_tasks_response status="200" status_text="OK">'
+            '<task id="08b69003-5fc2-4037-a479-93b440211c73"><name>foo</name>'
+            '</task></get_tasks_response>'
+        }
+
+        with override_settings(
+            SELENE={'GMP_SOCKET_PATH': str(self.path), 'GMP_POOL_SIZE': 2}
+        ):
+            async with FakeGvmd(self.path, tasks) as gvmd:
+                request = self.create_request(
+                    '''
+                    query {
+                        a: task(id: "08b69003-5fc2-4037-a479-93b440211c73") {
+                            name
+                        }
+                        b: task(id: "6b2db524-9fb0-45b8-9b56-d958f84cb546") {
+                            name
+                        }
+                    }
+                    ''',
+                    username='foo',
+                )
+                response = await view(request)
+
+        content = json.loads(response.content)
+
+        self.assertIsNone(content.get('errors'))
+        self.assertEqual(content['data']['a']['name'], 'foo')
+        self.assertEqual(content['data']['b']['name'], 'foo')
+
+        # the async view neither pools connections nor batches the loads
+        self.assertEqual(
+            gvmd.commands,
+            ['get_version', 'authenticate', 'get_tasks', 'get_tasks'],
+        )
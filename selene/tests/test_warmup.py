@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from selene.documents import get_query_hash
+from selene.management.commands.warmup import Command
+from selene.warmup import forks_workers, warmup, when_ready
+from selene.views import SeleneView
+
+VALID_QUERY = 'query { version }'
+INVALID_QUERY = 'query { foo }'
+
+
+class WarmupTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        SeleneView.document_backend = None
+        SeleneView.persisted_queries = None
+        self.directory.cleanup()
+
+    def write_persisted_queries(self, *queries: str) -> str:
+        path = Path(self.directory.name) / 'queries.json'
+        path.write_text(
+            json.dumps({get_query_hash(query): query for query in queries})
+        )
+        return str(path)
+
+    def test_warmup(self):
+        path = self.write_persisted_queries(VALID_QUERY)
+
+        with self.settings(SELENE={'PERSISTED_QUERIES_FILE': path}):
+            report = warmup()
+
+        self.assertEqual(report['cachedDocuments'], 1)
+        self.assertEqual(report['errors'], {})
+        self.assertGreater(report['duration'], 0)
+        self.assertGreater(report['maxRss'], 0)
+
+        # the persisted query has been cached for the requests
+        self.assertEqual(len(SeleneView.document_backend), 1)
+
+    def test_invalid_persisted_query(self):
+        path = self.write_persisted_queries(VALID_QUERY, INVALID_QUERY)
+
+        with self.settings(SELENE={'PERSISTED_QUERIES_FILE': path}):
+            report = warmup()
+
+        self.assertEqual(report['cachedDocuments'], 1)
+        self.assertEqual(
+            list(report['errors']), [get_query_hash(INVALID_QUERY)]
+        )
+
+    def test_document_cache_disabled(self):
+        path = self.write_persisted_queries(VALID_QUERY)
+
+        with self.settings(
+            SELENE={
+                'PERSISTED_QUERIES_FILE': path,
+                'GRAPHQL_DOCUMENT_CACHE_SIZE': 0,
+            }
+        ):
+            report = warmup()
+
+        self.assertEqual(report['cachedDocuments'], 0)
+
+    def test_command(self):
+        out = StringIO()
+
+        with self.settings(SELENE={}):
+            call_command(Command(), stdout=out)
+
+        self.assertIn('built the schema', out.getvalue())
+
+    def test_command_invalid_persisted_query(self):
+        path = self.write_persisted_queries(INVALID_QUERY)
+
+        with self.settings(
+            SELENE={'PERSISTED_QUERIES_FILE': path}
+        ), self.assertRaises(CommandError):
+            call_command(Command(), stdout=StringIO(), stderr=StringIO())
+
+
+class ForksWorkersTestCase(SimpleTestCase):
+    def test_not_uwsgi(self):
+        self.assertFalse(forks_workers())
+
+    def test_uwsgi_master(self):
+        uwsgi = SimpleNamespace(opt={'master': True})
+
+        with patch.dict('sys.modules', {'uwsgi': uwsgi}):
+            self.assertTrue(forks_workers())
+
+    def test_uwsgi_lazy_apps(self):
+        uwsgi = SimpleNamespace(opt={'master': True, 'lazy-apps': True})
+
+        with patch.dict('sys.modules', {'uwsgi': uwsgi}):
+            self.assertFalse(forks_workers())
+
+    @patch('selene.warmup.warmup')
+    def test_when_ready(self, mock_warmup):
+        when_ready(object())
+
+        mock_warmup.assert_called_once_with(docs=True, freeze=True)
@@ -17,7 +17,12 @@
 
 import unittest
 
-from selene.schema.parser import parse_filter_string, FilterString
+from selene.schema.parser import (
+    get_canonical_filter_string,
+    parse_filter_string,
+    tokenize_filter_string,
+    FilterString,
+)
 
 
 class FilterStringTestCase(unittest.TestCase):
@@ -146,3 +151,132 @@ class FilterStringTestCase(unittest.TestCase):
         self.assertEqual(
             str(filter_string), "first=1 foo=bar first=123 first=321"
         )
+
+    def test_remove_rows_keeps_quoted_terms(self):
+        filter_string = parse_filter_string('name="rows=5 first=1" rows=10')
+        filter_string = filter_string.remove_rows().remove_first()
+
+        self.assertEqual(str(filter_string), 'name="rows=5 first=1"')
+
+    def test_add_term_to_none(self):
+        filter_string = parse_filter_string(None).add_rows(10)
+
+        self.assertEqual(str(filter_string), 'rows=10')
+
+
+class TokenizeFilterStringTestCase(unittest.TestCase):
+    def test_keywords(self):
+        terms = tokenize_filter_string('name~foo severity>5 created<1 a:b')
+
+        self.assertEqual(
+            [(term.column, term.relation, term.value) for term in terms],
+            [
+                ('name', '~', 'foo'),
+                ('severity', '>', '5'),
+                ('created', '<', '1'),
+                ('a', ':', 'b'),
+            ],
+        )
+
+    def test_quoted(self):
+        terms = tokenize_filter_string('name="foo bar" "baz qux" "unterminated')
+
+        self.assertEqual(
+            [(term.column, term.value, term.quoted) for term in terms],
+            [
+                ('name', 'foo bar', True),
+                (None, 'baz qux', True),
+                (None, 'unterminated', True),
+            ],
+        )
+        self.assertEqual(terms[0].raw, 'name="foo bar"')
+
+    def test_prefixes_and_operators(self):
+        terms = tokenize_filter_string('-foo =bar ~baz and "or"')
+
+        self.assertEqual(
+            [(term.prefix, term.value) for term in terms],
+            [('-', 'foo'), ('=', 'bar'), ('~', 'baz'), ('', 'and'), ('', 'or')],
+        )
+        self.assertEqual(
+            [term.is_operator for term in terms],
+            [False, False, False, True, False],
+        )
+
+    def test_control_keywords(self):
+        terms = tokenize_filter_string(
+            'apply_overrides=1 min_qod=70 sort-reverse=severity foo=bar'
+        )
+
+        self.assertEqual(
+            [term.is_control for term in terms], [True, True, True, False]
+        )
+
+
+class FilterStringKeywordsTestCase(unittest.TestCase):
+    def test_get_keyword(self):
+        filter_string = parse_filter_string('apply_overrides=0 min_qod=70')
+
+        self.assertEqual(filter_string.get_keyword('min_qod'), '70')
+        self.assertEqual(filter_string.get_keyword('apply_overrides'), '0')
+        self.assertIsNone(filter_string.get_keyword('rows'))
+
+    def test_get_sort_ignores_quoted_terms(self):
+        filter_string = parse_filter_string('"sort=name" sort=created')
+
+        self.assertEqual(filter_string.get_sort(), ('created', False))
+
+
+class CanonicalFilterStringTestCase(unittest.TestCase):
+    def test_whitespace(self):
+        self.assertEqual(
+            get_canonical_filter_string('  name~foo    rows=10 '),
+            'name~foo rows=10',
+        )
+
+    def test_control_keywords_are_sorted(self):
+        self.assertEqual(
+            get_canonical_filter_string(
+                'sort=name rows=10 foo first=01 apply_overrides=1 bar'
+            ),
+            get_canonical_filter_string(
+                'foo apply_overrides=1 bar first=1 rows=10 sort=name'
+            ),
+        )
+
+    def test_criteria_order_is_kept(self):
+        self.assertNotEqual(
+            get_canonical_filter_string('foo or bar and baz'),
+            get_canonical_filter_string('bar or foo and baz'),
+        )
+
+    def test_quotes_are_kept(self):
+        self.assertEqual(
+            get_canonical_filter_string('name="foo" "bar"'),
+            'name="foo" "bar"',
+        )
+
+    def test_quoted_values_are_byte_exact(self):
+        self.assertEqual(
+            get_canonical_filter_string(
+                'name="foo  Bar" "a=b" "and" "-x" name=""'
+            ),
+            'name="foo  Bar" "a=b" "and" "-x" name=""',
+        )
+
+    def test_quoted_and_unquoted_values_differ(self):
+        self.assertNotEqual(
+            get_canonical_filter_string('name="A B"'),
+            get_canonical_filter_string('name=a b'),
+        )
+
+    def test_quoted_control_keywords_are_kept(self):
+        self.assertEqual(
+            get_canonical_filter_string('rows="010"'), 'rows="010"'
+        )
+
+    def test_operators_are_kept(self):
+        self.assertEqual(get_canonical_filter_string('a AND b'), 'a AND b')
+
+    def test_none(self):
+        self.assertEqual(get_canonical_filter_string(None), '')
@@ -16,15 +16,21 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from datetime import timedelta
 from unittest import TestCase
 
 from uuid import UUID
 
+from django.utils.dateparse import parse_datetime as django_parse_datetime
+
 from selene.schema.parser import (
+    check_severity,
+    check_uuid,
     parse_bool,
     parse_datetime,
     parse_uuid,
     parse_int,
+    parse_nvt_tags,
     parse_yes_no,
 )
 
@@ -61,6 +67,70 @@ class ParseDateTimeTestCase(TestCase):
         self.assertEqual(dt.second, 21)
         self.assertEqual(dt.tzinfo.tzname(dt), 'UTC')
 
+    def test_offset(self):
+        dt = parse_datetime('2020-01-08T14:36:21+01:30')
+        self.assertEqual(dt.utcoffset(), timedelta(hours=1, minutes=30))
+
+        dt = parse_datetime('2020-01-08T14:36:21-05:00')
+        self.assertEqual(dt.utcoffset(), timedelta(hours=-5))
+
+    def test_same_as_django(self):
+        for value in (
+            '2020-01-08T14:36:21Z',
+            '2020-01-08T14:36:21+02:00',
+            '2020-01-08T14:36:21',
+            '2020-01-08 14:36',
+            '2020-1-8T14:36:21.123Z',
+            'foo',
+        ):
+            dt = parse_datetime(value)
+            expected = django_parse_datetime(value)
+            self.assertEqual(dt, expected)
+            if expected is not None:
+                self.assertEqual(dt.utcoffset(), expected.utcoffset())
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            parse_datetime('2020-02-30T14:36:21Z')
+
+    def test_cached(self):
+        self.assertIs(
+            parse_datetime('2020-01-08T14:36:21Z'),
+            parse_datetime('2020-01-08T14:36:21Z'),
+        )
+
+
+class CheckSeverityTestCase(TestCase):
+    def test_severity(self):
+        self.assertEqual(check_severity('5.0'), 5.0)
+        self.assertEqual(check_severity('5.55'), 5.5)
+        self.assertEqual(check_severity(10), 10.0)
+        self.assertEqual(check_severity('-99.0'), -99.0)
+
+
+class CheckUuidTestCase(TestCase):
+    def test_none(self):
+        self.assertIsNone(check_uuid(None))
+        self.assertIsNone(check_uuid(''))
+
+    def test_canonical_uuid(self):
+        value = '75d23ba8-3d23-11ea-858e-b7c2cb43e815'
+        self.assertIs(check_uuid(value), value)
+
+    def test_other_notations(self):
+        self.assertEqual(
+            check_uuid('75D23BA8-3D23-11EA-858E-B7C2CB43E815'),
+            '75d23ba8-3d23-11ea-858e-b7c2cb43e815',
+        )
+        self.assertEqual(
+            check_uuid('{75d23ba83d2311ea858eb7c2cb43e815}'),
+            '75d23ba8-3d23-11ea-858e-b7c2cb43e815',
+        )
+
+    def test_invalid_uuid(self):
+        with self.assertRaises(ValueError):
+            check_uuid('foo')
+
 
 class ParseUuidTestCase(TestCase):
     def test_none(self):
@@ -117,3 +187,49 @@ class ParseYesNoTestCase(TestCase):
         self.assertFalse(parse_yes_no(1))
         self.assertFalse(parse_yes_no(True))
         self.assertFalse(parse_yes_no(False))
+
+
+class ParseNvtTagsTestCase(TestCase):
+    def test_none(self):
+        self.assertEqual(parse_nvt_tags(None), {})
+        self.assertEqual(parse_nvt_tags(''), {})
+
+    def test_tags(self):
+        self.assertEqual(
+            parse_nvt_tags(
+                'cvss_base_vector=AV:N/AC:L/Au:N/C:N/I:N/A:N|summary=foo'
+                '|insight=bar baz'
+            ),
+            {
+                'cvss_base_vector': 'AV:N/AC:L/Au:N/C:N/I:N/A:N',
+                'summary': 'foo',
+                'insight': 'bar baz',
+            },
+        )
+
+    def test_separators_in_values(self):
+        tags = parse_nvt_tags(
+            'summary=a=b|insight=cat foo | grep bar|affected=x || y|impact='
+        )
+
+        self.assertEqual(tags['summary'], 'a=b')
+        self.assertEqual(tags['insight'], 'cat foo | grep bar')
+        self.assertEqual(tags['affected'], 'x || y')
+        self.assertEqual(tags['impact'], '')
+
+    def test_invalid_tags(self):
+        self.assertEqual(
+            parse_nvt_tags('foo|summary=bar|=baz'), {'summary': 'bar|=baz'}
+        )
+
+    def test_first_tag_wins(self):
+        self.assertEqual(
+            parse_nvt_tags('summary=foo|summary=bar'), {'summary': 'foo'}
+        )
+
+    def test_read_only(self):
+        tags = parse_nvt_tags('summary=foo')
+
+        self.assertIs(parse_nvt_tags('summary=foo'), tags)
+        with self.assertRaises(TypeError):
+            tags['summary'] = 'bar'
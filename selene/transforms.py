@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Transforms for GMP responses
+
+Large list responses like the ones of `get_results` or `get_info_list` are
+not converted into a complete element tree. Instead they are parsed
+incrementally while the entities are resolved and each entity element is
+freed after it has been processed.
+"""
+
+from io import BytesIO
+from typing import Any, Iterator, Optional, Union
+
+from lxml import etree
+
+from gvm.transforms import EtreeCheckCommandTransform, check_command_status
+from gvm.xml import create_parser
+
+XmlElement = etree._Element  # pylint: disable=invalid-name,protected-access
+
+# responses smaller than this number of bytes are always parsed completely
+DEFAULT_STREAMING_MIN_SIZE = 64 * 1024
+
+STREAMED_RESPONSES = frozenset(['get_results_response', 'get_info_response'])
+
+
+def _iterparse(data: bytes, events, tag=None) -> Any:
+    return etree.iterparse(
+        BytesIO(data),
+        events=events,
+        tag=tag,
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+
+
+class StreamingResponse:
+    """A GMP response which is parsed on demand
+
+    The attributes of the root element are available immediately. The
+    `iterchildren` method parses the response incrementally. All other
+    element methods like `find` and `findall` parse the complete response
+    once and use the resulting tree.
+    """
+
+    def __init__(self, data: bytes, root: XmlElement):
+        self._data = data
+        self._root = root
+        self._tree: Optional[XmlElement] = None
+
+    @property
+    def data(self) -> bytes:
+        """The raw XML of the response"""
+        return self._data
+
+    @property
+    def tag(self) -> str:
+        return self._root.tag
+
+    @property
+    def attrib(self):
+        return self._root.attrib
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._root.get(key, default)
+
+    @property
+    def tree(self) -> XmlElement:
+        """The completely parsed response"""
+        if self._tree is None:
+            self._tree = etree.XML(self._data, parser=create_parser())
+        return self._tree
+
+    def iterchildren(self, *tags: str) -> Iterator[XmlElement]:
+        """Iterate over the direct children of the root element
+
+        If tags are passed only children with one of these tags are returned.
+
+        The response is parsed while iterating. A returned child element is
+        removed from the parsed tree as soon as the next child is requested.
+        Callers may keep a reference to a returned element to use it
+        afterwards.
+        """
+        for _, element in _iterparse(
+            self._data, events=('end',), tag=tags or None
+        ):
+            parent = element.getparent()
+            # ignore the root element and nested elements with the same tag
+            if parent is None or parent.getparent() is not None:
+                continue
+
+            yield element
+
+            # free the processed element. iterparse only holds a reference
+            # to the root element.
+            parent.remove(element)
+
+    def find(self, path: str, namespaces=None) -> Optional[XmlElement]:
+        return self.tree.find(path, namespaces)
+
+    def findall(self, path: str, namespaces=None) -> list:
+        return self.tree.findall(path, namespaces)
+
+    def findtext(self, path: str, default=None, namespaces=None):
+        return self.tree.findtext(path, default, namespaces)
+
+    def iterfind(self, path: str, namespaces=None) -> Iterator[XmlElement]:
+        return self.tree.iterfind(path, namespaces)
+
+    def iter(self, tag=None, *tags) -> Iterator[XmlElement]:
+        return self.tree.iter(tag, *tags)
+
+    def xpath(self, *args, **kwargs) -> Any:
+        return self.tree.xpath(*args, **kwargs)
+
+    def __iter__(self) -> Iterator[XmlElement]:
+        return iter(self.tree)
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def __getitem__(self, index):
+        return self.tree[index]
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.tag} {len(self._data)}B>'
+
+
+def xml_to_string(xml: Union[XmlElement, StreamingResponse]) -> str:
+    """Serialize a GMP response or an element"""
+    if isinstance(xml, StreamingResponse):
+        return xml.data.decode('utf-8')
+    return etree.tostring(xml, encoding='unicode')
+
+
+class StreamingCheckCommandTransform(EtreeCheckCommandTransform):
+    """Transform a response into a lxml.etree root element or into a
+    StreamingResponse and raise GmpError if the response was an error response
+
+    A StreamingResponse is only returned for large responses of commands
+    listed in streamed_responses.
+    """
+
+    def __init__(
+        self,
+        *,
+        streamed_responses=STREAMED_RESPONSES,
+        min_size: int = DEFAULT_STREAMING_MIN_SIZE,
+    ):
+        super().__init__()
+
+        self.streamed_responses = frozenset(streamed_responses)
+        self.min_size = min_size
+
+    def __call__(self, response: str) -> Union[XmlElement, StreamingResponse]:
+        if len(response) < self.min_size:
+            return super().__call__(response)
+
+        data = response.encode('utf-8')
+
+        # only parse the start tag of the root element
+        try:
+            _, root = next(iter(_iterparse(data, events=('start',))))
+        except (StopIteration, etree.XMLSyntaxError):
+            return super().__call__(response)
+
+        if root.tag not in self.streamed_responses:
+            return super().__call__(response)
+
+        # the parser may have read some children of the root element already.
+        # only keep its attributes.
+        root = etree.Element(root.tag, attrib=dict(root.attrib))
+
+        check_command_status(root)
+
+        return StreamingResponse(data, root)
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""asyncio based GMP transport
+
+The GMP commands are still created by python-gvm. Only sending the commands
+and reading the responses is done via asyncio, which allows to wait for
+gvmd without blocking a thread.
+"""
+
+import asyncio
+import inspect
+
+from time import perf_counter
+from typing import Any, Callable, Optional, Type
+
+from gvm.connections import (
+    BUF_SIZE,
+    DEFAULT_TIMEOUT,
+    DEFAULT_UNIX_SOCKET_PATH,
+    XmlReader,
+)
+from gvm.errors import GvmError, RequiredArgument
+from gvm.protocols.gmpv208 import Gmp as Gmpv208
+from gvm.protocols.gmpv214 import Gmp as Gmpv214
+from gvm.xml import XmlCommand
+
+from selene.instrumentation import CommandTiming, RequestTimings
+
+
+class AsyncUnixSocketConnection(XmlReader):
+    """Connection to gvmd via an unix domain socket using asyncio streams
+
+    Arguments:
+        path: Path to the socket
+        timeout: Timeout in seconds for connecting and reading a response
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Optional[str] = DEFAULT_UNIX_SOCKET_PATH,
+        timeout: Optional[int] = DEFAULT_TIMEOUT,
+    ):
+        self.path = path if path is not None else DEFAULT_UNIX_SOCKET_PATH
+        self._timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+        # time when the first bytes of the last response have been received
+        self.first_data: Optional[float] = None
+        # number of bytes of the last response
+        self.received = 0
+
+    async def connect(self):
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.path), self._timeout
+            )
+        except FileNotFoundError:
+            raise GvmError(f"Socket {self.path} does not exist") from None
+        except (ConnectionError, asyncio.TimeoutError):
+            raise GvmError(f"Could not connect to socket {self.path}") from None
+
+    async def send(self, data: str):
+        if self._writer is None:
+            raise GvmError("Socket is not connected")
+
+        self._writer.write(data.encode('utf-8'))
+        await self._writer.drain()
+
+    async def _read_response(self) -> str:
+        response = []
+
+        self._start_xml()
+        self.first_data = None
+        self.received = 0
+
+        while True:
+            data = await self._reader.read(BUF_SIZE)
+
+            if not data:
+                # Connection was closed by server
+                raise GvmError("Remote closed the connection")
+
+            if self.first_data is None:
+                self.first_data = perf_counter()
+
+            self.received += len(data)
+
+            self._feed_xml(data)
+
+            response.append(data)
+
+            if self._is_end_xml():
+                break
+
+        return b''.join(response).decode('utf-8', errors='ignore')
+
+    async def read(self) -> str:
+        if self._reader is None:
+            raise GvmError("Socket is not connected")
+
+        try:
+            return await asyncio.wait_for(self._read_response(), self._timeout)
+        except asyncio.TimeoutError:
+            raise GvmError("Timeout while reading the response") from None
+
+    async def disconnect(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+
+        self._reader = None
+        self._writer = None
+
+
+class AsyncGmpMixin:
+    """Turns a python-gvm Gmp class into an asyncio protocol
+
+    All GMP commands return awaitables. Commands sent concurrently over the
+    same connection are serialized because gvmd handles one command per
+    connection at a time.
+
+    If timings are set the duration of each command is added to them.
+    """
+
+    def __init__(self, connection: AsyncUnixSocketConnection, **kwargs):
+        super().__init__(connection, **kwargs)
+
+        self.timings: Optional[RequestTimings] = None
+
+        self._lock = asyncio.Lock()
+
+    async def connect(self):
+        if not self.is_connected():
+            await self._connection.connect()
+            self._connected = True
+
+    async def disconnect(self):
+        if self.is_connected():
+            await self._connection.disconnect()
+            self._connected = False
+
+    async def send_command(self, cmd: str) -> Any:
+        async with self._lock:
+            try:
+                await self.connect()
+
+                start = perf_counter()
+                await self._connection.send(cmd)
+                sent = perf_counter()
+                response = await self._connection.read()
+                received = perf_counter()
+            except BaseException:
+                await self.disconnect()
+                raise
+
+        timings = self.timings
+        if timings is None:
+            return self._transform(response)
+
+        command = CommandTiming(cmd, start=start, write=sent - start)
+        first_data = self._connection.first_data or received
+        command.wait = first_data - sent
+        command.read = received - first_data
+        command.response_size = self._connection.received
+
+        try:
+            return self._transform(response)
+        finally:
+            command.parse = perf_counter() - received
+            command.observe()
+            timings.add_command(command)
+
+    async def authenticate(self, username: str, password: str) -> Any:
+        if not username:
+            raise RequiredArgument(
+                function=self.authenticate.__name__, argument='username'
+            )
+
+        if not password:
+            raise RequiredArgument(
+                function=self.authenticate.__name__, argument='password'
+            )
+
+        cmd = XmlCommand("authenticate")
+
+        credentials = cmd.add_element("credentials")
+        credentials.add_element("username", username)
+        credentials.add_element("password", password)
+
+        # the transform raises an error if the authentication failed
+        response = await self.send_command(cmd.to_string())
+
+        self._authenticated = True
+
+        return response
+
+
+class AsyncGmpv208(AsyncGmpMixin, Gmpv208):
+    pass
+
+
+class AsyncGmpv214(AsyncGmpMixin, Gmpv214):
+    pass
+
+
+class AsyncGmp:
+    """Select the asyncio GMP protocol supported by the remote gvmd
+
+    Must be used as an asynchronous context manager.
+
+    Example:
+
+        .. code-block:: python
+
+            async with AsyncGmp(connection, transform=transform) as gmp:
+                response = await gmp.get_tasks()
+    """
+
+    def __init__(
+        self,
+        connection: AsyncUnixSocketConnection,
+        *,
+        transform: Optional[Callable[[str], Any]] = None,
+    ):
+        self._connection = connection
+        self._transform = transform
+        self._gmp = None
+
+    async def determine_supported_gmp(self) -> AsyncGmpMixin:
+        # use the newest protocol only for requesting the version
+        gmp = AsyncGmpv214(self._connection, transform=self._transform)
+        response = await gmp.get_version()
+
+        version_element = response.find('version')
+        if version_element is None:
+            raise GvmError(
+                'Invalid response from manager daemon while requesting the '
+                'version information.'
+            )
+
+        major_version = int(version_element.text.split('.')[0])
+        if major_version == 20:
+            gmp_class: Type[AsyncGmpMixin] = AsyncGmpv208
+        elif major_version == 21:
+            gmp_class = AsyncGmpv214
+        else:
+            raise GvmError(
+                'Remote manager daemon uses an unsupported version of GMP. '
+                f'The GMP version was {version_element.text}.'
+            )
+
+        supported = gmp_class(self._connection, transform=self._transform)
+        # the connection is kept open
+        supported._connected = gmp.is_connected()
+        return supported
+
+    async def __aenter__(self) -> AsyncGmpMixin:
+        try:
+            self._gmp = await self.determine_supported_gmp()
+        except BaseException:
+            await self._connection.disconnect()
+            raise
+        return self._gmp
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._gmp is not None:
+            await self._gmp.disconnect()
+        else:
+            await self._connection.disconnect()
+
+
+class SyncGmp:
+    """A blocking facade for an asyncio GMP protocol
+
+    Allows synchronous resolvers running in a worker thread to use a
+    connection owned by an event loop running in another thread. Calling a
+    GMP command blocks the worker thread until the event loop has received
+    the response.
+    """
+
+    def __init__(
+        self, gmp: AsyncGmpMixin, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._gmp = gmp
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._gmp, name)
+
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+
+            if inspect.isawaitable(result):
+                future = asyncio.run_coroutine_threadsafe(result, self._loop)
+                return future.result()
+
+            return result
+
+        return call
@@ -16,14 +16,21 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from django.conf import settings
 from django.urls import path
 
 from django.views.generic.base import RedirectView
 
-from selene.views import main, GraphqlDocView
+from selene.views import main, main_async, GraphqlDocView, MetricsView
+
+if getattr(settings, 'SELENE', {}).get('ASYNC_VIEW'):
+    graphql_view = main_async()  # pylint: disable=invalid-name
+else:
+    graphql_view = main()  # pylint: disable=invalid-name
 
 urlpatterns = [  # pylint: disable=invalid-name
     path('', RedirectView.as_view(pattern_name='selene-graphql')),
-    path('graphql/', main(), name='selene-graphql'),
+    path('graphql/', graphql_view, name='selene-graphql'),
     path('docs/', GraphqlDocView.as_view(), name='selene-graphql-docs'),
+    path('metrics', MetricsView.as_view(), name='selene-metrics'),
 ]
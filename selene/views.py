@@ -16,26 +16,207 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, Tuple
+import asyncio
+import hmac
+import inspect
+import json
+import re
+import threading
 
-import graphdoc
+from contextlib import ExitStack, contextmanager
+from functools import partial, update_wrapper
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urljoin
 
-from graphene_django.views import GraphQLView
+from asgiref.sync import sync_to_async
+
+from graphene_django.views import GraphQLView, HttpError
+from graphql import ResolveInfo
 from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.execution.executors.asyncio import AsyncioExecutor
+from graphql.execution.middleware import MiddlewareManager
 
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBadRequest, HttpResponseNotAllowed
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
 from django.views import View
 
 from gvm.connections import UnixSocketConnection
 from gvm.errors import GvmError, GvmResponseError, GvmClientError
 from gvm.protocols.gmp import Gmp
-from gvm.transforms import EtreeCheckCommandTransform
 
+from selene.docs import get_docs, get_schema_version, get_static_path
+from selene.documents import (
+    DEFAULT_DOCUMENT_CACHE_SIZE,
+    DEFAULT_PERSISTED_QUERIES_CACHE_SIZE,
+    CachedDocumentBackend,
+    PersistedQueries,
+    PersistedQueryError,
+)
 from selene.errors import SeleneError, AuthenticationRequired
+from selene.instrumentation import (
+    CACHE_REQUESTS,
+    GRAPHQL_OPERATION_ERRORS,
+    GRAPHQL_OPERATIONS,
+    RequestTimings,
+    TimedTransform,
+    TimedUnixSocketConnection,
+    TimingMiddleware,
+    get_operation,
+    log_slow_query,
+    record_timings,
+)
+from selene.metrics import (
+    CONTENT_TYPE,
+    DEFAULT_FLUSH_INTERVAL,
+    REGISTRY,
+    MetricsStore,
+    render,
+)
+from selene.memo import MemoizedGmp
+from selene.parallel import GmpConnectionGroup, ParallelRootFieldExecutor
+from selene.prefetch import (
+    DEFAULT_PREFETCH_CACHE_SIZE,
+    DEFAULT_PREFETCH_TTL,
+    DEFAULT_PREFETCH_WORKERS,
+    PrefetchCache,
+    Prefetcher,
+)
+from selene.pool import (
+    DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_IDLE_TIMEOUT,
+    GmpConnectionPool,
+)
 from selene.schema import schema
+from selene.secinfo import (
+    DEFAULT_FEED_CHECK_INTERVAL,
+    CachedSecInfoGmp,
+    SecInfoCache,
+)
+from selene.streaming import DEFAULT_CHUNK_SIZE, JsonStream, contains_large_list
+from selene.transforms import (
+    DEFAULT_STREAMING_MIN_SIZE,
+    StreamingCheckCommandTransform,
+)
+from selene.transport import AsyncGmp, AsyncUnixSocketConnection, SyncGmp
+
+DEFAULT_SETTINGS = {
+    'GMP_SOCKET_PATH': '/var/run/gvmd.sock',
+    # number of authenticated gvmd connections kept per worker. 0 disables
+    # the connection pool.
+    'GMP_POOL_SIZE': 0,
+    'GMP_POOL_IDLE_TIMEOUT': DEFAULT_IDLE_TIMEOUT,
+    'GMP_POOL_HEALTH_CHECK_INTERVAL': DEFAULT_HEALTH_CHECK_INTERVAL,
+    # number of SecInfo responses cached per worker. 0 disables the cache.
+    'SECINFO_CACHE_SIZE': 0,
+    # optional directory for sharing cached SecInfo responses between workers
+    'SECINFO_CACHE_DIR': None,
+    'SECINFO_CACHE_FEED_CHECK_INTERVAL': DEFAULT_FEED_CHECK_INTERVAL,
+    # large result and SecInfo list responses are parsed incrementally
+    'GMP_STREAMING_MIN_SIZE': DEFAULT_STREAMING_MIN_SIZE,
+    # number of parsed and validated GraphQL documents cached per worker. 0
+    # disables the cache.
+    'GRAPHQL_DOCUMENT_CACHE_SIZE': DEFAULT_DOCUMENT_CACHE_SIZE,
+    # number of queries registered by clients via automatic persisted queries
+    # kept per worker. 0 disables the registration.
+    'PERSISTED_QUERIES_CACHE_SIZE': DEFAULT_PERSISTED_QUERIES_CACHE_SIZE,
+    # optional JSON file mapping SHA-256 hashes to persisted queries
+    'PERSISTED_QUERIES_FILE': None,
+    # number of gvmd connections used per request to resolve the root fields
+    # of a query in parallel. 0 or 1 disables the parallel resolution.
+    'GMP_PARALLELISM': 0,
+    # measure the duration of the GMP commands, resolvers and serialization
+    # of each request and aggregate them into histograms
+    'INSTRUMENTATION': False,
+    # the timings of a request are returned in the extensions of the response
+    # if the client sends this header
+    'INSTRUMENTATION_DEBUG_HEADER': 'X-Selene-Debug',
+    # collect the metrics exported by the metrics view. Contrary to the
+    # instrumentation the resolvers aren't timed.
+    'METRICS': False,
+    # directory for sharing the metrics between worker processes. Should be
+    # emptied before the workers are started.
+    'METRICS_DIR': None,
+    # seconds after which a worker writes its metrics into METRICS_DIR
+    'METRICS_FLUSH_INTERVAL': DEFAULT_FLUSH_INTERVAL,
+    # client addresses allowed to request the metrics. Behind a reverse proxy
+    # the address is the one of the proxy.
+    'METRICS_ALLOWED_ADDRESSES': (),
+    # clients sending this token via an "Authorization: Bearer <token>"
+    # header are allowed to request the metrics. None disables the token.
+    'METRICS_TOKEN': None,
+    # requests taking longer than this number of seconds are logged via the
+    # selene.slow_queries logger together with their GMP commands. None
+    # disables the logging.
+    'SLOW_QUERY_THRESHOLD': None,
+    # redirect to the schema documentation below STATIC_URL if it has been
+    # written to STATIC_ROOT via the graphqldocs management command
+    'GRAPHQL_DOCS_STATIC': False,
+    # fetch the following page of connections like results and NVTs in the
+    # background while a user is paging through them
+    'CONNECTION_PREFETCH': False,
+    # seconds a prefetched page is kept
+    'CONNECTION_PREFETCH_TTL': DEFAULT_PREFETCH_TTL,
+    # number of prefetched pages kept per worker
+    'CONNECTION_PREFETCH_CACHE_SIZE': DEFAULT_PREFETCH_CACHE_SIZE,
+    # number of threads per worker fetching the pages
+    'CONNECTION_PREFETCH_WORKERS': DEFAULT_PREFETCH_WORKERS,
+    # responses containing a list, e.g. the edges of a connection, with at
+    # least this number of items are encoded incrementally while they are
+    # sent. None disables the streaming of responses.
+    'STREAMING_RESPONSE_MIN_ITEMS': None,
+    # number of bytes of a streamed response sent at once
+    'STREAMING_RESPONSE_CHUNK_SIZE': DEFAULT_CHUNK_SIZE,
+}
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+_gmp_pool_lock = threading.Lock()
+_secinfo_cache_lock = threading.Lock()
+_document_backend_lock = threading.Lock()
+_persisted_queries_lock = threading.Lock()
+_metrics_store_lock = threading.Lock()
+_prefetch_cache_lock = threading.Lock()
+
+
+def get_selene_settings() -> Dict[str, Any]:
+    return {
+        **DEFAULT_SETTINGS,
+        **getattr(settings, 'SELENE', {}),
+    }
 
-DEFAULT_SETTINGS = {'GMP_SOCKET_PATH': '/var/run/gvmd.sock'}
+
+def get_metrics_store(
+    selene_settings: Dict[str, Any]
+) -> Optional[MetricsStore]:
+    """Return the store for sharing the metrics between worker processes"""
+    directory = selene_settings['METRICS_DIR']
+    if not directory:
+        return None
+
+    with _metrics_store_lock:
+        store = SeleneView.metrics_store
+        if store is None or str(store.directory) != str(directory):
+            store = MetricsStore(
+                directory,
+                flush_interval=selene_settings['METRICS_FLUSH_INTERVAL'],
+            )
+            SeleneView.metrics_store = store
+        return store
 
 
 class HttpResponeAuthenticationRequired(HttpResponse):
@@ -43,55 +224,455 @@ class HttpResponeAuthenticationRequired(HttpResponse):
 
 
 class SeleneView(GraphQLView):
+    # the pool is shared by all view instances of a worker process
+    gmp_pool: Optional[GmpConnectionPool] = None
+    # the SecInfo cache is shared by all view instances of a worker process
+    secinfo_cache: Optional[SecInfoCache] = None
+    # the cached GraphQL documents are shared by all view instances of a
+    # worker process
+    document_backend: Optional[CachedDocumentBackend] = None
+    # the persisted queries are shared by all view instances of a worker
+    # process
+    persisted_queries: Optional[PersistedQueries] = None
+    # the store for sharing the metrics is used by all view instances of a
+    # worker process
+    metrics_store: Optional[MetricsStore] = None
+    # the prefetched pages are shared by all view instances of a worker
+    # process
+    prefetch_cache: Optional[PrefetchCache] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.settings = getattr(settings, 'SELENE', DEFAULT_SETTINGS)
-        self.transform = EtreeCheckCommandTransform()
+        self.settings = get_selene_settings()
+        self.transform = StreamingCheckCommandTransform(
+            min_size=self.settings['GMP_STREAMING_MIN_SIZE']
+        )
+
+    def create_gmp(self) -> Gmp:
+        path = self.settings['GMP_SOCKET_PATH']
+
+        if self.is_timed():
+            connection = TimedUnixSocketConnection(path=path)
+            transform = TimedTransform(self.transform, connection)
+            return Gmp(connection=connection, transform=transform)
+
+        connection = UnixSocketConnection(path=path)
+        return Gmp(connection=connection, transform=self.transform)
+
+    def is_timed(self) -> bool:
+        """Whether the timings of the requests are measured"""
+        return bool(
+            self.settings['INSTRUMENTATION']
+            or self.settings['METRICS']
+            or self.settings['SLOW_QUERY_THRESHOLD'] is not None
+        )
+
+    def start_timings(self, request) -> Optional[RequestTimings]:
+        """Start measuring the timings of a request if enabled"""
+        timings = None
+
+        if self.is_timed():
+            header = self.settings['INSTRUMENTATION_DEBUG_HEADER']
+            debug = (
+                bool(self.settings['INSTRUMENTATION'])
+                and bool(header)
+                and bool(request.headers.get(header))
+            )
+            timings = RequestTimings(debug=debug)
+
+        request.timings = timings
+        return timings
+
+    def finish_timings(self, request, timings: RequestTimings):
+        """Add the timings and counters of a request to the metrics"""
+        timings.finish()
+
+        threshold = self.settings['SLOW_QUERY_THRESHOLD']
+        if threshold is not None and timings.duration >= threshold:
+            log_slow_query(timings)
+
+        gmp = getattr(request, 'gmp', None)
+        if isinstance(gmp, MemoizedGmp):
+            CACHE_REQUESTS.inc('memo', 'hit', value=gmp.hits)
+            CACHE_REQUESTS.inc('memo', 'miss', value=gmp.misses)
+
+        store = get_metrics_store(self.settings)
+        if store is not None:
+            store.maybe_flush()
+
+    def record_operation(
+        self,
+        request,
+        query: Optional[str],
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        result: Optional[ExecutionResult],
+    ):
+        timings = getattr(request, 'timings', None)
+        if timings is None or result is None:
+            return
+
+        operation_type, name = get_operation(query, operation_name)
+        timings.set_operation(operation_type, name, query, variables)
+
+        GRAPHQL_OPERATIONS.inc(operation_type, name)
+        if result.errors:
+            GRAPHQL_OPERATION_ERRORS.inc(operation_type, name)
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, *args, **kwargs
+    ):
+        result = super().execute_graphql_request(
+            request, data, query, variables, operation_name, *args, **kwargs
+        )
+        self.record_operation(request, query, variables, operation_name, result)
+        return result
+
+    def get_middleware(self, request):
+        middleware = super().get_middleware(request)
+        timings = getattr(request, 'timings', None)
+
+        if timings is None or not self.settings['INSTRUMENTATION']:
+            return middleware
+
+        # don't wrap the results of all resolvers into promises
+        return MiddlewareManager(
+            *(middleware or []),
+            TimingMiddleware(timings),
+            wrap_in_promise=False,
+        )
+
+    def is_streamed(self, request, d, pretty: bool = False) -> bool:
+        """Whether to encode a response incrementally while it is sent"""
+        min_items = self.settings['STREAMING_RESPONSE_MIN_ITEMS']
+        if min_items is None or self.batch or not isinstance(d, dict):
+            return False
+
+        if self.pretty or pretty or request.GET.get('pretty'):
+            return False
+
+        # the timings are added to the response after the serialization
+        timings = getattr(request, 'timings', None)
+        if timings is not None and timings.debug:
+            return False
+
+        return contains_large_list(d.get('data'), min_items)
+
+    def create_streaming_response(
+        self, stream: JsonStream, status_code: int
+    ) -> StreamingHttpResponse:
+        return StreamingHttpResponse(
+            stream, status=status_code, content_type='application/json'
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+
+        stream = getattr(request, 'response_stream', None)
+        if stream is None:
+            return response
+
+        return self.create_streaming_response(stream, response.status_code)
+
+    def json_encode(self, request, d, pretty=False):
+        if self.is_streamed(request, d, pretty):
+            return JsonStream(
+                d, chunk_size=self.settings['STREAMING_RESPONSE_CHUNK_SIZE']
+            )
+
+        timings = getattr(request, 'timings', None)
+
+        if timings is None:
+            return super().json_encode(request, d, pretty)
+
+        start = perf_counter()
+        result = super().json_encode(request, d, pretty)
+        timings.serialization = perf_counter() - start
+
+        if timings.debug and isinstance(d, dict):
+            extensions = {**d.get('extensions', {})}
+            extensions['timings'] = timings.to_dict()
+            result = super().json_encode(
+                request, {**d, 'extensions': extensions}, pretty
+            )
+
+        return result
+
+    def get_gmp_pool(self) -> Optional[GmpConnectionPool]:
+        if not self.settings['GMP_POOL_SIZE']:
+            return None
+
+        with _gmp_pool_lock:
+            if SeleneView.gmp_pool is None:
+                SeleneView.gmp_pool = GmpConnectionPool(
+                    self.create_gmp,
+                    max_size=self.settings['GMP_POOL_SIZE'],
+                    idle_timeout=self.settings['GMP_POOL_IDLE_TIMEOUT'],
+                    health_check_interval=self.settings[
+                        'GMP_POOL_HEALTH_CHECK_INTERVAL'
+                    ],
+                )
+            return SeleneView.gmp_pool
+
+    def get_secinfo_cache(self) -> Optional[SecInfoCache]:
+        if not self.settings['SECINFO_CACHE_SIZE']:
+            return None
+
+        with _secinfo_cache_lock:
+            if SeleneView.secinfo_cache is None:
+                SeleneView.secinfo_cache = SecInfoCache(
+                    max_size=self.settings['SECINFO_CACHE_SIZE'],
+                    directory=self.settings['SECINFO_CACHE_DIR'],
+                    feed_check_interval=self.settings[
+                        'SECINFO_CACHE_FEED_CHECK_INTERVAL'
+                    ],
+                )
+            return SeleneView.secinfo_cache
+
+    def get_document_backend(self) -> Optional[CachedDocumentBackend]:
+        if not self.settings['GRAPHQL_DOCUMENT_CACHE_SIZE']:
+            return None
+
+        with _document_backend_lock:
+            if SeleneView.document_backend is None:
+                SeleneView.document_backend = CachedDocumentBackend(
+                    max_size=self.settings['GRAPHQL_DOCUMENT_CACHE_SIZE']
+                )
+            return SeleneView.document_backend
+
+    def get_prefetch_cache(self) -> Optional[PrefetchCache]:
+        if not self.settings['CONNECTION_PREFETCH']:
+            return None
+
+        with _prefetch_cache_lock:
+            if SeleneView.prefetch_cache is None:
+                SeleneView.prefetch_cache = PrefetchCache(
+                    ttl=self.settings['CONNECTION_PREFETCH_TTL'],
+                    max_size=self.settings['CONNECTION_PREFETCH_CACHE_SIZE'],
+                    max_workers=self.settings['CONNECTION_PREFETCH_WORKERS'],
+                )
+            return SeleneView.prefetch_cache
+
+    def get_prefetcher(self, request) -> Optional[Prefetcher]:
+        cache = self.get_prefetch_cache()
+        username = request.session.get('username')
+        session_key = request.session.session_key
+        if cache is None or not username or not session_key:
+            return None
+
+        return Prefetcher(
+            cache,
+            username,
+            session_key,
+            partial(
+                self.connect_user_gmp,
+                request,
+                username,
+                request.session.get('password'),
+            ),
+        )
+
+    def get_backend(self, request):
+        backend = self.get_document_backend()
+        if backend is None:
+            return super().get_backend(request)
+        return backend
+
+    def get_persisted_queries(self) -> PersistedQueries:
+        with _persisted_queries_lock:
+            if SeleneView.persisted_queries is None:
+                max_size = self.settings['PERSISTED_QUERIES_CACHE_SIZE']
+                path = self.settings['PERSISTED_QUERIES_FILE']
+                SeleneView.persisted_queries = (
+                    PersistedQueries.from_file(path, max_size=max_size)
+                    if path
+                    else PersistedQueries(max_size=max_size)
+                )
+            return SeleneView.persisted_queries
+
+    def resolve_persisted_query(self, request, data):
+        """Return the data of the request including the query of a persisted
+        query hash
+
+        Called before connecting to gvmd because clients send a hash without
+        the query first and only send the query after it hasn't been found.
+        """
+        extensions = request.GET.get('extensions') or data.get('extensions')
+        if extensions and isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise HttpError(
+                    HttpResponseBadRequest("Extensions are invalid JSON.")
+                ) from None
+
+        if not isinstance(extensions, dict):
+            return data
+
+        persisted_query = extensions.get('persistedQuery')
+        if persisted_query is None:
+            return data
+
+        query = self.get_persisted_queries().resolve(
+            request.GET.get('query') or data.get('query'), persisted_query
+        )
+
+        data = data.copy()
+        data['query'] = query
+        return data
+
+    def wrap_gmp(self, request, gmp: Gmp) -> MemoizedGmp:
+        """Add the caching layers to the Gmp instance of a request"""
+        cache = self.get_secinfo_cache()
+        username = request.session.get('username')
+
+        if cache is not None and username:
+            gmp = CachedSecInfoGmp(gmp, cache, username)
+
+        return MemoizedGmp(
+            gmp, on_change=partial(self.invalidate_prefetched, request)
+        )
+
+    @staticmethod
+    def invalidate_prefetched(request):
+        """Drop the pages prefetched for the user of the request"""
+        prefetcher = getattr(request, 'prefetcher', None)
+        if prefetcher is not None:
+            prefetcher.invalidate()
+
+    @contextmanager
+    def connect_gmp(self, request) -> Iterator[Gmp]:
+        """Connect to gvmd and authenticate the user of the session
+
+        Authenticated connections are taken from the connection pool if it is
+        enabled.
+        """
+        username = request.session.get('username')
+        password = request.session.get('password')
+        pool = self.get_gmp_pool()
+        timings = getattr(request, 'timings', None)
+
+        request.gmp_pool = pool
+
+        if username and pool is not None:
+            connection = pool.acquire(username, password)
+            discard = True
+            try:
+                with record_timings(connection.gmp, timings) as gmp:
+                    yield gmp
+
+                # don't keep the connection if the session changed e.g. by a
+                # logout or a login as a different user
+                discard = (
+                    request.session.get('username') != username
+                    or request.session.get('password') != password
+                )
+            finally:
+                pool.release(connection, discard=discard)
+            return
+
+        with self.create_gmp() as gmp, record_timings(gmp, timings):
+            if username:
+                gmp.authenticate(username, password)
+
+            yield gmp
+
+    @contextmanager
+    def connect_user_gmp(
+        self, request, username: str, password: str
+    ) -> Iterator[Gmp]:
+        """Connect to gvmd as a user independently of the request
+
+        Used for GMP commands which may be sent after the request has been
+        handled, e.g. for prefetching. The connection isn't timed.
+        """
+        pool = self.get_gmp_pool()
+
+        if pool is not None:
+            connection = pool.acquire(username, password)
+            discard = True
+            try:
+                yield self.wrap_gmp(request, connection.gmp)
+                discard = False
+            finally:
+                pool.release(connection, discard=discard)
+            return
+
+        with self.create_gmp() as gmp:
+            gmp.authenticate(username, password)
+            yield self.wrap_gmp(request, gmp)
+
+    def is_parallel(self, request) -> bool:
+        """Whether to resolve the root fields of a query in parallel"""
+        return (
+            self.settings['GMP_PARALLELISM'] > 1
+            and request.session.get('username') is not None
+        )
 
     def get_response(
         self, request, data, show_graphiql=False
     ) -> Tuple[str, int]:
+        timings = self.start_timings(request)
         try:
+            data = self.resolve_persisted_query(request, data)
 
-            connection = UnixSocketConnection(
-                path=self.settings['GMP_SOCKET_PATH']
-            )
-
-            with Gmp(connection=connection, transform=self.transform) as gmp:
-                request.gmp = gmp
+            with ExitStack() as stack:
+                try:
+                    gmp = stack.enter_context(self.connect_gmp(request))
+                except GvmResponseError as e:
+                    result = self.get_error_result(request, e, show_graphiql)
+                    return result, 403
 
-                if request.session.get('username'):
-                    username = request.session['username']
-                    password = request.session['password']
-                    try:
-                        gmp.authenticate(username, password)
-                    except GvmResponseError as e:
-                        result = self.get_error_result(
-                            request, e, show_graphiql
+                if self.is_parallel(request):
+                    gmp = stack.enter_context(
+                        GmpConnectionGroup(
+                            gmp,
+                            partial(self.connect_gmp, request),
+                            max_size=self.settings['GMP_PARALLELISM'],
                         )
-                        return result, 403
+                    )
+                    self.executor = ParallelRootFieldExecutor(
+                        max_workers=self.settings['GMP_PARALLELISM']
+                    )
+
+                request.gmp = self.wrap_gmp(request, gmp)
+                request.prefetcher = self.get_prefetcher(request)
+                result, status_code = super().get_response(
+                    request, data, show_graphiql
+                )
+
+                if isinstance(result, JsonStream):
+                    # the response is sent by dispatch
+                    request.response_stream = result
+                    result = ''
+
+                return result, status_code
 
-                return super().get_response(request, data, show_graphiql)
+        except (ConnectionError, GvmError, SeleneError) as e:
+            return self.get_error_response(request, e, show_graphiql)
+        finally:
+            if timings is not None:
+                self.finish_timings(request, timings)
 
-        except GvmClientError as e:
+    def get_error_response(
+        self, request, error: Exception, show_graphiql: bool = False
+    ) -> Tuple[str, int]:
+        if isinstance(error, GvmClientError):
             # not sure if the session should get flushed
             request.session.flush()
-
-            result = self.get_error_result(request, e, pretty=show_graphiql)
-            return result, 400
-        except (ConnectionError, GvmError) as e:
-            result = self.get_error_result(request, e, pretty=show_graphiql)
-            return result, 500
-        except AuthenticationRequired as e:
+            status_code = 400
+        elif isinstance(error, (ConnectionError, GvmError)):
+            status_code = 500
+        elif isinstance(error, AuthenticationRequired):
             # remove session information
             request.session.flush()
+            status_code = error.httpStatusCode
+        else:
+            status_code = error.httpStatusCode
 
-            result = self.get_error_result(request, e, pretty=show_graphiql)
-            return result, e.httpStatusCode
-        except SeleneError as e:
-            result = self.get_error_result(request, e, pretty=show_graphiql)
-            return result, e.httpStatusCode
+        result = self.get_error_result(request, error, pretty=show_graphiql)
+        return result, status_code
 
     def get_error_result(
         self, request, error: Exception, pretty: bool = True
@@ -111,6 +692,12 @@ class SeleneView(GraphQLView):
         cls, graphql_error: GraphQLError
     ) -> Dict[str, str]:
 
+        if isinstance(graphql_error, PersistedQueryError):
+            return {
+                'message': str(graphql_error),
+                'extensions': {'code': graphql_error.code},
+            }
+
         if getattr(graphql_error, 'original_error', None):
             # this is a hack to allow own http status response codes
             error = graphql_error.original_error
@@ -120,11 +707,328 @@ class SeleneView(GraphQLView):
         return super().format_error(graphql_error)
 
 
+class ThreadedRootResolverMiddleware:
+    """Run the resolvers of root fields in worker threads
+
+    Only resolvers of the root query and mutation fields communicate with
+    gvmd. Running them in worker threads keeps the event loop free while a
+    synchronous resolver waits for a response. The resolvers of nested fields
+    only read the XML response and are run directly.
+    """
+
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        schema_ = info.schema
+        if info.parent_type not in (
+            schema_.get_query_type(),
+            schema_.get_mutation_type(),
+        ):
+            return next_(root, info, **kwargs)
+
+        async def resolve_in_thread():
+            result = await sync_to_async(next_, thread_sensitive=False)(
+                root, info, **kwargs
+            )
+            # native async resolvers only return an awaitable
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return resolve_in_thread()
+
+
+class AsyncSeleneView(SeleneView):
+    """A Selene view for ASGI servers
+
+    GMP commands are sent via an asyncio unix socket transport. Resolvers
+    implemented as coroutines can use the transport directly via
+    `get_async_gmp`. Synchronous resolvers get a blocking facade for the same
+    connection and are run in worker threads.
+
+    Contrary to the synchronous view each request opens and authenticates
+    its own connection, i.e. GMP_POOL_SIZE and GMP_PARALLELISM are not used.
+    The root fields are resolved in separate worker threads, therefore the
+    lookups of single tasks and results via the entity loaders are not
+    batched but sent one by one.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        # django only runs coroutine functions as asynchronous views
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        update_wrapper(async_view, view, updated=())
+        async_view.view_class = view.view_class
+        async_view.view_initkwargs = view.view_initkwargs
+        return async_view
+
+    async def dispatch(
+        self, request, *args, **kwargs
+    ):  # pylint: disable=invalid-overridden-method
+        try:
+            if request.method.lower() not in ("get", "post"):
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["GET", "POST"],
+                        "GraphQL only supports GET and POST requests.",
+                    )
+                )
+
+            data = self.parse_body(request)
+            show_graphiql = self.graphiql and self.can_display_graphiql(
+                request, data
+            )
+
+            if show_graphiql:
+                # rendering graphiql doesn't require a connection to gvmd
+                return await sync_to_async(super().dispatch)(
+                    request, *args, **kwargs
+                )
+
+            result, status_code = await self.get_response_async(
+                request, data, show_graphiql
+            )
+
+            if isinstance(result, JsonStream):
+                return self.create_streaming_response(result, status_code)
+
+            return HttpResponse(
+                status=status_code,
+                content=result,
+                content_type="application/json",
+            )
+
+        except HttpError as e:
+            response = e.response
+            response["Content-Type"] = "application/json"
+            response.content = self.json_encode(
+                request, {"errors": [self.format_error(e)]}
+            )
+            return response
+
+    async def get_response_async(
+        self, request, data, show_graphiql=False
+    ) -> Tuple[str, int]:
+        timings = self.start_timings(request)
+        try:
+            data = self.resolve_persisted_query(request, data)
+
+            connection = AsyncUnixSocketConnection(
+                path=self.settings['GMP_SOCKET_PATH']
+            )
+
+            async with AsyncGmp(connection, transform=self.transform) as gmp:
+                gmp.timings = timings
+                request.async_gmp = gmp
+                request.gmp = self.wrap_gmp(
+                    request, SyncGmp(gmp, asyncio.get_running_loop())
+                )
+                request.prefetcher = self.get_prefetcher(request)
+
+                if request.session.get('username'):
+                    username = request.session['username']
+                    password = request.session['password']
+                    try:
+                        await gmp.authenticate(username, password)
+                    except GvmResponseError as e:
+                        result = self.get_error_result(
+                            request, e, show_graphiql
+                        )
+                        return result, 403
+
+                return await self.get_graphql_response_async(
+                    request, data, show_graphiql
+                )
+
+        except (ConnectionError, GvmError, SeleneError) as e:
+            return self.get_error_response(request, e, show_graphiql)
+        finally:
+            if timings is not None:
+                self.finish_timings(request, timings)
+
+    async def get_graphql_response_async(
+        self, request, data, show_graphiql=False
+    ) -> Tuple[str, int]:
+        query, variables, operation_name, _ = self.get_graphql_params(
+            request, data
+        )
+
+        execution_result = await self.execute_graphql_request_async(
+            request, query, variables, operation_name
+        )
+        self.record_operation(
+            request, query, variables, operation_name, execution_result
+        )
+
+        status_code = 200
+        response = {}
+
+        if execution_result.errors:
+            response["errors"] = [
+                self.format_error(e) for e in execution_result.errors
+            ]
+
+        if execution_result.invalid:
+            status_code = 400
+        else:
+            response["data"] = execution_result.data
+
+        result = self.json_encode(request, response, pretty=show_graphiql)
+        return result, status_code
+
+    async def execute_graphql_request_async(
+        self, request, query, variables, operation_name
+    ) -> ExecutionResult:
+        if not query:
+            raise HttpError(
+                HttpResponseBadRequest("Must provide query string.")
+            )
+
+        try:
+            backend = self.get_backend(request)
+            document = backend.document_from_string(self.schema, query)
+        except Exception as e:  # pylint: disable=broad-except
+            return ExecutionResult(errors=[e], invalid=True)
+
+        if request.method.lower() == "get":
+            operation_type = document.get_operation_type(operation_name)
+            if operation_type and operation_type != "query":
+                raise HttpError(
+                    HttpResponseNotAllowed(
+                        ["POST"],
+                        f"Can only perform a {operation_type} operation from "
+                        "a POST request.",
+                    )
+                )
+
+        middleware = [ThreadedRootResolverMiddleware()]
+        extra_middleware = self.get_middleware(request)
+        if isinstance(extra_middleware, MiddlewareManager):
+            extra_middleware = extra_middleware.middlewares
+        middleware.extend(extra_middleware or [])
+
+        try:
+            return await document.execute(
+                root_value=self.get_root_value(request),
+                variable_values=variables,
+                operation_name=operation_name,
+                context_value=self.get_context(request),
+                middleware=middleware,
+                executor=AsyncioExecutor(loop=asyncio.get_running_loop()),
+                return_promise=True,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            return ExecutionResult(errors=[e], invalid=True)
+
+
 def main():
     return SeleneView.as_view(graphiql=True, schema=schema)
 
 
+def main_async():
+    return AsyncSeleneView.as_view(graphiql=True, schema=schema)
+
+
+def _collect_cache_requests() -> Dict[Tuple[str, str], int]:
+    samples = {}
+
+    for name, cache in (
+        ('document', SeleneView.document_backend),
+        ('secinfo', SeleneView.secinfo_cache),
+    ):
+        if cache is not None:
+            samples[(name, 'hit')] = cache.hits
+            samples[(name, 'miss')] = cache.misses
+
+    return samples
+
+
+CACHE_REQUESTS.add_callback(_collect_cache_requests)
+
+
 class GraphqlDocView(View):
-    def get(self, _request):
-        html = graphdoc.to_doc(schema)
-        return HttpResponse(html, content_type='text/html')
+    """Serve the documentation of the schema
+
+    The documentation is rendered once per schema version. It is returned
+    gzip compressed if accepted by the client and with the schema version as
+    ETag. If GRAPHQL_DOCS_STATIC is set and the documentation of the version
+    has been written below STATIC_ROOT, the client is redirected to the
+    static file instead.
+    """
+
+    @staticmethod
+    def get_static_url() -> Optional[str]:
+        """Return the url of the documentation if it is served statically"""
+        if not get_selene_settings()['GRAPHQL_DOCS_STATIC']:
+            return None
+
+        static_root = getattr(settings, 'STATIC_ROOT', None)
+        path = get_static_path(get_schema_version(schema))
+
+        if not static_root or not (Path(static_root) / path).is_file():
+            return None
+
+        return urljoin(settings.STATIC_URL, path)
+
+    def get(self, request):
+        static_url = self.get_static_url()
+        if static_url:
+            return HttpResponseRedirect(static_url)
+
+        docs = get_docs(schema)
+
+        response = get_conditional_response(request, etag=docs.etag)
+        if response is None:
+            if ACCEPTS_GZIP.search(request.headers.get('Accept-Encoding', '')):
+                response = HttpResponse(
+                    docs.compressed, content_type='text/html; charset=utf-8'
+                )
+                response['Content-Encoding'] = 'gzip'
+            else:
+                response = HttpResponse(
+                    docs.content, content_type='text/html; charset=utf-8'
+                )
+
+        response['ETag'] = docs.etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class MetricsView(View):
+    """Export the metrics in the Prometheus text format
+
+    Only clients with an address of METRICS_ALLOWED_ADDRESSES or sending the
+    METRICS_TOKEN are allowed to request the metrics.
+    """
+
+    @staticmethod
+    def is_allowed(request, selene_settings: Dict[str, Any]) -> bool:
+        if (
+            request.META.get('REMOTE_ADDR')
+            in selene_settings['METRICS_ALLOWED_ADDRESSES']
+        ):
+            return True
+
+        token = selene_settings['METRICS_TOKEN']
+        authorization = request.META.get('HTTP_AUTHORIZATION', '')
+        return bool(token) and hmac.compare_digest(
+            authorization.encode(), f'Bearer {token}'.encode()
+        )
+
+    def get(self, request):
+        selene_settings = get_selene_settings()
+
+        if not selene_settings['METRICS']:
+            raise Http404('Metrics are disabled')
+
+        if not self.is_allowed(request, selene_settings):
+            return HttpResponseForbidden()
+
+        store = get_metrics_store(selene_settings)
+        metrics = REGISTRY.to_dict() if store is None else store.collect()
+
+        return HttpResponse(render(metrics), content_type=CONTENT_TYPE)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2021 Greenbone Networks GmbH
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Warm up a process before it serves requests
+
+Importing the modules of all entities and building the schema takes about
+half a second and a good part of the memory of a worker. Django only imports
+the URLconf, and thereby the schema, on the first request. If a server like
+uWSGI forks its workers from a master process, every worker pays for the
+import on its first request and keeps its own copy of the schema.
+
+Calling :func:`warmup` in the master process builds the schema once before
+the workers are forked. The workers share its memory copy-on-write. The
+persisted queries are parsed and validated into the document cache the same
+way. Freezing the garbage collector afterwards prevents the collections in
+the workers from writing to, and thereby copying, the shared objects.
+
+The WSGI and ASGI modules of hyperion warm up the process if the
+SELENE_WARMUP environment variable is set to 1. They only freeze the garbage
+collector within an uWSGI master loading the application before forking the
+workers (see :func:`forks_workers`). For gunicorn set
+``when_ready = selene.warmup.when_ready`` together with ``preload_app =
+True`` in its configuration file instead.
+"""
+
+import gc
+import resource
+
+from importlib import import_module
+from time import perf_counter
+from typing import Any, Dict
+
+from django.conf import settings
+
+
+def warmup(*, docs: bool = False, freeze: bool = False) -> Dict[str, Any]:
+    """Import the views, build the schema and cache the persisted queries
+
+    Args:
+        docs: Also render the documentation of the schema unless it is
+            served from STATIC_ROOT
+        freeze: Move all objects into the permanent generation of the garbage
+            collector. Should only be set in a process forking workers.
+
+    Returns a report containing the durations of the steps in seconds, the
+    number of cached documents, the errors of invalid persisted queries
+    mapped by their hash and the peak RSS of the process in KiB.
+    """
+    start = perf_counter()
+
+    # pylint: disable=import-outside-toplevel
+    from selene.docs import get_docs
+    from selene.schema import schema
+    from selene.views import GraphqlDocView, SeleneView
+
+    # the URLconf imports the views of all installed apps
+    import_module(settings.ROOT_URLCONF)
+
+    imported = perf_counter()
+
+    view = SeleneView(schema=schema)
+    backend = view.get_document_backend()
+    persisted = view.get_persisted_queries().persisted
+
+    errors = {}
+    if backend is not None:
+        for query_hash, query in persisted.items():
+            query_errors = backend.preload(schema, query)
+            if query_errors:
+                errors[query_hash] = [str(error) for error in query_errors]
+
+    validated = perf_counter()
+
+    if docs and not GraphqlDocView.get_static_url():
+        get_docs(schema)
+
+    rendered = perf_counter()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return {
+        'import': imported - start,
+        'documents': validated - imported,
+        'docs': rendered - validated,
+        'duration': perf_counter() - start,
+        'cachedDocuments': 0 if backend is None else len(backend),
+        'errors': errors,
+        'maxRss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def forks_workers() -> bool:
+    """Whether the process is an uWSGI master which forks its workers after
+    loading the application
+    """
+    try:
+        # only importable within a process run by uWSGI
+        import uwsgi  # pylint: disable=import-outside-toplevel,import-error
+    except ImportError:
+        return False
+
+    return not uwsgi.opt.get('lazy-apps') and not uwsgi.opt.get('lazy')
+
+
+def when_ready(_server):
+    """gunicorn server hook warming up the arbiter before the workers are
+    forked
+    """
+    warmup(docs=True, freeze=True)